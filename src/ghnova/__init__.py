@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from ghnova import client
-from ghnova.version import __version__
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova import client
+    from ghnova.version import __version__
 
 __all__ = ["__version__", "client"]
+
+__getattr__, __dir__ = attach(__name__, {"__version__": "ghnova.version", "client": "ghnova.client"})
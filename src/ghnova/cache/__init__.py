@@ -0,0 +1,25 @@
+"""HTTP response caching for the GitHub clients."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.cache.base import CacheEntry, ResponseCache, make_cache_key
+    from ghnova.cache.memory import MemoryCache
+    from ghnova.cache.sqlite import SQLiteCache
+
+__all__ = ["CacheEntry", "MemoryCache", "ResponseCache", "SQLiteCache", "make_cache_key"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "CacheEntry": "ghnova.cache.base",
+        "MemoryCache": "ghnova.cache.memory",
+        "ResponseCache": "ghnova.cache.base",
+        "SQLiteCache": "ghnova.cache.sqlite",
+        "make_cache_key": "ghnova.cache.base",
+    },
+)
@@ -0,0 +1,153 @@
+"""Base classes for HTTP response caches."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+import urllib.parse
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+_UNCACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+"""Headers that describe the wire format of a response rather than its cached body."""
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body together with its validators."""
+
+    body: bytes
+    """The raw (decoded) response body."""
+    headers: dict[str, str]
+    """The response headers, without transfer-related headers."""
+    status_code: int = 200
+    """The HTTP status code of the cached response."""
+    stored_at: float = field(default_factory=time.time)
+    """Unix timestamp at which the entry was stored."""
+
+    @classmethod
+    def from_response(cls, body: bytes, headers: Mapping[str, str], status_code: int = 200) -> CacheEntry:
+        """Create a cache entry from a response body and its headers.
+
+        Args:
+            body: The raw response body.
+            headers: The response headers.
+            status_code: The HTTP status code of the response.
+
+        Returns:
+            The cache entry.
+
+        """
+        kept_headers = {key: value for key, value in headers.items() if key.lower() not in _UNCACHED_HEADERS}
+        return cls(body=body, headers=kept_headers, status_code=status_code)
+
+    def _get_header(self, name: str) -> str | None:
+        """Get a header value, ignoring the case of its name.
+
+        Args:
+            name: The header name.
+
+        Returns:
+            The header value, or None if the header is missing.
+
+        """
+        lowered = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == lowered:
+                return value
+        return None
+
+    @property
+    def etag(self) -> str | None:
+        """Return the ETag validator of the cached response.
+
+        Returns:
+            The ETag value, or None.
+
+        """
+        return self._get_header("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Return the Last-Modified validator of the cached response.
+
+        Returns:
+            The Last-Modified value, or None.
+
+        """
+        return self._get_header("Last-Modified")
+
+    @property
+    def size(self) -> int:
+        """Return the approximate size of the entry in bytes.
+
+        Returns:
+            The size of the body plus the headers.
+
+        """
+        return len(self.body) + sum(len(key) + len(value) for key, value in self.headers.items())
+
+
+class ResponseCache:
+    """Base class for response caches keyed by request identity."""
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached entry, or None on a cache miss.
+
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry.
+
+        Args:
+            key: The cache key.
+            entry: The entry to store.
+
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present.
+
+        Args:
+            key: The cache key.
+
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+
+def make_cache_key(method: str, url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]) -> str:
+    """Build the cache key of a request.
+
+    The key covers the method, URL, query parameters, requested media type and the identity
+    of the credentials, so that responses are never shared between different tokens.
+    The token itself is only stored as a hash.
+
+    Args:
+        method: The HTTP method.
+        url: The full request URL.
+        params: The query parameters.
+        headers: The request headers.
+
+    Returns:
+        The cache key.
+
+    """
+    query = urllib.parse.urlencode(sorted((str(key), str(value)) for key, value in (params or {}).items()))
+    authorization = headers.get("Authorization")
+    identity = hashlib.sha256(authorization.encode("utf-8")).hexdigest() if authorization else "anonymous"
+    accept = headers.get("Accept", "")
+    raw_key = "\n".join((method.upper(), url, query, accept, identity))
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
@@ -0,0 +1,79 @@
+"""In-memory response cache."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from ghnova.cache.base import CacheEntry, ResponseCache
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-memory response cache with least-recently-used eviction."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the memory cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory.
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries.
+
+        Returns:
+            The number of entries.
+
+        """
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry and mark it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached entry, or None on a cache miss.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used entries if needed.
+
+        Args:
+            key: The cache key.
+            entry: The entry to store.
+
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present.
+
+        Args:
+            key: The cache key.
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,88 @@
+"""Replay of cached responses for the asynchronous client."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from ghnova.cache.base import CacheEntry
+
+
+class CachedClientResponse:
+    """A cached response served in place of a 304 Not Modified response.
+
+    It implements the subset of the aiohttp ClientResponse interface used by ghnova.
+    """
+
+    def __init__(self, entry: CacheEntry, url: str, headers: Mapping[str, str] | None = None) -> None:
+        """Initialize the cached response.
+
+        Args:
+            entry: The cache entry to replay.
+            url: The URL of the request.
+            headers: Headers of the revalidation response, which take precedence over the cached ones.
+
+        """
+        merged_headers: CIMultiDict[str] = CIMultiDict(entry.headers)
+        for key, value in (headers or {}).items():
+            if key.lower() != "content-length":
+                merged_headers[key] = value
+        self.status = entry.status_code
+        self.headers = CIMultiDictProxy(merged_headers)
+        self.url = url
+        self._body = entry.body
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the status code is below 400.
+
+        Returns:
+            True for successful responses.
+
+        """
+        return self.status < 400  # noqa: PLR2004
+
+    async def read(self) -> bytes:
+        """Return the cached body.
+
+        Returns:
+            The raw body.
+
+        """
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Return the cached body as text.
+
+        Args:
+            encoding: The text encoding of the body.
+
+        Returns:
+            The decoded body.
+
+        """
+        return self._body.decode(encoding)
+
+    async def json(self, **kwargs: Any) -> Any:
+        """Parse the cached body as JSON.
+
+        Args:
+            **kwargs: Ignored; accepted for compatibility with ClientResponse.json().
+
+        Returns:
+            The parsed body.
+
+        """
+        return json.loads(self._body)
+
+    def raise_for_status(self) -> None:
+        """Do nothing; cached responses are always successful."""
+
+    def release(self) -> None:
+        """Do nothing; there is no connection to release."""
+
+    def close(self) -> None:
+        """Do nothing; there is no connection to close."""
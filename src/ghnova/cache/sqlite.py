@@ -0,0 +1,246 @@
+"""Persistent SQLite-backed response cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import platformdirs
+
+from ghnova.cache.base import CacheEntry, ResponseCache
+
+logger = logging.getLogger("ghnova")
+
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+"""Default size budget of the cache in bytes (100 MiB)."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) SELECT 'total_size', COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_insert_size AFTER INSERT ON responses BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE name = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS responses_update_size AFTER UPDATE OF size ON responses BEGIN
+    UPDATE meta SET value = value - OLD.size + NEW.size WHERE name = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS responses_delete_size AFTER DELETE ON responses BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE name = 'total_size';
+END;
+"""
+"""Schema of the cache. The triggers keep the total size of the entries in the meta table, so that
+writes do not scan the whole table to check the size budget."""
+
+TOUCH_INTERVAL = 60.0
+"""Minimum number of seconds between two updates of the access time of an entry, so that reads of
+frequently used entries do not each write to the database."""
+
+
+def get_default_cache_path() -> Path:
+    """Get the default location of the persistent cache.
+
+    Returns:
+        The path of the cache database in the user cache directory.
+
+    """
+    return Path(platformdirs.user_cache_dir(appname="ghnova")) / "http_cache.sqlite"
+
+
+class SQLiteCache(ResponseCache):
+    """Response cache stored in a SQLite database, shared across processes.
+
+    The database runs in WAL mode so that concurrent CLI invocations can read while another one writes.
+    When the total size of the stored entries exceeds the size budget, the least recently used entries
+    are evicted.
+    """
+
+    def __init__(self, path: Path | str | None = None, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialize the SQLite cache.
+
+        The database is opened on first use.
+
+        Args:
+            path: Path of the database file. Defaults to the user cache directory.
+            max_size: Size budget of the cache in bytes.
+
+        """
+        if max_size < 0:
+            raise ValueError("max_size must not be negative.")
+        self.path = Path(path) if path is not None else get_default_cache_path()
+        self.max_size = max_size
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed.
+
+        Returns:
+            The database connection.
+
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            # Create the schema and seed the total size atomically, in case another process does the same.
+            connection.executescript(f"BEGIN IMMEDIATE;{_SCHEMA}COMMIT;")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry and mark it as recently used.
+
+        The access time is updated at most once per TOUCH_INTERVAL, which is precise enough to evict the
+        least recently used entries.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached entry, or None on a cache miss.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT status_code, headers, body, stored_at, accessed_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[4] >= TOUCH_INTERVAL:
+                connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        status_code, headers, body, stored_at, _ = row
+        return CacheEntry(body=bytes(body), headers=json.loads(headers), status_code=status_code, stored_at=stored_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used entries if the budget is exceeded.
+
+        Args:
+            key: The cache key.
+            entry: The entry to store.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete would not fire the size trigger.
+            connection.execute(
+                "INSERT INTO responses (key, status_code, headers, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET status_code = excluded.status_code, headers = excluded.headers, "
+                "body = excluded.body, size = excluded.size, stored_at = excluded.stored_at, "
+                "accessed_at = excluded.accessed_at",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    sqlite3.Binary(entry.body),
+                    entry.size,
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            self._evict(connection, self.max_size)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present.
+
+        Args:
+            key: The cache key.
+
+        """
+        with self._lock:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM responses")
+            connection.execute("VACUUM")
+
+    def prune(self, max_size: int | None = None) -> int:
+        """Evict the least recently used entries until the cache fits in the size budget.
+
+        Args:
+            max_size: Size budget in bytes. Defaults to the budget of the cache.
+
+        Returns:
+            The number of evicted entries.
+
+        """
+        with self._lock:
+            return self._evict(self._connect(), self.max_size if max_size is None else max_size)
+
+    def stats(self) -> dict[str, Any]:
+        """Get statistics about the cache.
+
+        Returns:
+            A dictionary with the path, number of entries, total size, size budget,
+            and the timestamps of the oldest and newest entries.
+
+        """
+        with self._lock:
+            entries, size, oldest, newest = (
+                self._connect()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(stored_at), MAX(stored_at) FROM responses")
+                .fetchone()
+            )
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "size": size,
+            "max_size": self.max_size,
+            "oldest": oldest,
+            "newest": newest,
+        }
+
+    @staticmethod
+    def _evict(connection: sqlite3.Connection, max_size: int) -> int:
+        """Evict the least recently used entries until the total size fits in the budget.
+
+        Args:
+            connection: The database connection.
+            max_size: Size budget in bytes.
+
+        Returns:
+            The number of evicted entries.
+
+        """
+        (total_size,) = connection.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()
+        if total_size <= max_size:
+            return 0
+        evicted_keys: list[str] = []
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall():
+            if total_size <= max_size:
+                break
+            evicted_keys.append(key)
+            total_size -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in evicted_keys])
+        logger.debug("Evicted %d entries from the response cache.", len(evicted_keys))
+        return len(evicted_keys)
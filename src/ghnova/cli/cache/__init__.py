@@ -0,0 +1,7 @@
+"""Command line interface for the HTTP response cache."""
+
+from __future__ import annotations
+
+from ghnova.cli.cache.main import cache_app
+
+__all__ = ["cache_app"]
@@ -0,0 +1,23 @@
+"""Clear command for cache CLI."""
+
+from __future__ import annotations
+
+import typer
+
+
+def clear_command(ctx: typer.Context) -> None:
+    """Remove all cached responses.
+
+    Args:
+        ctx: Typer context.
+
+    """
+    from ghnova.cache.sqlite import SQLiteCache  # noqa: PLC0415
+
+    cache = SQLiteCache(path=ctx.obj["cache_path"])
+    try:
+        cache.clear()
+    finally:
+        cache.close()
+
+    typer.echo(f"Cleared the cache at {cache.path}.")
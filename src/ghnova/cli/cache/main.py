@@ -0,0 +1,25 @@
+"""Cache CLI commands for ghnova."""
+
+from __future__ import annotations
+
+import typer
+
+cache_app = typer.Typer(
+    name="cache",
+    help="Manage the HTTP response cache.",
+    rich_markup_mode="rich",
+)
+
+
+def register_commands() -> None:
+    """Register cache subcommands."""
+    from ghnova.cli.cache.clear import clear_command  # noqa: PLC0415
+    from ghnova.cli.cache.prune import prune_command  # noqa: PLC0415
+    from ghnova.cli.cache.stats import stats_command  # noqa: PLC0415
+
+    cache_app.command(name="clear", help="Remove all cached responses.")(clear_command)
+    cache_app.command(name="prune", help="Evict least recently used responses.")(prune_command)
+    cache_app.command(name="stats", help="Show cache statistics.")(stats_command)
+
+
+register_commands()
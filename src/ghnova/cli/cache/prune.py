@@ -0,0 +1,42 @@
+"""Prune command for cache CLI."""
+
+from __future__ import annotations
+
+import logging
+from typing import Annotated
+
+import typer
+
+logger = logging.getLogger("ghnova")
+
+
+def prune_command(
+    ctx: typer.Context,
+    max_size: Annotated[
+        int | None,
+        typer.Option(
+            "--max-size",
+            help="Size budget in bytes. If not provided, the default size budget of the cache is used.",
+        ),
+    ] = None,
+) -> None:
+    """Evict the least recently used responses until the cache fits in the size budget.
+
+    Args:
+        ctx: Typer context.
+        max_size: Size budget in bytes.
+
+    """
+    from ghnova.cache.sqlite import SQLiteCache  # noqa: PLC0415
+
+    if max_size is not None and max_size < 0:
+        logger.error("The size budget must not be negative.")
+        raise typer.Exit(code=1)
+
+    cache = SQLiteCache(path=ctx.obj["cache_path"])
+    try:
+        evicted = cache.prune(max_size=max_size)
+    finally:
+        cache.close()
+
+    typer.echo(f"Evicted {evicted} entries.")
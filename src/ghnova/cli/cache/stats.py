@@ -0,0 +1,31 @@
+"""Stats command for cache CLI."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import typer
+
+
+def stats_command(ctx: typer.Context) -> None:
+    """Show statistics about the HTTP response cache.
+
+    Args:
+        ctx: Typer context.
+
+    """
+    from ghnova.cache.sqlite import SQLiteCache  # noqa: PLC0415
+
+    cache = SQLiteCache(path=ctx.obj["cache_path"])
+    try:
+        stats = cache.stats()
+    finally:
+        cache.close()
+
+    typer.echo(f"Cache path: {stats['path']}")
+    typer.echo(f"Entries: {stats['entries']}")
+    typer.echo(f"Size: {stats['size']} bytes")
+    typer.echo(f"Size budget: {stats['max_size']} bytes")
+    for label, key in (("Oldest entry", "oldest"), ("Newest entry", "newest")):
+        value = stats[key]
+        typer.echo(f"{label}: {datetime.fromtimestamp(value).isoformat(timespec='seconds') if value else 'None'}")
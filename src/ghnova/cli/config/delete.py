@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Annotated
 
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def delete_command(
     ctx: typer.Context,
@@ -23,8 +26,6 @@ def delete_command(
         force: Force deletion without confirmation.
 
     """
-    import logging  # noqa: PLC0415
-
     from ghnova.config.manager import ConfigManager  # noqa: PLC0415
 
     if not force:
@@ -33,8 +34,6 @@ def delete_command(
             typer.echo("Deletion cancelled.")
             raise typer.Exit()
 
-    logger = logging.getLogger("ghnova")
-
     config_manager = ConfigManager(filename=ctx.obj["config_path"])
 
     logger.info("Configuration path: %s", config_manager.config_path)
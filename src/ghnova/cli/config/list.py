@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import logging
+
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def list_command(ctx: typer.Context) -> None:
     """List all configured accounts.
@@ -12,12 +16,8 @@ def list_command(ctx: typer.Context) -> None:
         ctx: Typer context.
 
     """
-    import logging  # noqa: PLC0415
-
     from ghnova.config.manager import ConfigManager  # noqa: PLC0415
 
-    logger = logging.getLogger("ghnova")
-
     config_manager = ConfigManager(filename=ctx.obj["config_path"])
 
     logger.info("Configuration path: %s", config_manager.config_path)
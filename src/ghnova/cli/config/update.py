@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Annotated
 
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def update_command(
     ctx: typer.Context,
@@ -24,12 +27,8 @@ def update_command(
         default: Set as default account.
 
     """
-    import logging  # noqa: PLC0415
-
     from ghnova.config.manager import ConfigManager  # noqa: PLC0415
 
-    logger = logging.getLogger("ghnova")
-
     config_manager = ConfigManager(filename=ctx.obj["config_path"])
 
     logger.info("Configuration path: %s", config_manager.config_path)
@@ -0,0 +1,7 @@
+"""Command line interface for the background daemon."""
+
+from __future__ import annotations
+
+from ghnova.cli.daemon.main import daemon_app
+
+__all__ = ["daemon_app"]
@@ -0,0 +1,25 @@
+"""Daemon CLI commands for ghnova."""
+
+from __future__ import annotations
+
+import typer
+
+daemon_app = typer.Typer(
+    name="daemon",
+    help="Manage the background daemon.",
+    rich_markup_mode="rich",
+)
+
+
+def register_commands() -> None:
+    """Register daemon subcommands."""
+    from ghnova.cli.daemon.start import start_command  # noqa: PLC0415
+    from ghnova.cli.daemon.status import status_command  # noqa: PLC0415
+    from ghnova.cli.daemon.stop import stop_command  # noqa: PLC0415
+
+    daemon_app.command(name="start", help="Start the background daemon.")(start_command)
+    daemon_app.command(name="status", help="Show whether the background daemon is running.")(status_command)
+    daemon_app.command(name="stop", help="Stop the background daemon.")(stop_command)
+
+
+register_commands()
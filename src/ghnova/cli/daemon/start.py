@@ -0,0 +1,111 @@
+"""Start command for daemon CLI."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import time
+from typing import Annotated
+
+import typer
+
+logger = logging.getLogger("ghnova")
+
+
+def start_command(
+    ctx: typer.Context,
+    detach: Annotated[
+        bool,
+        typer.Option("--detach", "-d", help="Run the daemon in the background and return once it is ready."),
+    ] = False,
+    idle_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--idle-timeout",
+            help="Stop the daemon after this many seconds without requests. If not provided, the daemon runs until stopped.",
+        ),
+    ] = None,
+) -> None:
+    """Start the background daemon.
+
+    The daemon keeps one open client per account, with its connections, response cache and rate limit
+    state, and serves the commands of the CLI over a UNIX domain socket.
+
+    Args:
+        ctx: Typer context.
+        detach: Run the daemon in the background and return once it is ready.
+        idle_timeout: Stop the daemon after this many seconds without requests.
+
+    """
+    from ghnova.cli.daemon.utils import get_socket_path  # noqa: PLC0415
+    from ghnova.daemon.client import is_daemon_running  # noqa: PLC0415
+
+    if idle_timeout is not None and idle_timeout <= 0:
+        logger.error("The idle timeout must be positive.")
+        raise typer.Exit(code=1)
+
+    socket_path = get_socket_path(ctx)
+    if is_daemon_running(socket_path):
+        logger.error("The daemon is already running at %s.", socket_path)
+        raise typer.Exit(code=1)
+
+    if detach:
+        if not _spawn(socket_path=str(socket_path), idle_timeout=idle_timeout):
+            logger.error("The daemon did not start at %s.", socket_path)
+            raise typer.Exit(code=1)
+        typer.echo(f"Started the daemon at {socket_path}.")
+        return
+
+    from ghnova.daemon.server import DaemonServer  # noqa: PLC0415
+
+    server = DaemonServer(socket_path=socket_path, idle_timeout=idle_timeout)
+    typer.echo(f"Serving at {socket_path}.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _spawn(socket_path: str, idle_timeout: float | None, timeout: float = 10.0) -> bool:
+    """Start the daemon in a detached process and wait until it answers.
+
+    Args:
+        socket_path: Path of the daemon socket.
+        idle_timeout: Stop the daemon after this many seconds without requests.
+        timeout: Seconds to wait for the daemon to answer.
+
+    Returns:
+        True if the daemon answered before the timeout.
+
+    """
+    from ghnova.daemon.client import is_daemon_running  # noqa: PLC0415
+
+    command = [
+        sys.executable,
+        "-c",
+        "from ghnova.cli.main import app; app()",
+        "--daemon-socket",
+        socket_path,
+        "daemon",
+        "start",
+    ]
+    if idle_timeout is not None:
+        command += ["--idle-timeout", str(idle_timeout)]
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if is_daemon_running(socket_path, timeout=0.5):
+            return True
+        if process.poll() is not None:
+            return False
+        time.sleep(0.05)
+    return False
@@ -0,0 +1,27 @@
+"""Status command for daemon CLI."""
+
+from __future__ import annotations
+
+import typer
+
+
+def status_command(ctx: typer.Context) -> None:
+    """Show whether the background daemon is running.
+
+    Args:
+        ctx: Typer context.
+
+    """
+    from ghnova.cli.daemon.utils import get_socket_path  # noqa: PLC0415
+    from ghnova.daemon.protocol import DaemonUnavailableError, send_request  # noqa: PLC0415
+
+    socket_path = get_socket_path(ctx)
+    try:
+        info = send_request(socket_path, {"op": "ping"}, timeout=5.0)
+    except DaemonUnavailableError:
+        typer.echo(f"The daemon is not running at {socket_path}.")
+        raise typer.Exit(code=1) from None
+
+    typer.echo(f"The daemon is running at {socket_path}.")
+    typer.echo(f"PID: {info['pid']}")
+    typer.echo(f"Warm clients: {info['clients']}")
@@ -0,0 +1,35 @@
+"""Utilities for the daemon CLI commands."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import typer
+
+
+def get_socket_path(ctx: typer.Context) -> Path:
+    """Get the path of the daemon socket of the CLI invocation.
+
+    Args:
+        ctx: Typer context.
+
+    Returns:
+        The socket path given by --daemon-socket, or the default socket path.
+
+    Raises:
+        typer.Exit: If no socket path is given and there is no private runtime directory.
+
+    """
+    from ghnova.daemon.protocol import get_default_socket_path  # noqa: PLC0415
+
+    socket_path = (ctx.obj or {}).get("daemon_socket")
+    if socket_path is not None:
+        return Path(socket_path)
+    default_socket = get_default_socket_path()
+    if default_socket is None:
+        logging.getLogger("ghnova").error(
+            "There is no private runtime directory for the daemon socket. Set XDG_RUNTIME_DIR or give --daemon-socket."
+        )
+        raise typer.Exit(code=1)
+    return default_socket
@@ -0,0 +1,173 @@
+"""Bulk command for issue CLI."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from typing import Annotated, Any, Literal
+
+import typer
+
+logger = logging.getLogger("ghnova")
+
+
+def bulk_command(  # noqa: PLR0913
+    ctx: typer.Context,
+    input_path: Annotated[
+        str,
+        typer.Option(
+            "--input",
+            help="Path to a JSON Lines file of create and update operations, or '-' for the standard input.",
+        ),
+    ],
+    account_name: Annotated[
+        str | None,
+        typer.Option(
+            "--account-name",
+            help="Name of the account to use for authentication.",
+        ),
+    ] = None,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            help="Token for authentication. If not provided, the token from the specified account will be used.",
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            help="Base URL of the GitHub platform. If not provided, the base URL from the specified account will be used.",
+        ),
+    ] = None,
+    checkpoint_path: Annotated[
+        str | None,
+        typer.Option(
+            "--checkpoint",
+            help="Path to the checkpoint recording the completed operations. Running the command again with the same checkpoint skips them. Defaults to the input path with a '.checkpoint' suffix.",
+        ),
+    ] = None,
+    no_checkpoint: Annotated[
+        bool,
+        typer.Option(
+            "--no-checkpoint",
+            help="Do not record the completed operations.",
+        ),
+    ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Maximum number of operations in flight.",
+            min=1,
+            max=10,
+        ),
+    ] = 2,
+    min_interval: Annotated[
+        float,
+        typer.Option(
+            "--min-interval",
+            help="Minimum number of seconds between two requests.",
+            min=0,
+        ),
+    ] = 1.0,
+    per_minute: Annotated[
+        int,
+        typer.Option(
+            "--per-minute",
+            help="Maximum number of requests in any minute.",
+            min=1,
+        ),
+    ] = 80,
+    per_hour: Annotated[
+        int,
+        typer.Option(
+            "--per-hour",
+            help="Maximum number of requests in any hour.",
+            min=1,
+        ),
+    ] = 500,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv", "tsv"],
+        typer.Option(
+            "--format",
+            help="Output format: a JSON document with the data and metadata, or one result per line as NDJSON, CSV or TSV.",
+        ),
+    ] = "ndjson",
+) -> None:
+    """Create and update issues from a JSON Lines file.
+
+    Each line is an operation, e.g. {"op": "create", "owner": "octocat", "repository": "hello", "title": "Bug"}
+    or {"op": "update", "owner": "octocat", "repository": "hello", "issue_number": 1, "state": "closed"}.
+    The requests are paced to stay under the secondary rate limits of GitHub, and the result of each line is
+    written as soon as it is known. The command exits with status 1 if any operation failed.
+
+    Args:
+        ctx: Typer context.
+        input_path: Path to the JSON Lines file of operations, or '-' for the standard input.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+        checkpoint_path: Path to the checkpoint.
+        no_checkpoint: Do not record the completed operations.
+        concurrency: Maximum number of operations in flight.
+        min_interval: Minimum number of seconds between two requests.
+        per_minute: Maximum number of requests in any minute.
+        per_hour: Maximum number of requests in any hour.
+        output_format: Output format.
+
+    """
+    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.issue.bulk import BulkCheckpoint, BulkRunner, ContentPacer, read_operations  # noqa: PLC0415
+
+    if checkpoint_path is None and not no_checkpoint:
+        if input_path == "-":
+            logger.error("Give --checkpoint or --no-checkpoint when reading the operations from the standard input.")
+            raise typer.Exit(code=1)
+        checkpoint_path = f"{input_path}.checkpoint"
+
+    token, base_url = get_auth_params(
+        config_path=ctx.obj["config_path"],
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
+    )
+
+    counts: Counter[str] = Counter()
+
+    with contextlib.ExitStack() as stack:
+
+        def results() -> Iterator[dict[str, Any]]:
+            lines = sys.stdin if input_path == "-" else stack.enter_context(open(input_path, encoding="utf-8"))
+            client = stack.enter_context(create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False))
+            checkpoint = None if no_checkpoint else stack.enter_context(BulkCheckpoint(checkpoint_path))
+            runner = BulkRunner(
+                client=client,
+                checkpoint=checkpoint,
+                concurrency=concurrency,
+                pacer=ContentPacer(min_interval=min_interval, per_minute=per_minute, per_hour=per_hour),
+            )
+            for result in runner.run(read_operations(lines)):
+                counts[result.status] += 1
+                if not result.ok:
+                    logger.warning("Line %d failed: %s", result.line, result.error)
+                yield result.to_dict()
+
+        def api_call() -> tuple[Iterator[dict[str, Any]] | list[dict[str, Any]], dict[str, Any]]:
+            if output_format != "json":
+                return results(), {}
+            data = list(results())
+            return data, dict(counts)
+
+        execute_api_command(api_call=api_call, command_name="ghnova issue bulk", output_format=output_format)
+
+    logger.info("Bulk run finished: %s", ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    if counts["failed"]:
+        raise typer.Exit(code=1)
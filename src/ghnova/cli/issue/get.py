@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 
@@ -65,6 +65,13 @@ def get_command(  # noqa: PLR0913
             help="Last-Modified header from a previous request for caching purposes.",
         ),
     ] = None,
+    fields: Annotated[
+        str | None,
+        typer.Option(
+            "--fields",
+            help="Comma-separated dotted paths of the fields to output, e.g. number,state,user.login.",
+        ),
+    ] = None,
 ) -> None:
     """Get a specific issue by owner, repository, and issue number.
 
@@ -78,29 +85,30 @@ def get_command(  # noqa: PLR0913
         base_url: Base URL of the GitHub platform.
         etag: ETag from a previous request for caching purposes.
         last_modified: Last-Modified header from a previous request for caching purposes.
+        fields: Comma-separated dotted paths of the fields to output.
 
     """
-    from typing import Any  # noqa: PLC0415
-
-    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.api import execute_api_command, split_fields  # noqa: PLC0415
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
         account_name=account_name,
         token=token,
         base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
 
     def api_call() -> tuple[dict[str, Any], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.issue.get_issue(
                 owner=owner,
                 repository=repository,
                 issue_number=issue_number,
                 etag=etag,
                 last_modified=last_modified,
+                fields=split_fields(fields),
             )
 
     execute_api_command(api_call=api_call, command_name="ghnova issue get")
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal, cast
 
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def list_command(  # noqa: PLR0913
     ctx: typer.Context,
@@ -152,12 +156,12 @@ def list_command(  # noqa: PLR0913
         ),
     ] = None,
     per_page: Annotated[
-        int,
+        int | None,
         typer.Option(
             "--per-page",
-            help="Number of results per page.",
+            help="Number of results per page (max 100). Defaults to 30, or 100 when listing all pages.",
         ),
-    ] = 30,
+    ] = None,
     page: Annotated[
         int,
         typer.Option(
@@ -179,6 +183,51 @@ def list_command(  # noqa: PLR0913
             help="Last-Modified header from a previous request for caching purposes.",
         ),
     ] = None,
+    fields: Annotated[
+        str | None,
+        typer.Option(
+            "--fields",
+            help="Comma-separated dotted paths of the fields to output, e.g. number,state,user.login.",
+        ),
+    ] = None,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv", "tsv"],
+        typer.Option(
+            "--format",
+            help="Output format: a JSON document with the data and metadata, or one item per line as NDJSON, CSV or TSV.",
+        ),
+    ] = "json",
+    all_pages: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            help="Fetch all pages by following the pagination links, writing the items as they arrive.",
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this many items. Implies --all."),
+    ] = None,
+    max_pages: Annotated[
+        int | None,
+        typer.Option("--max-pages", min=1, help="Request at most this many pages. Implies --all."),
+    ] = None,
+    all_repositories: Annotated[
+        bool,
+        typer.Option(
+            "--all-repositories",
+            help="List the issues of every repository of the organization, tagged with repository_full_name. Requires --organization and implies --all.",
+        ),
+    ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            min=1,
+            max=32,
+            help="Maximum number of repositories whose issues are listed at the same time with --all-repositories.",
+        ),
+    ] = 8,
 ) -> None:
     """List issues from a repository or organization.
 
@@ -205,50 +254,135 @@ def list_command(  # noqa: PLR0913
         assignee: Filter by assignee.
         creator: Filter by creator.
         mentioned: Filter by mentioned user.
-        per_page: Number of results per page.
+        per_page: Number of results per page. Defaults to 30, or to 100 when all pages are fetched.
         page: Page number for pagination.
         etag: ETag from a previous request for caching purposes.
         last_modified: Last-Modified header from a previous request for caching purposes.
+        fields: Comma-separated dotted paths of the fields to output.
+        output_format: Output format: json, ndjson, csv or tsv.
+        all_pages: Fetch all pages by following the pagination links.
+        max_items: Stop after this many items.
+        max_pages: Request at most this many pages.
+        all_repositories: List the issues of every repository of the organization.
+        concurrency: Maximum number of repositories whose issues are listed at the same time.
 
     """
-    from typing import Any  # noqa: PLC0415
-
-    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.api import (  # noqa: PLC0415
+        check_single_page_options,
+        execute_api_command,
+        execute_paginated_command,
+        split_fields,
+    )
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.utils.pagination import PageCallback  # noqa: PLC0415
+
+    if all_repositories:
+        if organization is None:
+            logger.error("--all-repositories requires --organization.")
+            raise typer.Exit(code=1)
+        unsupported = {
+            "--owner": owner,
+            "--repository": repository,
+            "--filter-by": filter_by,
+            "--collab": collab,
+            "--orgs": orgs,
+            "--owned": owned,
+            "--pulls": pulls,
+            "--issue-type": issue_type,
+            "--max-pages": max_pages,
+        }
+        given = [option for option, value in unsupported.items() if value is not None]
+        if given:
+            logger.error("--all-repositories cannot be combined with %s.", ", ".join(given))
+            raise typer.Exit(code=1)
+        check_single_page_options(page=page, etag=etag, last_modified=last_modified)
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
         account_name=account_name,
         token=token,
         base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
 
+    filters: dict[str, Any] = {
+        "owner": owner,
+        "organization": organization,
+        "repository": repository,
+        "filter_by": filter_by,
+        "state": state,
+        "labels": labels,
+        "sort": sort,
+        "direction": direction,
+        "since": since,
+        "collab": collab,
+        "orgs": orgs,
+        "owned": owned,
+        "pulls": pulls,
+        "issue_type": issue_type,
+        "milestone": milestone,
+        "assignee": assignee,
+        "creator": creator,
+        "mentioned": mentioned,
+    }
+
+    if all_repositories:
+
+        def iterate_repositories(on_page: PageCallback) -> Iterator[Any]:
+            with create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False) as client:
+                yield from client.issue.iter_org_repository_issues(
+                    organization=cast(str, organization),
+                    state=state,
+                    labels=labels,
+                    sort=sort,
+                    direction=direction,
+                    since=since,
+                    milestone=milestone,
+                    assignee=assignee,
+                    creator=creator,
+                    mentioned=mentioned,
+                    per_page=100 if per_page is None else per_page,
+                    fields=split_fields(fields),
+                    concurrency=concurrency,
+                    on_page=on_page,
+                )
+
+        execute_paginated_command(
+            iterate=iterate_repositories,
+            command_name="ghnova issue list",
+            output_format=output_format,
+            max_items=max_items,
+        )
+        return
+
+    if all_pages or max_items is not None or max_pages is not None:
+        check_single_page_options(page=page, etag=etag, last_modified=last_modified)
+
+        def iterate(on_page: PageCallback) -> Iterator[Any]:
+            with create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False) as client:
+                yield from client.issue.iter_issues(
+                    **filters,
+                    per_page=100 if per_page is None else per_page,
+                    fields=split_fields(fields),
+                    max_pages=max_pages,
+                    on_page=on_page,
+                )
+
+        execute_paginated_command(
+            iterate=iterate, command_name="ghnova issue list", output_format=output_format, max_items=max_items
+        )
+        return
+
     def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.issue.list_issues(
-                owner=owner,
-                organization=organization,
-                repository=repository,
-                filter_by=filter_by,
-                state=state,
-                labels=labels,
-                sort=sort,
-                direction=direction,
-                since=since,
-                collab=collab,
-                orgs=orgs,
-                owned=owned,
-                pulls=pulls,
-                issue_type=issue_type,
-                milestone=milestone,
-                assignee=assignee,
-                creator=creator,
-                mentioned=mentioned,
-                per_page=per_page,
+                **filters,
+                per_page=30 if per_page is None else per_page,
                 page=page,
                 etag=etag,
                 last_modified=last_modified,
+                fields=split_fields(fields),
             )
 
-    execute_api_command(api_call=api_call, command_name="ghnova issue list")
+    execute_api_command(api_call=api_call, command_name="ghnova issue list", output_format=output_format)
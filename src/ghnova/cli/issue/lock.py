@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+import logging
+from typing import Annotated, Any, Literal
 
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def lock_command(  # noqa: PLR0913
     ctx: typer.Context,
@@ -24,12 +27,12 @@ def lock_command(  # noqa: PLR0913
         ),
     ],
     issue_number: Annotated[
-        int,
+        int | None,
         typer.Option(
             "--issue-number",
             help="The issue number.",
         ),
-    ],
+    ] = None,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -58,8 +61,54 @@ def lock_command(  # noqa: PLR0913
             help="Reason for locking: off-topic, too heated, resolved, or spam.",
         ),
     ] = None,
+    query: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--query",
+            help="Instead of --issue-number, lock all issues matching a filter given as key=value, e.g. state=open, labels=bug,ui, since=2024-01-01T00:00:00Z, milestone, assignee, creator, mentioned or type. Repeat for several filters.",
+        ),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="With --query, report the issues that would be locked without changing them.",
+        ),
+    ] = False,
+    max_requests: Annotated[
+        int | None,
+        typer.Option(
+            "--max-requests",
+            help="With --query, maximum number of lock requests to send.",
+            min=0,
+        ),
+    ] = None,
+    rate_limit_reserve: Annotated[
+        int | None,
+        typer.Option(
+            "--rate-limit-reserve",
+            help="With --query, stop before the remaining rate limit budget drops below this number of requests.",
+            min=0,
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="With --query, maximum number of requests in flight.",
+            min=1,
+            max=10,
+        ),
+    ] = 4,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv", "tsv"],
+        typer.Option(
+            "--format",
+            help="With --query, output format: a JSON document with the data and metadata, or one result per line as NDJSON, CSV or TSV.",
+        ),
+    ] = "json",
 ) -> None:
-    """Lock an issue to prevent further comments.
+    """Lock an issue, or all the issues matching a query, to prevent further comments.
 
     Args:
         ctx: Typer context.
@@ -70,23 +119,52 @@ def lock_command(  # noqa: PLR0913
         token: Token for authentication.
         base_url: Base URL of the GitHub platform.
         lock_reason: Reason for locking the issue.
+        query: Filters of the issues to lock as key=value.
+        dry_run: Report the issues that would be locked without changing them.
+        max_requests: Maximum number of lock requests to send.
+        rate_limit_reserve: Number of rate limit requests to keep.
+        concurrency: Maximum number of requests in flight.
+        output_format: Output format of the results of a query.
 
     """
-    from typing import Any  # noqa: PLC0415
-
     from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+
+    if (issue_number is None) == (not query):
+        logger.error("Give either --issue-number or --query.")
+        raise typer.Exit(code=1)
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
         account_name=account_name,
         token=token,
         base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
 
+    if query:
+        from ghnova.cli.issue.utils import execute_lock_query  # noqa: PLC0415
+
+        execute_lock_query(
+            ctx=ctx,
+            action="lock",
+            owner=owner,
+            repository=repository,
+            query=query,
+            token=token,
+            base_url=base_url,
+            lock_reason=lock_reason,
+            dry_run=dry_run,
+            max_requests=max_requests,
+            rate_limit_reserve=rate_limit_reserve,
+            concurrency=concurrency,
+            output_format=output_format,
+        )
+        return
+
     def api_call() -> tuple[dict[str, Any], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.issue.lock_issue(
                 owner=owner,
                 repository=repository,
@@ -13,17 +13,21 @@ issue_app = typer.Typer(
 
 def register_commands() -> None:
     """Register issue subcommands."""
+    from ghnova.cli.issue.bulk import bulk_command  # noqa: PLC0415
     from ghnova.cli.issue.create import create_command  # noqa: PLC0415
     from ghnova.cli.issue.get import get_command  # noqa: PLC0415
     from ghnova.cli.issue.list import list_command  # noqa: PLC0415
     from ghnova.cli.issue.lock import lock_command  # noqa: PLC0415
+    from ghnova.cli.issue.sync import sync_command  # noqa: PLC0415
     from ghnova.cli.issue.unlock import unlock_command  # noqa: PLC0415
     from ghnova.cli.issue.update import update_command  # noqa: PLC0415
 
+    issue_app.command(name="bulk", help="Create and update issues from a JSON Lines file.")(bulk_command)
     issue_app.command(name="create", help="Create a new issue.")(create_command)
     issue_app.command(name="get", help="Get a specific issue.")(get_command)
     issue_app.command(name="list", help="List issues.")(list_command)
     issue_app.command(name="lock", help="Lock an issue.")(lock_command)
+    issue_app.command(name="sync", help="Mirror issues into a local SQLite database.")(sync_command)
     issue_app.command(name="unlock", help="Unlock an issue.")(unlock_command)
     issue_app.command(name="update", help="Update an issue.")(update_command)
 
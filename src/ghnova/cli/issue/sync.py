@@ -0,0 +1,141 @@
+"""Sync command for issue CLI."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import Annotated, Any
+
+import typer
+
+logger = logging.getLogger("ghnova")
+
+
+def sync_command(  # noqa: PLR0913
+    ctx: typer.Context,
+    owner: Annotated[
+        str | None,
+        typer.Option(
+            "--owner",
+            help="The owner of the repository.",
+        ),
+    ] = None,
+    organization: Annotated[
+        str | None,
+        typer.Option(
+            "--organization",
+            help="The organization name. Without --repository, all issues of the organization are mirrored.",
+        ),
+    ] = None,
+    repository: Annotated[
+        str | None,
+        typer.Option(
+            "--repository",
+            help="The name of the repository.",
+        ),
+    ] = None,
+    account_name: Annotated[
+        str | None,
+        typer.Option(
+            "--account-name",
+            help="Name of the account to use for authentication.",
+        ),
+    ] = None,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            help="Token for authentication. If not provided, the token from the specified account will be used.",
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            help="Base URL of the GitHub platform. If not provided, the base URL from the specified account will be used.",
+        ),
+    ] = None,
+    mirror_path: Annotated[
+        str | None,
+        typer.Option(
+            "--mirror-path",
+            help="Path to the issue mirror database. If not provided, it uses the path specified by `GHNOVA_MIRROR_PATH`. If the environment variable is not defined, it uses the default location.",
+        ),
+    ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Ignore the stored high-water mark and fetch all issues again.",
+        ),
+    ] = False,
+    per_page: Annotated[
+        int,
+        typer.Option(
+            "--per-page",
+            min=1,
+            max=100,
+            help="Number of issues per page.",
+        ),
+    ] = 100,
+) -> None:
+    """Mirror the issues of a repository or an organization into a local SQLite database.
+
+    Only the issues updated since the previous sync are fetched. Each page is upserted with the new high-water
+    mark in its own transaction, so an interrupted sync keeps the pages written so far. An organization keeps a
+    high-water mark per repository.
+
+    Args:
+        ctx: Typer context.
+        owner: The owner of the repository.
+        organization: The organization name.
+        repository: The name of the repository.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+        mirror_path: Path to the issue mirror database.
+        full: Ignore the stored high-water mark and fetch all issues again.
+        per_page: Number of issues per page.
+
+    """
+    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.cli.utils.progress import PageProgress  # noqa: PLC0415
+    from ghnova.issue.mirror import IssueMirror, get_scope  # noqa: PLC0415
+
+    try:
+        get_scope(owner=owner, repository=repository, organization=organization)
+    except ValueError as e:
+        logger.error(str(e))
+        raise typer.Exit(code=1) from e
+
+    token, base_url = get_auth_params(
+        config_path=ctx.obj["config_path"],
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
+    )
+
+    def api_call() -> tuple[dict[str, Any], dict[str, Any]]:
+        progress = PageProgress()
+        try:
+            with (
+                create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False) as client,
+                IssueMirror(path=mirror_path) as mirror,
+            ):
+                result = mirror.sync(
+                    client=client,
+                    owner=owner,
+                    repository=repository,
+                    organization=organization,
+                    per_page=per_page,
+                    full=full,
+                    on_page=progress,
+                )
+        finally:
+            progress.close()
+        return dataclasses.asdict(result), {**progress.metadata, "mirror_path": str(mirror.path)}
+
+    execute_api_command(api_call=api_call, command_name="ghnova issue sync")
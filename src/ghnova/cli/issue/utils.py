@@ -0,0 +1,149 @@
+"""Utilities shared by the issue CLI commands."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import Any, Literal
+
+import typer
+
+LockReason = Literal["off-topic", "too heated", "resolved", "spam"]
+
+logger = logging.getLogger("ghnova")
+
+ISSUE_QUERY_KEYS = frozenset(
+    {"state", "labels", "since", "milestone", "assignee", "creator", "mentioned", "type", "sort", "direction"}
+)
+"""Keys of a --query option filtering the issues of a repository."""
+
+_ISSUE_QUERY_CHOICES = {
+    "state": ("open", "closed", "all"),
+    "sort": ("created", "updated", "comments"),
+    "direction": ("asc", "desc"),
+}
+"""Allowed values of the keys of a --query option taking a choice."""
+
+
+def parse_issue_query(query: list[str] | None) -> dict[str, Any]:
+    """Parse the values of a --query option into filters of the issues of a repository.
+
+    Args:
+        query: Filters as key=value, e.g. ["state=open", "labels=bug,ui", "since=2024-01-01T00:00:00Z"].
+            Labels are comma-separated and since is an ISO 8601 time.
+
+    Returns:
+        The keyword arguments of Issue.iter_issues.
+
+    Raises:
+        ValueError: If a filter is malformed or unknown.
+
+    """
+    filters: dict[str, Any] = {}
+    for item in query or []:
+        key, separator, value = item.partition("=")
+        key = key.strip()
+        if not separator or key not in ISSUE_QUERY_KEYS:
+            raise ValueError(
+                f"Invalid query '{item}'. Use key=value with a key among {', '.join(sorted(ISSUE_QUERY_KEYS))}."
+            )
+        value = value.strip()
+        if key in _ISSUE_QUERY_CHOICES and value not in _ISSUE_QUERY_CHOICES[key]:
+            raise ValueError(f"Invalid {key} '{value}'. Choose from {', '.join(_ISSUE_QUERY_CHOICES[key])}.")
+        if key == "labels":
+            filters["labels"] = [label.strip() for label in value.split(",") if label.strip()]
+        elif key == "since":
+            try:
+                filters["since"] = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError as e:
+                raise ValueError(f"Invalid time '{value}' in query '{item}'.") from e
+        elif key == "type":
+            filters["issue_type"] = value
+        else:
+            filters[key] = value
+    return filters
+
+
+def execute_lock_query(  # noqa: PLR0913
+    ctx: typer.Context,
+    action: Literal["lock", "unlock"],
+    owner: str,
+    repository: str,
+    query: list[str],
+    token: str,
+    base_url: str,
+    lock_reason: LockReason | None = None,
+    dry_run: bool = False,
+    max_requests: int | None = None,
+    rate_limit_reserve: int | None = None,
+    concurrency: int = 4,
+    output_format: Literal["json", "ndjson", "csv", "tsv"] = "json",
+) -> None:
+    """Lock or unlock the issues of a repository matching a query and output a result per issue.
+
+    Args:
+        ctx: Typer context.
+        action: Whether to lock or unlock the issues.
+        owner: The owner of the repository.
+        repository: The name of the repository.
+        query: Filters of the issues as key=value.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+        lock_reason: Reason for locking the issues.
+        dry_run: Report the issues that would change without changing them.
+        max_requests: Maximum number of lock or unlock requests to send.
+        rate_limit_reserve: Number of core rate limit requests to keep.
+        concurrency: Maximum number of requests in flight.
+        output_format: Output format.
+
+    """
+    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.issue.bulk import BulkLocker  # noqa: PLC0415
+
+    try:
+        filters = parse_issue_query(query)
+    except ValueError as e:
+        logger.error(str(e))
+        raise typer.Exit(code=1) from e
+
+    counts: Counter[str] = Counter()
+    budget_exhausted = False
+
+    with contextlib.ExitStack() as stack:
+
+        def results() -> Iterator[dict[str, Any]]:
+            nonlocal budget_exhausted
+            client = stack.enter_context(create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False))
+            locker = BulkLocker(client=client, concurrency=concurrency)
+            for result in locker.run(
+                owner=owner,
+                repository=repository,
+                action=action,
+                lock_reason=lock_reason,
+                filters=filters,
+                dry_run=dry_run,
+                max_requests=max_requests,
+                rate_limit_reserve=rate_limit_reserve,
+            ):
+                counts[result.status] += 1
+                if not result.ok:
+                    logger.warning("Issue #%d failed: %s", result.number, result.error)
+                yield result.to_dict()
+            budget_exhausted = locker.budget_exhausted
+
+        def get_metadata() -> dict[str, Any]:
+            return {**counts, "dry_run": dry_run, "budget_exhausted": budget_exhausted}
+
+        def api_call() -> tuple[Iterator[dict[str, Any]], Callable[[], dict[str, Any]]]:
+            # The JSON document holds the results, followed by the counts of the whole run.
+            return results(), get_metadata
+
+        execute_api_command(api_call=api_call, command_name=f"ghnova issue {action}", output_format=output_format)
+
+    logger.info("Bulk %s finished: %s", action, ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+    if counts["failed"]:
+        raise typer.Exit(code=1)
@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import enum
-from typing import Annotated
+from typing import Annotated, ClassVar
 
 import typer
 
+from ghnova.cli.utils.lazy import LazyRichHandler, LazyTyperGroup
+
 
 class LoggingLevel(str, enum.Enum):
     """Logging levels for the CLI."""
@@ -20,38 +22,50 @@ class LoggingLevel(str, enum.Enum):
     CRITICAL = "CRITICAL"
 
 
+class MainGroup(LazyTyperGroup):
+    """Main command group, loading the command group of the invoked subcommand only."""
+
+    lazy_subcommands: ClassVar[dict[str, tuple[str, str]]] = {
+        "cache": ("ghnova.cli.cache.main:cache_app", "Manage the HTTP response cache."),
+        "config": ("ghnova.cli.config.main:config_app", "Manage GitHub configuration."),
+        "daemon": ("ghnova.cli.daemon.main:daemon_app", "Manage the background daemon."),
+        "issue": ("ghnova.cli.issue.main:issue_app", "Manage issues."),
+        "pull-request": ("ghnova.cli.pull_request.main:pull_request_app", "Manage pull requests."),
+        "repository": ("ghnova.cli.repository.main:repository_app", "Manage repositories."),
+        "search": ("ghnova.cli.search.main:search_app", "Search issues, repositories and users."),
+        "user": ("ghnova.cli.user.main:user_app", "Manage users."),
+    }
+
+
 # Create the main Typer app
 app = typer.Typer(
     name="ghnova",
     help="Main CLI for ghnova.",
     rich_markup_mode="rich",
+    cls=MainGroup,
 )
 
 
 def setup_logging(level: LoggingLevel = LoggingLevel.INFO) -> None:
     """Set up logging with Rich handler.
 
+    Rich is only imported once a record is emitted.
+
     Args:
         level: Logging level.
     """
     import logging
 
-    from rich.console import Console
-    from rich.logging import RichHandler
-
     logger = logging.getLogger("ghnova")
 
     logger.setLevel(level.value)
 
-    console = Console(stderr=True)
-
     # Remove any existing handlers to ensure RichHandler is used
     for h in logger.handlers[:]:  # Use slice copy to avoid modification during iteration
         logger.removeHandler(h)
     # Add the RichHandler
 
-    handler = RichHandler(
-        console=console,
+    handler = LazyRichHandler(
         rich_tracebacks=True,
         show_time=True,
         show_level=True,  # Keep level (e.g., DEBUG, INFO) for clarity
@@ -77,6 +91,28 @@ def main(
             help="Path to the configuration file. If not provided, it uses the path specified by `GHNOVA_CONFIG_PATH`. If the environment variable is not defined, it uses the default location.",
         ),
     ] = None,
+    cache_path: Annotated[
+        str | None,
+        typer.Option(
+            "--cache-path",
+            help="Path to the HTTP response cache database. If not provided, it uses the path specified by `GHNOVA_CACHE_PATH`. If the environment variable is not defined, it uses the default location.",
+        ),
+    ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Disable the persistent HTTP response cache."),
+    ] = False,
+    daemon_socket: Annotated[
+        str | None,
+        typer.Option(
+            "--daemon-socket",
+            help="Path to the socket of the background daemon. If not provided, it uses the path specified by `GHNOVA_DAEMON_SOCKET`. If the environment variable is not defined, it uses the default location.",
+        ),
+    ] = None,
+    no_daemon: Annotated[
+        bool,
+        typer.Option("--no-daemon", help="Run the command in-process even if the background daemon is running."),
+    ] = False,
     verbose: Annotated[
         LoggingLevel,
         typer.Option("--verbose", "-v", help="Set verbosity level."),
@@ -87,6 +123,10 @@ def main(
     Args:
         ctx: Typer context.
         config_path: Path to the configuration file.
+        cache_path: Path to the HTTP response cache database.
+        no_cache: Disable the persistent HTTP response cache.
+        daemon_socket: Path to the socket of the background daemon.
+        no_daemon: Run the command in-process even if the background daemon is running.
         verbose: Verbosity level for logging.
 
     """
@@ -94,26 +134,21 @@ def main(
     import os
 
     config_path = config_path or os.getenv("GHNOVA_CONFIG_PATH")
+    cache_path = cache_path or os.getenv("GHNOVA_CACHE_PATH")
 
-    ctx.obj = {"config_path": config_path}
-
-    setup_logging(verbose)
-
-
-def register_commands() -> None:
-    """Register CLI commands."""
+    from ghnova.daemon.protocol import get_default_socket_path
 
-    from ghnova.cli.config.main import config_app  # noqa: PLC0415
-    from ghnova.cli.issue.main import issue_app  # noqa: PLC0415
-    from ghnova.cli.pull_request.main import pull_request_app  # noqa: PLC0415
-    from ghnova.cli.repository.main import repository_app  # noqa: PLC0415
-    from ghnova.cli.user.main import user_app  # noqa: PLC0415
+    if no_daemon:
+        daemon_socket = None
+    elif daemon_socket is None:
+        default_socket = get_default_socket_path()
+        daemon_socket = None if default_socket is None else str(default_socket)
 
-    app.add_typer(config_app)
-    app.add_typer(issue_app)
-    app.add_typer(pull_request_app)
-    app.add_typer(repository_app)
-    app.add_typer(user_app)
+    ctx.obj = {
+        "config_path": config_path,
+        "cache_path": cache_path,
+        "no_cache": no_cache,
+        "daemon_socket": daemon_socket,
+    }
 
-
-register_commands()
+    setup_logging(verbose)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal, cast
 
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def list_command(  # noqa: PLR0913
     ctx: typer.Context,
@@ -60,12 +64,12 @@ def list_command(  # noqa: PLR0913
         ),
     ] = None,
     per_page: Annotated[
-        int,
+        int | None,
         typer.Option(
             "--per-page",
-            help="Number of results per page.",
+            help="Number of results per page (max 100). Defaults to 30, or 100 when listing all pages.",
         ),
-    ] = 30,
+    ] = None,
     page: Annotated[
         int,
         typer.Option(
@@ -122,6 +126,35 @@ def list_command(  # noqa: PLR0913
             help="Base URL of the GitHub platform. If not provided, the base URL from the specified account will be used.",
         ),
     ] = None,
+    fields: Annotated[
+        str | None,
+        typer.Option(
+            "--fields",
+            help="Comma-separated dotted paths of the fields to output, e.g. number,state,user.login.",
+        ),
+    ] = None,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv", "tsv"],
+        typer.Option(
+            "--format",
+            help="Output format: a JSON document with the data and metadata, or one item per line as NDJSON, CSV or TSV.",
+        ),
+    ] = "json",
+    all_pages: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            help="Fetch all pages by following the pagination links, writing the items as they arrive.",
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this many items. Implies --all."),
+    ] = None,
+    max_pages: Annotated[
+        int | None,
+        typer.Option("--max-pages", min=1, help="Request at most this many pages. Implies --all."),
+    ] = None,
 ) -> None:
     """List repositories.
 
@@ -134,7 +167,7 @@ def list_command(  # noqa: PLR0913
         repository_type: Filter by repository type: all, owner, public, private, or member.
         sort: Sort by: created, updated, pushed, or full_name.
         direction: Sort direction: asc or desc.
-        per_page: Number of results per page.
+        per_page: Number of results per page. Defaults to 30, or to 100 when all pages are fetched.
         page: Page number for pagination.
         since: Only show repositories updated after this time.
         before: Only show repositories updated before this time.
@@ -143,22 +176,29 @@ def list_command(  # noqa: PLR0913
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the GitHub platform.
+        fields: Comma-separated dotted paths of the fields to output.
+        output_format: Output format: json, ndjson, csv or tsv.
+        all_pages: Fetch all pages by following the pagination links.
+        max_items: Stop after this many items.
+        max_pages: Request at most this many pages.
 
     """
-    import logging  # noqa: PLC0415
-    from typing import Any, cast  # noqa: PLC0415
-
-    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.api import (  # noqa: PLC0415
+        check_single_page_options,
+        execute_api_command,
+        execute_paginated_command,
+        split_fields,
+    )
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
-
-    logger = logging.getLogger("ghnova")
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.utils.pagination import PageCallback  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
         account_name=account_name,
         token=token,
         base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
     affiliation_list = None
     if affiliation:
@@ -169,22 +209,45 @@ def list_command(  # noqa: PLR0913
             raise typer.Exit(code=1)
         affiliation_list = cast(list[Literal["owner", "collaborator", "organization_member"]], affiliation)
 
+    filters: dict[str, Any] = {
+        "owner": owner,
+        "organization": organization,
+        "visibility": visibility,
+        "affiliation": affiliation_list,
+        "repository_type": repository_type,
+        "sort": sort,
+        "direction": direction,
+        "since": since,
+        "before": before,
+    }
+
+    if all_pages or max_items is not None or max_pages is not None:
+        check_single_page_options(page=page, etag=etag, last_modified=last_modified)
+
+        def iterate(on_page: PageCallback) -> Iterator[Any]:
+            with create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False) as client:
+                yield from client.repository.iter_repositories(
+                    **filters,
+                    per_page=100 if per_page is None else per_page,
+                    fields=split_fields(fields),
+                    max_pages=max_pages,
+                    on_page=on_page,
+                )
+
+        execute_paginated_command(
+            iterate=iterate, command_name="ghnova repository list", output_format=output_format, max_items=max_items
+        )
+        return
+
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.repository.list_repositories(
-                owner=owner,
-                organization=organization,
-                visibility=visibility,
-                affiliation=affiliation_list,
-                repository_type=repository_type,
-                sort=sort,
-                direction=direction,
-                per_page=per_page,
+                **filters,
+                per_page=30 if per_page is None else per_page,
                 page=page,
-                since=since,
-                before=before,
                 etag=etag,
                 last_modified=last_modified,
+                fields=split_fields(fields),
             )
 
-    execute_api_command(api_call=api_call, command_name="ghnova repository list")
+    execute_api_command(api_call=api_call, command_name="ghnova repository list", output_format=output_format)
@@ -0,0 +1,25 @@
+"""Search CLI commands for ghnova."""
+
+from __future__ import annotations
+
+import typer
+
+search_app = typer.Typer(
+    name="search",
+    help="Search issues, repositories and users.",
+    rich_markup_mode="rich",
+)
+
+
+def register_commands() -> None:
+    """Register search subcommands."""
+    from ghnova.cli.search.issues import issues_command  # noqa: PLC0415
+    from ghnova.cli.search.repositories import repositories_command  # noqa: PLC0415
+    from ghnova.cli.search.users import users_command  # noqa: PLC0415
+
+    search_app.command(name="issues")(issues_command)
+    search_app.command(name="repositories")(repositories_command)
+    search_app.command(name="users")(users_command)
+
+
+register_commands()
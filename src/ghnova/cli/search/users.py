@@ -0,0 +1,124 @@
+"""Users command for search CLI."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+import typer
+
+
+def users_command(  # noqa: PLR0913
+    ctx: typer.Context,
+    query: Annotated[
+        str,
+        typer.Option(
+            "--query",
+            help="The search query with qualifiers, e.g. 'type:user location:Berlin followers:>100'.",
+        ),
+    ],
+    account_name: Annotated[
+        str | None,
+        typer.Option(
+            "--account-name",
+            help="Name of the account to use for authentication.",
+        ),
+    ] = None,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            help="Token for authentication. If not provided, the token from the specified account will be used.",
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            help="Base URL of the GitHub platform. If not provided, the base URL from the specified account will be used.",
+        ),
+    ] = None,
+    split_by: Annotated[
+        Literal["created"] | None,
+        typer.Option(
+            "--split-by",
+            help="Split the query on this date qualifier to get all results beyond the first 1,000.",
+        ),
+    ] = None,
+    since: Annotated[
+        datetime | None,
+        typer.Option(
+            "--since",
+            help="Start of the date range of a split search (ISO 8601 format). Requires --split-by.",
+        ),
+    ] = None,
+    until: Annotated[
+        datetime | None,
+        typer.Option(
+            "--until",
+            help="End of the date range of a split search (ISO 8601 format). Requires --split-by.",
+        ),
+    ] = None,
+    sort: Annotated[
+        Literal["followers", "repositories", "joined"] | None,
+        typer.Option(
+            "--sort",
+            help="Field to sort the results by. Defaults to best match.",
+        ),
+    ] = None,
+    order: Annotated[
+        Literal["asc", "desc"] | None,
+        typer.Option(
+            "--order",
+            help="Sort order: asc or desc.",
+        ),
+    ] = None,
+    per_page: Annotated[int, typer.Option("--per-page", min=1, max=100, help="Number of results per page.")] = 100,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this many results."),
+    ] = None,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv", "tsv"],
+        typer.Option(
+            "--format",
+            help="Output format: a JSON document with the data and metadata, or one result per line as NDJSON, CSV or TSV.",
+        ),
+    ] = "ndjson",
+) -> None:
+    """Search users.
+
+    Args:
+        ctx: Typer context.
+        query: The search query.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+        split_by: The date qualifier to split the query on.
+        since: Start of the date range of a split search.
+        until: End of the date range of a split search.
+        sort: Field to sort the results by.
+        order: Sort order.
+        per_page: Number of results per page.
+        max_items: Maximum number of results to output.
+        output_format: Output format.
+
+    """
+    from ghnova.cli.search.utils import execute_search  # noqa: PLC0415
+
+    execute_search(
+        ctx=ctx,
+        kind="users",
+        query=query,
+        token=token,
+        base_url=base_url,
+        account_name=account_name,
+        split_by=split_by,
+        since=since,
+        until=until,
+        sort=sort,
+        order=order,
+        per_page=per_page,
+        max_items=max_items,
+        output_format=output_format,
+    )
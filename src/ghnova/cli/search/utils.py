@@ -0,0 +1,78 @@
+"""Utilities shared by the search CLI commands."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, Literal
+
+import typer
+
+from ghnova.search.base import SearchKind, SplitField
+
+
+def execute_search(  # noqa: PLR0913
+    ctx: typer.Context,
+    kind: SearchKind,
+    query: str,
+    token: str | None,
+    base_url: str | None,
+    account_name: str | None = None,
+    split_by: SplitField | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    sort: str | None = None,
+    order: Literal["asc", "desc"] | None = None,
+    per_page: int = 100,
+    max_items: int | None = None,
+    output_format: Literal["json", "ndjson", "csv", "tsv"] = "ndjson",
+) -> None:
+    """Search a kind of resource and stream the results to the output.
+
+    Args:
+        ctx: Typer context.
+        kind: The kind of resource to search.
+        query: The search query.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+        account_name: Name of the account to use for authentication.
+        split_by: The date qualifier to split the query on, to get more results than the cap.
+        since: Start of the date range of a split search.
+        until: End of the date range of a split search.
+        sort: The field to sort the results by.
+        order: The sort order.
+        per_page: The number of results per page.
+        max_items: Maximum number of results to output.
+        output_format: Output format.
+
+    """
+    from ghnova.cli.utils.api import execute_paginated_command  # noqa: PLC0415
+    from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.utils.pagination import PageCallback  # noqa: PLC0415
+
+    token, base_url = get_auth_params(
+        config_path=ctx.obj["config_path"],
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
+    )
+
+    def iterate(on_page: PageCallback) -> Iterator[Any]:
+        with create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False) as client:
+            yield from client.search.iter_search(
+                kind=kind,
+                query=query,
+                split_by=split_by,
+                since=since,
+                until=until,
+                sort=sort,
+                order=order,
+                per_page=per_page,
+                on_page=on_page,
+            )
+
+    execute_paginated_command(
+        iterate=iterate, command_name=f"ghnova search {kind}", output_format=output_format, max_items=max_items
+    )
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+import logging
+from typing import Annotated, Any
 
 import typer
 
+logger = logging.getLogger("ghnova")
+
 
 def contextual_information_command(  # noqa: PLR0913
     ctx: typer.Context,
@@ -64,14 +67,9 @@ def contextual_information_command(  # noqa: PLR0913
         subject_id: The ID of the subject for the hovercard.
 
     """
-    import logging  # noqa: PLC0415
-    from typing import Any  # noqa: PLC0415
-
     from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
-
-    logger = logging.getLogger("ghnova")
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
 
     if username is None:
         logger.error("Username must be provided to retrieve contextual information.")
@@ -82,10 +80,11 @@ def contextual_information_command(  # noqa: PLR0913
         account_name=account_name,
         token=token,
         base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
 
     def api_call() -> tuple[dict[str, Any], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.user.get_contextual_information(
                 username=username,
                 subject_type=subject_type,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 
@@ -66,18 +66,20 @@ def get_command(  # noqa: PLR0913
         last_modified: Last-Modified header from a previous request for caching purposes.
 
     """
-    from typing import Any  # noqa: PLC0415
-
     from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
 
     token, base_url = get_auth_params(
-        config_path=ctx.obj["config_path"], account_name=account_name, token=token, base_url=base_url
+        config_path=ctx.obj["config_path"],
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
 
     def api_call() -> tuple[dict[str, Any], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.user.get_user(
                 username=username, account_id=account_id, etag=etag, last_modified=last_modified
             )
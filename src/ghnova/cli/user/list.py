@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from collections.abc import Iterator
+from typing import Annotated, Any, Literal
 
 import typer
 
@@ -45,19 +46,66 @@ def list_command(  # noqa: D103, PLR0913
         str | None,
         typer.Option("--last-modified", help="Last-Modified header from a previous request for caching purposes."),
     ] = None,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv", "tsv"],
+        typer.Option(
+            "--format",
+            help="Output format: a JSON document with the data and metadata, or one item per line as NDJSON, CSV or TSV.",
+        ),
+    ] = "json",
+    all_pages: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            help="Fetch all pages by following the since cursor of the pagination links, writing the users as they arrive.",
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this many users. Implies --all."),
+    ] = None,
+    max_pages: Annotated[
+        int | None,
+        typer.Option("--max-pages", min=1, help="Request at most this many pages. Implies --all."),
+    ] = None,
 ):
-    from typing import Any  # noqa: PLC0415
 
-    from ghnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from ghnova.cli.utils.api import (  # noqa: PLC0415
+        check_single_page_options,
+        execute_api_command,
+        execute_paginated_command,
+    )
     from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from ghnova.client.github import GitHub  # noqa: PLC0415
+    from ghnova.cli.utils.client import create_client  # noqa: PLC0415
+    from ghnova.utils.pagination import PageCallback  # noqa: PLC0415
 
     token, base_url = get_auth_params(
-        config_path=ctx.obj["config_path"], account_name=account_name, token=token, base_url=base_url
+        config_path=ctx.obj["config_path"],
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+        daemon_socket=ctx.obj.get("daemon_socket"),
     )
 
+    if all_pages or max_items is not None or max_pages is not None:
+        check_single_page_options(etag=etag, last_modified=last_modified)
+
+        def iterate(on_page: PageCallback) -> Iterator[Any]:
+            with create_client(ctx=ctx, token=token, base_url=base_url, use_daemon=False) as client:
+                yield from client.user.iter_users(
+                    since=since,
+                    per_page=100 if per_page is None else per_page,
+                    max_pages=max_pages,
+                    on_page=on_page,
+                )
+
+        execute_paginated_command(
+            iterate=iterate, command_name="ghnova user list", output_format=output_format, max_items=max_items
+        )
+        return
+
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        with GitHub(token=token, base_url=base_url) as client:
+        with create_client(ctx=ctx, token=token, base_url=base_url) as client:
             return client.user.list_users(since=since, per_page=per_page, etag=etag, last_modified=last_modified)
 
-    execute_api_command(api_call=api_call, command_name="ghnova user list")
+    execute_api_command(api_call=api_call, command_name="ghnova user list", output_format=output_format)
@@ -2,7 +2,23 @@
 
 from __future__ import annotations
 
-from ghnova.cli.utils.api import execute_api_command
-from ghnova.cli.utils.auth import get_auth_params
+from typing import TYPE_CHECKING
 
-__all__ = ["execute_api_command", "get_auth_params"]
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.cli.utils.api import execute_api_command
+    from ghnova.cli.utils.auth import get_auth_params
+    from ghnova.cli.utils.client import create_client, get_cache
+
+__all__ = ["create_client", "execute_api_command", "get_auth_params", "get_cache"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "create_client": "ghnova.cli.utils.client",
+        "execute_api_command": "ghnova.cli.utils.api",
+        "get_auth_params": "ghnova.cli.utils.auth",
+        "get_cache": "ghnova.cli.utils.client",
+    },
+)
@@ -2,31 +2,130 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
+import itertools
 import logging
-from collections.abc import Callable
-from typing import Any
+import os
+import sys
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
 
 import typer
 
+if TYPE_CHECKING:
+    from ghnova.cli.utils.output import OutputFormat
+    from ghnova.utils.pagination import PageCallback
+
 logger = logging.getLogger("ghnova")
 
 
 def execute_api_command(
-    api_call: Callable[[], tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]],
+    api_call: Callable[[], tuple[Any, dict[str, Any] | Callable[[], dict[str, Any]]]],
     command_name: str = "Command",
+    output_format: OutputFormat = "json",
 ) -> None:
     """Execute an API command and output results.
 
     Args:
-        api_call: Callable that executes the API call and returns the result.
+        api_call: Callable that executes the API call and returns the data and the metadata. The data can be
+            an iterator over the items, and the metadata a callable called once the items are written.
         command_name: Name of the command for error messages.
+        output_format: Output format: a JSON document with the data and metadata, or the items of the data
+            as newline-delimited JSON, CSV or TSV.
 
     """
+    from ghnova.cli.utils.output import write_items  # noqa: PLC0415
+
     try:
         response_data, metadata = api_call()
 
-        print(json.dumps({"data": response_data, "metadata": metadata}, indent=2, default=str))
+        write_items(response_data, metadata=metadata, output_format=output_format)
+    except BrokenPipeError:
+        # The reader of the output, e.g. head, exited early. Silence the error of the final flush.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise typer.Exit(1) from None
     except Exception as e:
         logger.exception("Error executing %s: %s", command_name, e)
         raise typer.Exit(1) from e
+
+
+def execute_paginated_command(
+    iterate: Callable[[PageCallback], Iterator[Any]],
+    command_name: str = "Command",
+    output_format: OutputFormat = "json",
+    max_items: int | None = None,
+) -> None:
+    """Execute a command listing all pages and stream its items to the output.
+
+    The items are written as they are received, and a progress line is shown on the standard error
+    when it is a terminal.
+
+    Args:
+        iterate: Callable taking the on_page callback and returning an iterator over the items. The iterator
+            is closed once the output is written, so it can hold the client open in a with block.
+        command_name: Name of the command for error messages.
+        output_format: Output format: a JSON document with the data and metadata, or the items as
+            newline-delimited JSON, CSV or TSV.
+        max_items: Maximum number of items to output. If None, all items are output.
+
+    """
+    from ghnova.cli.utils.progress import PageProgress  # noqa: PLC0415
+
+    progress = PageProgress()
+
+    with contextlib.ExitStack() as stack:
+        stack.callback(progress.close)
+
+        def get_metadata() -> dict[str, Any]:
+            progress.close()
+            return progress.metadata
+
+        def api_call() -> tuple[Iterator[Any], Callable[[], dict[str, Any]]]:
+            items: Iterator[Any] = stack.enter_context(contextlib.closing(iterate(progress)))
+            if max_items is not None:
+                items = itertools.islice(items, max_items)
+            # The JSON document holds the items, followed by the metadata of the whole listing.
+            return items, get_metadata
+
+        execute_api_command(api_call=api_call, command_name=command_name, output_format=output_format)
+
+
+def split_fields(fields: str | None) -> list[str] | None:
+    """Split the value of a --fields option.
+
+    Args:
+        fields: Comma-separated dotted field paths, e.g. "number,state,user.login".
+
+    Returns:
+        The field paths, or None if no field is given.
+
+    """
+    if fields is None:
+        return None
+    paths = [path.strip() for path in fields.split(",") if path.strip()]
+    return paths or None
+
+
+def check_single_page_options(
+    page: int | None = None, etag: str | None = None, last_modified: str | None = None
+) -> None:
+    """Reject the options of a single-page request when all pages are fetched.
+
+    Args:
+        page: Value of the --page option, or None if the command has none.
+        etag: Value of the --etag option.
+        last_modified: Value of the --last-modified option.
+
+    Raises:
+        typer.Exit: If --page is not 1, or --etag or --last-modified is given.
+
+    """
+    options = {
+        "--page": page if page is not None and page != 1 else None,
+        "--etag": etag,
+        "--last-modified": last_modified,
+    }
+    given = [option for option, value in options.items() if value is not None]
+    if given:
+        logger.error("%s cannot be combined with --all, --max-items or --max-pages.", ", ".join(given))
+        raise typer.Exit(code=1)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ghnova.config.manager import ConfigManager
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ghnova.config.manager import ConfigManager
 
 logger = logging.getLogger("ghnova")
 
@@ -15,6 +18,7 @@ def get_auth_params(
     account_name: str | None,
     token: str | None,
     base_url: str | None,
+    daemon_socket: Path | str | None = None,
 ) -> tuple[str, str]:
     """Get authentication parameters from CLI context.
 
@@ -23,11 +27,23 @@ def get_auth_params(
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the GitHub platform.
+        daemon_socket: Path of the daemon socket. If the parameters come from the configuration and the
+            daemon is running, the daemon resolves them, so that the configuration is not loaded in-process.
 
     Returns:
         A tuple containing the token and base URL for authentication.
 
     """
+    if daemon_socket is not None and (account_name is not None or token is None or base_url is None):
+        resolved = _get_auth_params_from_daemon(
+            daemon_socket=daemon_socket,
+            config_path=config_path,
+            account_name=account_name,
+            token=token,
+            base_url=base_url,
+        )
+        if resolved is not None:
+            return resolved
     if account_name is not None:
         if token is not None or base_url is not None:
             logger.warning(
@@ -35,15 +51,13 @@ def get_auth_params(
                 account_name,
             )
 
-        config_manager = ConfigManager(filename=config_path)
-        config_manager.load_config()
+        config_manager = _load_config_manager(config_path=config_path)
         account_config = config_manager.get_config(name=account_name)
         token = account_config.token
         base_url = account_config.base_url
         return token, base_url
     if token is None and base_url is None:
-        config_manager = ConfigManager(filename=config_path)
-        config_manager.load_config()
+        config_manager = _load_config_manager(config_path=config_path)
 
         if config_manager.has_default_account():
             account_config = config_manager.get_config(name=None)
@@ -65,3 +79,65 @@ def get_auth_params(
             f"Please provide both token and base_url, or use an account name."
         )
     return token, base_url
+
+
+def _get_auth_params_from_daemon(
+    daemon_socket: Path | str,
+    config_path: Path | str | None,
+    account_name: str | None,
+    token: str | None,
+    base_url: str | None,
+) -> tuple[str, str] | None:
+    """Resolve the authentication parameters with the daemon.
+
+    Args:
+        daemon_socket: Path of the daemon socket.
+        config_path: Path to the configuration file.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+
+    Returns:
+        The token and base URL, or None if the daemon is not running.
+
+    Raises:
+        ValueError: If the daemon cannot resolve the parameters.
+
+    """
+    from ghnova.daemon.protocol import DaemonError, DaemonUnavailableError, send_request  # noqa: PLC0415
+
+    request = {
+        "op": "auth",
+        "config_path": None if config_path is None else str(config_path),
+        "account_name": account_name,
+        "token": token,
+        "base_url": base_url,
+    }
+    try:
+        resolved_token, resolved_base_url = send_request(daemon_socket, request)
+    except DaemonUnavailableError as e:
+        logger.debug("Resolving the authentication parameters in-process: %s", e)
+        return None
+    except DaemonError as e:
+        raise ValueError(str(e)) from e
+    return resolved_token, resolved_base_url
+
+
+def _load_config_manager(config_path: Path | str) -> ConfigManager:
+    """Load the configuration.
+
+    The configuration manager is imported here, so that pydantic is only imported when the
+    token or base URL come from an account.
+
+    Args:
+        config_path: Path to the configuration file.
+
+    Returns:
+        The configuration manager with the configuration loaded.
+
+    """
+    from ghnova.config.manager import ConfigManager  # noqa: PLC0415
+
+    config_manager = ConfigManager(filename=config_path)
+    config_manager.load_config()
+    return config_manager
@@ -0,0 +1,66 @@
+"""Utilities for creating API clients in the CLI."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import typer
+
+if TYPE_CHECKING:
+    from ghnova.cache.sqlite import SQLiteCache
+    from ghnova.client.github import GitHub
+    from ghnova.daemon.client import DaemonClient
+
+
+def get_cache(ctx: typer.Context) -> SQLiteCache | None:
+    """Get the persistent response cache configured for the CLI invocation.
+
+    Args:
+        ctx: Typer context.
+
+    Returns:
+        The SQLite response cache, or None if caching is disabled.
+
+    """
+    from ghnova.cache.sqlite import SQLiteCache  # noqa: PLC0415
+
+    options = ctx.obj or {}
+    if options.get("no_cache"):
+        return None
+    return SQLiteCache(path=options.get("cache_path"))
+
+
+def create_client(ctx: typer.Context, token: str, base_url: str, use_daemon: bool = True) -> GitHub | DaemonClient:
+    """Create a GitHub client backed by the persistent response cache.
+
+    When a daemon socket is configured and exists, the client forwards the calls to the daemon,
+    falling back to in-process calls if the daemon does not answer.
+
+    Args:
+        ctx: Typer context.
+        token: Token for authentication.
+        base_url: Base URL of the GitHub platform.
+        use_daemon: Whether the calls may be forwarded to the daemon. The daemon answers with whole results,
+            so commands streaming the items of many pages run in-process.
+
+    Returns:
+        The GitHub client. It must be used as a context manager.
+
+    """
+    options = ctx.obj or {}
+    daemon_socket = options.get("daemon_socket")
+    if use_daemon and daemon_socket is not None and os.path.exists(daemon_socket):
+        from ghnova.daemon.client import DaemonClient  # noqa: PLC0415
+
+        return DaemonClient(
+            socket_path=daemon_socket,
+            token=token,
+            base_url=base_url,
+            cache_path=options.get("cache_path"),
+            no_cache=bool(options.get("no_cache")),
+        )
+
+    from ghnova.client.github import GitHub  # noqa: PLC0415
+
+    return GitHub(token=token, base_url=base_url, cache=get_cache(ctx))
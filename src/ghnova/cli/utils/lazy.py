@@ -0,0 +1,150 @@
+"""Lazy loading of CLI command groups and of the Rich log handler."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import logging
+from collections.abc import Iterator
+from typing import Any, ClassVar
+
+import click
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group importing the sub-application of a command group only when it is invoked.
+
+    Listing the commands, for the help page or for shell completion, uses the declared help
+    and does not import any sub-application.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, tuple[str, str]]] = {}
+    """Import path ("module:attribute") of the Typer sub-application and help of each command group."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the group.
+
+        Args:
+            **kwargs: Arguments for TyperGroup.
+
+        """
+        super().__init__(**kwargs)
+        self._summaries_only = False
+
+    @contextlib.contextmanager
+    def _listing_summaries(self) -> Iterator[None]:
+        """Serve placeholder commands carrying the declared help instead of loading the command groups."""
+        self._summaries_only = True
+        try:
+            yield
+        finally:
+            self._summaries_only = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List the names of the commands, including the command groups that are not loaded yet.
+
+        Args:
+            ctx: Click context.
+
+        Returns:
+            The command names.
+
+        """
+        loaded = super().list_commands(ctx)
+        return loaded + [name for name in self.lazy_subcommands if name not in loaded]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command, loading its sub-application on first use.
+
+        Args:
+            ctx: Click context.
+            cmd_name: The command name.
+
+        Returns:
+            The command, or None if there is no such command.
+
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_subcommands:
+            return command
+        if self._summaries_only:
+            return TyperGroup(name=cmd_name, help=self.lazy_subcommands[cmd_name][1])
+        return self._load_command(cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Group:
+        """Import the sub-application of a command group and register its command.
+
+        Args:
+            cmd_name: The command name.
+
+        Returns:
+            The command.
+
+        """
+        import typer.main  # noqa: PLC0415
+
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        command = typer.main.get_group(sub_app)
+        self.add_command(command, name=cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Write the help page without loading the command groups.
+
+        Args:
+            ctx: Click context.
+            formatter: Help formatter.
+
+        """
+        with self._listing_summaries():
+            super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[Any]:
+        """Complete the command names without loading the command groups.
+
+        Args:
+            ctx: Click context.
+            incomplete: The incomplete value being completed.
+
+        Returns:
+            The completion items.
+
+        """
+        with self._listing_summaries():
+            return super().shell_complete(ctx, incomplete)
+
+
+class LazyRichHandler(logging.Handler):
+    """Log handler creating a Rich handler when the first record is emitted.
+
+    Importing Rich takes tens of milliseconds, which most commands never need to spend.
+    """
+
+    def __init__(self, level: int | str = logging.NOTSET, **kwargs: Any) -> None:
+        """Initialize the handler.
+
+        Args:
+            level: The logging level.
+            **kwargs: Arguments for rich.logging.RichHandler.
+
+        """
+        super().__init__(level=level)
+        self.kwargs = kwargs
+        self.handler: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record with the Rich handler.
+
+        Args:
+            record: The log record.
+
+        """
+        if self.handler is None:
+            from rich.console import Console  # noqa: PLC0415
+            from rich.logging import RichHandler  # noqa: PLC0415
+
+            self.handler = RichHandler(console=Console(stderr=True), level=self.level, **self.kwargs)
+        self.handler.handle(record)
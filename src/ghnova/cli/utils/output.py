@@ -0,0 +1,152 @@
+"""Output formats of the CLI list commands."""
+
+from __future__ import annotations
+
+import csv
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any, Literal, TextIO
+
+from ghnova.utils.json_codec import dumps
+
+OutputFormat = Literal["json", "ndjson", "csv", "tsv"]
+"""Output formats: a JSON document with data and metadata, one JSON object per line, or delimited rows."""
+
+
+def _to_cell(value: Any) -> Any:
+    """Convert a value to a cell of a delimited row.
+
+    Args:
+        value: The value of a field.
+
+    Returns:
+        The value, with nested objects and lists encoded as JSON and None as an empty cell.
+
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return dumps(value)
+    return value
+
+
+def write_ndjson(items: Iterable[Any], stream: TextIO | None = None) -> int:
+    """Write items as newline-delimited JSON, flushing each line as soon as it is written.
+
+    Args:
+        items: The items. They are consumed one at a time, so an iterator over the pages of a listing
+            is written while later pages are still being fetched.
+        stream: The output stream. Defaults to the standard output.
+
+    Returns:
+        The number of items written.
+
+    """
+    stream = stream or sys.stdout
+    count = 0
+    for item in items:
+        stream.write(dumps(item) + "\n")
+        stream.flush()
+        count += 1
+    return count
+
+
+def write_json(items: Iterable[Any], metadata: Callable[[], dict[str, Any]], stream: TextIO | None = None) -> int:
+    """Write items as a JSON document with the data and metadata, writing each item as soon as it is received.
+
+    The document is the same as the one written for a list of items, so the items are never held in memory
+    together.
+
+    Args:
+        items: The items.
+        metadata: Callable returning the metadata, called once all items are written.
+        stream: The output stream. Defaults to the standard output.
+
+    Returns:
+        The number of items written.
+
+    """
+    stream = stream or sys.stdout
+    count = 0
+    for item in items:
+        stream.write(('{\n  "data": [\n' if count == 0 else ",\n") + _indent(dumps(item, indent=True), 4))
+        stream.flush()
+        count += 1
+    stream.write('{\n  "data": [],\n' if count == 0 else "\n  ],\n")
+    stream.write('  "metadata": ' + _indent(dumps(metadata(), indent=True), 2).lstrip() + "\n}\n")
+    stream.flush()
+    return count
+
+
+def _indent(text: str, width: int) -> str:
+    """Indent each line of a text.
+
+    Args:
+        text: The text.
+        width: The number of spaces.
+
+    Returns:
+        The indented text.
+
+    """
+    prefix = " " * width
+    return "\n".join(prefix + line for line in text.split("\n"))
+
+
+def write_delimited(items: Iterable[Any], delimiter: str = ",", stream: TextIO | None = None) -> int:
+    """Write items as delimited rows with a header.
+
+    The columns are the fields of the first item. Fields missing from later items are left empty and
+    fields that the first item does not have are dropped.
+
+    Args:
+        items: The items, dictionaries or records.
+        delimiter: The delimiter of the cells, "," for CSV and a tab for TSV.
+        stream: The output stream. Defaults to the standard output.
+
+    Returns:
+        The number of items written.
+
+    """
+    stream = stream or sys.stdout
+    writer: csv.DictWriter | None = None
+    count = 0
+    for item in items:
+        row = item if isinstance(item, dict) else item.to_dict()
+        if writer is None:
+            writer = csv.DictWriter(
+                stream, fieldnames=list(row), delimiter=delimiter, extrasaction="ignore", lineterminator="\n"
+            )
+            writer.writeheader()
+        writer.writerow({key: _to_cell(value) for key, value in row.items()})
+        stream.flush()
+        count += 1
+    return count
+
+
+def write_items(
+    data: Any, metadata: dict[str, Any] | Callable[[], dict[str, Any]], output_format: OutputFormat = "json"
+) -> None:
+    """Write the result of a command in an output format.
+
+    Args:
+        data: The items returned by the command, a list or an iterator. A single object is written as one item.
+        metadata: The response metadata, or a callable returning it once the items are written. It is only part
+            of the JSON output.
+        output_format: The output format.
+
+    """
+    if output_format == "json":
+        if not isinstance(data, (list, dict)):
+            write_json(data, metadata=metadata if callable(metadata) else lambda: metadata)
+            return
+        print(dumps({"data": data, "metadata": metadata() if callable(metadata) else metadata}, indent=True))
+        return
+    if isinstance(data, dict):
+        data = [data] if data else []
+    if output_format == "ndjson":
+        write_ndjson(data)
+    elif output_format in ("csv", "tsv"):
+        write_delimited(data, delimiter="," if output_format == "csv" else "\t")
+    else:
+        raise ValueError(f"Unknown output format '{output_format}'.")
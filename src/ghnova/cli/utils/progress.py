@@ -0,0 +1,90 @@
+"""Progress reporting of paginated CLI commands."""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING, Any, TextIO
+
+if TYPE_CHECKING:
+    from ghnova.utils.pagination import PageInfo
+
+
+class PageProgress:
+    """Progress line of a paginated listing, rewritten on the standard error as each page is received.
+
+    Instances are used as the on_page callback of the iter_* methods. The counters are kept even when
+    the line is not displayed, to report them in the metadata of the command.
+    """
+
+    def __init__(self, stream: TextIO | None = None, enabled: bool | None = None) -> None:
+        """Initialize the progress line.
+
+        Args:
+            stream: The stream of the progress line. Defaults to the standard error.
+            enabled: Whether to display the progress line. If None, it is displayed when the stream is a terminal.
+
+        """
+        self.stream = stream or sys.stderr
+        self.enabled = self.stream.isatty() if enabled is None else enabled
+        self.pages = 0
+        self.items = 0
+        self.rate_limit_remaining: int | None = None
+        self.start = time.monotonic()
+
+    def __call__(self, info: PageInfo) -> None:
+        """Record a received page and refresh the progress line.
+
+        Args:
+            info: The progress of the iteration.
+
+        """
+        self.pages = info.page
+        self.items += info.items
+        remaining = info.rate_limit_remaining
+        if remaining is not None:
+            self.rate_limit_remaining = remaining
+        if self.enabled:
+            self.stream.write(f"\r{self.format()}\033[K")
+            self.stream.flush()
+
+    @property
+    def pages_per_second(self) -> float:
+        """Pages received per second since the start of the listing.
+
+        Returns:
+            The page rate.
+
+        """
+        elapsed = time.monotonic() - self.start
+        return self.pages / elapsed if elapsed > 0 else 0.0
+
+    def format(self) -> str:
+        """Format the progress line.
+
+        Returns:
+            The progress line, without line terminator.
+
+        """
+        remaining = "unknown" if self.rate_limit_remaining is None else str(self.rate_limit_remaining)
+        return (
+            f"Pages: {self.pages} | Items: {self.items} | {self.pages_per_second:.1f} pages/s | "
+            f"Rate limit remaining: {remaining}"
+        )
+
+    def close(self) -> None:
+        """End the progress line. Later pages are still counted but no longer displayed."""
+        if self.enabled and self.pages:
+            self.stream.write("\n")
+            self.stream.flush()
+        self.enabled = False
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Metadata of the listing.
+
+        Returns:
+            The number of pages and items received and the remaining rate limit.
+
+        """
+        return {"pages": self.pages, "items": self.items, "rate_limit_remaining": self.rate_limit_remaining}
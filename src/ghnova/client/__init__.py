@@ -2,7 +2,48 @@
 
 from __future__ import annotations
 
-from ghnova.client.async_github import AsyncGitHub
-from ghnova.client.github import GitHub
+from typing import TYPE_CHECKING
 
-__all__ = ["AsyncGitHub", "GitHub"]
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.client.async_github import AsyncGitHub
+    from ghnova.client.async_pooled_github import AsyncPooledGitHub
+    from ghnova.client.batch import BatchResult
+    from ghnova.client.github import GitHub
+    from ghnova.client.pool import PoolConfig
+    from ghnova.client.pooled_github import PooledGitHub
+    from ghnova.client.rate_limit import RateLimitBucket, RateLimitGovernor
+    from ghnova.client.retry import RequestAttempt, RetryPolicy
+    from ghnova.client.token_pool import TokenPool
+
+__all__ = [
+    "AsyncGitHub",
+    "AsyncPooledGitHub",
+    "BatchResult",
+    "GitHub",
+    "PoolConfig",
+    "PooledGitHub",
+    "RateLimitBucket",
+    "RateLimitGovernor",
+    "RequestAttempt",
+    "RetryPolicy",
+    "TokenPool",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncGitHub": "ghnova.client.async_github",
+        "AsyncPooledGitHub": "ghnova.client.async_pooled_github",
+        "BatchResult": "ghnova.client.batch",
+        "GitHub": "ghnova.client.github",
+        "PoolConfig": "ghnova.client.pool",
+        "PooledGitHub": "ghnova.client.pooled_github",
+        "RateLimitBucket": "ghnova.client.rate_limit",
+        "RateLimitGovernor": "ghnova.client.rate_limit",
+        "RequestAttempt": "ghnova.client.retry",
+        "RetryPolicy": "ghnova.client.retry",
+        "TokenPool": "ghnova.client.token_pool",
+    },
+)
@@ -0,0 +1,37 @@
+"""HTTP adapter of the requests sessions of the synchronous clients."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from ghnova.client.pool import SocketOption
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies socket options to the pooled connections."""
+
+    def __init__(self, socket_options: list[SocketOption] | None = None, **kwargs: Any) -> None:
+        """Initialize the adapter.
+
+        Args:
+            socket_options: Socket options set on every new connection.
+            **kwargs: Additional arguments for HTTPAdapter.
+
+        """
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool manager with the socket options.
+
+        Args:
+            *args: Positional arguments for HTTPAdapter.init_poolmanager.
+            **kwargs: Keyword arguments for HTTPAdapter.init_poolmanager.
+
+        """
+        if self.socket_options is not None:
+            kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
@@ -2,31 +2,66 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import functools
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, TypeVar, cast
 
-from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from aiohttp import ClientConnectionError, ClientResponse, ClientSession, ClientTimeout
 
+from ghnova.cache.base import CacheEntry, ResponseCache, make_cache_key
+from ghnova.cache.response import CachedClientResponse
 from ghnova.client.base import Client
+from ghnova.client.batch import BatchResult, ProgressCallback, iter_batch
+from ghnova.client.pool import PoolConfig
+from ghnova.client.rate_limit import RateLimitGovernor
+from ghnova.client.retry import RetryPolicy
+from ghnova.graphql.async_graphql import AsyncGraphQL
 from ghnova.issue.async_issue import AsyncIssue
 from ghnova.pull_request.async_pull_request import AsyncPullRequest
+from ghnova.repository.async_repository import AsyncRepository
+from ghnova.search.async_search import AsyncSearch
 from ghnova.user.async_user import AsyncUser
 
+T = TypeVar("T")
+
 
 class AsyncGitHub(Client):
     """Asynchronous GitHub API client."""
 
-    def __init__(self, token: str | None = None, base_url: str = "https://github.com") -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str | None = None,
+        base_url: str = "https://github.com",
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitGovernor | None = None,
+        retry: RetryPolicy | None = None,
+        pool: PoolConfig | None = None,
+        single_flight: bool = False,
+    ) -> None:
         """Initialize the asynchronous GitHub client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the GitHub instance.
+            cache: Optional response cache for transparent conditional requests.
+            rate_limit: Rate limit governor pacing the requests of the token.
+            retry: Optional retry policy for transient failures.
+            pool: Optional connection pool settings. When None, the defaults of the HTTP library are used.
+            single_flight: Whether identical GET requests in flight at the same time share a single request.
 
         """
-        super().__init__(token=token, base_url=base_url)
+        super().__init__(token=token, base_url=base_url, cache=cache, rate_limit=rate_limit, retry=retry)
+        self.pool = pool
+        self.single_flight = single_flight
+        self._in_flight: dict[str, asyncio.Future[tuple[CacheEntry, str]]] = {}
         self.session: ClientSession | None = None
+        self.graphql = AsyncGraphQL(client=self)
         self.issue = AsyncIssue(client=self)
         self.pull_request = AsyncPullRequest(client=self)
+        self.repository = AsyncRepository(client=self)
+        self.search = AsyncSearch(client=self)
         self.user = AsyncUser(client=self)
 
     def __str__(self) -> str:
@@ -47,7 +82,10 @@ class AsyncGitHub(Client):
         """
         if self.session is not None and not self.session.closed:
             raise RuntimeError("AsyncGitHub session already open; do not re-enter context manager.")
-        self.session = ClientSession(headers=self.headers)
+        if self.pool is not None:
+            self.session = ClientSession(headers=self.headers, connector=self.pool.create_connector())
+        else:
+            self.session = ClientSession(headers=self.headers)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -63,6 +101,51 @@ class AsyncGitHub(Client):
             await self.session.close()
             self.session = None
 
+    def batch(
+        self,
+        factories: Iterable[Callable[[], Awaitable[T]]],
+        concurrency: int = 10,
+        ordered: bool = False,
+        on_progress: ProgressCallback | None = None,
+    ) -> AsyncIterator[BatchResult[T]]:
+        """Run many calls with a concurrency limit, yielding each result as it becomes available.
+
+        Args:
+            factories: Callables returning the coroutine of each item. They are consumed lazily.
+            concurrency: Maximum number of calls running at the same time.
+            ordered: Whether to yield the results in input order instead of as they complete.
+            on_progress: Optional callback invoked with each result, the number of completed items and
+                the total number of items, if known.
+
+        Returns:
+            An asynchronous iterator of the results. Errors are collected per item.
+
+        """
+        return iter_batch(factories, concurrency=concurrency, ordered=ordered, on_progress=on_progress)
+
+    async def run_many(
+        self,
+        factories: Iterable[Callable[[], Awaitable[T]]],
+        concurrency: int = 10,
+        on_progress: ProgressCallback | None = None,
+    ) -> list[BatchResult[T]]:
+        """Run many calls with a concurrency limit and collect their results.
+
+        Args:
+            factories: Callables returning the coroutine of each item.
+            concurrency: Maximum number of calls running at the same time.
+            on_progress: Optional callback invoked with each result, the number of completed items and
+                the total number of items, if known.
+
+        Returns:
+            The results in input order. Errors are collected per item.
+
+        """
+        return [
+            result
+            async for result in iter_batch(factories, concurrency=concurrency, ordered=True, on_progress=on_progress)
+        ]
+
     def _get_session(self, headers: dict | None = None, **kwargs: Any) -> ClientSession:
         """Get or create the aiohttp ClientSession.
 
@@ -88,11 +171,92 @@ class AsyncGitHub(Client):
     ) -> ClientResponse:
         """Make an asynchronous HTTP request to the GitHub API.
 
+        With single-flight enabled, a GET request identical to one already in flight waits for that request
+        and receives a copy of its response instead of sending its own.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            endpoint: The API endpoint.
+            etag: The ETag value for conditional requests.
+            last_modified: The Last-Modified timestamp for conditional requests.
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The HTTP response.
+
+        """
+        send = functools.partial(
+            self._send_request,
+            method=method,
+            endpoint=endpoint,
+            etag=etag,
+            last_modified=last_modified,
+            headers=headers,
+            timeout=timeout,
+            **kwargs,
+        )
+        if not self.single_flight or method.upper() != "GET" or etag or last_modified or self.session is None:
+            return await send()
+
+        key = make_cache_key(
+            method=method,
+            url=self._build_url(endpoint=endpoint),
+            params=kwargs.get("params"),
+            headers={**self.headers, **(headers or {})},
+        )
+        leader = self._in_flight.get(key)
+        if leader is not None:
+            try:
+                entry, url = await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+                # The leading request was cancelled; send this one on its own.
+                return await send()
+            return cast(ClientResponse, CachedClientResponse(entry=entry, url=url))
+
+        future: asyncio.Future[tuple[CacheEntry, str]] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await send()
+            body = await response.read()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved in case no other request is waiting for it.
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+        future.set_result(
+            (
+                CacheEntry.from_response(body=body, headers=response.headers, status_code=response.status),
+                str(response.url),
+            )
+        )
+        return response
+
+    async def _send_request(  # noqa: PLR0913
+        self,
+        method: str,
+        endpoint: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        headers: dict | None = None,
+        timeout: int = 30,
+        **kwargs: Any,
+    ) -> ClientResponse:
+        """Send an asynchronous HTTP request to the GitHub API, retrying it according to the retry policy.
+
         Args:
             method: The HTTP method (GET, POST, etc.).
             endpoint: The API endpoint.
-            etag: str | None = None,
-            last_modified: str | None = None,
+            etag: The ETag value for conditional requests.
+            last_modified: The Last-Modified timestamp for conditional requests.
             headers: Optional headers to include in the request.
             timeout: Request timeout in seconds.
             **kwargs: Additional arguments for the request.
@@ -109,15 +273,65 @@ class AsyncGitHub(Client):
 
         url = self._build_url(endpoint=endpoint)
         conditional_headers = self._get_conditional_request_headers(etag=etag, last_modified=last_modified)
-        request_headers = {**self.headers, **conditional_headers, **(headers or {})}
+        resource = self._get_rate_limit_resource(url=url)
         timeout_obj = ClientTimeout(total=timeout)
-        response = await self.session.request(
-            method=method, url=url, headers=request_headers, timeout=timeout_obj, **kwargs
-        )
+        attempt = 0
+        while True:
+            attempt += 1
+            auth_headers, governor = self._select_credentials(resource=resource)
+            request_headers = {**auth_headers, **conditional_headers, **(headers or {})}
+            cache_key, cached_entry = self._lookup_cache(
+                method=method, url=url, params=kwargs.get("params"), request_headers=request_headers
+            )
+            if cached_entry is not None:
+                request_headers.update(
+                    self._get_conditional_request_headers(
+                        etag=cached_entry.etag, last_modified=cached_entry.last_modified
+                    )
+                )
+            delay = self._reserve_rate_limit(governor=governor, resource=resource)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            started = time.monotonic()
+            try:
+                response = await self.session.request(
+                    method=method, url=url, headers=request_headers, timeout=timeout_obj, **kwargs
+                )
+            except (ClientConnectionError, asyncio.TimeoutError) as error:
+                retry_delay = self._record_attempt(
+                    method=method, url=url, attempt=attempt, started=started, error=error
+                )
+                if retry_delay is None:
+                    raise
+                await asyncio.sleep(retry_delay)
+                continue
+            governor.update(response.headers, resource=resource)
+            retry_delay = self._record_attempt(
+                method=method,
+                url=url,
+                attempt=attempt,
+                started=started,
+                status_code=response.status,
+                headers=response.headers,
+            )
+            if retry_delay is None:
+                break
+            response.release()
+            await asyncio.sleep(retry_delay)
         try:
             response.raise_for_status()
         except Exception:
             response.release()
             raise
 
+        if cache_key is not None:
+            if response.status == 304 and cached_entry is not None:  # noqa: PLR2004
+                response.release()
+                return cast(
+                    ClientResponse,
+                    CachedClientResponse(entry=cached_entry, url=str(response.url), headers=response.headers),
+                )
+            body = await response.read()
+            self._store_cache(key=cache_key, status_code=response.status, body=body, headers=response.headers)
+
         return response
@@ -0,0 +1,56 @@
+"""Asynchronous GitHub API client spreading requests across a pool of tokens."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from ghnova.cache.base import ResponseCache
+from ghnova.client.async_github import AsyncGitHub
+from ghnova.client.pool import PoolConfig
+from ghnova.client.retry import RetryPolicy
+from ghnova.client.token_pool import BasePooledClient, TokenPool
+
+
+class AsyncPooledGitHub(BasePooledClient, AsyncGitHub):
+    """Asynchronous GitHub API client using several tokens of the same GitHub instance.
+
+    Each request is sent with the token that has the most remaining rate limit budget, and rate limited
+    requests are retried with another token. The rate limit governors of the tokens are available in
+    ``token_pool.governors``. Cached responses are kept per token.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        tokens: Sequence[str],
+        base_url: str = "https://github.com",
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        pool: PoolConfig | None = None,
+        threshold: float = 0.2,
+        single_flight: bool = False,
+    ) -> None:
+        """Initialize the asynchronous pooled GitHub client.
+
+        Args:
+            tokens: The API tokens of the pool.
+            base_url: The base URL of the GitHub instance.
+            cache: Optional response cache for transparent conditional requests.
+            retry: Optional retry policy for transient failures.
+            pool: Optional connection pool settings.
+            threshold: Fraction of the limit below which the requests of a token are paced.
+            single_flight: Whether identical GET requests in flight at the same time share a single request.
+
+        """
+        super().__init__(
+            token=None, base_url=base_url, cache=cache, retry=retry, pool=pool, single_flight=single_flight
+        )
+        self.token_pool = TokenPool(tokens=tokens, threshold=threshold)
+
+    def __str__(self) -> str:
+        """Return a string representation of the AsyncPooledGitHub client.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<AsyncPooledGitHub base_url={self.base_url} tokens={len(self.token_pool)}>"
@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+import logging
+import time
 import urllib.parse
+from collections import deque
+from collections.abc import Mapping
 from typing import Any
 
+from ghnova.cache.base import CacheEntry, ResponseCache, make_cache_key
+from ghnova.client.rate_limit import RateLimitGovernor, get_rate_limit_resource
+from ghnova.client.retry import RequestAttempt, RetryPolicy
+
+logger = logging.getLogger("ghnova")
+
 
 class Client:
     """Abstract base class for GitHub clients."""
 
-    def __init__(self, token: str | None, base_url: str) -> None:
+    def __init__(
+        self,
+        token: str | None,
+        base_url: str,
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitGovernor | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
         """Construct the base client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the GitHub instance.
+            cache: Optional response cache. When set, GET responses carrying an ETag or Last-Modified
+                validator are stored and transparently revalidated with conditional requests.
+            rate_limit: Rate limit governor of the token. Defaults to a governor with the default pacing.
+            retry: Optional retry policy for transient failures. When None, failed requests are not retried.
 
         """
         self.token = token
+        self.cache = cache
+        self.rate_limit = rate_limit if rate_limit is not None else RateLimitGovernor()
+        self.retry = retry
+        self.attempts: deque[RequestAttempt] = deque(maxlen=retry.history_size if retry is not None else 1000)
         self.base_url = base_url.rstrip("/")
         self.headers: dict[str, Any] = {}
         if self.token:
@@ -45,16 +70,36 @@ class Client:
         else:
             return f"{self.base_url}/api/v3"
 
+    @property
+    def graphql_url(self) -> str:
+        """Return the URL of the GraphQL API.
+
+        Returns:
+            str: The GraphQL API URL.
+
+        """
+        if urllib.parse.urlparse(self.base_url).netloc == "github.com":
+            return "https://api.github.com/graphql"
+        else:
+            return f"{self.base_url}/api/graphql"
+
     def _build_url(self, endpoint: str) -> str:
         """Construct the full URL for a given endpoint.
 
+        Absolute URLs (e.g. pagination links returned by the API or the GraphQL URL) are used as-is,
+        provided they point to the API of this GitHub instance.
+
         Args:
-            endpoint (str): The API endpoint.
+            endpoint (str): The API endpoint or an absolute API URL.
 
         Returns:
             str: The full URL.
 
         """
+        if endpoint.startswith(("http://", "https://")):
+            if endpoint != self.graphql_url and not endpoint.startswith(f"{self.api_url}/"):
+                raise ValueError(f"URL '{endpoint}' does not belong to the API at {self.api_url}.")
+            return endpoint
         return f"{self.api_url}/{endpoint.lstrip('/')}"
 
     def _get_conditional_request_headers(
@@ -76,3 +121,179 @@ class Client:
         if last_modified:
             headers["If-Modified-Since"] = last_modified
         return headers
+
+    def _lookup_cache(
+        self, method: str, url: str, params: Mapping[str, Any] | None, request_headers: Mapping[str, str]
+    ) -> tuple[str | None, CacheEntry | None]:
+        """Look up the cached response of a request.
+
+        Only GET requests without caller-supplied validators are eligible for caching.
+
+        Args:
+            method: The HTTP method.
+            url: The full request URL.
+            params: The query parameters.
+            request_headers: The request headers.
+
+        Returns:
+            A tuple of the cache key (None if the request is not cacheable) and the cached entry, if any.
+
+        """
+        if self.cache is None or method.upper() != "GET":
+            return None, None
+        if "If-None-Match" in request_headers or "If-Modified-Since" in request_headers:
+            return None, None
+        key = make_cache_key(method=method, url=url, params=params, headers=request_headers)
+        return key, self.cache.get(key)
+
+    def _store_cache(self, key: str, status_code: int, body: bytes, headers: Mapping[str, str]) -> None:
+        """Store a response in the cache if it carries a validator.
+
+        Args:
+            key: The cache key.
+            status_code: The HTTP status code of the response.
+            body: The raw response body.
+            headers: The response headers.
+
+        """
+        if self.cache is None or status_code != 200:  # noqa: PLR2004
+            return
+        entry = CacheEntry.from_response(body=body, headers=headers, status_code=status_code)
+        if entry.etag is None and entry.last_modified is None:
+            return
+        self.cache.set(key, entry)
+
+    def _get_rate_limit_resource(self, url: str) -> str:
+        """Get the rate limit bucket of a request.
+
+        Args:
+            url: The full request URL.
+
+        Returns:
+            The name of the rate limit bucket.
+
+        """
+        if url == self.graphql_url:
+            return "graphql"
+        return get_rate_limit_resource(url.removeprefix(self.api_url))
+
+    def _select_credentials(self, resource: str) -> tuple[dict[str, str], RateLimitGovernor]:
+        """Select the credentials of the next attempt of a request.
+
+        Args:
+            resource: The rate limit bucket of the request.
+
+        Returns:
+            A tuple of the authentication headers and the rate limit governor of the selected token.
+
+        """
+        return self.headers, self.rate_limit
+
+    def _set_rate_limit_cost(self, cost: int, resource: str) -> None:
+        """Set the number of points that each later request of a rate limit bucket spends.
+
+        Args:
+            cost: The number of points.
+            resource: The rate limit bucket.
+
+        """
+        self.rate_limit.set_cost(cost=cost, resource=resource)
+
+    def _reserve_rate_limit(self, governor: RateLimitGovernor, resource: str) -> float:
+        """Reserve a request from the rate limit budget.
+
+        Args:
+            governor: The rate limit governor of the token sending the request.
+            resource: The rate limit bucket of the request.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+
+        """
+        delay = governor.reserve(resource)
+        if delay > 0:
+            bucket = governor.get(resource)
+            remaining = bucket.remaining if bucket is not None else None
+            logger.info("Rate limit '%s' has %s requests remaining; waiting %.2f seconds.", resource, remaining, delay)
+        return delay
+
+    def _get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        """Get the delay before retrying an attempt of a request.
+
+        Args:
+            method: The HTTP method.
+            attempt: The attempt number, starting at 1.
+            status_code: The status code of the response, if any.
+            headers: The response headers, if any.
+            error: The connection error, if the request failed without a response.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the request should not be retried.
+
+        """
+        if self.retry is None:
+            return None
+        failed = error is not None or (status_code is not None and status_code >= 400)  # noqa: PLR2004
+        if not failed:
+            return None
+        return self.retry.get_retry_delay(
+            method=method, attempt=attempt, status_code=status_code, headers=headers, error=error
+        )
+
+    def _record_attempt(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        started: float,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        """Record an attempt of a request and decide whether to retry it.
+
+        Args:
+            method: The HTTP method.
+            url: The full request URL.
+            attempt: The attempt number, starting at 1.
+            started: The monotonic time at which the attempt started.
+            status_code: The status code of the response, if any.
+            headers: The response headers, if any.
+            error: The connection error, if the request failed without a response.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the request should not be retried.
+
+        """
+        elapsed = time.monotonic() - started
+        retry_delay = self._get_retry_delay(
+            method=method, attempt=attempt, status_code=status_code, headers=headers, error=error
+        )
+        self.attempts.append(
+            RequestAttempt(
+                method=method,
+                url=url,
+                attempt=attempt,
+                elapsed=elapsed,
+                status_code=status_code,
+                error=repr(error) if error is not None else None,
+                retry_delay=retry_delay,
+            )
+        )
+        if retry_delay is not None:
+            logger.warning(
+                "%s %s failed (%s) on attempt %d; retrying in %.2f seconds.",
+                method,
+                url,
+                status_code if error is None else type(error).__name__,
+                attempt,
+                retry_delay,
+            )
+        return retry_delay
@@ -0,0 +1,117 @@
+"""Bounded-concurrency execution of many API calls."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sized
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """Outcome of a single item of a batch."""
+
+    index: int
+    """Position of the item in the input."""
+    value: T | None = None
+    """Return value of the call, if it succeeded."""
+    error: BaseException | None = None
+    """Exception raised by the call, if it failed."""
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the call succeeded.
+
+        Returns:
+            True if the call did not raise an exception.
+
+        """
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Return the value of the call, raising its exception if it failed.
+
+        Returns:
+            The return value of the call.
+
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+ProgressCallback = Callable[[BatchResult, int, int | None], None]
+"""Callback receiving each result, the number of completed items and the total number of items, if known."""
+
+
+async def iter_batch(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    concurrency: int = 10,
+    ordered: bool = False,
+    on_progress: ProgressCallback | None = None,
+) -> AsyncIterator[BatchResult[T]]:
+    """Run coroutine factories with a concurrency limit.
+
+    The factories are consumed lazily, so the input can be a generator of any length.
+    An exception raised by a call is collected in its result instead of cancelling the batch.
+
+    Args:
+        factories: Callables returning the coroutine of each item.
+        concurrency: Maximum number of calls running at the same time.
+        ordered: Whether to yield the results in input order instead of as they complete.
+        on_progress: Optional callback invoked as each call completes.
+
+    Yields:
+        The result of each item.
+
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    total = len(factories) if isinstance(factories, Sized) else None
+    items = enumerate(factories)
+    queue: asyncio.Queue[BatchResult[T] | None] = asyncio.Queue(maxsize=concurrency)
+    failures: list[BaseException] = []
+
+    async def worker() -> None:
+        try:
+            for index, factory in items:
+                try:
+                    result = BatchResult(index=index, value=await factory())
+                except Exception as error:
+                    result = BatchResult(index=index, error=error)
+                await queue.put(result)
+        except Exception as error:
+            # The input iterable itself failed.
+            failures.append(error)
+        await queue.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    completed = 0
+    next_index = 0
+    pending: dict[int, BatchResult[T]] = {}
+    try:
+        while running:
+            result = await queue.get()
+            if result is None:
+                running -= 1
+                continue
+            completed += 1
+            if on_progress is not None:
+                on_progress(result, completed, total)
+            if not ordered:
+                yield result
+                continue
+            pending[result.index] = result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+        if failures:
+            raise failures[0]
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -2,34 +2,64 @@
 
 from __future__ import annotations
 
-from typing import Any
+import dataclasses
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, TypeVar
 
 import requests
 from requests import Response
+from requests.structures import CaseInsensitiveDict
 
+from ghnova.cache.base import CacheEntry, ResponseCache
 from ghnova.client.base import Client
+from ghnova.client.batch import BatchResult, ProgressCallback
+from ghnova.client.pool import PoolConfig
+from ghnova.client.rate_limit import RateLimitGovernor
+from ghnova.client.retry import RetryPolicy
+from ghnova.graphql.graphql import GraphQL
 from ghnova.issue.issue import Issue
 from ghnova.pull_request import PullRequest
 from ghnova.repository.repository import Repository
+from ghnova.search.search import Search
 from ghnova.user.user import User
 
+ItemT = TypeVar("ItemT")
+T = TypeVar("T")
+
 
 class GitHub(Client):
     """Synchronous GitHub API client."""
 
-    def __init__(self, token: str | None = None, base_url: str = "https://github.com") -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str | None = None,
+        base_url: str = "https://github.com",
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitGovernor | None = None,
+        retry: RetryPolicy | None = None,
+        pool: PoolConfig | None = None,
+    ) -> None:
         """Initialize the GitHub client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the GitHub instance.
+            cache: Optional response cache for transparent conditional requests.
+            rate_limit: Rate limit governor pacing the requests of the token.
+            retry: Optional retry policy for transient failures.
+            pool: Optional connection pool settings. When None, the defaults of the HTTP library are used.
 
         """
-        super().__init__(token=token, base_url=base_url)
+        super().__init__(token=token, base_url=base_url, cache=cache, rate_limit=rate_limit, retry=retry)
+        self.pool = pool
         self.session: requests.Session | None = None
+        self.graphql = GraphQL(client=self)
         self.issue = Issue(client=self)
         self.pull_request = PullRequest(client=self)
         self.repository = Repository(client=self)
+        self.search = Search(client=self)
         self.user = User(client=self)
 
     def __str__(self) -> str:
@@ -51,6 +81,10 @@ class GitHub(Client):
         if self.session is not None:
             raise RuntimeError("GitHub session already open; do not re-enter context manager.")
         self.session = requests.Session()
+        if self.pool is not None:
+            adapter = self.pool.create_adapter()
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -66,6 +100,78 @@ class GitHub(Client):
             self.session.close()
             self.session = None
 
+    def map(
+        self,
+        fn: Callable[[ItemT], T],
+        items: Iterable[ItemT],
+        max_workers: int = 8,
+        on_progress: ProgressCallback | None = None,
+    ) -> list[BatchResult[T]]:
+        """Call a function on many items in parallel threads sharing the session of the client.
+
+        The connection pool of the session is enlarged to at least max_workers connections, so that
+        the threads do not wait for each other's connections.
+
+        Args:
+            fn: The function to call on each item, e.g. ``lambda n: client.issue.get_issue("o", "r", n)``.
+            items: The items.
+            max_workers: Maximum number of threads.
+            on_progress: Optional callback invoked with each result, the number of completed items and
+                the total number of items.
+
+        Returns:
+            The results in input order. Errors are collected per item.
+
+        """
+        if self.session is None:
+            raise RuntimeError(
+                "GitHub must be used as a context manager. "
+                + "Use 'with GitHub(...) as client:' to ensure proper resource cleanup."
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._ensure_pool_size(size=max_workers)
+
+        def call(index: int, item: ItemT) -> BatchResult[T]:
+            try:
+                return BatchResult(index=index, value=fn(item))
+            except Exception as error:
+                return BatchResult(index=index, error=error)
+
+        items = list(items)
+        results: list[BatchResult[T]] = [BatchResult(index=index) for index in range(len(items))]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ghnova") as executor:
+            futures = [executor.submit(call, index, item) for index, item in enumerate(items)]
+            try:
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    result = future.result()
+                    results[result.index] = result
+                    if on_progress is not None:
+                        on_progress(result, completed, len(items))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
+    def _ensure_pool_size(self, size: int) -> None:
+        """Enlarge the connection pool of the session to at least the given size.
+
+        Args:
+            size: The minimum number of pooled connections per host.
+
+        """
+        if self.session is None:
+            return
+        adapter = self.session.get_adapter(f"{self.api_url}/")
+        if getattr(adapter, "_pool_maxsize", 0) >= size:
+            return
+        config = dataclasses.replace(self.pool or PoolConfig(), max_connections=size, max_connections_per_host=0)
+        new_adapter = config.create_adapter()
+        self.session.mount("https://", new_adapter)
+        self.session.mount("http://", new_adapter)
+        adapter.close()
+
     def _request(  # noqa: PLR0913
         self,
         method: str,
@@ -98,12 +204,83 @@ class GitHub(Client):
             )
         url = self._build_url(endpoint=endpoint)
         conditional_headers = self._get_conditional_request_headers(etag=etag, last_modified=last_modified)
-        request_headers = {**self.headers, **conditional_headers, **(headers or {})}
-        response = self.session.request(method, url, headers=request_headers, timeout=timeout, **kwargs)
+        resource = self._get_rate_limit_resource(url=url)
+        attempt = 0
+        while True:
+            attempt += 1
+            auth_headers, governor = self._select_credentials(resource=resource)
+            request_headers = {**auth_headers, **conditional_headers, **(headers or {})}
+            cache_key, cached_entry = self._lookup_cache(
+                method=method, url=url, params=kwargs.get("params"), request_headers=request_headers
+            )
+            if cached_entry is not None:
+                request_headers.update(
+                    self._get_conditional_request_headers(
+                        etag=cached_entry.etag, last_modified=cached_entry.last_modified
+                    )
+                )
+            delay = self._reserve_rate_limit(governor=governor, resource=resource)
+            if delay > 0:
+                time.sleep(delay)
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, headers=request_headers, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                retry_delay = self._record_attempt(
+                    method=method, url=url, attempt=attempt, started=started, error=error
+                )
+                if retry_delay is None:
+                    raise
+                time.sleep(retry_delay)
+                continue
+            governor.update(response.headers, resource=resource)
+            retry_delay = self._record_attempt(
+                method=method,
+                url=url,
+                attempt=attempt,
+                started=started,
+                status_code=response.status_code,
+                headers=response.headers,
+            )
+            if retry_delay is None:
+                break
+            response.close()
+            time.sleep(retry_delay)
         try:
             response.raise_for_status()
         except Exception:
             response.close()
             raise
 
+        if cache_key is not None:
+            if response.status_code == 304 and cached_entry is not None:  # noqa: PLR2004
+                response.close()
+                return self._replay_cached_response(entry=cached_entry, not_modified=response)
+            self._store_cache(
+                key=cache_key, status_code=response.status_code, body=response.content, headers=response.headers
+            )
+
+        return response
+
+    def _replay_cached_response(self, entry: CacheEntry, not_modified: Response) -> Response:
+        """Build a response from a cache entry revalidated by a 304 Not Modified response.
+
+        Args:
+            entry: The cache entry.
+            not_modified: The 304 Not Modified response. Its headers take precedence over the cached ones.
+
+        Returns:
+            A response carrying the cached body.
+
+        """
+        response = Response()
+        response.status_code = entry.status_code
+        response._content = entry.body
+        response.headers = CaseInsensitiveDict(entry.headers)
+        for key, value in not_modified.headers.items():
+            if key.lower() != "content-length":
+                response.headers[key] = value
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.encoding = "utf-8"
         return response
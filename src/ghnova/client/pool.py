@@ -0,0 +1,105 @@
+"""Connection pool configuration of the GitHub clients."""
+
+from __future__ import annotations
+
+import socket
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiohttp import TCPConnector
+
+    from ghnova.client.adapter import PooledHTTPAdapter
+
+SocketOption = tuple[int, int, int]
+"""Socket option as a tuple of level, option name and value."""
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings shared by the synchronous and asynchronous clients.
+
+    The settings map onto ``requests.adapters.HTTPAdapter`` for GitHub and onto ``aiohttp.TCPConnector``
+    for AsyncGitHub. The keep-alive timeout and the DNS cache only apply to AsyncGitHub,
+    since urllib3 has neither.
+    """
+
+    max_connections: int = 100
+    """Maximum number of connections in the pool."""
+    max_connections_per_host: int = 0
+    """Maximum number of connections to the same host. 0 means no limit other than max_connections."""
+    block: bool = False
+    """Whether GitHub waits for a free connection instead of opening a temporary one when the pool is full."""
+    keepalive_timeout: float = 15.0
+    """Seconds an idle connection is kept open for reuse."""
+    dns_cache_ttl: int | None = 10
+    """Seconds resolved addresses are cached. None caches them forever."""
+    tcp_keepalive: bool = True
+    """Whether to enable TCP keepalive probes on the connections."""
+    tcp_keepalive_idle: int = 60
+    """Seconds a connection is idle before the first keepalive probe, where the platform supports it."""
+
+    def __post_init__(self) -> None:
+        """Validate the configuration."""
+        if self.max_connections < 1:
+            raise ValueError("max_connections must be at least 1.")
+        if self.max_connections_per_host < 0:
+            raise ValueError("max_connections_per_host must not be negative.")
+
+    def get_socket_options(self) -> list[SocketOption]:
+        """Get the socket options of new connections.
+
+        Returns:
+            A list of (level, option, value) tuples.
+
+        """
+        options: list[SocketOption] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if self.tcp_keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle))
+        return options
+
+    def create_adapter(self) -> PooledHTTPAdapter:
+        """Create the HTTP adapter of a requests session.
+
+        Returns:
+            An HTTP adapter sized according to the configuration.
+
+        """
+        from ghnova.client.adapter import PooledHTTPAdapter  # noqa: PLC0415
+
+        return PooledHTTPAdapter(
+            socket_options=self.get_socket_options(),
+            pool_maxsize=self.max_connections_per_host or self.max_connections,
+            pool_block=self.block,
+        )
+
+    def create_connector(self) -> TCPConnector:
+        """Create the connector of an aiohttp session.
+
+        Must be called from a running event loop.
+
+        Returns:
+            A TCP connector sized according to the configuration.
+
+        """
+        from aiohttp import TCPConnector  # noqa: PLC0415
+
+        socket_options = self.get_socket_options()
+
+        def socket_factory(addr_info: tuple[Any, ...]) -> socket.socket:
+            family, type_, proto, _, _ = addr_info
+            sock = socket.socket(family=family, type=type_, proto=proto)
+            for level, option, value in socket_options:
+                sock.setsockopt(level, option, value)
+            return sock
+
+        return TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            socket_factory=socket_factory,
+        )
@@ -0,0 +1,195 @@
+"""Client-side pacing based on the rate limit headers returned by the GitHub API."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+
+@dataclass
+class RateLimitBucket:
+    """State of a rate limit bucket (e.g. core, search, graphql) of a token."""
+
+    resource: str
+    """Name of the rate limit bucket."""
+    limit: int
+    """Maximum number of requests allowed in the window."""
+    remaining: int
+    """Number of requests remaining in the window."""
+    reset: float
+    """Time at which the window resets, in seconds since the epoch."""
+    next_request_at: float = 0.0
+    """Earliest time at which the next paced request may be sent."""
+
+
+def _parse_int(value: object) -> int | None:
+    """Parse an integer header value.
+
+    Args:
+        value: The raw header value.
+
+    Returns:
+        The integer value, or None if the header is missing or malformed.
+
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def get_rate_limit_resource(endpoint: str) -> str:
+    """Guess the rate limit bucket of an endpoint before the API has reported it.
+
+    Args:
+        endpoint: The API endpoint, relative to the API root.
+
+    Returns:
+        The name of the rate limit bucket.
+
+    """
+    path = endpoint.lstrip("/").split("?", 1)[0]
+    if path == "graphql":
+        return "graphql"
+    if path.startswith("search/code"):
+        return "code_search"
+    if path.startswith("search/"):
+        return "search"
+    return "core"
+
+
+class RateLimitGovernor:
+    """Track the rate limit budget of a token and pace requests to avoid exhausting it.
+
+    The budget of each bucket is updated from the ``X-RateLimit-*`` headers of every response.
+    Once the remaining budget drops below ``threshold`` of the limit, the remaining requests are
+    spread evenly over the time left until the window resets. When the budget is exhausted,
+    requests wait for the reset instead of failing.
+    """
+
+    def __init__(self, threshold: float = 0.2, enabled: bool = True, reset_margin: float = 1.0) -> None:
+        """Initialize the governor.
+
+        Args:
+            threshold: Fraction of the limit below which requests are paced.
+            enabled: Whether to pace requests. When False, the budget is only tracked.
+            reset_margin: Extra seconds to wait after the reset time when the budget is exhausted.
+
+        """
+        if not 0 <= threshold <= 1:
+            raise ValueError("threshold must be between 0 and 1.")
+        self.threshold = threshold
+        self.enabled = enabled
+        self.reset_margin = reset_margin
+        self._buckets: dict[str, RateLimitBucket] = {}
+        self._costs: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the governor.
+
+        Returns:
+            str: String representation.
+
+        """
+        buckets = ", ".join(f"{b.resource}={b.remaining}/{b.limit}" for b in self.buckets.values())
+        return f"<RateLimitGovernor {buckets}>"
+
+    @property
+    def buckets(self) -> dict[str, RateLimitBucket]:
+        """Return a snapshot of the known rate limit buckets.
+
+        Returns:
+            A dictionary mapping bucket names to copies of their state.
+
+        """
+        with self._lock:
+            return {name: dataclasses.replace(bucket) for name, bucket in self._buckets.items()}
+
+    def get(self, resource: str = "core") -> RateLimitBucket | None:
+        """Get a snapshot of a rate limit bucket.
+
+        Args:
+            resource: The name of the bucket.
+
+        Returns:
+            A copy of the bucket state, or None if no response for this bucket has been seen yet.
+
+        """
+        with self._lock:
+            bucket = self._buckets.get(resource)
+            return dataclasses.replace(bucket) if bucket is not None else None
+
+    def update(self, headers: Mapping[str, str], resource: str = "core") -> None:
+        """Update the budget from the headers of a response.
+
+        Args:
+            headers: The response headers.
+            resource: The bucket to update when the response does not report its bucket.
+
+        """
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        reset = _parse_int(headers.get("X-RateLimit-Reset"))
+        if limit is None or remaining is None or reset is None:
+            return
+        reported_resource = headers.get("X-RateLimit-Resource")
+        if isinstance(reported_resource, str) and reported_resource:
+            resource = reported_resource
+        with self._lock:
+            bucket = self._buckets.get(resource)
+            if bucket is None:
+                self._buckets[resource] = RateLimitBucket(
+                    resource=resource, limit=limit, remaining=remaining, reset=float(reset)
+                )
+                return
+            if bucket.reset == reset:
+                # Responses of concurrent requests can arrive out of order; the budget only decreases within a window.
+                remaining = min(bucket.remaining, remaining)
+            bucket.limit = limit
+            bucket.remaining = remaining
+            bucket.reset = float(reset)
+
+    def set_cost(self, cost: int, resource: str = "core") -> None:
+        """Set the number of points that each later request of a bucket spends.
+
+        GraphQL queries spend a variable number of points of the graphql bucket. The cost reported by the
+        last query is the best estimate of the cost of the next ones.
+
+        Args:
+            cost: The number of points, at least 1.
+            resource: The name of the bucket.
+
+        """
+        with self._lock:
+            self._costs[resource] = max(1, cost)
+
+    def reserve(self, resource: str = "core", now: float | None = None) -> float:
+        """Reserve a request from the budget of a bucket.
+
+        Args:
+            resource: The name of the bucket.
+            now: The current time in seconds since the epoch. Defaults to the system time.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(resource)
+            if not self.enabled or bucket is None or bucket.reset <= now:
+                return 0.0
+            cost = self._costs.get(resource, 1)
+            if bucket.remaining < cost:
+                return bucket.reset - now + self.reset_margin
+            start = max(now, bucket.next_request_at)
+            bucket.remaining -= cost
+            if bucket.remaining < bucket.limit * self.threshold:
+                bucket.next_request_at = start + (bucket.reset - start) / (bucket.remaining // cost + 1)
+            return start - now
@@ -0,0 +1,166 @@
+"""Retry policy for transient failures of GitHub API requests."""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""Status codes retried by default."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""HTTP methods retried by default."""
+
+
+@dataclass(frozen=True)
+class RequestAttempt:
+    """Record of a single attempt of a request."""
+
+    method: str
+    """The HTTP method."""
+    url: str
+    """The request URL."""
+    attempt: int
+    """The attempt number, starting at 1."""
+    elapsed: float
+    """Duration of the attempt in seconds."""
+    status_code: int | None = None
+    """Status code of the response, or None if the request failed without a response."""
+    error: str | None = None
+    """Description of the connection error, if any."""
+    retry_delay: float | None = None
+    """Seconds waited before the next attempt, or None if the request was not retried."""
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse the value of a Retry-After header.
+
+    Args:
+        value: The header value, either a number of seconds or an HTTP date.
+        now: The current time in seconds since the epoch. Defaults to the system time.
+
+    Returns:
+        The number of seconds to wait, or None if the header is missing or malformed.
+
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+@dataclass
+class RetryPolicy:
+    """Policy for retrying requests that failed for transient reasons.
+
+    Responses with a retryable status code, secondary rate limit responses (403 with a Retry-After header or
+    an exhausted budget) and connection errors are retried. The delay honors the Retry-After and
+    X-RateLimit-Reset headers and otherwise uses exponential backoff with full jitter.
+    """
+
+    max_attempts: int = 3
+    """Maximum number of attempts, including the first one."""
+    backoff_factor: float = 0.5
+    """Upper bound of the first backoff in seconds. The bound doubles with each attempt."""
+    max_backoff: float = 60.0
+    """Maximum backoff in seconds."""
+    max_retry_after: float = 300.0
+    """Maximum delay in seconds requested by the server that is honored. Longer delays are not retried."""
+    statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
+    """Status codes to retry."""
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+    """HTTP methods to retry."""
+    retry_connection_errors: bool = True
+    """Whether to retry requests that failed without a response."""
+    history_size: int = 1000
+    """Number of attempts kept in the history of the client."""
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+    """Random number generator used for the jitter."""
+
+    def __post_init__(self) -> None:
+        """Validate the policy."""
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if self.backoff_factor < 0 or self.max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative.")
+        self.methods = frozenset(method.upper() for method in self.methods)
+
+    def get_backoff(self, attempt: int) -> float:
+        """Get the backoff before the next attempt.
+
+        Args:
+            attempt: The number of the attempt that failed.
+
+        Returns:
+            A random delay between zero and the exponential backoff bound.
+
+        """
+        return self.rng.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    def is_retryable_status(self, status_code: int, headers: Mapping[str, str] | None = None) -> bool:
+        """Check whether a response status is retryable.
+
+        Args:
+            status_code: The status code of the response.
+            headers: The response headers.
+
+        Returns:
+            True if the response should be retried.
+
+        """
+        if status_code in self.statuses:
+            return True
+        if status_code == 403 and headers is not None:  # noqa: PLR2004
+            return "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+        return False
+
+    def get_retry_delay(  # noqa: PLR0913
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        error: BaseException | None = None,
+        now: float | None = None,
+    ) -> float | None:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            method: The HTTP method.
+            attempt: The number of the attempt that failed.
+            status_code: The status code of the response, if any.
+            headers: The response headers, if any.
+            error: The connection error, if the request failed without a response.
+            now: The current time in seconds since the epoch. Defaults to the system time.
+
+        Returns:
+            The number of seconds to wait before the next attempt, or None if the request should not be retried.
+
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return None
+        if error is not None:
+            return self.get_backoff(attempt) if self.retry_connection_errors else None
+        if status_code is None or not self.is_retryable_status(status_code, headers):
+            return None
+        headers = headers or {}
+        delay = parse_retry_after(headers.get("Retry-After"), now=now)
+        if delay is None and headers.get("X-RateLimit-Remaining") == "0":
+            reset = headers.get("X-RateLimit-Reset")
+            if isinstance(reset, str) and reset.isdigit():
+                delay = max(0.0, int(reset) - (time.time() if now is None else now))
+        if delay is None:
+            return self.get_backoff(attempt)
+        if delay > self.max_retry_after:
+            return None
+        return delay
@@ -0,0 +1,221 @@
+"""Pool of API tokens sharing the requests of a client."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ghnova.client.rate_limit import RateLimitGovernor
+
+PooledClientT = TypeVar("PooledClientT", bound="BasePooledClient")
+
+
+class TokenPool:
+    """Tokens of the same GitHub instance, each with its own rate limit governor.
+
+    Each request is sent with the token that has the most remaining budget in the rate limit bucket of the
+    request. Tokens whose budget is not known yet are tried first, in turn. Exhausted tokens are only used
+    once every token is exhausted, starting with the one that resets first.
+    """
+
+    def __init__(self, tokens: Sequence[str], threshold: float = 0.2) -> None:
+        """Initialize the token pool.
+
+        Args:
+            tokens: The API tokens. Duplicates are ignored.
+            threshold: Fraction of the limit below which the requests of a token are paced.
+
+        """
+        unique_tokens = list(dict.fromkeys(token for token in tokens if token))
+        if not unique_tokens:
+            raise ValueError("At least one token is required.")
+        self.governors: dict[str, RateLimitGovernor] = {
+            token: RateLimitGovernor(threshold=threshold) for token in unique_tokens
+        }
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of tokens in the pool.
+
+        Returns:
+            int: The number of tokens.
+
+        """
+        return len(self.governors)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the token pool.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<TokenPool tokens={len(self)}>"
+
+    @property
+    def tokens(self) -> list[str]:
+        """Return the tokens of the pool.
+
+        Returns:
+            The tokens, in the order they were given.
+
+        """
+        return list(self.governors)
+
+    def _score(self, governor: RateLimitGovernor, resource: str, now: float) -> tuple[int, float]:
+        """Rank a token for a request.
+
+        Args:
+            governor: The rate limit governor of the token.
+            resource: The rate limit bucket of the request.
+            now: The current time in seconds since the epoch.
+
+        Returns:
+            A sortable score; higher is better.
+
+        """
+        bucket = governor.get(resource)
+        if bucket is None or bucket.reset <= now:
+            return 1, math.inf
+        if bucket.remaining > 0:
+            return 1, bucket.remaining
+        return 0, -bucket.reset
+
+    def select(self, resource: str = "core", now: float | None = None) -> tuple[str, RateLimitGovernor]:
+        """Select the token for the next request.
+
+        Args:
+            resource: The rate limit bucket of the request.
+            now: The current time in seconds since the epoch. Defaults to the system time.
+
+        Returns:
+            A tuple of the selected token and its rate limit governor.
+
+        """
+        now = time.time() if now is None else now
+        tokens = self.tokens
+        with self._lock:
+            offset = self._offset
+            self._offset = (self._offset + 1) % len(tokens)
+        best_token = tokens[offset]
+        best_score = self._score(self.governors[best_token], resource, now)
+        for index in range(1, len(tokens)):
+            token = tokens[(offset + index) % len(tokens)]
+            score = self._score(self.governors[token], resource, now)
+            if score > best_score:
+                best_token, best_score = token, score
+        return best_token, self.governors[best_token]
+
+    def has_budget(self, resource: str = "core", now: float | None = None) -> bool:
+        """Check whether any token has budget left in a rate limit bucket.
+
+        Args:
+            resource: The rate limit bucket.
+            now: The current time in seconds since the epoch. Defaults to the system time.
+
+        Returns:
+            True if at least one token is not exhausted.
+
+        """
+        now = time.time() if now is None else now
+        return any(self._score(governor, resource, now)[0] > 0 for governor in self.governors.values())
+
+
+class BasePooledClient:
+    """Mixin spreading the requests of a GitHub client across a pool of tokens."""
+
+    token_pool: TokenPool
+
+    def _select_credentials(self, resource: str) -> tuple[dict[str, str], RateLimitGovernor]:
+        """Select the token with the most remaining budget.
+
+        Args:
+            resource: The rate limit bucket of the request.
+
+        Returns:
+            A tuple of the authentication headers and the rate limit governor of the selected token.
+
+        """
+        token, governor = self.token_pool.select(resource)
+        return {"Authorization": f"Bearer {token}"}, governor
+
+    def _set_rate_limit_cost(self, cost: int, resource: str) -> None:
+        """Set the number of points that each later request of a rate limit bucket spends, for every token.
+
+        Args:
+            cost: The number of points.
+            resource: The rate limit bucket.
+
+        """
+        for governor in self.token_pool.governors.values():
+            governor.set_cost(cost=cost, resource=resource)
+
+    def _get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        """Retry rate limited requests right away with another token, if one has budget left.
+
+        Args:
+            method: The HTTP method.
+            attempt: The attempt number, starting at 1.
+            status_code: The status code of the response, if any.
+            headers: The response headers, if any.
+            error: The connection error, if the request failed without a response.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the request should not be retried.
+
+        """
+        if (
+            status_code in (403, 429)
+            and headers is not None
+            and headers.get("X-RateLimit-Remaining") == "0"
+            and attempt < len(self.token_pool)
+            and self.token_pool.has_budget(headers.get("X-RateLimit-Resource") or "core")
+        ):
+            return 0.0
+        return super()._get_retry_delay(  # type: ignore[misc]
+            method=method, attempt=attempt, status_code=status_code, headers=headers, error=error
+        )
+
+    @classmethod
+    def from_accounts(
+        cls: type[PooledClientT],
+        names: Sequence[str] | None = None,
+        config_path: Path | str | None = None,
+        **kwargs: Any,
+    ) -> PooledClientT:
+        """Create a pooled client from the accounts of the configuration.
+
+        Args:
+            names: Names of the accounts. Defaults to all configured accounts.
+            config_path: Path to the configuration file. Defaults to the user configuration.
+            **kwargs: Additional arguments for the client.
+
+        Returns:
+            A client using the tokens of the accounts.
+
+        """
+        from ghnova.config.manager import ConfigManager  # noqa: PLC0415
+
+        config_manager = ConfigManager(filename=config_path)
+        names = list(config_manager.config.accounts) if names is None else list(names)
+        accounts = [config_manager.get_config(name=name) for name in names]
+        if not accounts:
+            raise ValueError("No accounts are configured.")
+        base_urls = {account.base_url for account in accounts}
+        if len(base_urls) > 1:
+            raise ValueError(f"All accounts of a token pool must share the same base URL, got {sorted(base_urls)}.")
+        return cls(  # type: ignore[call-arg]
+            tokens=[account.token for account in accounts], base_url=base_urls.pop(), **kwargs
+        )
@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from ghnova.config.manager import ConfigManager
-from ghnova.config.model import AccountConfig, Config
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.config.manager import ConfigManager
+    from ghnova.config.model import AccountConfig, Config
 
 __all__ = ["AccountConfig", "Config", "ConfigManager"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AccountConfig": "ghnova.config.model",
+        "Config": "ghnova.config.model",
+        "ConfigManager": "ghnova.config.manager",
+    },
+)
@@ -0,0 +1,43 @@
+"""Background daemon keeping warm clients, response caches and rate limit state for the CLI."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.daemon.client import DaemonClient, is_daemon_running
+    from ghnova.daemon.protocol import (
+        DaemonError,
+        DaemonTimeoutError,
+        DaemonUnavailableError,
+        get_default_socket_path,
+        send_request,
+    )
+    from ghnova.daemon.server import DaemonServer
+
+__all__ = [
+    "DaemonClient",
+    "DaemonError",
+    "DaemonServer",
+    "DaemonTimeoutError",
+    "DaemonUnavailableError",
+    "get_default_socket_path",
+    "is_daemon_running",
+    "send_request",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "DaemonClient": "ghnova.daemon.client",
+        "DaemonError": "ghnova.daemon.protocol",
+        "DaemonServer": "ghnova.daemon.server",
+        "DaemonTimeoutError": "ghnova.daemon.protocol",
+        "DaemonUnavailableError": "ghnova.daemon.protocol",
+        "get_default_socket_path": "ghnova.daemon.protocol",
+        "is_daemon_running": "ghnova.daemon.client",
+        "send_request": "ghnova.daemon.protocol",
+    },
+)
@@ -0,0 +1,201 @@
+"""Client forwarding API calls to the ghnova daemon."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ghnova.daemon.protocol import (
+    RESOURCES,
+    DaemonError,
+    DaemonTimeoutError,
+    DaemonUnavailableError,
+    get_default_socket_path,
+    send_request,
+)
+
+if TYPE_CHECKING:
+    from ghnova.client.github import GitHub
+
+logger = logging.getLogger("ghnova")
+
+_READ_ONLY_PREFIXES = ("get_", "list_", "iter_", "search")
+"""Prefixes of the methods that only read, and can run again in-process if the daemon does not answer."""
+
+
+def is_daemon_running(socket_path: Path | str | None = None, timeout: float = 1.0) -> bool:
+    """Check whether the daemon answers on a socket.
+
+    Args:
+        socket_path: Path of the socket. If None, the default socket path is used.
+        timeout: Timeout of the check in seconds.
+
+    Returns:
+        True if the daemon answered a ping.
+
+    """
+    socket_path = socket_path or get_default_socket_path()
+    if socket_path is None:
+        return False
+    try:
+        send_request(socket_path, {"op": "ping"}, timeout=timeout, connect_timeout=timeout)
+    except (DaemonUnavailableError, OSError):
+        return False
+    return True
+
+
+class _RemoteResource:
+    """Proxy of a resource of the warm client of the daemon."""
+
+    def __init__(self, client: DaemonClient, name: str) -> None:
+        """Initialize the proxy.
+
+        Args:
+            client: The daemon client.
+            name: The name of the resource, e.g. "issue".
+
+        """
+        self._client = client
+        self._name = name
+
+    def __getattr__(self, method: str) -> Any:
+        """Get a function calling a method of the resource.
+
+        Args:
+            method: The method name.
+
+        Returns:
+            A function taking the keyword arguments of the method.
+
+        """
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def call(**kwargs: Any) -> Any:
+            return self._client.call(self._name, method, **kwargs)
+
+        return call
+
+
+class DaemonClient:
+    """Stand-in for the GitHub client forwarding the calls of the CLI to the daemon.
+
+    If the daemon cannot be reached, the calls run in-process on a GitHub client created on first
+    use, so commands work the same with or without a daemon.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | str,
+        token: str,
+        base_url: str,
+        cache_path: str | None = None,
+        no_cache: bool = False,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Path of the daemon socket.
+            token: Token for authentication.
+            base_url: Base URL of the GitHub platform.
+            cache_path: Path to the HTTP response cache database.
+            no_cache: Whether to disable the response cache.
+
+        """
+        self.socket_path = Path(socket_path)
+        self.token = token
+        self.base_url = base_url
+        self.cache_path = cache_path
+        self.no_cache = no_cache
+        self._fallback: GitHub | None = None
+
+    def __enter__(self) -> DaemonClient:
+        """Enter the context manager.
+
+        Returns:
+            The daemon client.
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the context manager, closing the in-process client if one was created.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        if self._fallback is not None:
+            self._fallback.__exit__(exc_type, exc_val, exc_tb)
+            self._fallback = None
+
+    def __getattr__(self, name: str) -> _RemoteResource:
+        """Get the proxy of a resource.
+
+        Args:
+            name: The name of the resource.
+
+        Returns:
+            The proxy.
+
+        """
+        if name not in RESOURCES:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return _RemoteResource(client=self, name=name)
+
+    def call(self, resource: str, method: str, **kwargs: Any) -> Any:
+        """Call a method of a resource.
+
+        The call runs in-process if the daemon cannot be reached, and also if it does not answer in time
+        and the method only reads.
+
+        Args:
+            resource: The name of the resource, e.g. "issue".
+            method: The method name, e.g. "list_issues".
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            The result of the method.
+
+        """
+        if self._fallback is None:
+            try:
+                return send_request(
+                    self.socket_path,
+                    {
+                        "op": "call",
+                        "token": self.token,
+                        "base_url": self.base_url,
+                        "cache_path": self.cache_path,
+                        "no_cache": self.no_cache,
+                        "resource": resource,
+                        "method": method,
+                        "kwargs": kwargs,
+                    },
+                )
+            except DaemonTimeoutError as e:
+                if not method.startswith(_READ_ONLY_PREFIXES):
+                    # The daemon may have applied the change, so running it again could apply it twice.
+                    raise DaemonError(f"{e} The outcome of {resource}.{method} is unknown.") from e
+                logger.warning("Running in-process: %s", e)
+                self._fallback = self._create_fallback()
+            except DaemonUnavailableError as e:
+                logger.debug("Running in-process: %s", e)
+                self._fallback = self._create_fallback()
+        return getattr(getattr(self._fallback, resource), method)(**kwargs)
+
+    def _create_fallback(self) -> GitHub:
+        """Create and open the in-process GitHub client.
+
+        Returns:
+            The open GitHub client.
+
+        """
+        from ghnova.cache.sqlite import SQLiteCache  # noqa: PLC0415
+        from ghnova.client.github import GitHub  # noqa: PLC0415
+
+        cache = None if self.no_cache else SQLiteCache(path=self.cache_path)
+        return GitHub(token=self.token, base_url=self.base_url, cache=cache).__enter__()
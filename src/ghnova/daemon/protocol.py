@@ -0,0 +1,223 @@
+"""Wire protocol between the CLI and the ghnova daemon."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import stat
+import tempfile
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import platformdirs
+
+logger = logging.getLogger("ghnova")
+
+CONNECT_TIMEOUT = 1.0
+"""Seconds to wait for the daemon to accept a connection."""
+
+READ_TIMEOUT = 60.0
+"""Seconds to wait for the daemon to answer a request."""
+
+RESOURCES = frozenset({"graphql", "issue", "pull_request", "repository", "search", "user"})
+"""Resources of the client that can be called through the daemon."""
+
+
+class DaemonUnavailableError(ConnectionError):
+    """The daemon is not running or cannot be reached."""
+
+
+class DaemonTimeoutError(DaemonUnavailableError):
+    """The daemon accepted a request but did not answer it in time."""
+
+
+class DaemonError(RuntimeError):
+    """An error raised by the daemon while handling a request."""
+
+    def __init__(self, message: str, error_type: str | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            message: The error message.
+            error_type: The name of the exception class raised in the daemon.
+
+        """
+        super().__init__(message, error_type)
+        self.message = message
+        self.error_type = error_type
+
+    def __str__(self) -> str:
+        """Return the error message.
+
+        Returns:
+            The error message, without the name of the exception class.
+
+        """
+        return self.message
+
+
+def get_default_socket_path() -> Path | None:
+    """Get the default path of the daemon socket.
+
+    Returns:
+        The socket path given by the GHNOVA_DAEMON_SOCKET environment variable, or a path in the user
+        runtime directory. None if there is no private runtime directory and platformdirs falls back
+        to the temporary directory, where another user could create the socket first.
+
+    """
+    path = os.getenv("GHNOVA_DAEMON_SOCKET")
+    if path:
+        return Path(path)
+    with warnings.catch_warnings(record=True) as caught:
+        # platformdirs warns when XDG_RUNTIME_DIR is not set or not private and falls back to another directory.
+        warnings.simplefilter("always")
+        runtime_dir = Path(platformdirs.user_runtime_dir(appname="ghnova"))
+    if caught and runtime_dir.is_relative_to(Path(tempfile.gettempdir()).resolve()):
+        logger.debug("Not using the ghnova daemon: %s", caught[0].message)
+        return None
+    return runtime_dir / "daemon.sock"
+
+
+def check_socket_path(socket_path: Path | str) -> None:
+    """Check that a daemon socket and its directory are private to the current user.
+
+    The requests carry tokens, so they are only sent to a socket that another user could not have
+    created or opened.
+
+    Args:
+        socket_path: Path of the daemon socket.
+
+    Raises:
+        DaemonUnavailableError: If the socket does not exist, or it or its directory is not owned by
+            the current user or is accessible to other users.
+
+    """
+    path = Path(socket_path)
+    if not hasattr(os, "getuid"):
+        return
+    for candidate, kind, is_kind in ((path.parent, "directory", stat.S_ISDIR), (path, "socket", stat.S_ISSOCK)):
+        try:
+            status = candidate.lstat()
+        except OSError as e:
+            raise DaemonUnavailableError(f"The ghnova daemon is not reachable at {path}: {e}") from e
+        if not is_kind(status.st_mode) or status.st_uid != os.getuid() or status.st_mode & 0o077:
+            message = (
+                f"Ignoring the ghnova daemon at {path}: its {kind} must be owned by the current user "
+                "and not accessible to other users."
+            )
+            logger.warning(message)
+            raise DaemonUnavailableError(message)
+
+
+def _default(obj: Any) -> Any:
+    """Encode the values that JSON does not support.
+
+    Args:
+        obj: The value.
+
+    Returns:
+        A JSON-serializable representation of the value.
+
+    """
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def _object_hook(obj: dict[str, Any]) -> Any:
+    """Decode the values encoded by _default.
+
+    Args:
+        obj: The decoded JSON object.
+
+    Returns:
+        The decoded value.
+
+    """
+    if len(obj) == 1 and "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """Encode a message as a line of JSON.
+
+    Args:
+        message: The message.
+
+    Returns:
+        The encoded message, terminated by a newline.
+
+    """
+    return json.dumps(message, default=_default).encode() + b"\n"
+
+
+def decode_message(line: bytes) -> dict[str, Any]:
+    """Decode a line of JSON.
+
+    Args:
+        line: The encoded message.
+
+    Returns:
+        The message.
+
+    """
+    message = json.loads(line, object_hook=_object_hook)
+    if not isinstance(message, dict):
+        raise ValueError("A daemon message must be a JSON object.")
+    return message
+
+
+def send_request(
+    socket_path: Path | str,
+    request: dict[str, Any],
+    timeout: float | None = READ_TIMEOUT,
+    connect_timeout: float | None = CONNECT_TIMEOUT,
+) -> Any:
+    """Send a request to the daemon and wait for its result.
+
+    Args:
+        socket_path: Path of the daemon socket. It must be private to the current user.
+        request: The request. Its "op" key names the operation.
+        timeout: Timeout in seconds for sending the request and receiving the response. None waits indefinitely.
+        connect_timeout: Timeout in seconds for connecting to the daemon. None waits indefinitely.
+
+    Returns:
+        The result of the request.
+
+    Raises:
+        DaemonUnavailableError: If the daemon cannot be reached or its socket is not private.
+        DaemonTimeoutError: If the daemon did not answer in time.
+        DaemonError: If the daemon failed to handle the request.
+
+    """
+    check_socket_path(socket_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(connect_timeout)
+    try:
+        try:
+            sock.connect(str(socket_path))
+        except OSError as e:
+            raise DaemonUnavailableError(f"The ghnova daemon is not reachable at {socket_path}: {e}") from e
+        sock.settimeout(timeout)
+        try:
+            sock.sendall(encode_message(request))
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        except TimeoutError as e:
+            raise DaemonTimeoutError(f"The ghnova daemon at {socket_path} did not answer within {timeout} s.") from e
+    finally:
+        sock.close()
+    if not line:
+        raise DaemonError("The ghnova daemon closed the connection without a response.")
+    response = decode_message(line)
+    error = response.get("error")
+    if error is not None:
+        raise DaemonError(error.get("message", "Unknown daemon error."), error_type=error.get("type"))
+    return response.get("result")
@@ -0,0 +1,274 @@
+"""Daemon keeping warm GitHub clients for the CLI."""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import logging
+import os
+import socketserver
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ghnova.daemon.protocol import (
+    RESOURCES,
+    DaemonUnavailableError,
+    decode_message,
+    encode_message,
+    get_default_socket_path,
+    send_request,
+)
+
+if TYPE_CHECKING:
+    from ghnova.cache.sqlite import SQLiteCache
+    from ghnova.client.github import GitHub
+
+logger = logging.getLogger("ghnova")
+
+ClientKey = tuple[str, str, str | None, bool]
+"""Token, base URL, cache path and whether caching is disabled."""
+
+
+def _to_serializable(value: Any) -> Any:
+    """Convert the result of a call to values that the protocol can encode.
+
+    Args:
+        value: The result.
+
+    Returns:
+        The result with records converted to dictionaries and iterators to lists.
+
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [_to_serializable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_serializable(item) for key, item in value.items()}
+    if inspect.isgenerator(value):
+        return [_to_serializable(item) for item in value]
+    return value
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handler of a connection to the daemon, carrying a single request."""
+
+    server: DaemonServer
+
+    def handle(self) -> None:
+        """Read the request and write its result or error."""
+        line = self.rfile.readline()
+        if not line:
+            return
+        self.server.touch()
+        try:
+            response = {"result": self.server.dispatch(decode_message(line))}
+        except Exception as e:
+            logger.debug("Daemon request failed: %s", e)
+            response = {"error": {"type": type(e).__name__, "message": str(e)}}
+        self.wfile.write(encode_message(response))
+        self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Server answering the requests of the CLI over a UNIX domain socket.
+
+    The server keeps one open GitHub client per token, base URL and cache settings, so that the
+    connections, the response caches and the rate limit state of each account stay warm between
+    CLI invocations.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = False
+
+    def __init__(self, socket_path: Path | str | None = None, idle_timeout: float | None = None) -> None:
+        """Initialize the server and bind its socket.
+
+        Args:
+            socket_path: Path of the socket. If None, the default socket path is used.
+            idle_timeout: Seconds without requests after which serve_forever returns. None serves
+                until a shutdown request.
+
+        """
+        if socket_path is None:
+            socket_path = get_default_socket_path()
+            if socket_path is None:
+                raise RuntimeError(
+                    "There is no private runtime directory for the ghnova daemon socket. "
+                    "Set XDG_RUNTIME_DIR or give the socket path."
+                )
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self.last_request = time.monotonic()
+        self._clients: dict[ClientKey, GitHub] = {}
+        self._caches: dict[str | None, SQLiteCache] = {}
+        self._lock = threading.Lock()
+        self._stopping = False
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self._check_directory()
+        if self.socket_path.exists():
+            try:
+                send_request(self.socket_path, {"op": "ping"}, timeout=1.0)
+            except DaemonUnavailableError:
+                # Stale socket left by a daemon that did not exit cleanly.
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"A ghnova daemon is already running at {self.socket_path}.")
+        # Create the socket without permissions for other users, rather than restricting them after bind.
+        umask = os.umask(0o077)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, 0o600)
+
+    def _check_directory(self) -> None:
+        """Check that the directory of the socket is private to the current user.
+
+        Raises:
+            RuntimeError: If the directory is not owned by the current user or is accessible to other users.
+
+        """
+        if not hasattr(os, "getuid"):
+            return
+        status = self.socket_path.parent.lstat()
+        if not stat.S_ISDIR(status.st_mode) or status.st_uid != os.getuid() or status.st_mode & 0o077:
+            raise RuntimeError(
+                f"The directory of the daemon socket {self.socket_path.parent} must be owned by the current user "
+                "with mode 0o700."
+            )
+
+    def touch(self) -> None:
+        """Record the time of the latest request."""
+        self.last_request = time.monotonic()
+
+    def stop(self) -> None:
+        """Make serve_forever return, without waiting for it."""
+        if not self._stopping:
+            self._stopping = True
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def service_actions(self) -> None:
+        """Stop serving once the server has been idle for longer than the idle timeout."""
+        if self.idle_timeout is not None and time.monotonic() - self.last_request > self.idle_timeout:
+            if not self._stopping:
+                logger.info("Stopping the ghnova daemon after %s seconds without requests.", self.idle_timeout)
+            self.stop()
+
+    def dispatch(self, request: dict[str, Any]) -> Any:
+        """Handle a request.
+
+        Args:
+            request: The request.
+
+        Returns:
+            The result of the request.
+
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"pid": os.getpid(), "clients": len(self._clients)}
+        if op == "shutdown":
+            self.stop()
+            return {"pid": os.getpid()}
+        if op == "auth":
+            return self._auth(request)
+        if op == "call":
+            return self._call(request)
+        raise ValueError(f"Unknown daemon operation '{op}'.")
+
+    @staticmethod
+    def _auth(request: dict[str, Any]) -> list[str]:
+        """Resolve the token and base URL of a CLI invocation.
+
+        Args:
+            request: The request, carrying the arguments of get_auth_params.
+
+        Returns:
+            The token and base URL.
+
+        """
+        from ghnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+
+        token, base_url = get_auth_params(
+            config_path=request.get("config_path"),
+            account_name=request.get("account_name"),
+            token=request.get("token"),
+            base_url=request.get("base_url"),
+        )
+        return [token, base_url]
+
+    def _call(self, request: dict[str, Any]) -> Any:
+        """Call a method of a resource of a warm client.
+
+        Args:
+            request: The request, carrying the client settings, the resource, the method and its
+                keyword arguments.
+
+        Returns:
+            The result of the method.
+
+        """
+        resource = request.get("resource")
+        method = request.get("method")
+        if resource not in RESOURCES:
+            raise ValueError(f"Unknown resource '{resource}'.")
+        if not isinstance(method, str) or method.startswith("_"):
+            raise ValueError(f"Unknown method '{method}' of resource '{resource}'.")
+        client = self.get_client(
+            token=request["token"],
+            base_url=request["base_url"],
+            cache_path=request.get("cache_path"),
+            no_cache=bool(request.get("no_cache")),
+        )
+        function = getattr(getattr(client, resource), method, None)
+        if not callable(function):
+            raise ValueError(f"Unknown method '{method}' of resource '{resource}'.")
+        return _to_serializable(function(**request.get("kwargs", {})))
+
+    def get_client(self, token: str, base_url: str, cache_path: str | None, no_cache: bool) -> GitHub:
+        """Get the warm client of an account, creating it on first use.
+
+        Args:
+            token: Token for authentication.
+            base_url: Base URL of the GitHub platform.
+            cache_path: Path to the HTTP response cache database.
+            no_cache: Whether to disable the response cache.
+
+        Returns:
+            The open GitHub client.
+
+        """
+        from ghnova.cache.sqlite import SQLiteCache  # noqa: PLC0415
+        from ghnova.client.github import GitHub  # noqa: PLC0415
+
+        key = (token, base_url, cache_path, no_cache)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                cache = None
+                if not no_cache:
+                    cache = self._caches.get(cache_path)
+                    if cache is None:
+                        cache = self._caches[cache_path] = SQLiteCache(path=cache_path)
+                client = GitHub(token=token, base_url=base_url, cache=cache)
+                client.__enter__()
+                self._clients[key] = client
+            return client
+
+    def server_close(self) -> None:
+        """Close the clients, the caches and the socket."""
+        super().server_close()
+        with self._lock:
+            for client in self._clients.values():
+                client.__exit__(None, None, None)
+            for cache in self._caches.values():
+                cache.close()
+            self._clients.clear()
+            self._caches.clear()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
@@ -0,0 +1,23 @@
+"""GitHub GraphQL API module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.graphql.async_graphql import AsyncGraphQL
+    from ghnova.graphql.base import GraphQLError
+    from ghnova.graphql.graphql import GraphQL
+
+__all__ = ["AsyncGraphQL", "GraphQL", "GraphQLError"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncGraphQL": "ghnova.graphql.async_graphql",
+        "GraphQL": "ghnova.graphql.graphql",
+        "GraphQLError": "ghnova.graphql.base",
+    },
+)
@@ -0,0 +1,102 @@
+"""Asynchronous GitHub GraphQL API."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+from aiohttp import ClientResponse, ClientResponseError
+
+from ghnova.graphql.base import BaseGraphQL
+from ghnova.resource.async_resource import AsyncResource
+from ghnova.utils.response import process_async_response_with_last_modified
+
+
+class AsyncGraphQL(AsyncResource, BaseGraphQL):
+    """Asynchronous GitHub GraphQL API."""
+
+    def _record_query_cost(self, payload: Any) -> None:
+        """Pace the later queries of the client by the cost of a query.
+
+        Args:
+            payload: The JSON body of the response.
+
+        """
+        cost = self._get_query_cost(payload)
+        if cost is not None:
+            self.client._set_rate_limit_cost(cost=cost, resource="graphql")
+
+    async def _execute(self, query: str, variables: dict[str, Any] | None = None, **kwargs: Any) -> ClientResponse:
+        """Execute a GraphQL query.
+
+        Args:
+            query: The GraphQL query.
+            variables: The variables of the query.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            ClientResponse object containing the result of the query.
+
+        """
+        body, updated_kwargs = self._execute_helper(query=query, variables=variables, **kwargs)
+        return await self._post(endpoint=self.client.graphql_url, json=body, **updated_kwargs)
+
+    async def execute(
+        self, query: str, variables: dict[str, Any] | None = None, **kwargs: Any
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Execute a GraphQL query.
+
+        Args:
+            query: The GraphQL query.
+            variables: The variables of the query.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing the data of the response and a dictionary with metadata including status_code.
+
+        """
+        response = await self._execute(query=query, variables=variables, **kwargs)
+        payload, status_code, _, _ = await process_async_response_with_last_modified(response)
+        self._record_query_cost(payload)
+        return self._check_payload(payload), {"status_code": status_code}
+
+    async def get_issues_batch(
+        self, items: Sequence[tuple[str, str, int]], batch_size: int = 50, **kwargs: Any
+    ) -> list[dict[str, Any] | None]:
+        """Get many issues or pull requests with a few aliased GraphQL queries.
+
+        Batches that exceed the node limit or time out are split in half and retried.
+
+        Args:
+            items: Tuples of repository owner, repository name and issue number.
+            batch_size: The maximum number of lookups per query (at most 100).
+            **kwargs: Additional arguments for the requests.
+
+        Returns:
+            The issues in the order of the items, shaped like the REST API, with None for issues that
+            do not exist or are not accessible.
+
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        batches = deque(self._get_batch_ranges(count=len(items), batch_size=batch_size))
+        while batches:
+            start, end = batches.popleft()
+            query, variables = self._build_issues_batch_query(items[start:end])
+            try:
+                response = await self._execute(query=query, variables=variables, **kwargs)
+            except ClientResponseError as error:
+                status_code = error.status
+                if not self._should_split(size=end - start, status_code=status_code):
+                    raise
+                middle = (start + end) // 2
+                batches.extendleft([(middle, end), (start, middle)])
+                continue
+            payload, _, _, _ = await process_async_response_with_last_modified(response)
+            self._record_query_cost(payload)
+            if self._should_split(size=end - start, payload=payload):
+                middle = (start + end) // 2
+                batches.extendleft([(middle, end), (start, middle)])
+                continue
+            results[start:end] = self._parse_issues_batch(payload=payload, count=end - start)
+        return results
@@ -0,0 +1,296 @@
+"""Base class for the GitHub GraphQL API."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger("ghnova")
+
+MAX_BATCH_SIZE = 100
+"""Maximum number of lookups combined into a single aliased query."""
+
+_SPLIT_ERROR_TYPES = frozenset({"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED", "TIMEOUT"})
+"""GraphQL error types indicating that a batched query should be split."""
+
+_SPLIT_STATUS_CODES = frozenset({502, 504})
+"""HTTP status codes returned when a query times out on the server."""
+
+_COMMON_FIELDS = """
+    id
+    databaseId
+    number
+    title
+    body
+    state
+    locked
+    url
+    createdAt
+    updatedAt
+    closedAt
+    author { login avatarUrl url ... on User { databaseId } ... on Bot { databaseId } }
+    labels(first: 20) { nodes { id name color description } }
+    assignees(first: 10) { nodes { login databaseId avatarUrl url } }
+    milestone { number title state }
+    comments { totalCount }
+"""
+
+ISSUE_FIELDS_FRAGMENT = f"""
+fragment IssueFields on Issue {{{_COMMON_FIELDS}    stateReason
+}}
+fragment PullRequestFields on PullRequest {{{_COMMON_FIELDS}    mergedAt
+}}
+"""
+"""Fragments selecting the fields needed to shape issues and pull requests like the REST API."""
+
+
+class GraphQLError(Exception):
+    """Error returned by the GitHub GraphQL API."""
+
+    def __init__(self, errors: list[dict[str, Any]], data: dict[str, Any] | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            errors: The errors of the GraphQL response.
+            data: The partial data of the GraphQL response, if any.
+
+        """
+        super().__init__(errors, data)
+        self.errors = errors
+        self.data = data
+
+    def __str__(self) -> str:
+        """Return the messages of the errors.
+
+        Returns:
+            The messages of the errors separated by semicolons.
+
+        """
+        messages = "; ".join(str(error.get("message", error)) for error in self.errors)
+        return messages or "GraphQL request failed."
+
+
+def _to_rest_user(node: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Shape a GraphQL actor like a REST user.
+
+    Args:
+        node: The GraphQL actor.
+
+    Returns:
+        The user dictionary, or None if there is no actor.
+
+    """
+    if not node:
+        return None
+    return {
+        "login": node.get("login"),
+        "id": node.get("databaseId"),
+        "avatar_url": node.get("avatarUrl"),
+        "html_url": node.get("url"),
+    }
+
+
+def to_rest_issue(node: dict[str, Any]) -> dict[str, Any]:
+    """Shape a GraphQL issue or pull request like the REST issue representation.
+
+    Labels have no numeric ID in the GraphQL API, so their id is None and their node_id holds the global ID.
+
+    Args:
+        node: The GraphQL issue or pull request selected with the IssueFields or PullRequestFields fragment.
+
+    Returns:
+        The issue dictionary.
+
+    """
+    assignees = [_to_rest_user(assignee) for assignee in (node.get("assignees") or {}).get("nodes") or []]
+    milestone = node.get("milestone")
+    state_reason = node.get("stateReason")
+    issue = {
+        "id": node.get("databaseId"),
+        "node_id": node.get("id"),
+        "number": node.get("number"),
+        "title": node.get("title"),
+        "body": node.get("body"),
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "state_reason": state_reason.lower() if state_reason else None,
+        "locked": node.get("locked"),
+        "html_url": node.get("url"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "comments": (node.get("comments") or {}).get("totalCount", 0),
+        "user": _to_rest_user(node.get("author")),
+        "labels": [
+            {
+                "id": None,
+                "node_id": label.get("id"),
+                "name": label.get("name"),
+                "color": label.get("color"),
+                "description": label.get("description"),
+            }
+            for label in (node.get("labels") or {}).get("nodes") or []
+        ],
+        "assignee": assignees[0] if assignees else None,
+        "assignees": assignees,
+        "milestone": (
+            {"number": milestone.get("number"), "title": milestone.get("title"), "state": milestone["state"].lower()}
+            if milestone
+            else None
+        ),
+    }
+    if node.get("__typename") == "PullRequest":
+        issue["pull_request"] = {"html_url": node.get("url"), "merged_at": node.get("mergedAt")}
+    return issue
+
+
+class BaseGraphQL:
+    """Base class for the GitHub GraphQL API."""
+
+    def _execute_helper(
+        self, query: str, variables: dict[str, Any] | None = None, **kwargs: Any
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Get the request body and arguments of a GraphQL query.
+
+        Args:
+            query: The GraphQL query.
+            variables: The variables of the query.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing the request body and the request arguments.
+
+        """
+        body: dict[str, Any] = {"query": query}
+        if variables:
+            body["variables"] = variables
+        default_headers = {"Accept": "application/vnd.github+json"}
+        headers = kwargs.get("headers", {})
+        kwargs["headers"] = {**default_headers, **headers}
+        return body, kwargs
+
+    def _check_payload(self, payload: dict[str, Any] | list[Any]) -> dict[str, Any]:
+        """Raise the errors of a GraphQL response.
+
+        Args:
+            payload: The JSON body of the response.
+
+        Returns:
+            The data of the response.
+
+        """
+        if not isinstance(payload, dict):
+            raise GraphQLError(errors=[{"message": "Unexpected GraphQL response."}])
+        errors = payload.get("errors") or []
+        if errors:
+            raise GraphQLError(errors=errors, data=payload.get("data"))
+        return payload.get("data") or {}
+
+    def _get_query_cost(self, payload: Any) -> int | None:
+        """Get the rate limit cost reported in the body of a GraphQL response.
+
+        Args:
+            payload: The JSON body of the response.
+
+        Returns:
+            The number of points the query spent, or None if the query did not select rateLimit { cost }.
+
+        """
+        data = payload.get("data") if isinstance(payload, dict) else None
+        rate_limit = data.get("rateLimit") if isinstance(data, dict) else None
+        cost = rate_limit.get("cost") if isinstance(rate_limit, dict) else None
+        return cost if isinstance(cost, int) else None
+
+    def _build_issues_batch_query(self, items: Sequence[tuple[str, str, int]]) -> tuple[str, dict[str, Any]]:
+        """Build an aliased query looking up several issues or pull requests.
+
+        Args:
+            items: Tuples of repository owner, repository name and issue number.
+
+        Returns:
+            A tuple containing the query and its variables.
+
+        """
+        declarations: list[str] = []
+        selections: list[str] = []
+        variables: dict[str, Any] = {}
+        for index, (owner, repository, number) in enumerate(items):
+            declarations.append(f"$owner{index}: String!, $name{index}: String!, $number{index}: Int!")
+            selections.append(
+                f"  i{index}: repository(owner: $owner{index}, name: $name{index}) {{\n"
+                f"    issueOrPullRequest(number: $number{index}) {{ __typename ...IssueFields ...PullRequestFields }}\n"
+                "  }"
+            )
+            variables.update({f"owner{index}": owner, f"name{index}": repository, f"number{index}": number})
+        query = (
+            f"query({', '.join(declarations)}) {{\n"
+            + "\n".join(selections)
+            + "\n  rateLimit { cost remaining }\n}\n"
+            + ISSUE_FIELDS_FRAGMENT
+        )
+        return query, variables
+
+    def _parse_issues_batch(self, payload: dict[str, Any] | list[Any], count: int) -> list[dict[str, Any] | None]:
+        """Extract the issues of a batched lookup.
+
+        Args:
+            payload: The JSON body of the response.
+            count: The number of lookups in the query.
+
+        Returns:
+            The issues in lookup order, with None for issues that do not exist or are not accessible.
+
+        """
+        if not isinstance(payload, dict):
+            raise GraphQLError(errors=[{"message": "Unexpected GraphQL response."}])
+        data = payload.get("data") or {}
+        errors = [error for error in payload.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+        if errors:
+            raise GraphQLError(errors=errors, data=data)
+        rate_limit = data.get("rateLimit") or {}
+        logger.debug(
+            "GraphQL batch of %d lookups cost %s points; %s remaining.",
+            count,
+            rate_limit.get("cost"),
+            rate_limit.get("remaining"),
+        )
+        issues: list[dict[str, Any] | None] = []
+        for index in range(count):
+            node = (data.get(f"i{index}") or {}).get("issueOrPullRequest")
+            issues.append(to_rest_issue(node) if node else None)
+        return issues
+
+    def _should_split(self, size: int, status_code: int | None = None, payload: Any = None) -> bool:
+        """Check whether a failed batched query should be retried in smaller parts.
+
+        Args:
+            size: The number of lookups in the query.
+            status_code: The HTTP status code of the failed request, if any.
+            payload: The JSON body of the response, if any.
+
+        Returns:
+            True if the batch has more than one lookup and failed because it was too large.
+
+        """
+        if size <= 1:
+            return False
+        if status_code in _SPLIT_STATUS_CODES:
+            return True
+        if isinstance(payload, dict):
+            return any(error.get("type") in _SPLIT_ERROR_TYPES for error in payload.get("errors") or [])
+        return False
+
+    def _get_batch_ranges(self, count: int, batch_size: int) -> list[tuple[int, int]]:
+        """Split lookups into batches.
+
+        Args:
+            count: The number of lookups.
+            batch_size: The maximum number of lookups per batch.
+
+        Returns:
+            The start and end index of each batch.
+
+        """
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}.")
+        return [(start, min(start + batch_size, count)) for start in range(0, count, batch_size)]
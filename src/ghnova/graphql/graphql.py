@@ -0,0 +1,103 @@
+"""Synchronous GitHub GraphQL API."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+import requests
+from requests import Response
+
+from ghnova.graphql.base import BaseGraphQL
+from ghnova.resource.resource import Resource
+from ghnova.utils.response import process_response_with_last_modified
+
+
+class GraphQL(Resource, BaseGraphQL):
+    """Synchronous GitHub GraphQL API."""
+
+    def _record_query_cost(self, payload: Any) -> None:
+        """Pace the later queries of the client by the cost of a query.
+
+        Args:
+            payload: The JSON body of the response.
+
+        """
+        cost = self._get_query_cost(payload)
+        if cost is not None:
+            self.client._set_rate_limit_cost(cost=cost, resource="graphql")
+
+    def _execute(self, query: str, variables: dict[str, Any] | None = None, **kwargs: Any) -> Response:
+        """Execute a GraphQL query.
+
+        Args:
+            query: The GraphQL query.
+            variables: The variables of the query.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            Response object containing the result of the query.
+
+        """
+        body, updated_kwargs = self._execute_helper(query=query, variables=variables, **kwargs)
+        return self._post(endpoint=self.client.graphql_url, json=body, **updated_kwargs)
+
+    def execute(
+        self, query: str, variables: dict[str, Any] | None = None, **kwargs: Any
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Execute a GraphQL query.
+
+        Args:
+            query: The GraphQL query.
+            variables: The variables of the query.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing the data of the response and a dictionary with metadata including status_code.
+
+        """
+        response = self._execute(query=query, variables=variables, **kwargs)
+        payload, status_code, _, _ = process_response_with_last_modified(response)
+        self._record_query_cost(payload)
+        return self._check_payload(payload), {"status_code": status_code}
+
+    def get_issues_batch(
+        self, items: Sequence[tuple[str, str, int]], batch_size: int = 50, **kwargs: Any
+    ) -> list[dict[str, Any] | None]:
+        """Get many issues or pull requests with a few aliased GraphQL queries.
+
+        Batches that exceed the node limit or time out are split in half and retried.
+
+        Args:
+            items: Tuples of repository owner, repository name and issue number.
+            batch_size: The maximum number of lookups per query (at most 100).
+            **kwargs: Additional arguments for the requests.
+
+        Returns:
+            The issues in the order of the items, shaped like the REST API, with None for issues that
+            do not exist or are not accessible.
+
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        batches = deque(self._get_batch_ranges(count=len(items), batch_size=batch_size))
+        while batches:
+            start, end = batches.popleft()
+            query, variables = self._build_issues_batch_query(items[start:end])
+            try:
+                response = self._execute(query=query, variables=variables, **kwargs)
+            except requests.HTTPError as error:
+                status_code = error.response.status_code if error.response is not None else None
+                if not self._should_split(size=end - start, status_code=status_code):
+                    raise
+                middle = (start + end) // 2
+                batches.extendleft([(middle, end), (start, middle)])
+                continue
+            payload, _, _, _ = process_response_with_last_modified(response)
+            self._record_query_cost(payload)
+            if self._should_split(size=end - start, payload=payload):
+                middle = (start + end) // 2
+                batches.extendleft([(middle, end), (start, middle)])
+                continue
+            results[start:end] = self._parse_issues_batch(payload=payload, count=end - start)
+        return results
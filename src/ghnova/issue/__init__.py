@@ -2,7 +2,59 @@
 
 from __future__ import annotations
 
-from ghnova.issue.async_issue import AsyncIssue
-from ghnova.issue.issue import Issue
+from typing import TYPE_CHECKING
 
-__all__ = ["AsyncIssue", "Issue"]
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.issue.async_issue import AsyncIssue
+    from ghnova.issue.bulk import (
+        BulkCheckpoint,
+        BulkLocker,
+        BulkOperation,
+        BulkResult,
+        BulkRunner,
+        ContentPacer,
+        LockResult,
+        read_operations,
+    )
+    from ghnova.issue.issue import Issue
+    from ghnova.issue.mirror import IssueMirror, SyncResult
+    from ghnova.issue.record import IssueRecord, LabelRecord
+
+__all__ = [
+    "AsyncIssue",
+    "BulkCheckpoint",
+    "BulkLocker",
+    "BulkOperation",
+    "BulkResult",
+    "BulkRunner",
+    "ContentPacer",
+    "Issue",
+    "IssueMirror",
+    "IssueRecord",
+    "LabelRecord",
+    "LockResult",
+    "SyncResult",
+    "read_operations",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncIssue": "ghnova.issue.async_issue",
+        "BulkCheckpoint": "ghnova.issue.bulk",
+        "BulkLocker": "ghnova.issue.bulk",
+        "BulkOperation": "ghnova.issue.bulk",
+        "BulkResult": "ghnova.issue.bulk",
+        "BulkRunner": "ghnova.issue.bulk",
+        "ContentPacer": "ghnova.issue.bulk",
+        "Issue": "ghnova.issue.issue",
+        "IssueMirror": "ghnova.issue.mirror",
+        "IssueRecord": "ghnova.issue.record",
+        "LabelRecord": "ghnova.issue.record",
+        "LockResult": "ghnova.issue.bulk",
+        "SyncResult": "ghnova.issue.mirror",
+        "read_operations": "ghnova.issue.bulk",
+    },
+)
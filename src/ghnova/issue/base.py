@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import logging
+import threading
 from datetime import datetime
 from typing import Any, Literal
 
+from ghnova.utils.pagination import PageCallback, PageInfo
+
 logger = logging.getLogger("ghnova")
 
+FANOUT_REPOSITORY_FIELDS = ("full_name", "has_issues", "open_issues_count")
+"""Fields of the repositories of an organization needed to list their issues."""
+
 
 class BaseIssue:
     """Base class for GitHub Issue resource."""
@@ -467,3 +475,58 @@ class BaseIssue:
         kwargs["headers"] = headers
 
         return endpoint, kwargs
+
+    def _should_list_repository_issues(self, repository: dict[str, Any], state: str | None) -> bool:
+        """Check whether the issues of a repository of an organization need to be listed.
+
+        Listing the issues of a repository with issues disabled fails with 410 Gone, and a repository
+        without open issues or pull requests has nothing to list unless closed issues are requested.
+
+        Args:
+            repository: The repository, with the fields in FANOUT_REPOSITORY_FIELDS.
+            state: The state of the issues to list. None lists the open issues.
+
+        Returns:
+            True if the issues of the repository need to be listed.
+
+        """
+        if repository.get("has_issues") is False:
+            return False
+        return not ((state is None or state == "open") and repository.get("open_issues_count") == 0)
+
+    def _tag_repository_issue(self, issue: dict[str, Any], repository_full_name: str) -> dict[str, Any]:
+        """Tag an issue with the full name of its repository.
+
+        Args:
+            issue: The issue.
+            repository_full_name: The full name of the repository, e.g. "octocat/hello".
+
+        Returns:
+            The issue, with the repository_full_name field.
+
+        """
+        issue["repository_full_name"] = repository_full_name
+        return issue
+
+    def _get_fanout_page_callback(self, on_page: PageCallback | None) -> PageCallback | None:
+        """Wrap the page callback of a listing of the issues of many repositories at once.
+
+        The pages are numbered across all repositories, and the callback is called by one thread at a time.
+
+        Args:
+            on_page: The page callback.
+
+        Returns:
+            The wrapped callback, or None if on_page is None.
+
+        """
+        if on_page is None:
+            return None
+        lock = threading.Lock()
+        pages = itertools.count(1)
+
+        def callback(info: PageInfo) -> None:
+            with lock:
+                on_page(dataclasses.replace(info, page=next(pages)))
+
+        return callback
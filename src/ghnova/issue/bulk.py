@@ -0,0 +1,852 @@
+"""Bulk operations on issues: creation and update from JSON Lines, and locking by query."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from ghnova.client.retry import parse_retry_after
+from ghnova.utils.json_codec import dumps, loads
+from ghnova.utils.response import process_response_with_last_modified
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from ghnova.client.github import GitHub
+
+logger = logging.getLogger("ghnova")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CREATE_FIELDS = frozenset({"title", "body", "assignee", "milestone", "labels", "assignees", "issue_type"})
+"""Fields accepted by a create operation."""
+
+UPDATE_FIELDS = frozenset({"title", "body", "assignee", "milestone", "labels", "assignees", "state"})
+"""Fields accepted by an update operation."""
+
+_OPERATION_KEYS = frozenset({"op", "owner", "repository", "issue_number", "key"})
+"""Keys of an operation that are not fields of the issue."""
+
+BulkStatus = Literal["created", "updated", "skipped", "failed"]
+
+LockStatus = Literal["locked", "unlocked", "unchanged", "planned", "failed"]
+
+
+@dataclass(frozen=True)
+class BulkOperation:
+    """A create or update operation read from one line of the input."""
+
+    line: int
+    """Line number of the operation in the input, starting at 1."""
+    op: Literal["create", "update"]
+    """The kind of operation."""
+    owner: str
+    """The owner of the repository."""
+    repository: str
+    """The name of the repository."""
+    key: str
+    """Key identifying the operation in the checkpoint."""
+    fields: dict[str, Any] = field(default_factory=dict)
+    """Fields of the issue to set."""
+    issue_number: int | None = None
+    """The number of the issue to update."""
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """Outcome of a bulk operation."""
+
+    line: int
+    """Line number of the operation in the input."""
+    key: str | None
+    """Key of the operation, or None if the line could not be parsed."""
+    status: BulkStatus
+    """created, updated, skipped (already done in a previous run) or failed."""
+    number: int | None = None
+    """Number of the created or updated issue."""
+    url: str | None = None
+    """Web URL of the created or updated issue."""
+    status_code: int | None = None
+    """Status code of the last response, if any."""
+    error: str | None = None
+    """Description of the failure, if any."""
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the operation is done.
+
+        Returns:
+            True if the issue was created or updated, in this run or a previous one.
+
+        """
+        return self.status != "failed"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a dictionary.
+
+        Returns:
+            The fields of the result.
+
+        """
+        return dataclasses.asdict(self)
+
+
+@dataclass(frozen=True)
+class LockResult:
+    """Outcome of locking or unlocking an issue matching a query."""
+
+    repository: str
+    """Full name of the repository."""
+    number: int
+    """Number of the issue."""
+    title: str | None = None
+    """Title of the issue."""
+    status: LockStatus = "planned"
+    """locked, unlocked, unchanged (already in the requested state), planned (dry run) or failed."""
+    status_code: int | None = None
+    """Status code of the last response, if any."""
+    error: str | None = None
+    """Description of the failure, if any."""
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the issue is in the requested state, or would be in a dry run.
+
+        Returns:
+            True unless the request failed.
+
+        """
+        return self.status != "failed"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a dictionary.
+
+        Returns:
+            The fields of the result.
+
+        """
+        return dataclasses.asdict(self)
+
+
+def parse_operation(data: Any, line: int, key: str | None = None) -> BulkOperation:
+    """Validate a decoded operation.
+
+    Args:
+        data: The decoded JSON object of the line.
+        line: The line number.
+        key: The key of the operation if the object does not give one.
+
+    Returns:
+        The operation.
+
+    Raises:
+        ValueError: If the operation is not valid.
+
+    """
+    if not isinstance(data, dict):
+        raise ValueError("An operation must be a JSON object.")
+    op = data.get("op")
+    if op not in ("create", "update"):
+        raise ValueError("'op' must be 'create' or 'update'.")
+    for name in ("owner", "repository"):
+        if not isinstance(data.get(name), str) or not data[name]:
+            raise ValueError(f"'{name}' is required.")
+    fields = {name: value for name, value in data.items() if name not in _OPERATION_KEYS}
+    allowed = CREATE_FIELDS if op == "create" else UPDATE_FIELDS
+    unknown = sorted(set(fields) - allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields for {op}: {', '.join(unknown)}.")
+    issue_number = data.get("issue_number")
+    if op == "create" and not fields.get("title"):
+        raise ValueError("'title' is required to create an issue.")
+    if op == "update" and (not isinstance(issue_number, int) or isinstance(issue_number, bool)):
+        raise ValueError("'issue_number' is required to update an issue.")
+    return BulkOperation(
+        line=line,
+        op=op,
+        owner=data["owner"],
+        repository=data["repository"],
+        key=str(data.get("key") or key or f"line:{line}"),
+        fields=fields,
+        issue_number=issue_number if op == "update" else None,
+    )
+
+
+def read_operations(lines: Iterable[str]) -> Iterator[BulkOperation | BulkResult]:
+    """Read operations from JSON Lines.
+
+    Operations without a "key" get one derived from their content, so that the checkpoint still
+    matches after lines are added to or removed from the input. Identical operations are told apart
+    by their occurrence.
+
+    Args:
+        lines: The lines of the input. Blank lines are ignored.
+
+    Yields:
+        The operation of each line, or a failed result for the lines that are not valid.
+
+    """
+    occurrences: dict[str, int] = {}
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            data = loads(text)
+            digest = hashlib.sha256(dumps(_canonical(data)).encode()).hexdigest()[:16]
+            occurrences[digest] = occurrences.get(digest, 0) + 1
+            yield parse_operation(data, line=line, key=f"{digest}#{occurrences[digest]}")
+        except ValueError as e:
+            yield BulkResult(line=line, key=None, status="failed", error=str(e))
+
+
+def _canonical(value: Any) -> Any:
+    """Sort the keys of the objects of a decoded value.
+
+    Args:
+        value: The decoded value.
+
+    Returns:
+        The value with sorted object keys.
+
+    """
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    return value
+
+
+class ContentPacer:
+    """Pace the requests creating content to stay under the secondary rate limits of GitHub.
+
+    GitHub limits the requests that create content (e.g. issues) to about 80 per minute and 500 per
+    hour, and recommends waiting at least a second between them. The slots of the requests are
+    reserved in order, so the limits hold across threads.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        per_minute: int | None = 80,
+        per_hour: int | None = 500,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the pacer.
+
+        Args:
+            min_interval: Minimum number of seconds between two requests.
+            per_minute: Maximum number of requests in any minute, or None for no limit.
+            per_hour: Maximum number of requests in any hour, or None for no limit.
+            clock: Monotonic clock in seconds.
+            sleep: Function sleeping for a number of seconds.
+
+        """
+        if min_interval < 0:
+            raise ValueError("min_interval must not be negative.")
+        if (per_minute is not None and per_minute < 1) or (per_hour is not None and per_hour < 1):
+            raise ValueError("per_minute and per_hour must be at least 1.")
+        self.min_interval = min_interval
+        self.per_minute = per_minute
+        self.per_hour = per_hour
+        self._clock = clock
+        self._sleep = sleep
+        self._slots: deque[float] = deque(maxlen=max(per_minute or 1, per_hour or 1))
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve the slot of the next request.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+
+        """
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._paused_until)
+            if self._slots:
+                slot = max(slot, self._slots[-1] + self.min_interval)
+            for limit, window in ((self.per_minute, 60.0), (self.per_hour, 3600.0)):
+                if limit is not None and len(self._slots) >= limit:
+                    slot = max(slot, self._slots[-limit] + window)
+            self._slots.append(slot)
+            return slot - now
+
+    def wait(self) -> None:
+        """Wait for the slot of the next request."""
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all the requests that are not reserved yet, e.g. after hitting a secondary rate limit.
+
+        Args:
+            seconds: Number of seconds to wait from now.
+
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class BulkCheckpoint:
+    """Append-only JSON Lines journal of the operations that were started and completed.
+
+    A "pending" entry is written before an issue is created and a "done" entry once it is created,
+    so a create that was interrupted in flight can be told apart from one that never started.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the checkpoint, loading the entries of previous runs.
+
+        Args:
+            path: Path to the journal.
+
+        """
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for text in f:
+                    try:
+                        entry = loads(text)
+                    except ValueError:
+                        # A line truncated by an interrupted write.
+                        continue
+                    if isinstance(entry, dict) and isinstance(entry.get("key"), str):
+                        self._entries[entry["key"]] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def __enter__(self) -> BulkCheckpoint:
+        """Enter the runtime context.
+
+        Returns:
+            The checkpoint.
+
+        """
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        """Close the journal.
+
+        Args:
+            exc_type: The exception type.
+            exc_value: The exception value.
+            traceback: The traceback.
+
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal."""
+        self._file.close()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get the last entry of an operation.
+
+        Args:
+            key: The key of the operation.
+
+        Returns:
+            The entry, or None if the operation was never started.
+
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def record(self, key: str, state: Literal["pending", "done", "failed"], **values: Any) -> None:
+        """Append an entry to the journal and flush it to disk.
+
+        Args:
+            key: The key of the operation.
+            state: "pending" before the request is sent and while its outcome is unknown, "done" once it
+                succeeded, "failed" if the API rejected it.
+            **values: Other values of the entry, e.g. the issue number.
+
+        """
+        entry = {"key": key, "state": state, "at": datetime.now(timezone.utc).isoformat(), **values}
+        with self._lock:
+            self._file.write(dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._entries[key] = entry
+
+
+class BulkRunner:
+    """Run bulk create and update operations with bounded concurrency and paced requests."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client: GitHub,
+        checkpoint: BulkCheckpoint | None = None,
+        concurrency: int = 2,
+        pacer: ContentPacer | None = None,
+        max_attempts: int = 3,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            client: An entered synchronous GitHub client.
+            checkpoint: Optional checkpoint recording the completed operations, to resume an interrupted run.
+            concurrency: Maximum number of operations in flight.
+            pacer: Pacer of the requests. Defaults to the secondary rate limits of GitHub.
+            max_attempts: Maximum number of attempts of an operation rejected by a secondary rate limit.
+            sleep: Function sleeping for a number of seconds.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.client = client
+        self.checkpoint = checkpoint
+        self.concurrency = concurrency
+        self.pacer = pacer if pacer is not None else ContentPacer(sleep=sleep)
+        self.max_attempts = max_attempts
+
+    def run(self, operations: Iterable[BulkOperation | BulkResult]) -> Iterator[BulkResult]:
+        """Run operations, consuming the input lazily.
+
+        Args:
+            operations: The operations, e.g. from read_operations. Failed results are passed through.
+
+        Yields:
+            The result of each operation, in completion order.
+
+        """
+
+        def run(operation: BulkOperation | BulkResult) -> BulkResult:
+            return operation if isinstance(operation, BulkResult) else self.run_operation(operation)
+
+        yield from _map_bounded(run, operations, concurrency=self.concurrency)
+
+    def run_operation(self, operation: BulkOperation) -> BulkResult:
+        """Run a single operation, skipping it if the checkpoint records it as done.
+
+        Args:
+            operation: The operation.
+
+        Returns:
+            The result of the operation.
+
+        """
+        entry = self.checkpoint.get(operation.key) if self.checkpoint is not None else None
+        if entry is not None and entry.get("state") == "done":
+            return self._result(operation, status="skipped", number=entry.get("number"), url=entry.get("url"))
+        try:
+            if entry is not None and entry.get("state") == "pending":
+                existing = self._find_created_issue(operation, since=entry["at"])
+                if existing is not None:
+                    logger.info("Line %d: issue #%s was created by an interrupted run.", operation.line, existing[0])
+                    self._record_done(operation, number=existing[0], url=existing[1])
+                    return self._result(operation, status="skipped", number=existing[0], url=existing[1])
+                # Keep the time of the first attempt, so that a later run still looks back far enough.
+                return self._send(operation, pending_since=entry["at"])
+            return self._send(operation)
+        except Exception as e:
+            return self._result(operation, status="failed", error=f"{type(e).__name__}: {e}")
+
+    def _send(self, operation: BulkOperation, pending_since: str | None = None) -> BulkResult:
+        """Send the request of an operation, retrying the rejections by secondary rate limits.
+
+        A create is only recorded as failed when the API rejects it with a 4xx status. After a 5xx
+        status, GitHub may still have created the issue, so the create stays pending and the next
+        run looks for the issue before sending it again.
+
+        Args:
+            operation: The operation.
+            pending_since: Time of the first attempt of a create left pending by an earlier run.
+
+        Returns:
+            The result of the operation.
+
+        """
+        if operation.op == "create" and self.checkpoint is not None:
+            self.checkpoint.record(operation.key, "pending", **({"at": pending_since} if pending_since else {}))
+        response = _send_paced(
+            self.pacer, lambda: self._request(operation), max_attempts=self.max_attempts, label=f"Line {operation.line}"
+        )
+        data, status_code, _, _ = process_response_with_last_modified(response)
+        if 200 <= status_code < 300 and isinstance(data, dict):  # noqa: PLR2004
+            number, url = data.get("number"), data.get("html_url")
+            self._record_done(operation, number=number, url=url)
+            status: BulkStatus = "created" if operation.op == "create" else "updated"
+            return self._result(operation, status=status, number=number, url=url, status_code=status_code)
+        if operation.op == "create" and self.checkpoint is not None and 400 <= status_code < 500:  # noqa: PLR2004
+            self.checkpoint.record(operation.key, "failed", status_code=status_code)
+        return self._result(operation, status="failed", status_code=status_code, error=_get_error_message(response))
+
+    def _request(self, operation: BulkOperation) -> Response:
+        """Send the request of an operation.
+
+        Args:
+            operation: The operation.
+
+        Returns:
+            The response.
+
+        """
+        if operation.op == "create":
+            return self.client.issue._create_issue(
+                owner=operation.owner, repository=operation.repository, **operation.fields
+            )
+        return self.client.issue._update_issue(
+            owner=operation.owner,
+            repository=operation.repository,
+            issue_number=operation.issue_number,
+            **operation.fields,
+        )
+
+    def _find_created_issue(self, operation: BulkOperation, since: str) -> tuple[int, str | None] | None:
+        """Look for the issue created by an interrupted attempt of a create operation.
+
+        Args:
+            operation: The create operation.
+            since: Time at which the interrupted attempt started, in ISO 8601.
+
+        Returns:
+            The number and URL of the issue with the same title created since the attempt, or None.
+
+        """
+        # Allow for clock skew between this machine and GitHub.
+        started = datetime.fromisoformat(since) - timedelta(minutes=5)
+        for issue in self.client.issue.iter_issues(
+            owner=operation.owner,
+            repository=operation.repository,
+            state="all",
+            sort="created",
+            direction="desc",
+            since=started,
+            fields=["number", "title", "html_url", "created_at"],
+        ):
+            if not isinstance(issue, dict) or not isinstance(issue.get("created_at"), str):
+                continue
+            created_at = datetime.fromisoformat(issue["created_at"].replace("Z", "+00:00"))
+            if created_at < started:
+                break
+            if issue.get("title") == operation.fields["title"]:
+                return issue["number"], issue.get("html_url")
+        return None
+
+    def _record_done(self, operation: BulkOperation, number: int | None, url: str | None) -> None:
+        """Record an operation as done in the checkpoint.
+
+        Args:
+            operation: The operation.
+            number: The number of the issue.
+            url: The web URL of the issue.
+
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.record(operation.key, "done", number=number, url=url)
+
+    @staticmethod
+    def _result(operation: BulkOperation, status: BulkStatus, **values: Any) -> BulkResult:
+        """Create the result of an operation.
+
+        Args:
+            operation: The operation.
+            status: The status of the operation.
+            **values: Other fields of the result.
+
+        Returns:
+            The result.
+
+        """
+        return BulkResult(line=operation.line, key=operation.key, status=status, **values)
+
+
+class BulkLocker:
+    """Lock or unlock the issues of a repository matching a query.
+
+    The matching issues are streamed page by page and the lock requests are sent as they arrive, with a
+    bounded concurrency and paced like the requests creating content.
+    """
+
+    def __init__(
+        self,
+        client: GitHub,
+        concurrency: int = 4,
+        pacer: ContentPacer | None = None,
+        max_attempts: int = 3,
+    ) -> None:
+        """Initialize the locker.
+
+        Args:
+            client: An entered synchronous GitHub client.
+            concurrency: Maximum number of requests in flight.
+            pacer: Pacer of the requests. Defaults to the secondary rate limits of GitHub.
+            max_attempts: Maximum number of attempts of a request rejected by a secondary rate limit.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.client = client
+        self.concurrency = concurrency
+        self.pacer = pacer if pacer is not None else ContentPacer()
+        self.max_attempts = max_attempts
+        self.budget_exhausted = False
+
+    def run(  # noqa: PLR0913
+        self,
+        owner: str,
+        repository: str,
+        action: Literal["lock", "unlock"] = "lock",
+        lock_reason: Literal["off-topic", "too heated", "resolved", "spam"] | None = None,
+        filters: dict[str, Any] | None = None,
+        dry_run: bool = False,
+        max_requests: int | None = None,
+        rate_limit_reserve: int | None = None,
+        include_pull_requests: bool = False,
+    ) -> Iterator[LockResult]:
+        """Lock or unlock the matching issues.
+
+        Args:
+            owner: The owner of the repository.
+            repository: The name of the repository.
+            action: Whether to lock or unlock the issues.
+            lock_reason: The reason for locking the issues.
+            filters: Filters of the issues, as accepted by Issue.iter_issues for a repository
+                (e.g. state, labels, since, milestone, assignee, creator).
+            dry_run: Report the issues that would be locked or unlocked without changing them.
+            max_requests: Maximum number of lock or unlock requests to send.
+            rate_limit_reserve: Stop before the remaining core rate limit budget drops below this number of
+                requests.
+            include_pull_requests: Whether to lock or unlock the matching pull requests as well.
+
+        Yields:
+            The result of each matching issue, in completion order. Issues already in the requested state are
+            reported as unchanged.
+
+        """
+        if action not in ("lock", "unlock"):
+            raise ValueError("action must be 'lock' or 'unlock'.")
+        if lock_reason is not None and action != "lock":
+            raise ValueError("lock_reason can only be given to lock issues.")
+        if max_requests is not None and max_requests < 0:
+            raise ValueError("max_requests must not be negative.")
+        self.budget_exhausted = False
+        full_name = f"{owner}/{repository}"
+        issues = self.client.issue.iter_issues(
+            owner=owner,
+            repository=repository,
+            fields=["number", "title", "locked", "pull_request"],
+            **(filters or {}),
+        )
+
+        def targets() -> Iterator[LockResult | dict[str, Any]]:
+            sent = 0
+            for issue in issues:
+                if not isinstance(issue, dict) or (not include_pull_requests and "pull_request" in issue):
+                    continue
+                if bool(issue.get("locked")) == (action == "lock"):
+                    yield LockResult(
+                        repository=full_name, number=issue["number"], title=issue.get("title"), status="unchanged"
+                    )
+                    continue
+                if dry_run:
+                    yield LockResult(
+                        repository=full_name, number=issue["number"], title=issue.get("title"), status="planned"
+                    )
+                    continue
+                if (max_requests is not None and sent >= max_requests) or self._is_below_reserve(rate_limit_reserve):
+                    logger.warning("Stopping before issue #%s: the request budget is exhausted.", issue["number"])
+                    self.budget_exhausted = True
+                    return
+                sent += 1
+                yield issue
+
+        def apply(item: LockResult | dict[str, Any]) -> LockResult:
+            if isinstance(item, LockResult):
+                return item
+            return self._apply(owner, repository, issue=item, action=action, lock_reason=lock_reason)
+
+        try:
+            yield from _map_bounded(apply, targets(), concurrency=self.concurrency)
+        finally:
+            close = getattr(issues, "close", None)
+            if close is not None:
+                close()
+
+    def _is_below_reserve(self, reserve: int | None) -> bool:
+        """Check whether the remaining core rate limit budget of the client is below a reserve.
+
+        Args:
+            reserve: The number of requests to keep, or None for no reserve.
+
+        Returns:
+            True if the budget is known and below the reserve.
+
+        """
+        if reserve is None:
+            return False
+        bucket = self.client.rate_limit.get("core")
+        return bucket is not None and bucket.remaining < reserve
+
+    def _apply(
+        self,
+        owner: str,
+        repository: str,
+        issue: dict[str, Any],
+        action: Literal["lock", "unlock"],
+        lock_reason: Literal["off-topic", "too heated", "resolved", "spam"] | None,
+    ) -> LockResult:
+        """Lock or unlock an issue.
+
+        Args:
+            owner: The owner of the repository.
+            repository: The name of the repository.
+            issue: The issue.
+            action: Whether to lock or unlock the issue.
+            lock_reason: The reason for locking the issue.
+
+        Returns:
+            The result.
+
+        """
+        number = issue["number"]
+        result = functools.partial(
+            LockResult, repository=f"{owner}/{repository}", number=number, title=issue.get("title")
+        )
+
+        def send() -> Response:
+            if action == "lock":
+                return self.client.issue._lock_issue(
+                    owner=owner, repository=repository, issue_number=number, lock_reason=lock_reason
+                )
+            return self.client.issue._unlock_issue(owner=owner, repository=repository, issue_number=number)
+
+        try:
+            response = _send_paced(self.pacer, send, max_attempts=self.max_attempts, label=f"Issue #{number}")
+        except Exception as e:
+            return result(status="failed", error=f"{type(e).__name__}: {e}")
+        if response.status_code >= 400:  # noqa: PLR2004
+            return result(status="failed", status_code=response.status_code, error=_get_error_message(response))
+        return result(status="locked" if action == "lock" else "unlocked", status_code=response.status_code)
+
+
+def _map_bounded(fn: Callable[[T], R], items: Iterable[T], concurrency: int) -> Iterator[R]:
+    """Call a function on items in threads, with a bounded number of calls in flight.
+
+    The items are consumed lazily, so that the input can be a stream of any length.
+
+    Args:
+        fn: The function. It should not raise.
+        items: The items.
+        concurrency: Maximum number of calls in flight.
+
+    Yields:
+        The return value of each call, in completion order.
+
+    """
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ghnova-bulk") as executor:
+        in_flight: set[Future[R]] = set()
+        try:
+            for item in items:
+                if len(in_flight) >= concurrency:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+                in_flight.add(executor.submit(fn, item))
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def _send_paced(pacer: ContentPacer, send: Callable[[], Response], max_attempts: int, label: str) -> Response:
+    """Send a paced request, sending it again when a secondary rate limit rejects it.
+
+    Args:
+        pacer: The pacer of the requests.
+        send: Function sending the request.
+        max_attempts: Maximum number of attempts.
+        label: Description of the request for the log.
+
+    Returns:
+        The last response, successful or not.
+
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        pacer.wait()
+        try:
+            response = send()
+        except Exception as e:
+            # Error responses are raised as HTTP errors holding the response.
+            response = getattr(e, "response", None)
+            if response is None:
+                raise
+        if response.status_code < 400:  # noqa: PLR2004
+            return response
+        delay = _get_secondary_limit_delay(response)
+        if delay is None or attempt >= max_attempts:
+            return response
+        # The request was rejected before being processed, so it is safe to send it again.
+        logger.warning("%s: secondary rate limit hit, waiting %.0f seconds.", label, delay)
+        pacer.pause(delay)
+
+
+def _get_secondary_limit_delay(response: Response) -> float | None:
+    """Get the delay requested by a response rejecting a request because of a rate limit.
+
+    Args:
+        response: The response.
+
+    Returns:
+        The number of seconds to wait before retrying, or None if the response is not a rate limit rejection.
+
+    """
+    if response.status_code not in (403, 429):
+        return None
+    delay = parse_retry_after(response.headers.get("Retry-After"))
+    if delay is not None:
+        return delay
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset")
+        if isinstance(reset, str) and reset.isdigit():
+            return max(0.0, int(reset) - time.time())
+    if response.status_code == 429 or "secondary rate limit" in response.text.lower():  # noqa: PLR2004
+        # GitHub asks to wait at least a minute when no delay is given.
+        return 60.0
+    return None
+
+
+def _get_error_message(response: Response) -> str:
+    """Get the error message of a failed response.
+
+    Args:
+        response: The response.
+
+    Returns:
+        The message returned by the API, or the status code.
+
+    """
+    try:
+        data = loads(response.content)
+    except ValueError:
+        data = None
+    if isinstance(data, dict) and data.get("message"):
+        return f"{response.status_code}: {data['message']}"
+    return f"HTTP {response.status_code}"
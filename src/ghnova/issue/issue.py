@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import datetime
 from typing import Any, Literal, cast
 
 from requests import Response
 
-from ghnova.issue.base import BaseIssue
+from ghnova.issue.base import FANOUT_REPOSITORY_FIELDS, BaseIssue
+from ghnova.issue.record import IssueRecord
 from ghnova.resource.resource import Resource
+from ghnova.utils.fanout import iter_fanout
+from ghnova.utils.pagination import PageCallback
 from ghnova.utils.response import process_response_with_last_modified
 
 
@@ -127,8 +131,10 @@ class Issue(Resource, BaseIssue):
         page: int = 1,
         etag: str | None = None,
         last_modified: str | None = None,
+        as_records: bool = False,
+        fields: Sequence[str] | None = None,
         **kwargs: Any,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    ) -> tuple[list[dict[str, Any]] | list[IssueRecord], dict[str, Any]]:
         """List issues with various filtering and sorting options.
 
         Supported scenarios:
@@ -160,12 +166,15 @@ class Issue(Resource, BaseIssue):
             page: The page number to retrieve.
             etag: The ETag value for conditional requests.
             last_modified: The Last-Modified timestamp for conditional requests.
+            as_records: Whether to return compact IssueRecord objects instead of dictionaries.
+            fields: Dotted paths of the fields to keep, e.g. ["number", "user.login"]. Other fields are
+                skipped while decoding.
             **kwargs: Additional arguments for the request.
 
         Returns:
             A tuple containing:
 
-                - A list of issues as dictionaries.
+                - A list of issues as dictionaries, or as records if as_records is True.
                 - A dictionary with metadata including status_code, etag, and last_modified.
 
         """
@@ -194,13 +203,201 @@ class Issue(Resource, BaseIssue):
             last_modified=last_modified,
             **kwargs,
         )
-        data, status_code, etag_value, last_modified_value = process_response_with_last_modified(response)
-        return cast(list[dict[str, Any]], data), {
+        data, status_code, etag_value, last_modified_value = process_response_with_last_modified(
+            response, record_type=IssueRecord if as_records else None, fields=fields
+        )
+        return cast(list[Any], data), {
             "status_code": status_code,
             "etag": etag_value,
             "last_modified": last_modified_value,
         }
 
+    def iter_issues(  # noqa: PLR0913
+        self,
+        owner: str | None = None,
+        organization: str | None = None,
+        repository: str | None = None,
+        filter_by: Literal["assigned", "created", "mentioned", "subscribed", "all"] | None = None,
+        state: Literal["open", "closed", "all"] | None = None,
+        labels: list[str] | None = None,
+        sort: Literal["created", "updated", "comments"] | None = None,
+        direction: Literal["asc", "desc"] | None = None,
+        since: datetime | None = None,
+        collab: bool | None = None,
+        orgs: bool | None = None,
+        owned: bool | None = None,
+        pulls: bool | None = None,
+        issue_type: str | None = None,
+        milestone: str | None = None,
+        assignee: str | None = None,
+        creator: str | None = None,
+        mentioned: str | None = None,
+        per_page: int = 100,
+        as_records: bool = False,
+        fields: Sequence[str] | None = None,
+        max_pages: int | None = None,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any] | IssueRecord]:
+        """Iterate over all issues matching the filters, following the pagination links.
+
+        Supported scenarios:
+
+        - Authenticated user: Do not provide owner, organization, or repository.
+        - Organization issues: Provide organization, but not owner or repository.
+        - Repository issues: Provide owner or organization along with repository.
+
+        Args:
+            owner: The owner of the repository.
+            organization: The organization name.
+            repository: The repository name.
+            filter_by: Filter issues by criteria.
+            state: The state of the issues to return.
+            labels: A list of labels to filter issues by.
+            sort: The field to sort issues by.
+            direction: The direction of the sort.
+            since: Only issues updated at or after this time are returned.
+            collab: Include issues from repositories the user collaborates on (for authenticated user issues).
+            orgs: Include issues from organizations the user is a member of (for authenticated user issues).
+            owned: Include issues from repositories owned by the user (for authenticated user issues).
+            pulls: Include pull requests in the issues list (for authenticated user issues).
+            issue_type: The type of issues to filter by (for organization issues).
+            milestone: Filter issues by milestone (for repository issues).
+            assignee: Filter issues by assignee (for repository issues).
+            creator: Filter issues by creator (for repository issues).
+            mentioned: Filter issues by mentioned user (for repository issues).
+            per_page: The number of issues per page (max 100).
+            as_records: Whether to return compact IssueRecord objects instead of dictionaries.
+            fields: If given, only these dotted field paths of each item are decoded.
+            max_pages: Maximum number of pages to request. If None, all pages are requested.
+            on_page: Optional callback invoked with the progress of the iteration when each page is received.
+            **kwargs: Additional arguments for the request.
+
+        Yields:
+            Each issue as a dictionary, or as a record if as_records is True, as soon as its page is received.
+
+        """
+        endpoint, params, kwargs = self._list_issues_helper(
+            owner=owner,
+            organization=organization,
+            repository=repository,
+            filter_by=filter_by,
+            state=state,
+            labels=labels,
+            sort=sort,
+            direction=direction,
+            since=since,
+            collab=collab,
+            orgs=orgs,
+            owned=owned,
+            pulls=pulls,
+            issue_type=issue_type,
+            milestone=milestone,
+            assignee=assignee,
+            creator=creator,
+            mentioned=mentioned,
+            per_page=per_page,
+            page=1,
+            **kwargs,
+        )
+        yield from self._paginate(
+            endpoint=endpoint,
+            params=params,
+            record_type=IssueRecord if as_records else None,
+            fields=fields,
+            max_pages=max_pages,
+            on_page=on_page,
+            **kwargs,
+        )
+
+    def iter_org_repository_issues(  # noqa: PLR0913
+        self,
+        organization: str,
+        repository_type: Literal["all", "public", "private", "member"] | None = None,
+        state: Literal["open", "closed", "all"] | None = None,
+        labels: list[str] | None = None,
+        sort: Literal["created", "updated", "comments"] | None = None,
+        direction: Literal["asc", "desc"] | None = None,
+        since: datetime | None = None,
+        since_by_repository: Mapping[str, datetime] | None = None,
+        milestone: str | None = None,
+        assignee: str | None = None,
+        creator: str | None = None,
+        mentioned: str | None = None,
+        per_page: int = 100,
+        fields: Sequence[str] | None = None,
+        concurrency: int = 8,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the issues of all repositories of an organization.
+
+        The repositories are listed page by page while the issues of up to concurrency repositories are
+        listed at the same time, so the first issues arrive before the last repositories are known.
+        Repositories with issues disabled are skipped, and so are repositories without open issues
+        or pull requests when only open issues are listed.
+
+        Args:
+            organization: The organization name.
+            repository_type: The type of repositories to include.
+            state: The state of the issues to return.
+            labels: A list of labels to filter issues by.
+            sort: The field to sort the issues of each repository by.
+            direction: The direction of the sort.
+            since: Only issues updated at or after this time are returned.
+            since_by_repository: The since time of some repositories, by full name, overriding since.
+            milestone: Filter issues by milestone.
+            assignee: Filter issues by assignee.
+            creator: Filter issues by creator.
+            mentioned: Filter issues by mentioned user.
+            per_page: The number of issues per page (max 100).
+            fields: If given, only these dotted field paths of each issue are decoded.
+            concurrency: Maximum number of repositories whose issues are listed at the same time.
+            on_page: Optional callback invoked with the progress of the iteration when each page of issues
+                is received. The pages are numbered across all repositories.
+            **kwargs: Additional arguments for the requests of the issues.
+
+        Yields:
+            Each issue as a dictionary with the full name of its repository in repository_full_name,
+            in the order they are received. The issues of a repository are in order.
+
+        """
+        repositories = self.client.repository.iter_repositories(
+            organization=organization,
+            repository_type=repository_type,
+            fields=FANOUT_REPOSITORY_FIELDS,
+        )
+        on_issue_page = self._get_fanout_page_callback(on_page)
+
+        def fetch(repository: dict[str, Any]) -> Iterator[dict[str, Any]]:
+            full_name = repository["full_name"]
+            owner, name = full_name.split("/", 1)
+            for issue in self.iter_issues(
+                owner=owner,
+                repository=name,
+                state=state,
+                labels=labels,
+                sort=sort,
+                direction=direction,
+                since=since if since_by_repository is None else since_by_repository.get(full_name, since),
+                milestone=milestone,
+                assignee=assignee,
+                creator=creator,
+                mentioned=mentioned,
+                per_page=per_page,
+                fields=fields,
+                on_page=on_issue_page,
+                **kwargs,
+            ):
+                yield self._tag_repository_issue(cast(dict[str, Any], issue), full_name)
+
+        selected = (
+            repository
+            for repository in repositories
+            if self._should_list_repository_issues(cast(dict[str, Any], repository), state)
+        )
+        yield from iter_fanout(selected, fetch, concurrency=concurrency)
+
     def _create_issue(  # noqa: PLR0913
         self,
         owner: str,
@@ -330,13 +527,14 @@ class Issue(Resource, BaseIssue):
         )
         return self._get(endpoint=endpoint, etag=etag, last_modified=last_modified, **kwargs)
 
-    def get_issue(
+    def get_issue(  # noqa: PLR0913
         self,
         owner: str,
         repository: str,
         issue_number: int,
         etag: str | None = None,
         last_modified: str | None = None,
+        fields: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         """Get a specific issue by its number.
@@ -347,6 +545,8 @@ class Issue(Resource, BaseIssue):
             issue_number: The number of the issue.
             etag: The ETag value for conditional requests.
             last_modified: The Last-Modified timestamp for conditional requests.
+            fields: Dotted paths of the fields to keep, e.g. ["number", "user.login"]. Other fields are
+                skipped while decoding.
             **kwargs: Additional arguments for the request.
 
         Returns:
@@ -364,7 +564,9 @@ class Issue(Resource, BaseIssue):
             last_modified=last_modified,
             **kwargs,
         )
-        data, status_code, etag_value, last_modified_value = process_response_with_last_modified(response)
+        data, status_code, etag_value, last_modified_value = process_response_with_last_modified(
+            response, fields=fields
+        )
         return cast(dict[str, Any], data), {
             "status_code": status_code,
             "etag": etag_value,
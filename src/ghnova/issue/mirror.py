@@ -0,0 +1,444 @@
+"""Local SQLite mirror of the issues of repositories and organizations, kept up to date by delta syncs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import platformdirs
+
+if TYPE_CHECKING:
+    from ghnova.client.github import GitHub
+    from ghnova.utils.pagination import PageCallback
+
+logger = logging.getLogger("ghnova")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    scope TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    repository TEXT,
+    number INTEGER NOT NULL,
+    state TEXT,
+    title TEXT,
+    is_pull_request INTEGER NOT NULL,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, id)
+);
+CREATE INDEX IF NOT EXISTS issues_scope_number ON issues (scope, repository, number);
+CREATE INDEX IF NOT EXISTS issues_scope_updated_at ON issues (scope, updated_at);
+CREATE TABLE IF NOT EXISTS cursors (
+    scope TEXT PRIMARY KEY,
+    since TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS repository_cursors (
+    scope TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    since TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (scope, repository)
+);
+"""
+
+
+def get_default_mirror_path() -> Path:
+    """Get the default location of the issue mirror.
+
+    Returns:
+        The path given by the GHNOVA_MIRROR_PATH environment variable, or the path of the mirror database
+        in the user data directory.
+
+    """
+    path = os.getenv("GHNOVA_MIRROR_PATH")
+    if path:
+        return Path(path)
+    return Path(platformdirs.user_data_dir(appname="ghnova")) / "issues.sqlite"
+
+
+def get_scope(owner: str | None = None, repository: str | None = None, organization: str | None = None) -> str:
+    """Get the key under which the issues of a repository or an organization are mirrored.
+
+    Args:
+        owner: The owner of the repository.
+        repository: The name of the repository.
+        organization: The organization name.
+
+    Returns:
+        "owner/repository" for the issues of a repository, or "org:organization" for the issues of
+        an organization.
+
+    """
+    if repository is not None:
+        repository_owner = owner or organization
+        if repository_owner is None:
+            raise ValueError("A repository must be given with its owner or organization.")
+        return f"{repository_owner}/{repository}"
+    if organization is not None:
+        if owner is not None:
+            raise ValueError("Give either an owner with a repository or an organization.")
+        return f"org:{organization}"
+    raise ValueError("Give a repository with its owner, or an organization.")
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """Outcome of a delta sync of the issue mirror."""
+
+    scope: str
+    """Key of the mirrored repository or organization."""
+
+    fetched: int
+    """Number of issues received and upserted by this sync."""
+
+    since: str | None
+    """High-water mark the sync started from, or None for a full sync. The latest one of its repositories
+    for an organization."""
+
+    cursor: str | None
+    """High-water mark stored for the next sync. The latest one of its repositories for an organization."""
+
+    total: int
+    """Number of issues in the mirror of the scope after the sync."""
+
+
+class IssueMirror:
+    """Local copy of the issues of repositories and organizations, stored in a SQLite database.
+
+    Each sync requests the issues updated since the high-water mark of the previous sync, sorted by update
+    time and including closed issues. Each page of issues is upserted with the new high-water mark in one
+    transaction, so an interrupted sync keeps the pages written so far and the next sync resumes after them.
+    An organization is mirrored repository by repository, with a high-water mark per repository. The
+    ``since`` filter of the API is inclusive, so the issues updated at the high-water mark are fetched again
+    and overwritten.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """Initialize the mirror.
+
+        The database is opened on first use.
+
+        Args:
+            path: Path of the database file. Defaults to the user data directory.
+
+        """
+        self.path = Path(path) if path is not None else get_default_mirror_path()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> IssueMirror:
+        """Enter the context manager.
+
+        Returns:
+            The mirror.
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the context manager, closing the database.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed.
+
+        Returns:
+            The database connection.
+
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_cursor(self, scope: str, repository: str | None = None) -> str | None:
+        """Get the high-water mark of a scope.
+
+        Args:
+            scope: The key of the repository or organization, see get_scope.
+            repository: The full name of a repository of an organization. If None, the latest high-water
+                mark of the repositories of an organization is returned.
+
+        Returns:
+            The latest update time of the mirrored issues, or None if the scope was never synced.
+
+        """
+        if not scope.startswith("org:"):
+            with self._lock:
+                row = self._connect().execute("SELECT since FROM cursors WHERE scope = ?", (scope,)).fetchone()
+            return None if row is None else row[0]
+        cursors = self._get_repository_cursors(scope)
+        if repository is not None:
+            return cursors.get(repository)
+        return max(cursors.values(), key=_parse, default=None)
+
+    def _get_repository_cursors(self, scope: str) -> dict[str, str]:
+        """Get the high-water marks of the repositories of an organization.
+
+        Args:
+            scope: The key of the organization.
+
+        Returns:
+            The high-water marks, by full name of the repository.
+
+        """
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute("SELECT repository, since FROM repository_cursors WHERE scope = ?", (scope,))
+                .fetchall()
+            )
+        return dict(rows)
+
+    def sync(  # noqa: PLR0913
+        self,
+        client: GitHub,
+        owner: str | None = None,
+        repository: str | None = None,
+        organization: str | None = None,
+        per_page: int = 100,
+        full: bool = False,
+        concurrency: int = 8,
+        on_page: PageCallback | None = None,
+    ) -> SyncResult:
+        """Fetch the issues updated since the previous sync and upsert them into the mirror.
+
+        The issues are written page by page, each page in a transaction that also advances the high-water
+        mark, so memory stays bounded by one page and other writers are only blocked while a page is written.
+
+        Args:
+            client: An open GitHub client.
+            owner: The owner of the repository.
+            repository: The name of the repository.
+            organization: The organization name. Without a repository, the issues of all repositories of the
+                organization are mirrored.
+            per_page: The number of issues per page (max 100).
+            full: Whether to ignore the stored high-water marks and fetch all issues.
+            concurrency: Maximum number of repositories of an organization synced at the same time.
+            on_page: Optional callback invoked with the progress of the sync when each page is received.
+
+        Returns:
+            The outcome of the sync.
+
+        """
+        scope = get_scope(owner=owner, repository=repository, organization=organization)
+        if repository is None:
+            cursors = {} if full else self._get_repository_cursors(scope)
+            issues: Iterable[dict[str, Any]] = client.issue.iter_org_repository_issues(
+                organization=cast(str, organization),
+                state="all",
+                sort="updated",
+                direction="asc",
+                since_by_repository={name: _parse(since) for name, since in cursors.items()},
+                per_page=per_page,
+                concurrency=concurrency,
+                on_page=on_page,
+            )
+        else:
+            since = None if full else self.get_cursor(scope)
+            cursors = {} if since is None else {scope: since}
+            issues = client.issue.iter_issues(
+                owner=owner,
+                repository=repository,
+                organization=organization,
+                state="all",
+                sort="updated",
+                direction="asc",
+                since=None if since is None else _parse(since),
+                per_page=per_page,
+                on_page=on_page,
+            )
+        start_cursor = max(cursors.values(), key=_parse, default=None)
+        fetched = 0
+        rows: list[tuple[Any, ...]] = []
+        advanced: dict[str, str] = {}
+        for issue in issues:
+            row = _to_row(scope=scope, issue=issue)
+            rows.append(row)
+            key = scope if repository is not None else row[2]
+            updated_at = issue.get("updated_at")
+            if updated_at is not None and (key not in cursors or _parse(updated_at) > _parse(cursors[key])):
+                cursors[key] = advanced[key] = updated_at
+            if len(rows) >= per_page:
+                self._write(scope=scope, rows=rows, cursors=advanced)
+                fetched += len(rows)
+                rows, advanced = [], {}
+        if rows:
+            self._write(scope=scope, rows=rows, cursors=advanced)
+            fetched += len(rows)
+        with self._lock:
+            (total,) = self._connect().execute("SELECT COUNT(*) FROM issues WHERE scope = ?", (scope,)).fetchone()
+        cursor = max(cursors.values(), key=_parse, default=None)
+        logger.debug("Synced %d issues of %s since %s.", fetched, scope, start_cursor)
+        return SyncResult(scope=scope, fetched=fetched, since=start_cursor, cursor=cursor, total=total)
+
+    def _write(self, scope: str, rows: list[tuple[Any, ...]], cursors: dict[str, str]) -> None:
+        """Upsert a page of issues and advance the high-water marks in one transaction.
+
+        Args:
+            scope: The key of the repository or organization.
+            rows: The rows of the issues.
+            cursors: The new high-water marks, by scope for a repository or by full name of the repository
+                for an organization.
+
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO issues "
+                    "(scope, id, repository, number, state, title, is_pull_request, updated_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                if scope.startswith("org:"):
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO repository_cursors (scope, repository, since, synced_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(scope, repository, since, now) for repository, since in cursors.items()],
+                    )
+                else:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO cursors (scope, since, synced_at) VALUES (?, ?, ?)",
+                        [(scope, since, now) for since in cursors.values()],
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def list_issues(
+        self,
+        scope: str,
+        state: str | None = None,
+        include_pull_requests: bool = True,
+    ) -> list[dict[str, Any]]:
+        """List the mirrored issues of a scope.
+
+        Args:
+            scope: The key of the repository or organization, see get_scope.
+            state: Only return the issues in this state ("open" or "closed"). If None, all issues are returned.
+            include_pull_requests: Whether to include the pull requests, which the issues API also returns.
+
+        Returns:
+            The issues as returned by the API, ordered by repository and number.
+
+        """
+        query = "SELECT data FROM issues WHERE scope = ?"
+        params: list[Any] = [scope]
+        if state is not None:
+            query += " AND state = ?"
+            params.append(state)
+        if not include_pull_requests:
+            query += " AND is_pull_request = 0"
+        query += " ORDER BY repository, number"
+        with self._lock:
+            rows = self._connect().execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def get_issue(self, scope: str, number: int, repository: str | None = None) -> dict[str, Any] | None:
+        """Get a mirrored issue.
+
+        Args:
+            scope: The key of the repository or organization, see get_scope.
+            number: The issue number.
+            repository: The full name of the repository, for the scope of an organization. Defaults to the scope.
+
+        Returns:
+            The issue as returned by the API, or None if it is not mirrored.
+
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT data FROM issues WHERE scope = ? AND repository = ? AND number = ?",
+                    (scope, repository or scope, number),
+                )
+                .fetchone()
+            )
+        return None if row is None else json.loads(row[0])
+
+    def reset(self, scope: str) -> None:
+        """Remove the mirrored issues and the high-water mark of a scope.
+
+        Args:
+            scope: The key of the repository or organization, see get_scope.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM issues WHERE scope = ?", (scope,))
+            connection.execute("DELETE FROM cursors WHERE scope = ?", (scope,))
+            connection.execute("DELETE FROM repository_cursors WHERE scope = ?", (scope,))
+            connection.execute("COMMIT")
+
+
+def _parse(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp of the API.
+
+    Args:
+        timestamp: The timestamp, e.g. "2024-01-01T00:00:00Z".
+
+    Returns:
+        The datetime.
+
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def _to_row(scope: str, issue: dict[str, Any]) -> tuple[Any, ...]:
+    """Convert an issue to a row of the issues table.
+
+    Args:
+        scope: The key of the repository or organization.
+        issue: The issue as returned by the API.
+
+    Returns:
+        The values of the row.
+
+    """
+    repository = issue.get("repository")
+    full_name = repository.get("full_name") if isinstance(repository, dict) else issue.get("repository_full_name")
+    return (
+        scope,
+        issue["id"],
+        full_name or (None if scope.startswith("org:") else scope),
+        issue["number"],
+        issue.get("state"),
+        issue.get("title"),
+        int(issue.get("pull_request") is not None),
+        issue.get("updated_at"),
+        json.dumps(issue),
+    )
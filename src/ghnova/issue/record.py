@@ -0,0 +1,73 @@
+"""Compact records of GitHub issues."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from ghnova.user.record import UserRecord
+from ghnova.utils.record import Record
+
+
+@dataclass(slots=True)
+class LabelRecord(Record):
+    """Essential fields of a label."""
+
+    id: int | None = None
+    """Numeric ID of the label."""
+    name: str | None = None
+    """Name of the label."""
+    color: str | None = None
+    """Hexadecimal color code of the label."""
+
+
+@dataclass(slots=True)
+class IssueRecord(Record):
+    """Essential fields of an issue."""
+
+    _nested: ClassVar[dict[str, type[Record]]] = {"user": UserRecord, "assignees": UserRecord, "labels": LabelRecord}
+
+    id: int | None = None
+    """Numeric ID of the issue."""
+    node_id: str | None = None
+    """Global node ID of the issue."""
+    number: int | None = None
+    """Number of the issue in its repository."""
+    title: str | None = None
+    """Title of the issue."""
+    body: str | None = None
+    """Body of the issue."""
+    state: str | None = None
+    """State of the issue, "open" or "closed"."""
+    state_reason: str | None = None
+    """Reason for the state of the issue."""
+    locked: bool | None = None
+    """Whether the conversation of the issue is locked."""
+    comments: int | None = None
+    """Number of comments on the issue."""
+    html_url: str | None = None
+    """URL of the issue page."""
+    created_at: str | None = None
+    """Creation time, in ISO 8601 format."""
+    updated_at: str | None = None
+    """Last update time, in ISO 8601 format."""
+    closed_at: str | None = None
+    """Closing time, in ISO 8601 format."""
+    user: UserRecord | None = None
+    """Author of the issue."""
+    assignees: list[UserRecord] = field(default_factory=list)
+    """Users assigned to the issue."""
+    labels: list[LabelRecord] = field(default_factory=list)
+    """Labels of the issue."""
+    pull_request: dict[str, Any] | None = None
+    """Links of the pull request, if the issue is a pull request."""
+
+    @property
+    def is_pull_request(self) -> bool:
+        """Return whether the issue is a pull request.
+
+        Returns:
+            True if the issue is a pull request.
+
+        """
+        return self.pull_request is not None
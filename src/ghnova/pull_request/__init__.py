@@ -2,7 +2,23 @@
 
 from __future__ import annotations
 
-from ghnova.pull_request.async_pull_request import AsyncPullRequest
-from ghnova.pull_request.pull_request import PullRequest
+from typing import TYPE_CHECKING
 
-__all__ = ["AsyncPullRequest", "PullRequest"]
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.pull_request.async_pull_request import AsyncPullRequest
+    from ghnova.pull_request.pull_request import PullRequest
+    from ghnova.pull_request.record import BranchRecord, PullRequestRecord
+
+__all__ = ["AsyncPullRequest", "BranchRecord", "PullRequest", "PullRequestRecord"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncPullRequest": "ghnova.pull_request.async_pull_request",
+        "BranchRecord": "ghnova.pull_request.record",
+        "PullRequest": "ghnova.pull_request.pull_request",
+        "PullRequestRecord": "ghnova.pull_request.record",
+    },
+)
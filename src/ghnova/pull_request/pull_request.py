@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from typing import Any, Literal, cast
 
 from requests import Response
 
 from ghnova.pull_request.base import BasePullRequest
+from ghnova.pull_request.record import PullRequestRecord
 from ghnova.resource.resource import Resource
+from ghnova.utils.pagination import PageCallback
 from ghnova.utils.response import process_response_with_last_modified
 
 
@@ -76,8 +79,10 @@ class PullRequest(Resource, BasePullRequest):
         page: int | None = None,
         etag: str | None = None,
         last_modified: str | None = None,
+        as_records: bool = False,
+        fields: Sequence[str] | None = None,
         **kwargs: Any,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    ) -> tuple[list[dict[str, Any]] | list[PullRequestRecord], dict[str, Any]]:
         """List pull requests from a repository.
 
         Args:
@@ -92,6 +97,9 @@ class PullRequest(Resource, BasePullRequest):
             page: Page number of the results to fetch.
             etag: ETag from a previous request for caching purposes.
             last_modified: Last-Modified header from a previous request for caching purposes.
+            as_records: Whether to return compact PullRequestRecord objects instead of dictionaries.
+            fields: Dotted paths of the fields to keep, e.g. ["number", "user.login"]. Other fields are
+                skipped while decoding.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -112,9 +120,70 @@ class PullRequest(Resource, BasePullRequest):
             last_modified=last_modified,
             **kwargs,
         )
-        data, status_code, etag_value, last_modified_value = process_response_with_last_modified(response)
-        return cast(list[dict[str, Any]], data), {
+        data, status_code, etag_value, last_modified_value = process_response_with_last_modified(
+            response, record_type=PullRequestRecord if as_records else None, fields=fields
+        )
+        return cast(list[Any], data), {
             "status_code": status_code,
             "etag": etag_value,
             "last_modified": last_modified_value,
         }
+
+    def iter_pull_requests(  # noqa: PLR0913
+        self,
+        owner: str,
+        repository: str,
+        state: Literal["open", "closed", "all"] | None = None,
+        head: str | None = None,
+        base: str | None = None,
+        sort: Literal["created", "updated", "popularity", "long-running"] | None = None,
+        direction: Literal["asc", "desc"] | None = None,
+        per_page: int = 100,
+        as_records: bool = False,
+        fields: Sequence[str] | None = None,
+        max_pages: int | None = None,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any] | PullRequestRecord]:
+        """Iterate over all pull requests of a repository, following the pagination links.
+
+        Args:
+            owner: Owner of the repository.
+            repository: Name of the repository.
+            state: Filter by state: open, closed, or all.
+            head: Filter by head branch name.
+            base: Filter by base branch name.
+            sort: Sort by: created, updated, popularity, or long-running.
+            direction: Sort direction: asc or desc.
+            per_page: Number of results per page (max 100).
+            as_records: Whether to return compact PullRequestRecord objects instead of dictionaries.
+            fields: If given, only these dotted field paths of each item are decoded.
+            max_pages: Maximum number of pages to request. If None, all pages are requested.
+            on_page: Optional callback invoked with the progress of the iteration when each page is received.
+            **kwargs: Additional keyword arguments for the request.
+
+        Yields:
+            Each pull request as a dictionary, or as a record if as_records is True, as soon as its page is received.
+
+        """
+        endpoint, params, kwargs = self._list_pull_requests_helper(
+            owner=owner,
+            repository=repository,
+            state=state,
+            head=head,
+            base=base,
+            sort=sort,
+            direction=direction,
+            per_page=per_page,
+            page=1,
+            **kwargs,
+        )
+        yield from self._paginate(
+            endpoint=endpoint,
+            params=params,
+            record_type=PullRequestRecord if as_records else None,
+            fields=fields,
+            max_pages=max_pages,
+            on_page=on_page,
+            **kwargs,
+        )
@@ -0,0 +1,74 @@
+"""Compact records of GitHub pull requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from ghnova.issue.record import LabelRecord
+from ghnova.user.record import UserRecord
+from ghnova.utils.record import Record
+
+
+@dataclass(slots=True)
+class BranchRecord(Record):
+    """Essential fields of the head or base branch of a pull request."""
+
+    label: str | None = None
+    """Label of the branch, e.g. "owner:branch"."""
+    ref: str | None = None
+    """Name of the branch."""
+    sha: str | None = None
+    """SHA of the commit the branch points to."""
+
+
+@dataclass(slots=True)
+class PullRequestRecord(Record):
+    """Essential fields of a pull request."""
+
+    _nested: ClassVar[dict[str, type[Record]]] = {
+        "user": UserRecord,
+        "assignees": UserRecord,
+        "labels": LabelRecord,
+        "head": BranchRecord,
+        "base": BranchRecord,
+    }
+
+    id: int | None = None
+    """Numeric ID of the pull request."""
+    node_id: str | None = None
+    """Global node ID of the pull request."""
+    number: int | None = None
+    """Number of the pull request in its repository."""
+    title: str | None = None
+    """Title of the pull request."""
+    body: str | None = None
+    """Body of the pull request."""
+    state: str | None = None
+    """State of the pull request, "open" or "closed"."""
+    locked: bool | None = None
+    """Whether the conversation of the pull request is locked."""
+    draft: bool | None = None
+    """Whether the pull request is a draft."""
+    html_url: str | None = None
+    """URL of the pull request page."""
+    created_at: str | None = None
+    """Creation time, in ISO 8601 format."""
+    updated_at: str | None = None
+    """Last update time, in ISO 8601 format."""
+    closed_at: str | None = None
+    """Closing time, in ISO 8601 format."""
+    merged_at: str | None = None
+    """Merge time, in ISO 8601 format."""
+    merge_commit_sha: str | None = None
+    """SHA of the merge commit."""
+    user: UserRecord | None = None
+    """Author of the pull request."""
+    assignees: list[UserRecord] = field(default_factory=list)
+    """Users assigned to the pull request."""
+    labels: list[LabelRecord] = field(default_factory=list)
+    """Labels of the pull request."""
+    head: BranchRecord | None = None
+    """Branch holding the changes."""
+    base: BranchRecord | None = None
+    """Branch the changes are merged into."""
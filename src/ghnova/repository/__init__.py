@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
-from ghnova.repository.async_repository import AsyncRepository
-from ghnova.repository.repository import Repository
+from typing import TYPE_CHECKING
 
-__all__ = ["AsyncRepository", "Repository"]
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.repository.async_repository import AsyncRepository
+    from ghnova.repository.record import RepositoryRecord
+    from ghnova.repository.repository import Repository
+
+__all__ = ["AsyncRepository", "Repository", "RepositoryRecord"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncRepository": "ghnova.repository.async_repository",
+        "Repository": "ghnova.repository.repository",
+        "RepositoryRecord": "ghnova.repository.record",
+    },
+)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import Any, Literal, cast
 
 from aiohttp import ClientResponse
 
 from ghnova.repository.base import BaseRepository
+from ghnova.repository.record import RepositoryRecord
 from ghnova.resource.async_resource import AsyncResource
+from ghnova.utils.pagination import PageCallback
 from ghnova.utils.response import process_async_response_with_last_modified
 
 
@@ -85,8 +88,10 @@ class AsyncRepository(BaseRepository, AsyncResource):
         before: datetime | None = None,
         etag: str | None = None,
         last_modified: str | None = None,
+        as_records: bool = False,
+        fields: Sequence[str] | None = None,
         **kwargs: Any,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    ) -> tuple[list[dict[str, Any]] | list[RepositoryRecord], dict[str, Any]]:
         """List repositories information.
 
         Args:
@@ -103,12 +108,15 @@ class AsyncRepository(BaseRepository, AsyncResource):
             before: Only show repositories updated before this time.
             etag: The ETag header value for conditional requests.
             last_modified: The Last-Modified header value for conditional requests.
+            as_records: Whether to return compact RepositoryRecord objects instead of dictionaries.
+            fields: Dotted paths of the fields to keep, e.g. ["number", "user.login"]. Other fields are
+                skipped while decoding.
             **kwargs: Additional arguments for the request.
 
         Returns:
             A tuple containing:
 
-                - A list of dictionaries representing the repositories.
+                - A list of dictionaries representing the repositories, or records if as_records is True.
                 - A dictionary with metadata including status_code, etag, and last_modified.
 
         """
@@ -128,9 +136,77 @@ class AsyncRepository(BaseRepository, AsyncResource):
             last_modified=last_modified,
             **kwargs,
         )
-        data, status_code, etag_value, last_modified_value = await process_async_response_with_last_modified(response)
-        return cast(list[dict[str, Any]], data), {
+        data, status_code, etag_value, last_modified_value = await process_async_response_with_last_modified(
+            response, record_type=RepositoryRecord if as_records else None, fields=fields
+        )
+        return cast(list[Any], data), {
             "status_code": status_code,
             "etag": etag_value,
             "last_modified": last_modified_value,
         }
+
+    async def iter_repositories(  # noqa: PLR0913
+        self,
+        owner: str | None = None,
+        organization: str | None = None,
+        visibility: Literal["all", "public", "private"] | None = None,
+        affiliation: list[Literal["owner", "collaborator", "organization_member"]] | None = None,
+        repository_type: Literal["all", "owner", "public", "private", "member"] | None = None,
+        sort: Literal["created", "updated", "pushed", "full_name"] | None = None,
+        direction: Literal["asc", "desc"] | None = None,
+        per_page: int = 100,
+        since: datetime | None = None,
+        before: datetime | None = None,
+        as_records: bool = False,
+        fields: Sequence[str] | None = None,
+        max_pages: int | None = None,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any] | RepositoryRecord]:
+        """Iterate over all repositories, following the pagination links.
+
+        Args:
+            owner: The owner of the repositories to retrieve. If None, retrieves the authenticated user's repositories.
+            organization: The organization of the repositories to retrieve. If None, retrieves by owner.
+            visibility: The visibility of the repositories. Can be one of "all", "public", or "private".
+            affiliation: A list of affiliations for the repositories. Can include "owner", "collaborator", and/or "organization_member".
+            repository_type: The type of repositories to retrieve. Can be one of "all", "owner", "public", "private", or "member".
+            sort: The field to sort the repositories by. Can be one of "created", "updated", "pushed", or "full_name".
+            direction: The direction to sort the repositories. Can be either "asc" or "desc".
+            per_page: The number of results per page (max 100).
+            since: Only show repositories updated after this time.
+            before: Only show repositories updated before this time.
+            as_records: Whether to return compact RepositoryRecord objects instead of dictionaries.
+            fields: If given, only these dotted field paths of each item are decoded.
+            max_pages: Maximum number of pages to request. If None, all pages are requested.
+            on_page: Optional callback invoked with the progress of the iteration when each page is received.
+            **kwargs: Additional arguments for the request.
+
+        Yields:
+            Each repository as a dictionary, or as a record if as_records is True, as soon as its page is received.
+
+        """
+        endpoint, params, kwargs = self._list_repositories_helper(
+            owner=owner,
+            organization=organization,
+            visibility=visibility,
+            affiliation=affiliation,
+            repository_type=repository_type,
+            sort=sort,
+            direction=direction,
+            per_page=per_page,
+            page=1,
+            since=since,
+            before=before,
+            **kwargs,
+        )
+        async for item in self._paginate(
+            endpoint=endpoint,
+            params=params,
+            record_type=RepositoryRecord if as_records else None,
+            fields=fields,
+            max_pages=max_pages,
+            on_page=on_page,
+            **kwargs,
+        ):
+            yield item
@@ -0,0 +1,55 @@
+"""Compact record of a GitHub repository."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from ghnova.user.record import UserRecord
+from ghnova.utils.record import Record
+
+
+@dataclass(slots=True)
+class RepositoryRecord(Record):
+    """Essential fields of a repository."""
+
+    _nested: ClassVar[dict[str, type[Record]]] = {"owner": UserRecord}
+
+    id: int | None = None
+    """Numeric ID of the repository."""
+    node_id: str | None = None
+    """Global node ID of the repository."""
+    name: str | None = None
+    """Name of the repository."""
+    full_name: str | None = None
+    """Full name of the repository, "owner/name"."""
+    owner: UserRecord | None = None
+    """Owner of the repository."""
+    private: bool | None = None
+    """Whether the repository is private."""
+    fork: bool | None = None
+    """Whether the repository is a fork."""
+    archived: bool | None = None
+    """Whether the repository is archived."""
+    description: str | None = None
+    """Description of the repository."""
+    html_url: str | None = None
+    """URL of the repository page."""
+    default_branch: str | None = None
+    """Name of the default branch."""
+    language: str | None = None
+    """Main language of the repository."""
+    stargazers_count: int | None = None
+    """Number of stars."""
+    forks_count: int | None = None
+    """Number of forks."""
+    open_issues_count: int | None = None
+    """Number of open issues and pull requests."""
+    topics: list[str] = field(default_factory=list)
+    """Topics of the repository."""
+    created_at: str | None = None
+    """Creation time, in ISO 8601 format."""
+    updated_at: str | None = None
+    """Last update time, in ISO 8601 format."""
+    pushed_at: str | None = None
+    """Last push time, in ISO 8601 format."""
@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from ghnova.resource.async_resource import AsyncResource
-from ghnova.resource.resource import Resource
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.resource.async_resource import AsyncResource
+    from ghnova.resource.resource import Resource
 
 __all__ = ["AsyncResource", "Resource"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncResource": "ghnova.resource.async_resource",
+        "Resource": "ghnova.resource.resource",
+    },
+)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import ClientResponse
 
+from ghnova.utils.pagination import PageCallback, PageInfo, get_page_number, parse_link_header
+from ghnova.utils.response import process_async_response_with_last_modified
+
 if TYPE_CHECKING:
     from ghnova.client.async_github import AsyncGitHub
+    from ghnova.utils.record import Record
 
 
 class AsyncResource:
@@ -86,3 +92,123 @@ class AsyncResource:
 
         """
         return await self.client._request(method="PATCH", endpoint=endpoint, **kwargs)
+
+    async def _paginate(  # noqa: PLR0912, PLR0913
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        concurrency: int | None = None,
+        record_type: type[Record] | None = None,
+        fields: Sequence[str] | None = None,
+        max_pages: int | None = None,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of a paginated listing by following the Link header.
+
+        If concurrency is given and the first response advertises the last page (``rel="last"``),
+        the remaining pages are requested at the same time, at most concurrency at once,
+        and their items are still yielded in page order.
+
+        Args:
+            endpoint: The API endpoint of the first page.
+            params: The query parameters of the first page.
+            concurrency: Maximum number of pages fetched at the same time once the last page is known.
+                If None, pages are fetched one after another.
+            record_type: If given, the items are decoded as records of this type instead of dictionaries.
+            fields: If given, only these dotted field paths of each item are decoded.
+            max_pages: Maximum number of pages to request. If None, all pages are requested.
+            on_page: Optional callback invoked with the progress of the iteration when each page is received,
+                in page order.
+            **kwargs: Additional arguments for the requests.
+
+        Yields:
+            The items of each page, as soon as the page is received.
+
+        """
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be a positive integer.")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be a positive integer.")
+        next_endpoint: str | None = endpoint
+        pages = 0
+        while next_endpoint is not None and (max_pages is None or pages < max_pages):
+            response = await self._get(endpoint=next_endpoint, params=params, **kwargs)
+            data, _, _, _ = await process_async_response_with_last_modified(
+                response, record_type=record_type, fields=fields
+            )
+            links = parse_link_header(response.headers.get("Link"))
+            next_endpoint = links.get("next")
+            if not isinstance(data, list):
+                break
+            pages += 1
+            if on_page is not None:
+                on_page(PageInfo(page=pages, items=len(data), headers=response.headers))
+            last_page = get_page_number(links.get("last"))
+            if concurrency is not None and next_endpoint is not None and params is not None and last_page is not None:
+                first_page = int(params.get("page", 1))
+                if max_pages is not None:
+                    last_page = min(last_page, first_page + max_pages - 1)
+                semaphore = asyncio.Semaphore(concurrency)
+                tasks = [
+                    asyncio.create_task(
+                        self._fetch_page(
+                            endpoint=endpoint,
+                            params={**params, "page": page},
+                            semaphore=semaphore,
+                            record_type=record_type,
+                            fields=fields,
+                            **kwargs,
+                        )
+                    )
+                    for page in range(first_page + 1, last_page + 1)
+                ]
+                try:
+                    for item in data:
+                        yield item
+                    for task in tasks:
+                        page_data, headers = await task
+                        pages += 1
+                        if on_page is not None:
+                            on_page(PageInfo(page=pages, items=len(page_data), headers=headers))
+                        for item in page_data:
+                            yield item
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                return
+            # The next link already carries the full query string.
+            params = None
+            for item in data:
+                yield item
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        record_type: type[Record] | None = None,
+        fields: Sequence[str] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[Any], Mapping[str, str]]:
+        """Fetch a single page of a paginated listing.
+
+        Args:
+            endpoint: The API endpoint of the listing.
+            params: The query parameters, including the page number.
+            semaphore: The semaphore bounding the number of pages fetched at the same time.
+            record_type: If given, the items are decoded as records of this type instead of dictionaries.
+            fields: If given, only these dotted field paths of each item are decoded.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The items of the page and the response headers.
+
+        """
+        async with semaphore:
+            response = await self._get(endpoint=endpoint, params=params, **kwargs)
+            data, _, _, _ = await process_async_response_with_last_modified(
+                response, record_type=record_type, fields=fields
+            )
+        return (data if isinstance(data, list) else []), response.headers
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING, Any
 
 from requests import Response
 
+from ghnova.utils.pagination import PageCallback, PageInfo, get_next_link
+from ghnova.utils.response import process_response_with_last_modified
+
 if TYPE_CHECKING:
     from ghnova.client.github import GitHub
+    from ghnova.utils.record import Record
 
 
 class Resource:
@@ -86,3 +91,45 @@ class Resource:
 
         """
         return self.client._request(method="PATCH", endpoint=endpoint, **kwargs)
+
+    def _paginate(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        record_type: type[Record] | None = None,
+        fields: Sequence[str] | None = None,
+        max_pages: int | None = None,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Iterate over the items of a paginated listing by following the Link header.
+
+        Args:
+            endpoint: The API endpoint of the first page.
+            params: The query parameters of the first page.
+            record_type: If given, the items are decoded as records of this type instead of dictionaries.
+            fields: If given, only these dotted field paths of each item are decoded.
+            max_pages: Maximum number of pages to request. If None, all pages are requested.
+            on_page: Optional callback invoked with the progress of the iteration when each page is received.
+            **kwargs: Additional arguments for the requests.
+
+        Yields:
+            The items of each page, as soon as the page is received.
+
+        """
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be a positive integer.")
+        next_endpoint: str | None = endpoint
+        pages = 0
+        while next_endpoint is not None and (max_pages is None or pages < max_pages):
+            response = self._get(endpoint=next_endpoint, params=params, **kwargs)
+            data, _, _, _ = process_response_with_last_modified(response, record_type=record_type, fields=fields)
+            next_endpoint = get_next_link(response.headers)
+            # The next link already carries the full query string.
+            params = None
+            if not isinstance(data, list):
+                break
+            pages += 1
+            if on_page is not None:
+                on_page(PageInfo(page=pages, items=len(data), headers=response.headers))
+            yield from data
@@ -0,0 +1,21 @@
+"""GitHub Search module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.search.async_search import AsyncSearch
+    from ghnova.search.search import Search
+
+__all__ = ["AsyncSearch", "Search"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncSearch": "ghnova.search.async_search",
+        "Search": "ghnova.search.search",
+    },
+)
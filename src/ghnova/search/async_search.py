@@ -0,0 +1,240 @@
+"""Asynchronous Search Resource for GitHub API."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from typing import Any, Literal, cast
+
+from aiohttp import ClientResponse
+
+from ghnova.resource.async_resource import AsyncResource
+from ghnova.search.base import SEARCH_RESULT_CAP, BaseSearch, SearchKind, SplitField, get_split_parts, split_range
+from ghnova.utils.pagination import PageCallback, PageInfo
+from ghnova.utils.response import process_async_response_with_last_modified
+
+logger = logging.getLogger("ghnova")
+
+
+class AsyncSearch(BaseSearch, AsyncResource):
+    """GitHub Asynchronous Search resource."""
+
+    async def _search(  # noqa: PLR0913
+        self,
+        kind: SearchKind,
+        query: str,
+        sort: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        per_page: int = 30,
+        page: int = 1,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        **kwargs: Any,
+    ) -> ClientResponse:
+        """Asynchronously search issues, repositories or users.
+
+        Args:
+            kind: The kind of resource: issues (including pull requests), repositories or users.
+            query: The search query, with qualifiers, e.g. "org:github is:issue is:open".
+            sort: The field to sort the results by. Defaults to best match.
+            order: The sort order.
+            per_page: The number of results per page (max 100).
+            page: The page number.
+            etag: The ETag value for conditional requests.
+            last_modified: The Last-Modified timestamp for conditional requests.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The ClientResponse object from the API call.
+
+        """
+        endpoint, params, kwargs = self._search_helper(
+            kind=kind, query=query, sort=sort, order=order, per_page=per_page, page=page, **kwargs
+        )
+        return await self._get(endpoint=endpoint, params=params, etag=etag, last_modified=last_modified, **kwargs)
+
+    async def search(  # noqa: PLR0913
+        self,
+        kind: SearchKind,
+        query: str,
+        sort: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        per_page: int = 30,
+        page: int = 1,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Asynchronously get a page of the results of a search of issues, repositories or users.
+
+        Search requests count against the search rate limit (30 requests per minute), which the client
+        tracks apart from the core rate limit.
+
+        Args:
+            kind: The kind of resource: issues (including pull requests), repositories or users.
+            query: The search query, with qualifiers, e.g. "org:github is:issue is:open".
+            sort: The field to sort the results by. Defaults to best match.
+            order: The sort order.
+            per_page: The number of results per page (max 100).
+            page: The page number.
+            etag: The ETag value for conditional requests.
+            last_modified: The Last-Modified timestamp for conditional requests.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing:
+
+                - The results, with total_count, incomplete_results and items (empty if 304 Not Modified).
+                - A dictionary with metadata including status_code, etag, and last_modified.
+
+        """
+        response = await self._search(
+            kind=kind,
+            query=query,
+            sort=sort,
+            order=order,
+            per_page=per_page,
+            page=page,
+            etag=etag,
+            last_modified=last_modified,
+            **kwargs,
+        )
+        data, status_code, etag_value, last_modified_value = await process_async_response_with_last_modified(response)
+        return cast(dict[str, Any], data), {
+            "status_code": status_code,
+            "etag": etag_value,
+            "last_modified": last_modified_value,
+        }
+
+    async def iter_search(  # noqa: PLR0913
+        self,
+        kind: SearchKind,
+        query: str,
+        split_by: SplitField | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        sort: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        per_page: int = 100,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously iterate over the results of a search of issues, repositories or users.
+
+        The search API returns at most 1,000 results per query. With split_by, the query is restricted to
+        the date range from since to until, and a range matching more results than the cap is split in
+        slices recursively until every slice is under the cap. The results of the slices are merged
+        without duplicates, so an item updated while the search runs is only returned once. The sort
+        order then holds within each slice only, and the slices are returned from oldest to newest.
+
+        Args:
+            kind: The kind of resource: issues (including pull requests), repositories or users.
+            query: The search query, with qualifiers, e.g. "org:github is:issue is:open".
+            split_by: The date qualifier to split the query on: created, or updated (not for users).
+                If None, at most the first 1,000 results are returned.
+            since: Start of the date range of a split search. Defaults to the launch of GitHub.
+            until: End of the date range of a split search. Defaults to now.
+            sort: The field to sort the results by. Defaults to best match.
+            order: The sort order.
+            per_page: The number of results per page (max 100).
+            on_page: Optional callback invoked with the progress of the search when each page is received.
+            **kwargs: Additional arguments for the requests.
+
+        Yields:
+            Each result as a dictionary, as soon as its page is received.
+
+        """
+        request_numbers = itertools.count(1)
+        search = {"kind": kind, "sort": sort, "order": order, "per_page": per_page, "on_page": on_page, **kwargs}
+        if split_by is None:
+            if since is not None or until is not None:
+                raise ValueError("since and until require split_by.")
+            pages = self._iter_search_pages(query=query, request_numbers=request_numbers, **search)
+            total_count, items = await anext(pages, (0, []))
+            if total_count > SEARCH_RESULT_CAP:
+                logger.warning(
+                    "The search matches %d results but only the first %d are returned. Use split_by to get all.",
+                    total_count,
+                    SEARCH_RESULT_CAP,
+                )
+            for item in items:
+                yield item
+            async for _, items in pages:
+                for item in items:
+                    yield item
+            return
+
+        start, end = self._get_split_range(kind=kind, query=query, split_by=split_by, since=since, until=until)
+        seen: set[Any] = set()
+        ranges = [(start, end)]
+        while ranges:
+            start, end = ranges.pop()
+            slice_query = self._get_slice_query(query=query, split_by=split_by, start=start, end=end)
+            pages = self._iter_search_pages(query=slice_query, request_numbers=request_numbers, **search)
+            total_count, items = await anext(pages, (0, []))
+            if total_count > SEARCH_RESULT_CAP:
+                slices = split_range(start, end, parts=get_split_parts(total_count))
+                if slices is not None:
+                    await pages.aclose()
+                    # Search the oldest slice first.
+                    ranges.extend(reversed(slices))
+                    continue
+                logger.warning(
+                    "%d results of '%s' exceed the cap and cannot be split further; only %d are returned.",
+                    total_count,
+                    slice_query,
+                    SEARCH_RESULT_CAP,
+                )
+            for item in self._drop_seen(items, seen):
+                yield item
+            async for _, page_items in pages:
+                for item in self._drop_seen(page_items, seen):
+                    yield item
+
+    async def _iter_search_pages(  # noqa: PLR0913
+        self,
+        kind: SearchKind,
+        query: str,
+        request_numbers: Iterator[int],
+        sort: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        per_page: int = 100,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[int, list[Any]]]:
+        """Iterate over the pages of results of a query, up to the cap.
+
+        Args:
+            kind: The kind of resource.
+            query: The search query.
+            request_numbers: Counter numbering the requests of the whole search for on_page.
+            sort: The field to sort the results by.
+            order: The sort order.
+            per_page: The number of results per page.
+            on_page: Optional callback invoked when each page is received.
+            **kwargs: Additional arguments for the requests.
+
+        Yields:
+            The total number of results of the query and the results of each page.
+
+        """
+        page = 1
+        while True:
+            response = await self._search(
+                kind=kind, query=query, sort=sort, order=order, per_page=per_page, page=page, **kwargs
+            )
+            data, _, _, _ = await process_async_response_with_last_modified(response)
+            if not isinstance(data, dict):
+                return
+            items = data.get("items") or []
+            total_count = int(data.get("total_count") or 0)
+            if data.get("incomplete_results"):
+                logger.warning("The search of '%s' timed out; its results may be incomplete.", query)
+            if on_page is not None:
+                on_page(PageInfo(page=next(request_numbers), items=len(items), headers=response.headers))
+            yield total_count, items
+            if not items or page >= self._get_last_page(total_count=total_count, per_page=per_page):
+                return
+            page += 1
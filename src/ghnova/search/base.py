@@ -0,0 +1,226 @@
+"""Base class for GitHub Search resource."""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+
+logger = logging.getLogger("ghnova")
+
+SearchKind = Literal["issues", "repositories", "users"]
+
+SplitField = Literal["created", "updated"]
+
+SEARCH_RESULT_CAP = 1000
+"""Maximum number of results the search API returns for a query."""
+
+SPLIT_FILL = 0.8
+"""Fraction of the cap each slice of a split query is sized for, leaving room for uneven distributions."""
+
+SEARCH_EPOCH = datetime(2007, 10, 1, tzinfo=timezone.utc)
+"""Default start of the date range of a split search, before anything was created on GitHub."""
+
+_SPLIT_FIELDS: dict[str, tuple[str, ...]] = {
+    "issues": ("created", "updated"),
+    "repositories": ("created", "updated"),
+    "users": ("created",),
+}
+"""Date qualifiers a search of each kind can be split on."""
+
+
+def format_search_time(value: datetime) -> str:
+    """Format a time for a date qualifier of a search query.
+
+    Args:
+        value: The time. Naive times are taken as UTC.
+
+    Returns:
+        The time in ISO 8601 with seconds and a UTC offset, e.g. "2024-01-01T00:00:00+00:00".
+
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def split_range(start: datetime, end: datetime, parts: int = 2) -> list[tuple[datetime, datetime]] | None:
+    """Split an inclusive date range into consecutive sub-ranges that do not overlap.
+
+    Args:
+        start: Start of the range.
+        end: End of the range.
+        parts: Number of sub-ranges. Fewer are returned if the range has fewer seconds.
+
+    Returns:
+        The sub-ranges in chronological order, or None if the range is one second long and cannot be split.
+
+    """
+    seconds = int((end - start).total_seconds()) + 1
+    if seconds < 2 or parts < 2:  # noqa: PLR2004
+        return None
+    parts = min(parts, seconds)
+    bounds = [start + timedelta(seconds=seconds * index // parts) for index in range(parts + 1)]
+    return [(bounds[index], bounds[index + 1] - timedelta(seconds=1)) for index in range(parts)]
+
+
+def get_split_parts(total_count: int) -> int:
+    """Get the number of slices to split a query into so that each is likely under the cap.
+
+    Splitting in proportion to the number of results, rather than in halves, saves the requests
+    probing intermediate slices that are still over the cap.
+
+    Args:
+        total_count: The number of results of the query.
+
+    Returns:
+        The number of slices, at least 2.
+
+    """
+    return max(2, math.ceil(total_count / (SEARCH_RESULT_CAP * SPLIT_FILL)))
+
+
+class BaseSearch:
+    """Base class for GitHub Search resource."""
+
+    def _search_endpoint(self, kind: SearchKind) -> str:
+        """Get the endpoint searching a kind of resource.
+
+        Args:
+            kind: The kind of resource: issues (including pull requests), repositories or users.
+
+        Returns:
+            The API endpoint.
+
+        """
+        if kind not in _SPLIT_FIELDS:
+            raise ValueError(f"Invalid search kind '{kind}'. Choose from {', '.join(_SPLIT_FIELDS)}.")
+        return f"/search/{kind}"
+
+    def _search_helper(  # noqa: PLR0913
+        self,
+        kind: SearchKind,
+        query: str,
+        sort: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        per_page: int = 30,
+        page: int = 1,
+        **kwargs: Any,
+    ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        """Get the endpoint and arguments of a search request.
+
+        Args:
+            kind: The kind of resource: issues (including pull requests), repositories or users.
+            query: The search query, with qualifiers, e.g. "org:github is:issue is:open".
+            sort: The field to sort the results by, e.g. "created", "updated", "comments", "stars".
+                Defaults to best match.
+            order: The sort order.
+            per_page: The number of results per page (max 100).
+            page: The page number.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing the endpoint and the request arguments.
+                - The API endpoint.
+                - A dictionary of query parameters.
+                - A dictionary of request arguments.
+
+        """
+        endpoint = self._search_endpoint(kind=kind)
+        if not query.strip():
+            raise ValueError("query must not be empty.")
+        default_headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        headers = kwargs.get("headers", {})
+        headers = {**default_headers, **headers}
+        kwargs["headers"] = headers
+
+        params: dict[str, Any] = {"q": query, "per_page": per_page, "page": page}
+        if sort is not None:
+            params["sort"] = sort
+        if order is not None:
+            params["order"] = order
+        return endpoint, params, kwargs
+
+    def _get_split_range(
+        self,
+        kind: SearchKind,
+        query: str,
+        split_by: SplitField,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[datetime, datetime]:
+        """Validate a split search and get its date range.
+
+        Args:
+            kind: The kind of resource.
+            query: The search query.
+            split_by: The date qualifier to split the query on.
+            since: Start of the date range. Defaults to the launch of GitHub.
+            until: End of the date range. Defaults to now.
+
+        Returns:
+            The start and end of the date range, in UTC and rounded to the second.
+
+        """
+        if split_by not in _SPLIT_FIELDS[kind]:
+            raise ValueError(f"A search of {kind} cannot be split on '{split_by}'.")
+        if re.search(rf"(^|\s)-?{split_by}:", query):
+            raise ValueError(f"Give the range of the '{split_by}:' qualifier with since and until instead.")
+        start = datetime.fromisoformat(format_search_time(since or SEARCH_EPOCH))
+        end = datetime.fromisoformat(format_search_time(until or datetime.now(timezone.utc)))
+        if start > end:
+            raise ValueError("since must not be after until.")
+        return start, end
+
+    def _get_slice_query(self, query: str, split_by: SplitField, start: datetime, end: datetime) -> str:
+        """Restrict a search query to a date range.
+
+        Args:
+            query: The search query.
+            split_by: The date qualifier.
+            start: Start of the range.
+            end: End of the range, included.
+
+        Returns:
+            The query with the date qualifier.
+
+        """
+        return f"{query} {split_by}:{format_search_time(start)}..{format_search_time(end)}"
+
+    def _get_last_page(self, total_count: int, per_page: int) -> int:
+        """Get the number of the last page of results the search API returns.
+
+        Args:
+            total_count: The total number of results of the query.
+            per_page: The number of results per page.
+
+        Returns:
+            The number of the last page, counting only the results under the cap.
+
+        """
+        return max(1, -(-min(total_count, SEARCH_RESULT_CAP) // per_page))
+
+    def _drop_seen(self, items: Iterable[Any], seen: set[Any]) -> Iterator[Any]:
+        """Drop the results already returned by another slice of a split search.
+
+        Args:
+            items: The results of a page.
+            seen: The IDs of the results returned so far. The IDs of the new results are added to it.
+
+        Yields:
+            The results that were not returned yet.
+
+        """
+        for item in items:
+            key = item.get("id", item.get("node_id")) if isinstance(item, dict) else None
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield item
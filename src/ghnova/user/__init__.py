@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
-from ghnova.user.async_user import AsyncUser
-from ghnova.user.user import User
+from typing import TYPE_CHECKING
 
-__all__ = ["AsyncUser", "User"]
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.user.async_user import AsyncUser
+    from ghnova.user.record import UserRecord
+    from ghnova.user.user import User
+
+__all__ = ["AsyncUser", "User", "UserRecord"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncUser": "ghnova.user.async_user",
+        "User": "ghnova.user.user",
+        "UserRecord": "ghnova.user.record",
+    },
+)
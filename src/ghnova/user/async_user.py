@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 from aiohttp import ClientResponse
 
 from ghnova.resource.async_resource import AsyncResource
 from ghnova.user.base import BaseUser
+from ghnova.user.record import UserRecord
+from ghnova.utils.pagination import PageCallback
 from ghnova.utils.response import process_async_response_with_last_modified
 
 
@@ -198,8 +201,9 @@ class AsyncUser(BaseUser, AsyncResource):
         per_page: int | None = None,
         etag: str | None = None,
         last_modified: str | None = None,
+        as_records: bool = False,
         **kwargs: Any,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    ) -> tuple[list[dict[str, Any]] | list[UserRecord], dict[str, Any]]:
         """Asynchronously list all users.
 
         Args:
@@ -207,22 +211,61 @@ class AsyncUser(BaseUser, AsyncResource):
             per_page: The number of results per page (max 100).
             etag: The ETag value for conditional requests.
             last_modified: The Last-Modified timestamp for conditional requests.
+            as_records: Whether to return compact UserRecord objects instead of dictionaries.
             **kwargs: Additional arguments for the request.
 
         Returns:
             A tuple containing:
 
-                - A list of user dictionaries (empty if 304 Not Modified).
+                - A list of user dictionaries, or records if as_records is True (empty if 304 Not Modified).
                 - A dictionary with metadata including status_code, etag, and last_modified.
 
         """
         response = await self._list_users(
             since=since, per_page=per_page, etag=etag, last_modified=last_modified, **kwargs
         )
-        data, status_code, etag_value, last_modified_value = await process_async_response_with_last_modified(response)
-        data = cast(list[dict[str, Any]], data)
+        data, status_code, etag_value, last_modified_value = await process_async_response_with_last_modified(
+            response, record_type=UserRecord if as_records else None
+        )
+        data = cast(list[Any], data)
         return data, {"status_code": status_code, "etag": etag_value, "last_modified": last_modified_value}
 
+    async def iter_users(
+        self,
+        since: int | None = None,
+        per_page: int = 100,
+        as_records: bool = False,
+        max_pages: int | None = None,
+        on_page: PageCallback | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any] | UserRecord]:
+        """Iterate over all users, following the pagination links.
+
+        The users endpoint paginates with the ``since`` user ID cursor, which is carried by the Link header.
+
+        Args:
+            since: The integer ID of the last User that you've seen.
+            per_page: The number of results per page (max 100).
+            as_records: Whether to return compact UserRecord objects instead of dictionaries.
+            max_pages: Maximum number of pages to request. If None, all pages are requested.
+            on_page: Optional callback invoked with the progress of the iteration when each page is received.
+            **kwargs: Additional arguments for the request.
+
+        Yields:
+            Each user as a dictionary, or as a record if as_records is True, as soon as its page is received.
+
+        """
+        endpoint, params, kwargs = self._list_users_helper(since=since, per_page=per_page, **kwargs)
+        async for item in self._paginate(
+            endpoint=endpoint,
+            params=params,
+            record_type=UserRecord if as_records else None,
+            max_pages=max_pages,
+            on_page=on_page,
+            **kwargs,
+        ):
+            yield item
+
     async def _get_contextual_information(
         self,
         username: str,
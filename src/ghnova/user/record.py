@@ -0,0 +1,25 @@
+"""Compact record of a GitHub user."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ghnova.utils.record import Record
+
+
+@dataclass(slots=True)
+class UserRecord(Record):
+    """Essential fields of a user."""
+
+    login: str | None = None
+    """Username of the user."""
+    id: int | None = None
+    """Numeric ID of the user."""
+    node_id: str | None = None
+    """Global node ID of the user."""
+    type: str | None = None
+    """Type of the account, e.g. "User", "Organization" or "Bot"."""
+    site_admin: bool | None = None
+    """Whether the user is a site administrator."""
+    html_url: str | None = None
+    """URL of the profile page of the user."""
@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
-from ghnova.utils.log import get_version_information, setup_logger
-from ghnova.utils.response import (
-    process_async_response_with_last_modified,
-    process_response_with_last_modified,
-)
+from typing import TYPE_CHECKING
+
+from ghnova.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from ghnova.utils.log import get_version_information, setup_logger
+    from ghnova.utils.pagination import get_next_link, get_page_number, parse_link_header
+    from ghnova.utils.response import process_async_response_with_last_modified, process_response_with_last_modified
 
 __all__ = [
+    "get_next_link",
+    "get_page_number",
     "get_version_information",
+    "parse_link_header",
     "process_async_response_with_last_modified",
     "process_response_with_last_modified",
     "setup_logger",
 ]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "get_next_link": "ghnova.utils.pagination",
+        "get_page_number": "ghnova.utils.pagination",
+        "get_version_information": "ghnova.utils.log",
+        "parse_link_header": "ghnova.utils.pagination",
+        "process_async_response_with_last_modified": "ghnova.utils.response",
+        "process_response_with_last_modified": "ghnova.utils.response",
+        "setup_logger": "ghnova.utils.log",
+    },
+)
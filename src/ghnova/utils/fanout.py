@@ -0,0 +1,140 @@
+"""Merging of the items fetched for many sources with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_BUFFERED_ITEMS_PER_WORKER = 100
+"""Number of items each worker may fetch ahead of the consumer, about a page."""
+
+_DONE = object()
+"""Sentinel marking the end of the sources."""
+
+
+def iter_fanout(sources: Iterable[T], fetch: Callable[[T], Iterable[R]], concurrency: int = 8) -> Iterator[R]:
+    """Fetch the items of many sources in threads and merge them as they arrive.
+
+    The sources are consumed lazily, so they can be a paginated listing of any length. Each thread takes
+    the next source once it has fetched all items of the previous one, so at most concurrency sources are
+    fetched at the same time. Closing the iterator stops the threads after their current request.
+
+    Args:
+        sources: The sources, e.g. repositories.
+        fetch: Function returning an iterable over the items of a source.
+        concurrency: Maximum number of sources fetched at the same time.
+
+    Yields:
+        The items of all sources, in the order they are received.
+
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    source_iterator = iter(sources)
+    source_lock = threading.Lock()
+    output: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=_BUFFERED_ITEMS_PER_WORKER * concurrency)
+    stop = threading.Event()
+
+    def put(kind: str, value: Any) -> bool:
+        while not stop.is_set():
+            try:
+                output.put((kind, value), timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def worker() -> None:
+        try:
+            while not stop.is_set():
+                with source_lock:
+                    source = next(source_iterator, _DONE)
+                if source is _DONE:
+                    break
+                for item in fetch(source):  # type: ignore[arg-type]
+                    if not put("item", item):
+                        return
+        except Exception as error:
+            put("error", error)
+            return
+        put("done", None)
+
+    threads = [
+        threading.Thread(target=worker, name=f"ghnova-fanout-{index}", daemon=True) for index in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    running = len(threads)
+    try:
+        while running:
+            kind, value = output.get()
+            if kind == "item":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                running -= 1
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+async def aiter_fanout(
+    sources: AsyncIterable[T], fetch: Callable[[T], AsyncIterable[R]], concurrency: int = 8
+) -> AsyncIterator[R]:
+    """Fetch the items of many sources in tasks and merge them as they arrive.
+
+    The asynchronous counterpart of iter_fanout.
+
+    Args:
+        sources: The sources, e.g. repositories.
+        fetch: Function returning an asynchronous iterable over the items of a source.
+        concurrency: Maximum number of sources fetched at the same time.
+
+    Yields:
+        The items of all sources, in the order they are received.
+
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    source_iterator = aiter(sources)
+    # An asynchronous generator cannot be advanced by two tasks at once.
+    source_lock = asyncio.Lock()
+    output: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(maxsize=_BUFFERED_ITEMS_PER_WORKER * concurrency)
+
+    async def worker() -> None:
+        try:
+            while True:
+                async with source_lock:
+                    source = await anext(source_iterator, _DONE)
+                if source is _DONE:
+                    break
+                async for item in fetch(source):  # type: ignore[arg-type]
+                    await output.put(("item", item))
+        except Exception as error:
+            await output.put(("error", error))
+            return
+        await output.put(("done", None))
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            kind, value = await output.get()
+            if kind == "item":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                running -= 1
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
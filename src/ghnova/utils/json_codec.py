@@ -0,0 +1,257 @@
+"""Pluggable JSON codec using the fastest available library."""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib.util
+import json
+from typing import Any
+
+
+def _encode_default(obj: Any) -> Any:
+    """Convert an object that is not JSON serializable.
+
+    Args:
+        obj: The object.
+
+    Returns:
+        The result of to_dict() if the object has it, the fields of a dataclass, or else str(obj).
+
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+class JSONCodec:
+    """Base class for JSON codecs."""
+
+    name = "base"
+    """Name of the codec."""
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+
+        """
+        raise NotImplementedError
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        """Encode an object as JSON.
+
+        Records and other dataclasses are encoded as objects, and any other object that is not JSON
+        serializable is encoded with str().
+
+        Args:
+            obj: The object to encode.
+            indent: Whether to indent the output with two spaces.
+
+        Returns:
+            The JSON document.
+
+        """
+        raise NotImplementedError
+
+
+class StdlibCodec(JSONCodec):
+    """JSON codec based on the json module of the standard library."""
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded object.
+
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        """Encode an object as JSON.
+
+        Args:
+            obj: The object to encode.
+            indent: Whether to indent the output with two spaces.
+
+        Returns:
+            The JSON document.
+
+        """
+        return json.dumps(obj, indent=2 if indent else None, default=_encode_default)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec based on orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec."""
+        import orjson  # noqa: PLC0415
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded object.
+
+        """
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        """Encode an object as JSON.
+
+        Args:
+            obj: The object to encode.
+            indent: Whether to indent the output with two spaces.
+
+        Returns:
+            The JSON document.
+
+        """
+        option = self._orjson.OPT_NON_STR_KEYS | (self._orjson.OPT_INDENT_2 if indent else 0)
+        return self._orjson.dumps(obj, default=_encode_default, option=option).decode()
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec based on msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize the codec."""
+        import msgspec  # noqa: PLC0415
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded object.
+
+        """
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        """Encode an object as JSON.
+
+        Args:
+            obj: The object to encode.
+            indent: Whether to indent the output with two spaces.
+
+        Returns:
+            The JSON document.
+
+        """
+        encoded = self._encoder.encode(obj)
+        if indent:
+            encoded = self._msgspec.json.format(encoded, indent=2)
+        return encoded.decode()
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    StdlibCodec.name: StdlibCodec,
+}
+"""Available codecs, in order of preference."""
+
+_codec: JSONCodec | None = None
+
+
+def _create_default_codec() -> JSONCodec:
+    """Create the fastest installed codec.
+
+    Returns:
+        The orjson codec if installed, else the msgspec codec if installed, else the standard library codec.
+
+    """
+    for name, codec_class in _CODECS.items():
+        if name == StdlibCodec.name or importlib.util.find_spec(name) is not None:
+            return codec_class()
+    return StdlibCodec()  # pragma: no cover
+
+
+def get_codec() -> JSONCodec:
+    """Get the JSON codec in use.
+
+    Returns:
+        The JSON codec.
+
+    """
+    global _codec  # noqa: PLW0603
+    if _codec is None:
+        _codec = _create_default_codec()
+    return _codec
+
+
+def set_codec(codec: JSONCodec | str | None) -> None:
+    """Set the JSON codec used to decode responses and encode output.
+
+    Args:
+        codec: A codec instance, the name of a codec ("orjson", "msgspec" or "json"),
+            or None to select the fastest installed codec.
+
+    """
+    global _codec  # noqa: PLW0603
+    if isinstance(codec, str):
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown JSON codec '{codec}'. Choose from {sorted(_CODECS)}.")
+        codec = _CODECS[codec]()
+    _codec = codec
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document with the codec in use.
+
+    Args:
+        data: The raw JSON document.
+
+    Returns:
+        The decoded object.
+
+    """
+    return get_codec().loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode an object as JSON with the codec in use.
+
+    Args:
+        obj: The object to encode.
+        indent: Whether to indent the output with two spaces.
+
+    Returns:
+        The JSON document.
+
+    """
+    return get_codec().dumps(obj, indent=indent)
@@ -0,0 +1,39 @@
+"""Lazy loading of the public attributes of packages (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def attach(package: str, attributes: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module __getattr__ and __dir__ of a package exporting attributes lazily.
+
+    Each attribute is imported from its module on first access and then stored on the package,
+    so that importing the package does not import the HTTP libraries until they are needed.
+
+    Args:
+        package: The name of the package.
+        attributes: The module of each attribute. An attribute named like a submodule of the
+            package maps to that submodule itself.
+
+    Returns:
+        A tuple of the __getattr__ and __dir__ functions of the package.
+
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name)
+        value = module if module_name == f"{package}.{name}" else getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,91 @@
+"""Pagination utilities based on the Link response header."""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+_LINK_PATTERN = re.compile(r'<(?P<url>[^>]*)>\s*;\s*rel="(?P<rel>[^"]*)"')
+
+
+@dataclass(frozen=True)
+class PageInfo:
+    """Progress of an iteration over a paginated listing, reported when a page is received."""
+
+    page: int
+    """Number of pages received so far, including this one."""
+
+    items: int
+    """Number of items on this page."""
+
+    headers: Mapping[str, str]
+    """Response headers of this page."""
+
+    @property
+    def rate_limit_remaining(self) -> int | None:
+        """Requests remaining in the rate limit window, as reported by the response.
+
+        Returns:
+            The value of the X-RateLimit-Remaining header, or None if the header is missing or invalid.
+
+        """
+        value = self.headers.get("X-RateLimit-Remaining")
+        if value is None or not str(value).isdigit():
+            return None
+        return int(value)
+
+
+PageCallback = Callable[[PageInfo], None]
+"""Callback invoked with the progress of a paginated iteration after each page is received."""
+
+
+def parse_link_header(link_header: str | None) -> dict[str, str]:
+    """Parse a Link header into a mapping of relation types to URLs.
+
+    Args:
+        link_header: The raw value of the Link header.
+
+    Returns:
+        A dictionary mapping each relation type (e.g. "next", "last") to its URL.
+
+    """
+    links: dict[str, str] = {}
+    if not link_header:
+        return links
+    for match in _LINK_PATTERN.finditer(link_header):
+        for rel in match.group("rel").split():
+            links[rel] = match.group("url")
+    return links
+
+
+def get_next_link(headers: Mapping[str, str]) -> str | None:
+    """Get the URL of the next page from the response headers.
+
+    Args:
+        headers: The response headers.
+
+    Returns:
+        The URL of the next page, or None if this is the last page.
+
+    """
+    return parse_link_header(headers.get("Link")).get("next")
+
+
+def get_page_number(url: str | None) -> int | None:
+    """Get the value of the page query parameter of a pagination link.
+
+    Args:
+        url: The pagination link.
+
+    Returns:
+        The page number, or None if the link has no page parameter.
+
+    """
+    if url is None:
+        return None
+    values = urllib.parse.parse_qs(urllib.parse.urlparse(url).query).get("page")
+    if not values or not values[0].isdigit():
+        return None
+    return int(values[0])
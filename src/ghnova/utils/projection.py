@@ -0,0 +1,130 @@
+"""Projection of decoded resources onto selected fields."""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any, TypedDict
+
+from ghnova.utils.json_codec import loads
+
+logger = logging.getLogger("ghnova")
+
+
+def parse_fields(fields: Iterable[str]) -> dict[str, Any]:
+    """Parse dotted field paths into a tree.
+
+    Args:
+        fields: Dotted paths of the fields to keep, e.g. ``["number", "user.login"]``.
+
+    Returns:
+        A nested dictionary mapping each field to the tree of its selected subfields,
+        or to None if the whole field is selected.
+
+    """
+    tree: dict[str, Any] = {}
+    for path in fields:
+        parts = [part.strip() for part in path.split(".")]
+        if not all(parts):
+            raise ValueError(f"Invalid field path '{path}'.")
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                # The whole parent field is already selected.
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def project(value: Any, tree: dict[str, Any]) -> Any:
+    """Keep the selected fields of a decoded value.
+
+    Lists are projected item by item, so ``labels.name`` keeps the name of each label.
+
+    Args:
+        value: The decoded value.
+        tree: The field tree returned by parse_fields.
+
+    Returns:
+        The projected value.
+
+    """
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: value[key] if subtree is None else project(value[key], subtree)
+        for key, subtree in tree.items()
+        if key in value
+    }
+
+
+def _build_type(tree: dict[str, Any], name: str) -> Any:
+    """Build the TypedDict declaring the selected fields of an object.
+
+    Args:
+        tree: The field tree.
+        name: The name of the TypedDict.
+
+    Returns:
+        The TypedDict.
+
+    """
+    annotations: dict[str, Any] = {}
+    for key, subtree in tree.items():
+        if subtree is None:
+            annotations[key] = Any
+        else:
+            nested = _build_type(subtree, name=f"{name}_{key}")
+            annotations[key] = list[nested] | nested | None  # type: ignore[valid-type]
+    return TypedDict(name, annotations, total=False)  # type: ignore[operator]
+
+
+@functools.lru_cache(maxsize=128)
+def _get_decoder(fields: tuple[str, ...]) -> Any:
+    """Get the msgspec decoder of a field selection.
+
+    msgspec skips the fields that are not declared without building them.
+
+    Args:
+        fields: Dotted paths of the fields to keep.
+
+    Returns:
+        The decoder, or None if msgspec is not installed.
+
+    """
+    if importlib.util.find_spec("msgspec") is None:
+        return None
+    import msgspec  # noqa: PLC0415
+
+    projected = _build_type(parse_fields(fields), name="Projection")
+    return msgspec.json.Decoder(list[projected] | projected)  # type: ignore[valid-type]
+
+
+def decode_projected(data: bytes | str, fields: Sequence[str]) -> Any:
+    """Decode a JSON document keeping only the selected fields of each object.
+
+    With msgspec installed, the fields that are not selected are skipped while decoding. Otherwise, or if
+    the document does not match the selection, the document is decoded with the JSON codec in use and
+    projected afterwards.
+
+    Args:
+        data: The raw JSON document, an object or an array of objects.
+        fields: Dotted paths of the fields to keep, e.g. ``["number", "user.login"]``.
+
+    Returns:
+        The decoded value with the selected fields only.
+
+    """
+    decoder = _get_decoder(tuple(fields))
+    if decoder is not None:
+        try:
+            return decoder.decode(data)
+        except Exception as e:
+            logger.debug("Falling back to projecting decoded dictionaries: %s", e)
+    return project(loads(data), parse_fields(fields))
@@ -0,0 +1,110 @@
+"""Compact typed records of API resources."""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib.util
+import logging
+from typing import Any, ClassVar, TypeVar
+
+from ghnova.utils.json_codec import loads
+
+logger = logging.getLogger("ghnova")
+
+RecordT = TypeVar("RecordT", bound="Record")
+
+_decoders: dict[type, Any] = {}
+"""msgspec decoders of record lists, by record type."""
+
+
+class Record:
+    """Base class of the slotted dataclasses holding the essential fields of a resource.
+
+    Subclasses are declared with ``@dataclass(slots=True)``. Fields missing from the payload keep their
+    defaults and fields of the payload that are not declared are dropped.
+    """
+
+    __slots__ = ()
+
+    _nested: ClassVar[dict[str, type[Record]]] = {}
+    """Record types of the fields holding nested objects or lists of nested objects."""
+
+    @classmethod
+    def from_dict(cls: type[RecordT], data: dict[str, Any]) -> RecordT:
+        """Create a record from the dictionary of a resource.
+
+        Args:
+            data: The resource as returned by the API.
+
+        Returns:
+            The record.
+
+        """
+        values: dict[str, Any] = {}
+        for field in dataclasses.fields(cls):  # type: ignore[arg-type]
+            if field.name not in data:
+                continue
+            value = data[field.name]
+            nested = cls._nested.get(field.name)
+            if nested is not None and value is not None:
+                value = (
+                    [nested.from_dict(item) for item in value] if isinstance(value, list) else nested.from_dict(value)
+                )
+            values[field.name] = value
+        return cls(**values)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record to a dictionary.
+
+        Returns:
+            The fields of the record, with nested records converted as well.
+
+        """
+        return dataclasses.asdict(self)  # type: ignore[call-overload]
+
+
+def _get_decoder(record_type: type[Record]) -> Any:
+    """Get the msgspec decoder of a list of records.
+
+    Args:
+        record_type: The record type.
+
+    Returns:
+        The decoder, or None if msgspec is not installed.
+
+    """
+    if record_type not in _decoders:
+        if importlib.util.find_spec("msgspec") is None:
+            _decoders[record_type] = None
+        else:
+            import msgspec  # noqa: PLC0415
+
+            _decoders[record_type] = msgspec.json.Decoder(list[record_type])  # type: ignore[valid-type]
+    return _decoders[record_type]
+
+
+def decode_records(data: bytes | str, record_type: type[RecordT]) -> list[RecordT]:
+    """Decode a JSON array of resources into records.
+
+    With msgspec installed, the records are decoded straight from the raw document without building
+    intermediate dictionaries. Otherwise, or if the document does not match the record fields, the document
+    is decoded with the JSON codec in use and the records are built from the dictionaries.
+
+    Args:
+        data: The raw JSON document.
+        record_type: The record type.
+
+    Returns:
+        The records, or an empty list if the document is not an array.
+
+    """
+    decoder = _get_decoder(record_type)
+    if decoder is not None:
+        try:
+            return decoder.decode(data)
+        except Exception as e:
+            logger.debug("Falling back to dictionaries to decode %s: %s", record_type.__name__, e)
+    items = loads(data)
+    if not isinstance(items, list):
+        return []
+    return [record_type.from_dict(item) for item in items if isinstance(item, dict)]
@@ -3,26 +3,62 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientResponse, ContentTypeError
-from requests import Response
+from ghnova.utils.json_codec import loads
+from ghnova.utils.projection import decode_projected
+from ghnova.utils.record import decode_records
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from aiohttp import ClientResponse
+    from requests import Response
+
+    from ghnova.utils.record import Record
 
 logger = logging.getLogger("ghnova")
 
 
+def _decode_body(body: bytes, record_type: type[Record] | None = None, fields: Sequence[str] | None = None) -> Any:
+    """Decode the JSON body of a response.
+
+    Args:
+        body: The raw body.
+        record_type: If given, the body is decoded as a list of records of this type.
+        fields: If given, only these dotted field paths (e.g. "user.login") are kept while decoding.
+
+    Returns:
+        The decoded body.
+
+    """
+    if record_type is not None:
+        return decode_records(body, record_type)
+    if fields:
+        return decode_projected(body, fields)
+    return loads(body)
+
+
 def process_response_with_last_modified(
     response: Response,
-) -> tuple[dict[str, Any] | list[dict[str, Any]], int, str | None, str | None]:
+    record_type: type[Record] | None = None,
+    fields: Sequence[str] | None = None,
+) -> tuple[dict[str, Any] | list[dict[str, Any]] | list[Any], int, str | None, str | None]:
     """Process an HTTP response and extract data, status, ETag, and Last-Modified.
 
+    The body is decoded from the raw bytes with the JSON codec in use (see ghnova.utils.json_codec).
+
     Args:
         response: The HTTP response object.
+        record_type: If given, the body is decoded as a list of records of this type.
+        fields: If given, only these dotted field paths (e.g. "user.login") are kept while decoding.
 
     Returns:
         A tuple containing the response data, status code, ETag, and Last-Modified.
 
     """
+    if record_type is not None and fields:
+        raise ValueError("fields cannot be combined with records.")
     status_code = response.status_code
     etag = response.headers.get("ETag", None)
     last_modified = response.headers.get("Last-Modified", None)
@@ -30,7 +66,7 @@ def process_response_with_last_modified(
         data = {}
     elif 200 <= status_code < 300:  # noqa: PLR2004
         try:
-            data = response.json()
+            data = _decode_body(response.content, record_type=record_type, fields=fields)
         except ValueError as e:
             logger.error("Failed to parse JSON response: %s", e)
             data = {}
@@ -41,16 +77,22 @@ def process_response_with_last_modified(
 
 async def process_async_response_with_last_modified(
     response: ClientResponse,
-) -> tuple[dict[str, Any] | list[dict[str, Any]], int, str | None, str | None]:
+    record_type: type[Record] | None = None,
+    fields: Sequence[str] | None = None,
+) -> tuple[dict[str, Any] | list[dict[str, Any]] | list[Any], int, str | None, str | None]:
     """Process an asynchronous HTTP response and extract data, status, ETag, and Last-Modified.
 
     Args:
         response: The asynchronous HTTP response object.
+        record_type: If given, the body is decoded as a list of records of this type.
+        fields: If given, only these dotted field paths (e.g. "user.login") are kept while decoding.
 
     Returns:
         A tuple containing the response data, status code, ETag, and Last-Modified.
 
     """
+    if record_type is not None and fields:
+        raise ValueError("fields cannot be combined with records.")
     status_code = response.status
     etag = response.headers.get("ETag", None)
     last_modified = response.headers.get("Last-Modified", None)
@@ -58,8 +100,8 @@ async def process_async_response_with_last_modified(
         data = {}
     elif 200 <= status_code < 300:  # noqa: PLR2004
         try:
-            data = await response.json()
-        except (ValueError, ContentTypeError) as e:
+            data = _decode_body(await response.read(), record_type=record_type, fields=fields)
+        except ValueError as e:
             logger.error("Failed to parse JSON response: %s", e)
             data = {}
     else:
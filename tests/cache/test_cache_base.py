@@ -0,0 +1,76 @@
+"""Unit tests for the cache base classes."""
+
+import pytest
+
+from ghnova.cache.base import CacheEntry, ResponseCache, make_cache_key
+
+
+class TestCacheEntry:
+    """Test cases for the CacheEntry class."""
+
+    def test_from_response_drops_transfer_headers(self):
+        """Test that transfer-related headers are not cached."""
+        entry = CacheEntry.from_response(
+            body=b"[]",
+            headers={"ETag": '"abc"', "Content-Encoding": "gzip", "Content-Length": "20", "Link": "<x>"},
+        )
+        assert entry.headers == {"ETag": '"abc"', "Link": "<x>"}
+        assert entry.status_code == 200  # noqa: PLR2004
+
+    def test_validators(self):
+        """Test the ETag and Last-Modified properties are case-insensitive."""
+        entry = CacheEntry(body=b"{}", headers={"etag": '"abc"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert entry.etag == '"abc"'
+        assert entry.last_modified == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def test_validators_missing(self):
+        """Test the validators of an entry without them."""
+        entry = CacheEntry(body=b"{}", headers={})
+        assert entry.etag is None
+        assert entry.last_modified is None
+
+    def test_size(self):
+        """Test the size of an entry."""
+        entry = CacheEntry(body=b"12345", headers={"ab": "cd"})
+        assert entry.size == 9  # noqa: PLR2004
+
+
+class TestResponseCache:
+    """Test cases for the ResponseCache base class."""
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [("get", ("key",)), ("set", ("key", CacheEntry(b"", {}))), ("delete", ("key",)), ("clear", ())],
+    )
+    def test_not_implemented(self, method, args):
+        """Test that the base class methods are abstract."""
+        with pytest.raises(NotImplementedError):
+            getattr(ResponseCache(), method)(*args)
+
+
+class TestMakeCacheKey:
+    """Test cases for make_cache_key."""
+
+    def test_key_is_stable_across_param_order(self):
+        """Test that the key does not depend on the order of the parameters."""
+        key1 = make_cache_key("GET", "https://api.github.com/issues", {"a": 1, "b": 2}, {})
+        key2 = make_cache_key("get", "https://api.github.com/issues", {"b": 2, "a": 1}, {})
+        assert key1 == key2
+
+    def test_key_depends_on_auth_identity(self):
+        """Test that different tokens never share an entry."""
+        key1 = make_cache_key("GET", "https://api.github.com/user", None, {"Authorization": "Bearer a"})
+        key2 = make_cache_key("GET", "https://api.github.com/user", None, {"Authorization": "Bearer b"})
+        key3 = make_cache_key("GET", "https://api.github.com/user", None, {})
+        assert len({key1, key2, key3}) == 3  # noqa: PLR2004
+
+    def test_key_does_not_contain_token(self):
+        """Test that the token does not appear in the key."""
+        key = make_cache_key("GET", "https://api.github.com/user", None, {"Authorization": "Bearer secret"})
+        assert "secret" not in key
+
+    def test_key_depends_on_accept_header(self):
+        """Test that different media types are cached separately."""
+        key1 = make_cache_key("GET", "https://api.github.com/x", None, {"Accept": "application/vnd.github+json"})
+        key2 = make_cache_key("GET", "https://api.github.com/x", None, {"Accept": "application/vnd.github.raw"})
+        assert key1 != key2
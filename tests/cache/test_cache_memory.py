@@ -0,0 +1,46 @@
+"""Unit tests for the in-memory response cache."""
+
+import pytest
+
+from ghnova.cache.base import CacheEntry
+from ghnova.cache.memory import MemoryCache
+
+
+class TestMemoryCache:
+    """Test cases for the MemoryCache class."""
+
+    def test_get_set(self):
+        """Test storing and retrieving an entry."""
+        cache = MemoryCache()
+        entry = CacheEntry(body=b"{}", headers={"ETag": '"a"'})
+        cache.set("key", entry)
+        assert cache.get("key") is entry
+        assert cache.get("missing") is None
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", CacheEntry(body=b"a", headers={}))
+        cache.set("b", CacheEntry(body=b"b", headers={}))
+        cache.get("a")
+        cache.set("c", CacheEntry(body=b"c", headers={}))
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_delete_and_clear(self):
+        """Test deleting and clearing entries."""
+        cache = MemoryCache()
+        cache.set("a", CacheEntry(body=b"a", headers={}))
+        cache.set("b", CacheEntry(body=b"b", headers={}))
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_entries(self):
+        """Test that max_entries must be positive."""
+        with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+            MemoryCache(max_entries=0)
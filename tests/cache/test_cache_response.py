@@ -0,0 +1,30 @@
+"""Unit tests for cached response replay."""
+
+import pytest
+
+from ghnova.cache.base import CacheEntry
+from ghnova.cache.response import CachedClientResponse
+
+
+class TestCachedClientResponse:
+    """Test cases for the CachedClientResponse class."""
+
+    @pytest.mark.asyncio
+    async def test_replay(self):
+        """Test the cached body and headers are replayed."""
+        entry = CacheEntry(body=b'[{"id": 1}]', headers={"ETag": '"old"', "Link": "<x>"})
+        response = CachedClientResponse(
+            entry=entry, url="https://api.github.com/x", headers={"ETag": '"new"', "Content-Length": "0"}
+        )
+
+        assert response.status == 200  # noqa: PLR2004
+        assert response.ok
+        assert response.headers["etag"] == '"new"'
+        assert response.headers["Link"] == "<x>"
+        assert "Content-Length" not in response.headers
+        assert await response.read() == b'[{"id": 1}]'
+        assert await response.text() == '[{"id": 1}]'
+        assert await response.json() == [{"id": 1}]
+        response.raise_for_status()
+        response.release()
+        response.close()
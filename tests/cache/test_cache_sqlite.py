@@ -0,0 +1,149 @@
+"""Unit tests for the SQLite response cache."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from ghnova.cache.base import CacheEntry
+from ghnova.cache.sqlite import TOUCH_INTERVAL, SQLiteCache, get_default_cache_path
+
+
+class TestSQLiteCache:
+    """Test cases for the SQLiteCache class."""
+
+    def test_default_path(self):
+        """Test the default cache location."""
+        assert get_default_cache_path().name == "http_cache.sqlite"
+        assert SQLiteCache().path == get_default_cache_path()
+
+    def test_lazy_connection(self, tmp_path):
+        """Test that the database is only created on first use."""
+        path = tmp_path / "sub" / "cache.sqlite"
+        cache = SQLiteCache(path=path)
+        assert not path.exists()
+        assert cache.get("missing") is None
+        assert path.exists()
+        cache.close()
+
+    def test_wal_mode(self, tmp_path):
+        """Test that the database runs in WAL mode."""
+        path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=path)
+        cache.get("missing")
+        cache.close()
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_get_set_across_instances(self, tmp_path):
+        """Test that entries persist across cache instances."""
+        path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=path)
+        cache.set("key", CacheEntry(body=b'[{"id": 1}]', headers={"ETag": '"a"', "Link": "<x>"}))
+        cache.close()
+
+        entry = SQLiteCache(path=path).get("key")
+        assert entry is not None
+        assert entry.body == b'[{"id": 1}]'
+        assert entry.etag == '"a"'
+        assert entry.headers["Link"] == "<x>"
+        assert entry.status_code == 200  # noqa: PLR2004
+
+    def test_lru_eviction(self, tmp_path, monkeypatch):
+        """Test that the least recently used entries are evicted when over budget."""
+        clock = iter(range(0, 10000, 100))
+        monkeypatch.setattr("ghnova.cache.sqlite.time.time", lambda: float(next(clock)))
+        cache = SQLiteCache(path=tmp_path / "cache.sqlite", max_size=25)
+        cache.set("a", CacheEntry(body=b"x" * 10, headers={}))
+        cache.set("b", CacheEntry(body=b"x" * 10, headers={}))
+        cache.get("a")
+        cache.set("c", CacheEntry(body=b"x" * 10, headers={}))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_access_time_is_throttled(self, tmp_path, monkeypatch):
+        """Test that reads update the access time at most once per touch interval."""
+        now = [1000.0]
+        monkeypatch.setattr("ghnova.cache.sqlite.time.time", lambda: now[0])
+        path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=path)
+        cache.set("a", CacheEntry(body=b"x", headers={}))
+
+        def accessed_at() -> float:
+            with sqlite3.connect(path) as connection:
+                return connection.execute("SELECT accessed_at FROM responses WHERE key = 'a'").fetchone()[0]
+
+        now[0] += TOUCH_INTERVAL / 2
+        assert cache.get("a") is not None
+        assert accessed_at() == 1000.0  # noqa: PLR2004
+        now[0] += TOUCH_INTERVAL
+        assert cache.get("a") is not None
+        assert accessed_at() == now[0]
+
+    def test_total_size_is_tracked(self, tmp_path):
+        """Test that the running total size follows inserts, replacements and deletions."""
+        path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=path)
+        cache.set("a", CacheEntry(body=b"x" * 10, headers={}))
+        cache.set("b", CacheEntry(body=b"x" * 10, headers={}))
+        cache.set("a", CacheEntry(body=b"x" * 4, headers={}))
+        cache.delete("b")
+
+        def total_size() -> int:
+            with sqlite3.connect(path) as connection:
+                return connection.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()[0]
+
+        assert total_size() == cache.stats()["size"] == 4  # noqa: PLR2004
+        cache.clear()
+        assert total_size() == 0
+
+    def test_total_size_of_existing_database(self, tmp_path):
+        """Test that the running total is seeded from a database created before it was tracked."""
+        path = tmp_path / "cache.sqlite"
+        with sqlite3.connect(path) as connection:
+            connection.executescript(
+                "CREATE TABLE responses (key TEXT PRIMARY KEY, status_code INTEGER NOT NULL, headers TEXT NOT NULL, "
+                "body BLOB NOT NULL, size INTEGER NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL);"
+                "INSERT INTO responses VALUES ('old', 200, '{}', x'00', 30, 0, 0);"
+            )
+        connection.close()
+        cache = SQLiteCache(path=path, max_size=35)
+
+        cache.set("new", CacheEntry(body=b"x" * 10, headers={}))
+
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+
+    def test_delete_clear_and_stats(self, tmp_path):
+        """Test deleting, clearing and the statistics."""
+        cache = SQLiteCache(path=tmp_path / "cache.sqlite")
+        cache.set("a", CacheEntry(body=b"12345", headers={}))
+        cache.set("b", CacheEntry(body=b"12345", headers={}))
+        cache.delete("a")
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["size"] == 5  # noqa: PLR2004
+        assert stats["path"] == str(tmp_path / "cache.sqlite")
+        assert stats["oldest"] is not None
+
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_prune(self, tmp_path):
+        """Test pruning to an explicit size budget."""
+        cache = SQLiteCache(path=tmp_path / "cache.sqlite")
+        for key in "abc":
+            cache.set(key, CacheEntry(body=b"x" * 10, headers={}))
+
+        assert cache.prune() == 0
+        assert cache.prune(max_size=15) == 2  # noqa: PLR2004
+        assert cache.stats()["entries"] == 1
+
+    def test_invalid_max_size(self):
+        """Test that the size budget must not be negative."""
+        with pytest.raises(ValueError, match="max_size must not be negative"):
+            SQLiteCache(max_size=-1)
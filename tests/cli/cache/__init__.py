@@ -0,0 +1 @@
+"""Unit tests for the ghnova cache CLI."""
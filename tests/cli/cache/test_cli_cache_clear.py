@@ -0,0 +1,28 @@
+"""Tests for the cache clear CLI command."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from ghnova.cache.base import CacheEntry
+from ghnova.cache.sqlite import SQLiteCache
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestClearCommand:
+    """Tests for the cache clear command."""
+
+    def test_clear(self, tmp_path) -> None:
+        """Test clearing the cache."""
+        cache_path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=cache_path)
+        cache.set("a", CacheEntry(body=b"x", headers={}))
+        cache.close()
+
+        result = runner.invoke(app, ["--cache-path", str(cache_path), "cache", "clear"])
+
+        assert result.exit_code == 0
+        assert "Cleared the cache" in result.stdout
+        assert SQLiteCache(path=cache_path).stats()["entries"] == 0
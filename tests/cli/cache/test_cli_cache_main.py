@@ -0,0 +1,25 @@
+"""Tests for the cache CLI main module."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from ghnova.cli.cache.main import cache_app
+
+runner = CliRunner()
+
+
+class TestCacheApp:
+    """Tests for the cache app."""
+
+    def test_cache_help(self) -> None:
+        """Test that cache help works."""
+        result = runner.invoke(cache_app, ["--help"])
+        assert result.exit_code == 0
+        assert "cache" in result.stdout.lower()
+
+    def test_cache_commands_exist(self) -> None:
+        """Test that the subcommands are available."""
+        for command in ("clear", "prune", "stats"):
+            result = runner.invoke(cache_app, [command, "--help"])
+            assert result.exit_code == 0
@@ -0,0 +1,36 @@
+"""Tests for the cache prune CLI command."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from ghnova.cache.base import CacheEntry
+from ghnova.cache.sqlite import SQLiteCache
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestPruneCommand:
+    """Tests for the cache prune command."""
+
+    def test_prune(self, tmp_path) -> None:
+        """Test pruning the cache to a size budget."""
+        cache_path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=cache_path)
+        cache.set("a", CacheEntry(body=b"x" * 10, headers={}))
+        cache.set("b", CacheEntry(body=b"x" * 10, headers={}))
+        cache.close()
+
+        result = runner.invoke(app, ["--cache-path", str(cache_path), "cache", "prune", "--max-size", "10"])
+
+        assert result.exit_code == 0
+        assert "Evicted 1 entries." in result.stdout
+
+    def test_prune_negative_size(self, tmp_path) -> None:
+        """Test that a negative size budget is rejected."""
+        result = runner.invoke(
+            app, ["--cache-path", str(tmp_path / "cache.sqlite"), "cache", "prune", "--max-size", "-1"]
+        )
+
+        assert result.exit_code == 1
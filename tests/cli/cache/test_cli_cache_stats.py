@@ -0,0 +1,37 @@
+"""Tests for the cache stats CLI command."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from ghnova.cache.base import CacheEntry
+from ghnova.cache.sqlite import SQLiteCache
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestStatsCommand:
+    """Tests for the cache stats command."""
+
+    def test_stats(self, tmp_path) -> None:
+        """Test showing the statistics of a populated cache."""
+        cache_path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path=cache_path)
+        cache.set("key", CacheEntry(body=b"12345", headers={}))
+        cache.close()
+
+        result = runner.invoke(app, ["--cache-path", str(cache_path), "cache", "stats"])
+
+        assert result.exit_code == 0
+        assert f"Cache path: {cache_path}" in result.stdout
+        assert "Entries: 1" in result.stdout
+        assert "Size: 5 bytes" in result.stdout
+
+    def test_stats_empty(self, tmp_path) -> None:
+        """Test showing the statistics of an empty cache."""
+        result = runner.invoke(app, ["--cache-path", str(tmp_path / "cache.sqlite"), "cache", "stats"])
+
+        assert result.exit_code == 0
+        assert "Entries: 0" in result.stdout
+        assert "Oldest entry: None" in result.stdout
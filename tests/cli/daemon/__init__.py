@@ -0,0 +1 @@
+"""Unit tests for the daemon CLI commands."""
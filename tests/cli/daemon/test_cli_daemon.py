@@ -0,0 +1,184 @@
+"""Tests for the daemon CLI commands."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from ghnova.cli.main import app
+from ghnova.daemon.server import DaemonServer
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Path of a daemon socket in a short temporary directory."""
+    directory = tempfile.mkdtemp(prefix="ghnova-")
+    yield Path(directory) / "daemon.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def server(socket_path) -> Iterator[DaemonServer]:
+    """Serve a daemon in a thread."""
+    server = DaemonServer(socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+class TestStatusCommand:
+    """Tests for the daemon status command."""
+
+    def test_status_running(self, server, socket_path) -> None:
+        """Test the status of a running daemon."""
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "status"])
+
+        assert result.exit_code == 0
+        assert f"The daemon is running at {socket_path}." in result.stdout
+        assert "Warm clients: 0" in result.stdout
+
+    def test_status_not_running(self, socket_path) -> None:
+        """Test the status when no daemon is running."""
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "status"])
+
+        assert result.exit_code == 1
+        assert "not running" in result.stdout
+
+
+class TestStopCommand:
+    """Tests for the daemon stop command."""
+
+    def test_stop(self, socket_path) -> None:
+        """Test stopping a running daemon."""
+        server = DaemonServer(socket_path=socket_path)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "stop"])
+        thread.join(timeout=5)
+        server.server_close()
+
+        assert result.exit_code == 0
+        assert "Stopped the daemon" in result.stdout
+        assert not thread.is_alive()
+
+    def test_stop_not_running(self, socket_path) -> None:
+        """Test stopping when no daemon is running."""
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "stop"])
+
+        assert result.exit_code == 1
+
+
+class TestStartCommand:
+    """Tests for the daemon start command."""
+
+    def test_start_foreground(self, socket_path) -> None:
+        """Test serving in the foreground until the idle timeout."""
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "start", "--idle-timeout", "0.1"])
+
+        assert result.exit_code == 0
+        assert f"Serving at {socket_path}." in result.stdout
+        assert not socket_path.exists()
+
+    def test_start_already_running(self, server, socket_path) -> None:
+        """Test that a second daemon is not started."""
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "start"])
+
+        assert result.exit_code == 1
+
+    def test_start_invalid_idle_timeout(self, socket_path) -> None:
+        """Test that the idle timeout must be positive."""
+        result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "start", "--idle-timeout", "0"])
+
+        assert result.exit_code == 1
+
+    def test_start_detach(self, socket_path) -> None:
+        """Test starting the daemon in a detached process."""
+        result = runner.invoke(
+            app, ["--daemon-socket", str(socket_path), "daemon", "start", "--detach", "--idle-timeout", "30"]
+        )
+        try:
+            assert result.exit_code == 0
+            assert f"Started the daemon at {socket_path}." in result.stdout
+        finally:
+            runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "stop"])
+
+    def test_start_detach_failure(self, socket_path) -> None:
+        """Test reporting a daemon that did not start."""
+        with patch("ghnova.cli.daemon.start._spawn", return_value=False):
+            result = runner.invoke(app, ["--daemon-socket", str(socket_path), "daemon", "start", "--detach"])
+
+        assert result.exit_code == 1
+
+
+class TestDaemonRouting:
+    """Tests for the routing of commands through the daemon."""
+
+    def test_command_served_by_daemon(self, server, socket_path) -> None:
+        """Test that a command is served by the warm client of the daemon."""
+        with patch.object(server, "get_client") as mock_get_client:
+            mock_get_client.return_value.user.get_user.return_value = ({"login": "octocat"}, {"status_code": 200})
+
+            result = runner.invoke(
+                app,
+                [
+                    "--daemon-socket",
+                    str(socket_path),
+                    "--no-cache",
+                    "user",
+                    "get",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--username",
+                    "octocat",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert '"login": "octocat"' in result.stdout
+        mock_get_client.assert_called_once_with(
+            token="t", base_url="https://github.com", cache_path=None, no_cache=True
+        )
+
+    def test_no_daemon(self, server, socket_path) -> None:
+        """Test that --no-daemon runs the command in-process."""
+        with (
+            patch.object(server, "get_client") as mock_get_client,
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            client = mock_github.return_value.__enter__.return_value
+            client.user.get_user.return_value = ({"login": "octocat"}, {"status_code": 200})
+
+            result = runner.invoke(
+                app,
+                [
+                    "--daemon-socket",
+                    str(socket_path),
+                    "--no-daemon",
+                    "--no-cache",
+                    "user",
+                    "get",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                ],
+            )
+
+        assert result.exit_code == 0
+        mock_get_client.assert_not_called()
+        client.user.get_user.assert_called_once()
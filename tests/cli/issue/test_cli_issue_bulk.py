@@ -0,0 +1,71 @@
+"""Tests for the issue bulk CLI command."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+BASE_ARGS = ["--no-cache", "issue", "bulk", "--token", "t", "--base-url", "https://github.com", "--min-interval", "0"]
+
+
+def _response(status_code: int, data: dict) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.content = json.dumps(data).encode()
+    return response
+
+
+class TestBulkCommand:
+    """Tests for the issue bulk command."""
+
+    def test_bulk(self, tmp_path) -> None:
+        """Test running operations from a file and resuming from the checkpoint."""
+        input_path = tmp_path / "ops.jsonl"
+        input_path.write_text(
+            json.dumps({"op": "create", "owner": "octocat", "repository": "hello", "title": "Bug"})
+            + "\n"
+            + json.dumps(
+                {"op": "update", "owner": "octocat", "repository": "hello", "issue_number": 1, "state": "closed"}
+            )
+            + "\n"
+        )
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue._create_issue.return_value = _response(201, {"number": 2})
+            mock_client.issue._update_issue.return_value = _response(200, {"number": 1})
+
+            result = runner.invoke(app, [*BASE_ARGS, "--input", str(input_path)])
+            resumed = runner.invoke(app, [*BASE_ARGS, "--input", str(input_path)])
+
+        assert result.exit_code == 0
+        statuses = sorted(json.loads(line)["status"] for line in result.stdout.splitlines())
+        assert statuses == ["created", "updated"]
+        assert (tmp_path / "ops.jsonl.checkpoint").exists()
+        assert resumed.exit_code == 0
+        assert [json.loads(line)["status"] for line in resumed.stdout.splitlines()] == ["skipped", "skipped"]
+        mock_client.issue._create_issue.assert_called_once()
+
+    def test_bulk_failure(self, tmp_path) -> None:
+        """Test that the command exits with status 1 if an operation failed."""
+        input_path = tmp_path / "ops.jsonl"
+        input_path.write_text("not json\n")
+        with patch("ghnova.client.github.GitHub"):
+            result = runner.invoke(app, [*BASE_ARGS, "--input", str(input_path), "--no-checkpoint", "--format", "json"])
+
+        assert result.exit_code == 1
+        output = json.loads(result.stdout)
+        assert output["data"][0]["status"] == "failed"
+        assert output["metadata"] == {"failed": 1}
+        assert not (tmp_path / "ops.jsonl.checkpoint").exists()
+
+    def test_bulk_stdin_requires_checkpoint(self) -> None:
+        """Test that a checkpoint path is required when reading the standard input."""
+        result = runner.invoke(app, [*BASE_ARGS, "--input", "-"], input="")
+        assert result.exit_code == 1
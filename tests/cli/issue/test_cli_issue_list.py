@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import json
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -139,3 +140,230 @@ class TestListCommand:
         call_kwargs = mock_issue_client.list_issues.call_args[1]
         assert call_kwargs["per_page"] == 50  # noqa: PLR2004
         assert call_kwargs["page"] == 2  # noqa: PLR2004
+
+    def test_list_issues_with_fields(self, tmp_path) -> None:
+        """Test listing issues with a field selection."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "accounts:\n  test:\n    name: test\n    token: test_token\n"
+            "    base_url: https://github.com\ndefault_account: test\n"
+        )
+
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_issue_client = mock_client.issue
+            mock_issue_client.list_issues.return_value = (
+                [{"number": 1, "user": {"login": "octocat"}}],
+                {"status_code": 200, "etag": None, "last_modified": None},
+            )
+
+            result = runner.invoke(
+                app,
+                [
+                    "--config-path",
+                    str(config_file),
+                    "issue",
+                    "list",
+                    "--account-name",
+                    "test",
+                    "--fields",
+                    "number,user.login",
+                ],
+            )
+
+        assert result.exit_code == 0
+        call_kwargs = mock_issue_client.list_issues.call_args[1]
+        assert call_kwargs["fields"] == ["number", "user.login"]
+
+    def test_list_issues_ndjson(self, tmp_path) -> None:
+        """Test listing issues as newline-delimited JSON."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.list_issues.return_value = (
+                [{"number": 1, "title": "First issue"}, {"number": 2, "title": "Second issue"}],
+                {"status_code": 200, "etag": None, "last_modified": None},
+            )
+
+            result = runner.invoke(
+                app,
+                ["issue", "list", "--token", "t", "--base-url", "https://github.com", "--format", "ndjson"],
+            )
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert len(lines) == 2  # noqa: PLR2004
+        assert json.loads(lines[0]) == {"number": 1, "title": "First issue"}
+
+    def test_list_issues_csv(self, tmp_path) -> None:
+        """Test listing issues as CSV."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.list_issues.return_value = (
+                [{"number": 1, "title": "First, issue"}],
+                {"status_code": 200, "etag": None, "last_modified": None},
+            )
+
+            result = runner.invoke(
+                app,
+                ["issue", "list", "--token", "t", "--base-url", "https://github.com", "--format", "csv"],
+            )
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == ["number,title", '1,"First, issue"']
+
+    def test_list_issues_invalid_format(self) -> None:
+        """Test that unknown output formats are rejected."""
+        result = runner.invoke(app, ["issue", "list", "--format", "xml"])
+        assert result.exit_code != 0
+
+    def test_list_issues_all(self) -> None:
+        """Test streaming the issues of all pages."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.iter_issues.return_value = iter([{"number": 1}, {"number": 2}, {"number": 3}])
+
+            result = runner.invoke(
+                app,
+                [
+                    "issue",
+                    "list",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--owner",
+                    "octocat",
+                    "--repository",
+                    "Hello-World",
+                    "--max-items",
+                    "2",
+                    "--max-pages",
+                    "5",
+                    "--format",
+                    "ndjson",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == ['{"number":1}', '{"number":2}']
+        mock_client.issue.list_issues.assert_not_called()
+        call_kwargs = mock_client.issue.iter_issues.call_args.kwargs
+        assert call_kwargs["owner"] == "octocat"
+        assert call_kwargs["repository"] == "Hello-World"
+        assert call_kwargs["max_pages"] == 5  # noqa: PLR2004
+        assert callable(call_kwargs["on_page"])
+
+    def test_list_issues_invalid_max_items(self) -> None:
+        """Test that --max-items must be positive."""
+        result = runner.invoke(app, ["issue", "list", "--max-items", "0"])
+        assert result.exit_code != 0
+
+    def test_list_issues_all_repositories(self) -> None:
+        """Test streaming the issues of every repository of an organization."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.iter_org_repository_issues.return_value = iter(
+                [
+                    {"number": 1, "repository_full_name": "octo-org/a"},
+                    {"number": 1, "repository_full_name": "octo-org/b"},
+                ]
+            )
+
+            result = runner.invoke(
+                app,
+                [
+                    "issue",
+                    "list",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--organization",
+                    "octo-org",
+                    "--all-repositories",
+                    "--state",
+                    "all",
+                    "--concurrency",
+                    "4",
+                    "--format",
+                    "ndjson",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [
+            '{"number":1,"repository_full_name":"octo-org/a"}',
+            '{"number":1,"repository_full_name":"octo-org/b"}',
+        ]
+        mock_client.issue.iter_issues.assert_not_called()
+        call_kwargs = mock_client.issue.iter_org_repository_issues.call_args.kwargs
+        assert call_kwargs["organization"] == "octo-org"
+        assert call_kwargs["state"] == "all"
+        assert call_kwargs["concurrency"] == 4  # noqa: PLR2004
+        assert callable(call_kwargs["on_page"])
+
+    def test_list_issues_all_repositories_requires_organization(self) -> None:
+        """Test that --all-repositories requires --organization."""
+        result = runner.invoke(
+            app, ["issue", "list", "--token", "t", "--base-url", "https://github.com", "--all-repositories"]
+        )
+        assert result.exit_code == 1
+
+    def test_list_issues_all_repositories_unsupported_options(self) -> None:
+        """Test that --all-repositories rejects the options of other listings."""
+        result = runner.invoke(
+            app,
+            [
+                "issue",
+                "list",
+                "--token",
+                "t",
+                "--base-url",
+                "https://github.com",
+                "--organization",
+                "octo-org",
+                "--repository",
+                "a",
+                "--all-repositories",
+            ],
+        )
+        assert result.exit_code == 1
+
+    def test_list_issues_all_rejects_single_page_options(self) -> None:
+        """Test that --page, --etag and --last-modified are rejected with --all."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            result = runner.invoke(
+                app,
+                [
+                    "issue",
+                    "list",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--organization",
+                    "octo-org",
+                    "--all-repositories",
+                    "--page",
+                    "2",
+                ],
+            )
+
+        assert result.exit_code == 1
+        assert "--page cannot be combined" in result.stderr
+        mock_github.assert_not_called()
+
+    def test_list_issues_all_requests_100_per_page(self) -> None:
+        """Test that listing all pages requests 100 items per page unless --per-page is given."""
+        with patch("requests.Session") as mock_session_class:
+            mock_session = mock_session_class.return_value
+            mock_session.request.return_value = MagicMock(status_code=200, headers={}, content=b"[]", links={})
+            options = ["--token", "t", "--base-url", "https://github.com", "--format", "ndjson"]
+            for extra in (["--all"], ["--max-items", "5"], ["--all", "--per-page", "50"]):
+                result = runner.invoke(
+                    app, [*["issue", "list", "--owner", "octocat", "--repository", "Hello-World"], *options, *extra]
+                )
+                assert result.exit_code == 0
+
+        sent = [call.kwargs["params"]["per_page"] for call in mock_session.request.call_args_list]
+        assert sent == [100, 100, 50]
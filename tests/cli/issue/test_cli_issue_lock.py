@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import patch
 
 from typer.testing import CliRunner
@@ -129,3 +130,57 @@ class TestLockCommand:
             )
 
         assert result.exit_code == 1
+
+    def test_lock_query(self) -> None:
+        """Test locking the issues matching a query."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.iter_issues.return_value = iter([{"number": 7, "title": "t", "locked": False}])
+            mock_client.issue._lock_issue.return_value.status_code = 204
+
+            result = runner.invoke(
+                app,
+                [
+                    "--no-cache",
+                    "issue",
+                    "lock",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--owner",
+                    "octocat",
+                    "--repository",
+                    "Hello-World",
+                    "--query",
+                    "state=open",
+                    "--query",
+                    "labels=bug",
+                    "--lock-reason",
+                    "resolved",
+                ],
+            )
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["data"][0]["number"] == 7  # noqa: PLR2004
+        assert output["data"][0]["status"] == "locked"
+        assert output["metadata"]["locked"] == 1
+        assert mock_client.issue.iter_issues.call_args.kwargs["labels"] == ["bug"]
+
+    def test_lock_requires_issue_number_or_query(self) -> None:
+        """Test that exactly one of --issue-number and --query is required."""
+        args = [
+            "issue",
+            "lock",
+            "--token",
+            "t",
+            "--base-url",
+            "https://github.com",
+            "--owner",
+            "o",
+            "--repository",
+            "r",
+        ]
+        assert runner.invoke(app, args).exit_code == 1
+        assert runner.invoke(app, [*args, "--issue-number", "1", "--query", "state=open"]).exit_code == 1
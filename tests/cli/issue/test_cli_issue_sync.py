@@ -0,0 +1,58 @@
+"""Tests for the issue sync CLI command."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from ghnova.cli.main import app
+from ghnova.issue.mirror import IssueMirror
+
+runner = CliRunner()
+
+
+class TestSyncCommand:
+    """Tests for the issue sync command."""
+
+    def test_sync(self, tmp_path) -> None:
+        """Test mirroring the issues of a repository."""
+        mirror_path = tmp_path / "mirror.sqlite"
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.iter_issues.return_value = iter(
+                [{"id": 1, "number": 1, "state": "open", "updated_at": "2024-01-01T00:00:00Z"}]
+            )
+
+            result = runner.invoke(
+                app,
+                [
+                    "--no-cache",
+                    "issue",
+                    "sync",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--owner",
+                    "octocat",
+                    "--repository",
+                    "hello",
+                    "--mirror-path",
+                    str(mirror_path),
+                ],
+            )
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["data"]["fetched"] == 1
+        assert output["data"]["cursor"] == "2024-01-01T00:00:00Z"
+        assert output["metadata"]["mirror_path"] == str(mirror_path)
+        with IssueMirror(path=mirror_path) as mirror:
+            assert mirror.get_cursor("octocat/hello") == "2024-01-01T00:00:00Z"
+
+    def test_sync_requires_scope(self) -> None:
+        """Test that a repository or an organization is required."""
+        result = runner.invoke(app, ["issue", "sync", "--token", "t", "--base-url", "https://github.com"])
+        assert result.exit_code == 1
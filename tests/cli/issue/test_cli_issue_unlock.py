@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import json
+from unittest.mock import ANY, patch
 
 from typer.testing import CliRunner
 
@@ -93,7 +94,7 @@ class TestUnlockCommand:
             )
 
         assert result.exit_code == 0
-        mock_github.assert_called_once_with(token="test_token", base_url="https://github.com")
+        mock_github.assert_called_once_with(token="test_token", base_url="https://github.com", cache=ANY)
 
     def test_unlock_issue_error_handling(self, tmp_path) -> None:
         """Test error handling in unlock command."""
@@ -127,3 +128,55 @@ class TestUnlockCommand:
             )
 
         assert result.exit_code == 1
+
+    def test_unlock_query(self) -> None:
+        """Test unlocking the issues matching a query."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.issue.iter_issues.return_value = iter([{"number": 7, "title": "t", "locked": True}])
+            mock_client.issue._unlock_issue.return_value.status_code = 204
+
+            result = runner.invoke(
+                app,
+                [
+                    "--no-cache",
+                    "issue",
+                    "unlock",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--owner",
+                    "octocat",
+                    "--repository",
+                    "Hello-World",
+                    "--query",
+                    "state=open",
+                    "--query",
+                    "labels=bug",
+                ],
+            )
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["data"][0]["number"] == 7  # noqa: PLR2004
+        assert output["data"][0]["status"] == "unlocked"
+        assert output["metadata"]["unlocked"] == 1
+        assert mock_client.issue.iter_issues.call_args.kwargs["labels"] == ["bug"]
+
+    def test_unlock_requires_issue_number_or_query(self) -> None:
+        """Test that exactly one of --issue-number and --query is required."""
+        args = [
+            "issue",
+            "unlock",
+            "--token",
+            "t",
+            "--base-url",
+            "https://github.com",
+            "--owner",
+            "o",
+            "--repository",
+            "r",
+        ]
+        assert runner.invoke(app, args).exit_code == 1
+        assert runner.invoke(app, [*args, "--issue-number", "1", "--query", "state=open"]).exit_code == 1
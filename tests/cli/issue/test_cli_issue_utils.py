@@ -0,0 +1,55 @@
+"""Unit tests for the utilities of the issue CLI commands."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghnova.cli.issue.utils import execute_lock_query, parse_issue_query
+from ghnova.issue.bulk import LockResult
+
+
+def test_parse_issue_query():
+    """Should parse the key=value filters of --query."""
+    assert parse_issue_query(None) == {}
+    assert parse_issue_query(["state=open", "labels=bug, ui", "since=2024-01-02T03:04:05Z", "type=Bug"]) == {
+        "state": "open",
+        "labels": ["bug", "ui"],
+        "since": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "issue_type": "Bug",
+    }
+
+
+@pytest.mark.parametrize("query", ["state", "color=red", "state=opened", "since=yesterday"])
+def test_parse_issue_query_invalid(query):
+    """Should reject malformed and unknown filters."""
+    with pytest.raises(ValueError, match="Invalid"):
+        parse_issue_query([query])
+
+
+def test_execute_lock_query_streams_json(capsys):
+    """Should write each result of the JSON document before the next issue is processed."""
+    written = []
+
+    def run(**kwargs):
+        yield LockResult(repository="octocat/Hello-World", number=1, status="locked")
+        written.append(capsys.readouterr().out)
+        yield LockResult(repository="octocat/Hello-World", number=2, status="unchanged")
+
+    with (
+        patch("ghnova.cli.utils.client.create_client"),
+        patch("ghnova.issue.bulk.BulkLocker") as mock_locker,
+    ):
+        mock_locker.return_value.run.side_effect = run
+        mock_locker.return_value.budget_exhausted = False
+        execute_lock_query(
+            ctx=MagicMock(), action="lock", owner="octocat", repository="Hello-World", query=[], token="t", base_url=""
+        )
+
+    output = json.loads(written[0] + capsys.readouterr().out)
+    assert '"number": 1' in written[0]
+    assert [result["number"] for result in output["data"]] == [1, 2]
+    assert output["metadata"] == {"locked": 1, "unchanged": 1, "dry_run": False, "budget_exhausted": False}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -69,6 +69,7 @@ class TestListCommand:
                 page=None,
                 etag=None,
                 last_modified=None,
+                fields=None,
             )
 
     def test_list_pull_requests_with_params(self, tmp_path) -> None:
@@ -123,6 +124,7 @@ class TestListCommand:
                 page=1,
                 etag=None,
                 last_modified=None,
+                fields=None,
             )
 
     def test_list_pull_requests_exception(self, tmp_path) -> None:
@@ -156,3 +158,47 @@ class TestListCommand:
 
             assert result.exit_code == 1
             assert "API Error" in result.stderr
+
+    def test_list_pull_requests_all_rejects_single_page_options(self) -> None:
+        """Test that --page, --etag and --last-modified are rejected with --all."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            result = runner.invoke(
+                app,
+                [
+                    "pull-request",
+                    "list",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--owner",
+                    "octocat",
+                    "--repository",
+                    "Hello-World",
+                    "--all",
+                    "--page",
+                    "2",
+                    "--etag",
+                    '"abc"',
+                ],
+            )
+
+        assert result.exit_code == 1
+        assert "--page, --etag cannot be combined" in result.stderr
+        mock_github.assert_not_called()
+
+    def test_list_pull_requests_all_requests_100_per_page(self) -> None:
+        """Test that listing all pages requests 100 items per page unless --per-page is given."""
+        with patch("requests.Session") as mock_session_class:
+            mock_session = mock_session_class.return_value
+            mock_session.request.return_value = MagicMock(status_code=200, headers={}, content=b"[]", links={})
+            options = ["--token", "t", "--base-url", "https://github.com", "--format", "ndjson"]
+            for extra in (["--all"], ["--max-items", "5"], ["--all", "--per-page", "50"]):
+                result = runner.invoke(
+                    app,
+                    [*["pull-request", "list", "--owner", "octocat", "--repository", "Hello-World"], *options, *extra],
+                )
+                assert result.exit_code == 0
+
+        sent = [call.kwargs["params"]["per_page"] for call in mock_session.request.call_args_list]
+        assert sent == [100, 100, 50]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -370,3 +370,39 @@ class TestListCommand:
             )
 
         assert result.exit_code == 1
+
+    def test_list_repositories_max_items_rejects_single_page_options(self) -> None:
+        """Test that --page, --etag and --last-modified are rejected with --max-items."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            result = runner.invoke(
+                app,
+                [
+                    "repository",
+                    "list",
+                    "--token",
+                    "t",
+                    "--base-url",
+                    "https://github.com",
+                    "--max-items",
+                    "10",
+                    "--last-modified",
+                    "Wed, 21 Oct 2015 07:28:00 GMT",
+                ],
+            )
+
+        assert result.exit_code == 1
+        assert "--last-modified cannot be combined" in result.stderr
+        mock_github.assert_not_called()
+
+    def test_list_repositories_all_requests_100_per_page(self) -> None:
+        """Test that listing all pages requests 100 items per page unless --per-page is given."""
+        with patch("requests.Session") as mock_session_class:
+            mock_session = mock_session_class.return_value
+            mock_session.request.return_value = MagicMock(status_code=200, headers={}, content=b"[]", links={})
+            options = ["--token", "t", "--base-url", "https://github.com", "--format", "ndjson"]
+            for extra in (["--all"], ["--max-items", "5"], ["--all", "--per-page", "50"]):
+                result = runner.invoke(app, [*["repository", "list"], *options, *extra])
+                assert result.exit_code == 0
+
+        sent = [call.kwargs["params"]["per_page"] for call in mock_session.request.call_args_list]
+        assert sent == [100, 100, 50]
@@ -0,0 +1 @@
+"""Unit tests for search CLI commands."""
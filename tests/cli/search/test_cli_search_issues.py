@@ -0,0 +1,103 @@
+"""Tests for the search issues CLI command."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestIssuesCommand:
+    """Tests for the search issues command."""
+
+    def test_issues_command_help(self) -> None:
+        """Test issues command help."""
+        result = runner.invoke(app, ["search", "issues", "--help"])
+        assert result.exit_code == 0
+        assert "--split-by" in result.stdout
+
+    def test_search_issues(self) -> None:
+        """Test that the results are streamed as NDJSON."""
+        with (
+            patch("ghnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            mock_auth.return_value = ("test_token", "https://github.com")
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.search.iter_search.return_value = iter([{"id": 1, "number": 1}, {"id": 2, "number": 2}])
+
+            result = runner.invoke(app, ["search", "issues", "--query", "org:octocat is:issue"])
+
+        assert result.exit_code == 0
+        assert [json.loads(line) for line in result.stdout.splitlines()] == [
+            {"id": 1, "number": 1},
+            {"id": 2, "number": 2},
+        ]
+        kwargs = mock_client.search.iter_search.call_args.kwargs
+        assert kwargs["kind"] == "issues"
+        assert kwargs["query"] == "org:octocat is:issue"
+        assert kwargs["split_by"] is None
+        assert kwargs["per_page"] == 100  # noqa: PLR2004
+
+    def test_search_issues_split(self) -> None:
+        """Test that the split options are passed to the search."""
+        with (
+            patch("ghnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            mock_auth.return_value = ("test_token", "https://github.com")
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.search.iter_search.return_value = iter([{"id": 1}, {"id": 2}, {"id": 3}])
+
+            result = runner.invoke(
+                app,
+                [
+                    "search",
+                    "issues",
+                    "--query",
+                    "org:octocat",
+                    "--split-by",
+                    "created",
+                    "--since",
+                    "2024-01-01",
+                    "--until",
+                    "2024-06-30",
+                    "--sort",
+                    "created",
+                    "--order",
+                    "asc",
+                    "--max-items",
+                    "2",
+                    "--format",
+                    "json",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["data"] == [{"id": 1}, {"id": 2}]
+        kwargs = mock_client.search.iter_search.call_args.kwargs
+        assert kwargs["split_by"] == "created"
+        assert kwargs["since"] == datetime(2024, 1, 1)
+        assert kwargs["until"] == datetime(2024, 6, 30)
+        assert kwargs["sort"] == "created"
+        assert kwargs["order"] == "asc"
+
+    def test_search_issues_error(self) -> None:
+        """Test that an invalid search exits with an error."""
+        with (
+            patch("ghnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            mock_auth.return_value = ("test_token", "https://github.com")
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.search.iter_search.side_effect = ValueError("since and until require split_by.")
+
+            result = runner.invoke(app, ["search", "issues", "--query", "org:octocat", "--since", "2024-01-01"])
+
+        assert result.exit_code == 1
@@ -0,0 +1,34 @@
+"""Tests for the search CLI main module."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from ghnova.cli.search.main import search_app
+
+runner = CliRunner()
+
+
+class TestSearchApp:
+    """Tests for the search app."""
+
+    def test_search_help(self) -> None:
+        """Test that search help works."""
+        result = runner.invoke(search_app, ["--help"])
+        assert result.exit_code == 0
+        assert "search" in result.stdout.lower()
+
+    def test_search_issues_command_exists(self) -> None:
+        """Test that issues command is available."""
+        result = runner.invoke(search_app, ["issues", "--help"])
+        assert result.exit_code == 0
+
+    def test_search_repositories_command_exists(self) -> None:
+        """Test that repositories command is available."""
+        result = runner.invoke(search_app, ["repositories", "--help"])
+        assert result.exit_code == 0
+
+    def test_search_users_command_exists(self) -> None:
+        """Test that users command is available."""
+        result = runner.invoke(search_app, ["users", "--help"])
+        assert result.exit_code == 0
@@ -0,0 +1,43 @@
+"""Tests for the search repositories CLI command."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestRepositoriesCommand:
+    """Tests for the search repositories command."""
+
+    def test_repositories_command_help(self) -> None:
+        """Test repositories command help."""
+        result = runner.invoke(app, ["search", "repositories", "--help"])
+        assert result.exit_code == 0
+
+    def test_search_repositories(self) -> None:
+        """Test searching repositories split on the update time."""
+        with (
+            patch("ghnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            mock_auth.return_value = ("test_token", "https://github.com")
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.search.iter_search.return_value = iter([{"id": 1, "full_name": "octocat/hello"}])
+
+            result = runner.invoke(
+                app,
+                ["search", "repositories", "--query", "language:python", "--split-by", "updated", "--sort", "stars"],
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {"id": 1, "full_name": "octocat/hello"}
+        kwargs = mock_client.search.iter_search.call_args.kwargs
+        assert kwargs["kind"] == "repositories"
+        assert kwargs["split_by"] == "updated"
+        assert kwargs["sort"] == "stars"
@@ -0,0 +1,42 @@
+"""Tests for the search users CLI command."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from ghnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestUsersCommand:
+    """Tests for the search users command."""
+
+    def test_users_command_help(self) -> None:
+        """Test users command help."""
+        result = runner.invoke(app, ["search", "users", "--help"])
+        assert result.exit_code == 0
+
+    def test_search_users(self) -> None:
+        """Test searching users."""
+        with (
+            patch("ghnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            mock_auth.return_value = ("test_token", "https://github.com")
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.search.iter_search.return_value = iter([{"id": 1, "login": "octocat"}])
+
+            result = runner.invoke(app, ["search", "users", "--query", "location:Berlin", "--format", "csv"])
+
+        assert result.exit_code == 0
+        assert "octocat" in result.stdout
+        assert mock_client.search.iter_search.call_args.kwargs["kind"] == "users"
+
+    def test_search_users_cannot_split_on_updated(self) -> None:
+        """Test that users cannot be split on the update time."""
+        result = runner.invoke(app, ["search", "users", "--query", "location:Berlin", "--split-by", "updated"])
+
+        assert result.exit_code != 0
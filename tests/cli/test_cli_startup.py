@@ -0,0 +1,86 @@
+"""Startup tests for the CLI."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from ghnova.cli.main import MainGroup, app
+
+runner = CliRunner()
+
+STARTUP_TIME_FRACTION = 0.25
+"""Upper bound of the import time of the CLI entry point, as a fraction of the import time of requests."""
+
+SUBCOMMAND_MODULES = {target.partition(":")[0] for target, _ in MainGroup.lazy_subcommands.values()}
+"""Modules of the command groups, which are only imported when they are invoked."""
+
+
+def get_loaded_modules(args: list[str]) -> set[str]:
+    """Run the CLI in a fresh interpreter and get the modules it loaded.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The names of the loaded modules.
+
+    """
+    code = (
+        "import json, sys\n"
+        "from ghnova.cli.main import app\n"
+        "try:\n"
+        f"    app({args!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(json.dumps(sorted(sys.modules)), file=sys.stderr)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(json.loads(result.stderr.splitlines()[-1]))
+
+
+class TestStartup:
+    """Tests for the startup of the CLI."""
+
+    def test_help_does_not_load_subcommands(self) -> None:
+        """Test that the main help lists the command groups without importing them."""
+        modules = get_loaded_modules(["--help"])
+
+        assert modules.isdisjoint(SUBCOMMAND_MODULES)
+
+    def test_subcommand_loads_its_group_only(self) -> None:
+        """Test that invoking a command imports its command group only, without Rich or pydantic."""
+        modules = get_loaded_modules(["issue", "get", "--owner", "o", "--repository", "r"])
+
+        assert "ghnova.cli.issue.main" in modules
+        assert modules.isdisjoint(SUBCOMMAND_MODULES - {"ghnova.cli.issue.main"})
+        assert "pydantic" not in modules
+        assert "rich.logging" not in modules
+
+    def test_completion_does_not_load_subcommands(self, monkeypatch) -> None:
+        """Test that completing the command names does not import the command groups."""
+        modules_before = set(sys.modules)
+        monkeypatch.setenv("_GHNOVA_COMPLETE", "complete_bash")
+        monkeypatch.setenv("COMP_WORDS", "ghnova iss")
+        monkeypatch.setenv("COMP_CWORD", "1")
+
+        result = runner.invoke(app, [], prog_name="ghnova")
+
+        assert "issue" in result.stdout
+        assert (set(sys.modules) - modules_before).isdisjoint(SUBCOMMAND_MODULES - modules_before)
+
+    def test_help_lists_command_groups(self) -> None:
+        """Test that the main help shows the help of each command group."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "Manage pull requests." in result.stdout
+
+    def test_startup_time_budget(self, import_times) -> None:
+        """Test that the CLI entry point, on top of typer, costs a fraction of importing requests."""
+        cumulative = import_times("import typer\nimport ghnova.cli.main\nimport requests")
+
+        assert cumulative["ghnova.cli.main"] < STARTUP_TIME_FRACTION * cumulative["requests"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from typer.testing import CliRunner
 
@@ -194,7 +194,7 @@ class TestContextualInformationCommand:
             )
 
         assert result.exit_code == 0
-        mock_github.assert_called_once_with(token="custom_token", base_url=None)
+        mock_github.assert_called_once_with(token="custom_token", base_url=None, cache=ANY)
 
     def test_ctx_info_error_handling(self, tmp_path) -> None:
         """Test error handling in ctx-info command."""
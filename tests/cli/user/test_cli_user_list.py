@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -172,3 +172,47 @@ class TestListCommand:
             )
 
         assert result.exit_code == 1
+
+    def test_list_users_all(self) -> None:
+        """Test following the since cursor through all pages."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            mock_client = mock_github.return_value.__enter__.return_value
+            mock_client.user.iter_users.return_value = iter([{"login": "a", "id": 1}, {"login": "b", "id": 2}])
+
+            result = runner.invoke(
+                app,
+                ["user", "list", "--token", "t", "--base-url", "https://github.com", "--since", "10", "--all"],
+            )
+
+        assert result.exit_code == 0
+        assert '"login": "b"' in result.stdout
+        assert '"pages": 0' in result.stdout
+        call_kwargs = mock_client.user.iter_users.call_args.kwargs
+        assert call_kwargs["since"] == 10  # noqa: PLR2004
+        assert call_kwargs["per_page"] == 100  # noqa: PLR2004
+        assert call_kwargs["max_pages"] is None
+
+    def test_list_users_all_rejects_single_page_options(self) -> None:
+        """Test that --etag and --last-modified are rejected with --max-pages."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            result = runner.invoke(
+                app,
+                ["user", "list", "--token", "t", "--base-url", "https://github.com", "--max-pages", "2", "--etag", "x"],
+            )
+
+        assert result.exit_code == 1
+        assert "--etag cannot be combined" in result.stderr
+        mock_github.assert_not_called()
+
+    def test_list_users_all_requests_100_per_page(self) -> None:
+        """Test that listing all pages requests 100 items per page unless --per-page is given."""
+        with patch("requests.Session") as mock_session_class:
+            mock_session = mock_session_class.return_value
+            mock_session.request.return_value = MagicMock(status_code=200, headers={}, content=b"[]", links={})
+            options = ["--token", "t", "--base-url", "https://github.com", "--format", "ndjson"]
+            for extra in (["--all"], ["--max-items", "5"], ["--all", "--per-page", "50"]):
+                result = runner.invoke(app, [*["user", "list"], *options, *extra])
+                assert result.exit_code == 0
+
+        sent = [call.kwargs["params"]["per_page"] for call in mock_session.request.call_args_list]
+        assert sent == [100, 100, 50]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from ghnova.cli.utils.auth import get_auth_params
+from ghnova.daemon.protocol import DaemonError
 
 
 class TestGetAuthParams:
@@ -233,3 +236,65 @@ class TestGetAuthParams:
                 token=None,
                 base_url="https://custom.github.com",
             )
+
+    def test_get_auth_params_from_daemon(self) -> None:
+        """Test that the daemon resolves the account when it is running."""
+        with patch("ghnova.daemon.protocol.send_request", return_value=["daemon_token", "https://github.com"]) as mock:
+            token, base_url = get_auth_params(
+                config_path="config.yaml",
+                account_name="test",
+                token=None,
+                base_url=None,
+                daemon_socket="daemon.sock",
+            )
+
+        assert (token, base_url) == ("daemon_token", "https://github.com")
+        request = mock.call_args.args[1]
+        assert request["op"] == "auth"
+        assert request["account_name"] == "test"
+
+    def test_get_auth_params_daemon_not_needed(self) -> None:
+        """Test that the daemon is not contacted when the token and base_url are given."""
+        with patch("ghnova.daemon.protocol.send_request") as mock:
+            token, base_url = get_auth_params(
+                config_path="config.yaml",
+                account_name=None,
+                token="direct_token",
+                base_url="https://github.com",
+                daemon_socket="daemon.sock",
+            )
+
+        assert (token, base_url) == ("direct_token", "https://github.com")
+        mock.assert_not_called()
+
+    def test_get_auth_params_daemon_unavailable(self, tmp_path) -> None:
+        """Test that the configuration is loaded in-process when the daemon is not running."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "accounts:\n  test:\n    name: test\n    token: test_token\n"
+            "    base_url: https://github.com\ndefault_account: test\n"
+        )
+
+        token, base_url = get_auth_params(
+            config_path=config_file,
+            account_name=None,
+            token=None,
+            base_url=None,
+            daemon_socket=tmp_path / "daemon.sock",
+        )
+
+        assert (token, base_url) == ("test_token", "https://github.com")
+
+    def test_get_auth_params_daemon_error(self) -> None:
+        """Test that a resolution error of the daemon is raised as ValueError."""
+        with (
+            patch("ghnova.daemon.protocol.send_request", side_effect=DaemonError("No default account")),
+            pytest.raises(ValueError, match="No default account"),
+        ):
+            get_auth_params(
+                config_path="config.yaml",
+                account_name=None,
+                token=None,
+                base_url=None,
+                daemon_socket="daemon.sock",
+            )
@@ -0,0 +1,81 @@
+"""Unit tests for CLI client utilities."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from ghnova.cache.sqlite import SQLiteCache
+from ghnova.cli.utils.client import create_client, get_cache
+from ghnova.daemon.client import DaemonClient
+
+
+def test_get_cache(tmp_path):
+    """Should return a SQLite cache at the configured path."""
+    ctx = MagicMock()
+    ctx.obj = {"cache_path": str(tmp_path / "cache.sqlite"), "no_cache": False}
+
+    cache = get_cache(ctx)
+
+    assert isinstance(cache, SQLiteCache)
+    assert cache.path == tmp_path / "cache.sqlite"
+
+
+def test_get_cache_disabled():
+    """Should return None when caching is disabled."""
+    ctx = MagicMock()
+    ctx.obj = {"cache_path": None, "no_cache": True}
+
+    assert get_cache(ctx) is None
+
+
+def test_create_client(tmp_path):
+    """Should create a GitHub client with the persistent cache."""
+    ctx = MagicMock()
+    ctx.obj = {"cache_path": str(tmp_path / "cache.sqlite"), "no_cache": False}
+
+    with patch("ghnova.client.github.GitHub") as mock_github:
+        client = create_client(ctx=ctx, token="token", base_url="https://github.com")
+
+    assert client is mock_github.return_value
+    kwargs = mock_github.call_args.kwargs
+    assert kwargs["token"] == "token"
+    assert kwargs["base_url"] == "https://github.com"
+    assert isinstance(kwargs["cache"], SQLiteCache)
+
+
+def test_create_client_daemon(tmp_path):
+    """Should forward the calls to the daemon when its socket exists."""
+    socket_path = tmp_path / "daemon.sock"
+    socket_path.touch()
+    ctx = MagicMock()
+    ctx.obj = {"cache_path": "cache.sqlite", "no_cache": False, "daemon_socket": str(socket_path)}
+
+    client = create_client(ctx=ctx, token="token", base_url="https://github.com")
+
+    assert isinstance(client, DaemonClient)
+    assert client.socket_path == socket_path
+    assert client.cache_path == "cache.sqlite"
+
+
+def test_create_client_daemon_socket_missing(tmp_path):
+    """Should create an in-process client when the daemon socket does not exist."""
+    ctx = MagicMock()
+    ctx.obj = {"cache_path": None, "no_cache": True, "daemon_socket": str(tmp_path / "daemon.sock")}
+
+    with patch("ghnova.client.github.GitHub") as mock_github:
+        client = create_client(ctx=ctx, token="token", base_url="https://github.com")
+
+    assert client is mock_github.return_value
+
+
+def test_create_client_without_daemon(tmp_path):
+    """Should create an in-process client when the daemon is not to be used."""
+    socket_path = tmp_path / "daemon.sock"
+    socket_path.touch()
+    ctx = MagicMock()
+    ctx.obj = {"cache_path": None, "no_cache": True, "daemon_socket": str(socket_path)}
+
+    with patch("ghnova.client.github.GitHub") as mock_github:
+        client = create_client(ctx=ctx, token="token", base_url="https://github.com", use_daemon=False)
+
+    assert client is mock_github.return_value
@@ -0,0 +1,76 @@
+"""Tests for the lazy CLI utilities."""
+
+from __future__ import annotations
+
+import logging
+from typing import ClassVar
+
+import click
+import typer
+
+from ghnova.cli.utils.lazy import LazyRichHandler, LazyTyperGroup
+
+
+class DemoGroup(LazyTyperGroup):
+    """Group with a single lazy command group."""
+
+    lazy_subcommands: ClassVar[dict[str, tuple[str, str]]] = {
+        "demo": ("tests.cli.utils.test_cli_utils_lazy:demo_app", "Demo commands.")
+    }
+
+
+demo_app = typer.Typer(name="demo")
+
+
+@demo_app.command(name="run")
+def run_command() -> None:
+    """Run the demo."""
+
+
+class TestLazyTyperGroup:
+    """Tests for LazyTyperGroup."""
+
+    def test_list_and_load(self) -> None:
+        """Test that commands are listed before loading and loaded as groups on use."""
+        group = DemoGroup(name="main")
+        ctx = click.Context(group)
+
+        assert group.list_commands(ctx) == ["demo"]
+        assert group.commands == {}
+
+        command = group.get_command(ctx, "demo")
+
+        assert isinstance(command, click.Group)
+        assert list(command.commands) == ["run"]
+        assert group.commands["demo"] is command
+
+    def test_summaries_only(self) -> None:
+        """Test that listing summaries serves placeholders without loading."""
+        group = DemoGroup(name="main")
+        ctx = click.Context(group)
+
+        with group._listing_summaries():
+            command = group.get_command(ctx, "demo")
+
+        assert command.help == "Demo commands."
+        assert group.commands == {}
+
+    def test_unknown_command(self) -> None:
+        """Test that unknown commands are not found."""
+        group = DemoGroup(name="main")
+
+        assert group.get_command(click.Context(group), "missing") is None
+
+
+class TestLazyRichHandler:
+    """Tests for LazyRichHandler."""
+
+    def test_creates_rich_handler_on_first_record(self) -> None:
+        """Test that the Rich handler is created when the first record is emitted."""
+        handler = LazyRichHandler(level=logging.INFO, show_time=False)
+
+        assert handler.handler is None
+
+        handler.handle(logging.LogRecord("ghnova", logging.INFO, __file__, 1, "hello", None, None))
+
+        assert type(handler.handler).__name__ == "RichHandler"
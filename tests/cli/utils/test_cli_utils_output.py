@@ -0,0 +1,134 @@
+"""Unit tests for CLI output formats."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from ghnova.cli.utils.output import write_delimited, write_items, write_json, write_ndjson
+from ghnova.utils.json_codec import dumps
+from ghnova.utils.record import Record
+
+
+@dataclass(slots=True)
+class _Item(Record):
+    number: int | None = None
+    title: str | None = None
+
+
+class _FlushCountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes: list[str] = []
+
+    def flush(self) -> None:
+        self.flushes.append(self.getvalue())
+
+
+def test_write_ndjson_streams_items():
+    """Should write and flush each item as soon as it is consumed."""
+    stream = _FlushCountingStream()
+    consumed = []
+
+    def items():
+        for number in (1, 2):
+            consumed.append(number)
+            yield {"number": number}
+
+    count = write_ndjson(items(), stream=stream)
+
+    assert count == 2  # noqa: PLR2004
+    assert [json.loads(line) for line in stream.getvalue().splitlines()] == [{"number": 1}, {"number": 2}]
+    assert len(stream.flushes) == 2  # noqa: PLR2004
+    assert stream.flushes[0].count("\n") == 1
+
+
+def test_write_json_streams_items():
+    """Should write and flush each item before the next one is consumed, and the metadata after the items."""
+    stream = _FlushCountingStream()
+    consumed = []
+
+    def items():
+        for number in (1, 2):
+            consumed.append(number)
+            yield {"number": number, "title": "Ünïcode\u2028"}
+
+    def metadata():
+        return {"consumed": list(consumed)}
+
+    count = write_json(items(), metadata=metadata, stream=stream)
+
+    assert count == 2  # noqa: PLR2004
+    assert json.loads(stream.getvalue())["metadata"] == {"consumed": [1, 2]}
+    assert len(stream.flushes) == 3  # noqa: PLR2004
+    assert json.loads(stream.flushes[0] + "]}")["data"] == [{"number": 1, "title": "Ünïcode\u2028"}]
+
+
+@pytest.mark.parametrize("items", [[], [{"number": 1, "labels": [{"name": "bug"}, {}]}, {"number": 2, "labels": []}]])
+def test_write_json_matches_document(items):
+    """Should write the same document as the one dumped at once."""
+    stream = io.StringIO()
+
+    write_json(iter(items), metadata=lambda: {"status_code": 200}, stream=stream)
+
+    assert stream.getvalue() == dumps({"data": items, "metadata": {"status_code": 200}}, indent=True) + "\n"
+
+
+def test_write_delimited_csv():
+    """Should write a header from the first item and encode nested values as JSON."""
+    stream = io.StringIO()
+    items = [
+        {"number": 1, "user": {"login": "octocat"}, "body": None},
+        {"number": 2, "extra": "dropped"},
+    ]
+
+    count = write_delimited(items, stream=stream)
+
+    assert count == 2  # noqa: PLR2004
+    rows = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert rows[0] == ["number", "user", "body"]
+    assert rows[1][0] == "1"
+    assert json.loads(rows[1][1]) == {"login": "octocat"}
+    assert rows[1][2] == ""
+    assert rows[2] == ["2", "", ""]
+
+
+def test_write_delimited_tsv_records():
+    """Should write records as tab-separated rows."""
+    stream = io.StringIO()
+
+    write_delimited([_Item(number=1, title="First")], delimiter="\t", stream=stream)
+
+    assert stream.getvalue() == "number\ttitle\n1\tFirst\n"
+
+
+def test_write_delimited_empty():
+    """Should write nothing without items."""
+    stream = io.StringIO()
+    assert write_delimited([], stream=stream) == 0
+    assert stream.getvalue() == ""
+
+
+def test_write_items_json(capsys):
+    """Should write a JSON document with the data and metadata."""
+    write_items(iter([{"number": 1}]), metadata={"status_code": 200}, output_format="json")
+
+    assert json.loads(capsys.readouterr().out) == {"data": [{"number": 1}], "metadata": {"status_code": 200}}
+
+
+@pytest.mark.parametrize(("data", "expected"), [({"number": 1}, '{"number":1}'), ({}, "")])
+def test_write_items_ndjson_single_object(capsys, data, expected):
+    """Should write a single object as one line and an empty response as nothing."""
+    write_items(data, metadata={}, output_format="ndjson")
+
+    assert capsys.readouterr().out.replace(" ", "").strip() == expected
+
+
+def test_write_items_unknown_format():
+    """Should reject unknown formats."""
+    with pytest.raises(ValueError, match="Unknown output format"):
+        write_items([], metadata={}, output_format="xml")  # type: ignore[arg-type]
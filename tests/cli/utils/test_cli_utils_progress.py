@@ -0,0 +1,43 @@
+"""Unit tests for the progress line of paginated CLI commands."""
+
+from __future__ import annotations
+
+import io
+
+from ghnova.cli.utils.progress import PageProgress
+from ghnova.utils.pagination import PageInfo
+
+
+def test_page_progress_line():
+    """Should rewrite the progress line on each page and end it on close."""
+    stream = io.StringIO()
+    progress = PageProgress(stream=stream, enabled=True)
+
+    progress(PageInfo(page=1, items=30, headers={"X-RateLimit-Remaining": "4999"}))
+    progress(PageInfo(page=2, items=10, headers={}))
+    progress.close()
+
+    output = stream.getvalue()
+    assert output.count("\r") == 2  # noqa: PLR2004
+    assert "Pages: 2 | Items: 40 |" in output
+    assert "pages/s | Rate limit remaining: 4999" in output
+    assert output.endswith("\n")
+    assert progress.metadata == {"pages": 2, "items": 40, "rate_limit_remaining": 4999}
+
+
+def test_page_progress_disabled_for_non_terminals():
+    """Should count the pages without writing when the stream is not a terminal."""
+    stream = io.StringIO()
+    progress = PageProgress(stream=stream)
+
+    progress(PageInfo(page=1, items=5, headers={}))
+    progress.close()
+
+    assert stream.getvalue() == ""
+    assert progress.metadata == {"pages": 1, "items": 5, "rate_limit_remaining": None}
+
+
+def test_page_progress_unknown_rate_limit():
+    """Should show an unknown remaining rate limit."""
+    progress = PageProgress(stream=io.StringIO(), enabled=False)
+    assert progress.format().endswith("Rate limit remaining: unknown")
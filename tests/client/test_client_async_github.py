@@ -1,11 +1,16 @@
 """Unit tests for the asynchronous GitHub client."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from aiohttp import ClientSession
+from aiohttp import ClientConnectionError, ClientSession
 
+from ghnova.cache.memory import MemoryCache
 from ghnova.client.async_github import AsyncGitHub
+from ghnova.client.pool import PoolConfig
+from ghnova.client.retry import RetryPolicy
 
 
 class TestAsyncGitHub:
@@ -82,3 +87,182 @@ class TestAsyncGitHub:
         client = AsyncGitHub(token=None, base_url="https://github.com")
         with pytest.raises(RuntimeError, match="AsyncGitHub must be used as an async context manager"):
             await client._request("GET", "repos/octocat/Hello-World")
+
+    def test_resources(self):
+        """Test that the resources are attached to the client."""
+        client = AsyncGitHub(token=None, base_url="https://github.com")
+        assert client.issue.client is client
+        assert client.pull_request.client is client
+        assert client.repository.client is client
+        assert client.search.client is client
+        assert client.user.client is client
+
+    @pytest.mark.asyncio
+    async def test_request_with_cache(self):
+        """Test that a 304 response is turned back into the cached body."""
+        with patch("ghnova.client.async_github.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            first = MagicMock()
+            first.status = 200
+            first.read = AsyncMock(return_value=b'[{"id": 1}]')
+            first.headers = {"ETag": '"abc"'}
+            not_modified = MagicMock()
+            not_modified.status = 304
+            not_modified.headers = {"ETag": '"abc"'}
+            not_modified.url = "https://api.github.com/user"
+            mock_session.request.side_effect = [first, not_modified]
+
+            client = AsyncGitHub(token="test_token", base_url="https://github.com", cache=MemoryCache())
+            async with client:
+                assert await client._request("GET", "user") is first
+                response = await client._request("GET", "user")
+
+            assert mock_session.request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+            not_modified.release.assert_called_once()
+            assert response.status == 200  # noqa: PLR2004
+            assert await response.json() == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_request_rate_limit(self):
+        """Test that the rate limit headers are tracked and requests are paced once the budget runs out."""
+        with (
+            patch("ghnova.client.async_github.ClientSession") as mock_session_class,
+            patch("ghnova.client.async_github.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_response = MagicMock()
+            mock_response.raise_for_status.return_value = None
+            mock_response.headers = {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 60),
+                "X-RateLimit-Resource": "core",
+            }
+            mock_session.request.return_value = mock_response
+
+            client = AsyncGitHub(token="test_token", base_url="https://github.com")
+            async with client:
+                await client._request("GET", "repos/octocat/Hello-World")
+                mock_sleep.assert_not_called()
+                await client._request("GET", "repos/octocat/Hello-World")
+
+            mock_sleep.assert_awaited_once()
+            assert 0 < mock_sleep.call_args.args[0] <= 61  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_request_retry(self):
+        """Test that transient failures are retried and every attempt is recorded."""
+        with (
+            patch("ghnova.client.async_github.ClientSession") as mock_session_class,
+            patch("ghnova.client.async_github.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            failed_response = MagicMock(status=503, headers={})
+            ok_response = MagicMock(status=200, headers={})
+            mock_session.request.side_effect = [ClientConnectionError("reset"), failed_response, ok_response]
+
+            client = AsyncGitHub(token=None, retry=RetryPolicy(max_attempts=3))
+            async with client:
+                response = await client._request("GET", "repos/octocat/Hello-World")
+
+            assert response is ok_response
+            assert mock_sleep.await_count == 2  # noqa: PLR2004
+            failed_response.release.assert_called_once()
+            assert [attempt.status_code for attempt in client.attempts] == [None, 503, 200]
+
+    @pytest.mark.asyncio
+    async def test_enter_with_pool(self):
+        """Test that the session uses a connector built from the pool configuration."""
+        client = AsyncGitHub(token=None, pool=PoolConfig(max_connections=50, max_connections_per_host=25))
+        async with client:
+            assert client.session.connector.limit == 50  # noqa: PLR2004
+            assert client.session.connector.limit_per_host == 25  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_request_single_flight(self):
+        """Test that identical GET requests in flight share a single request."""
+        with patch("ghnova.client.async_github.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_response = MagicMock(status=200, headers={"ETag": '"abc"'}, url="https://api.github.com/users/octocat")
+            mock_response.read = AsyncMock(return_value=b'{"login": "octocat"}')
+            release = asyncio.Event()
+
+            async def request(**kwargs):
+                await release.wait()
+                return mock_response
+
+            mock_session.request.side_effect = request
+
+            client = AsyncGitHub(token="test_token", single_flight=True)
+            async with client:
+                tasks = [asyncio.create_task(client._request("GET", "users/octocat")) for _ in range(5)]
+                await asyncio.sleep(0)
+                release.set()
+                responses = await asyncio.gather(*tasks)
+
+            mock_session.request.assert_called_once()
+            assert responses[0] is mock_response
+            for response in responses[1:]:
+                assert response.status == 200  # noqa: PLR2004
+                assert await response.json() == {"login": "octocat"}
+            assert client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_request_single_flight_error(self):
+        """Test that waiters receive the error of the shared request."""
+        with patch("ghnova.client.async_github.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            release = asyncio.Event()
+
+            async def request(**kwargs):
+                await release.wait()
+                raise ClientConnectionError("reset")
+
+            mock_session.request.side_effect = request
+
+            client = AsyncGitHub(token="test_token", single_flight=True)
+            async with client:
+                tasks = [asyncio.create_task(client._request("GET", "users/octocat")) for _ in range(3)]
+                await asyncio.sleep(0)
+                release.set()
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            mock_session.request.assert_called_once()
+            assert all(isinstance(result, ClientConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_request_single_flight_skips_writes(self):
+        """Test that only GET requests are coalesced."""
+        with patch("ghnova.client.async_github.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.return_value = MagicMock(status=201, headers={})
+
+            client = AsyncGitHub(token="test_token", single_flight=True)
+            async with client:
+                await asyncio.gather(*(client._request("POST", "repos/o/r/issues") for _ in range(3)))
+
+            assert mock_session.request.call_count == 3  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_run_many(self):
+        """Test running many calls through the client."""
+        client = AsyncGitHub(token=None)
+
+        async def call(value: int) -> int:
+            if value == 1:
+                raise ValueError("boom")
+            return value
+
+        results = await client.run_many([lambda v=v: call(v) for v in range(3)], concurrency=2)
+
+        assert [result.value for result in results] == [0, None, 2]
+        assert isinstance(results[1].error, ValueError)
+
+        streamed = [result.index async for result in client.batch([lambda v=v: call(v) for v in range(3)])]
+        assert sorted(streamed) == [0, 1, 2]
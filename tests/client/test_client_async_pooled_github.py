@@ -0,0 +1,46 @@
+"""Unit tests for the asynchronous pooled GitHub client."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ghnova.client.async_pooled_github import AsyncPooledGitHub
+
+
+def _response(status: int, remaining: int) -> MagicMock:
+    response = MagicMock(status=status)
+    response.headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": "9999999999",
+        "X-RateLimit-Resource": "core",
+    }
+    return response
+
+
+class TestAsyncPooledGitHub:
+    """Test cases for the AsyncPooledGitHub class."""
+
+    def test_str_representation(self):
+        """Test string representation."""
+        client = AsyncPooledGitHub(tokens=["a", "b"], base_url="https://github.com")
+        assert str(client) == "<AsyncPooledGitHub base_url=https://github.com tokens=2>"
+        assert client.headers == {}
+
+    @pytest.mark.asyncio
+    async def test_request_fails_over_exhausted_token(self):
+        """Test that a rate limited request is retried with another token."""
+        with patch("ghnova.client.async_github.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            exhausted_response = _response(429, 0)
+            ok_response = _response(200, 4000)
+            mock_session.request.side_effect = [exhausted_response, ok_response]
+
+            async with AsyncPooledGitHub(tokens=["a", "b"]) as client:
+                response = await client._request("GET", "repos/octocat/Hello-World")
+
+            assert response is ok_response
+            exhausted_response.release.assert_called_once()
+            tokens = [call.kwargs["headers"]["Authorization"] for call in mock_session.request.call_args_list]
+            assert tokens == ["Bearer a", "Bearer b"]
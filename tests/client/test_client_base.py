@@ -1,5 +1,8 @@
 """Unit tests for the base client."""
 
+import pytest
+
+from ghnova.cache.memory import MemoryCache
 from ghnova.client.base import Client
 
 
@@ -72,3 +75,64 @@ class TestClient:
         client = Client(token=None, base_url="https://github.com")
         headers = client._get_conditional_request_headers()
         assert headers == {}
+
+    def test_build_url_absolute(self):
+        """Test _build_url with an absolute URL of the same API."""
+        client = Client(token=None, base_url="https://github.com")
+        url = client._build_url("https://api.github.com/repositories/1/issues?page=2")
+        assert url == "https://api.github.com/repositories/1/issues?page=2"
+
+    def test_build_url_absolute_foreign_host(self):
+        """Test _build_url rejects absolute URLs of another host."""
+        client = Client(token=None, base_url="https://github.com")
+        with pytest.raises(ValueError, match="does not belong to the API"):
+            client._build_url("https://example.com/repos")
+
+    def test_lookup_cache_without_cache(self):
+        """Test that nothing is cached without a cache."""
+        client = Client(token=None, base_url="https://github.com")
+        assert client._lookup_cache("GET", "https://api.github.com/x", None, {}) == (None, None)
+
+    def test_lookup_cache_only_for_get(self):
+        """Test that only GET requests are cacheable."""
+        client = Client(token=None, base_url="https://github.com", cache=MemoryCache())
+        assert client._lookup_cache("POST", "https://api.github.com/x", None, {}) == (None, None)
+
+    def test_lookup_cache_with_caller_validators(self):
+        """Test that requests with caller-supplied validators bypass the cache."""
+        client = Client(token=None, base_url="https://github.com", cache=MemoryCache())
+        assert client._lookup_cache("GET", "https://api.github.com/x", None, {"If-None-Match": '"a"'}) == (None, None)
+
+    def test_store_and_lookup_cache(self):
+        """Test storing a response and looking it up again."""
+        client = Client(token="t", base_url="https://github.com", cache=MemoryCache())
+        key, entry = client._lookup_cache("GET", "https://api.github.com/x", {"page": 1}, client.headers)
+        assert key is not None
+        assert entry is None
+
+        client._store_cache(key, 200, b"[]", {"ETag": '"a"'})
+        _, entry = client._lookup_cache("GET", "https://api.github.com/x", {"page": 1}, client.headers)
+        assert entry is not None
+        assert entry.body == b"[]"
+
+    def test_store_cache_requires_validator_and_success(self):
+        """Test that responses without validators or with other statuses are not stored."""
+        cache = MemoryCache()
+        client = Client(token=None, base_url="https://github.com", cache=cache)
+        client._store_cache("a", 200, b"[]", {})
+        client._store_cache("b", 201, b"{}", {"ETag": '"b"'})
+        assert len(cache) == 0
+
+    def test_graphql_url(self):
+        """Test the GraphQL URL of github.com and GitHub Enterprise Server."""
+        assert Client(token=None, base_url="https://github.com").graphql_url == "https://api.github.com/graphql"
+        client = Client(token=None, base_url="https://ghe.example.com")
+        assert client.graphql_url == "https://ghe.example.com/api/graphql"
+        assert client._build_url("https://ghe.example.com/api/graphql") == "https://ghe.example.com/api/graphql"
+        assert client._get_rate_limit_resource("https://ghe.example.com/api/graphql") == "graphql"
+
+    def test_set_rate_limit_cost(self):
+        """Test that the cost is set on the governor of the client."""
+        client = Client(token="t", base_url="https://github.com")
+        client._set_rate_limit_cost(cost=7, resource="graphql")
+        assert client.rate_limit._costs == {"graphql": 7}
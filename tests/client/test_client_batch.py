@@ -0,0 +1,122 @@
+"""Unit tests for the batch executor."""
+
+import asyncio
+
+import pytest
+
+from ghnova.client.batch import BatchResult, iter_batch
+
+
+def _factory(value: int, delay: float = 0.0):
+    async def call() -> int:
+        await asyncio.sleep(delay)
+        if value < 0:
+            raise ValueError(f"bad value {value}")
+        return value * 2
+
+    return call
+
+
+class TestBatchResult:
+    """Test cases for the BatchResult class."""
+
+    def test_unwrap(self):
+        """Test unwrapping successful and failed results."""
+        assert BatchResult(index=0, value=1).unwrap() == 1
+        assert BatchResult(index=0, value=1).ok
+        failed = BatchResult(index=0, error=ValueError("boom"))
+        assert not failed.ok
+        with pytest.raises(ValueError, match="boom"):
+            failed.unwrap()
+
+
+class TestIterBatch:
+    """Test cases for iter_batch."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        """Test that the concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            async for _ in iter_batch([], concurrency=0):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_ordered(self):
+        """Test that ordered results follow the input order and errors are collected."""
+        factories = [_factory(3, 0.03), _factory(-1, 0.01), _factory(5, 0.0)]
+        results = [result async for result in iter_batch(factories, concurrency=3, ordered=True)]
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert results[0].value == 6  # noqa: PLR2004
+        assert isinstance(results[1].error, ValueError)
+        assert results[2].value == 10  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_as_completed(self):
+        """Test that unordered results are yielded as they complete."""
+        factories = [_factory(3, 0.05), _factory(4, 0.0)]
+        results = [result async for result in iter_batch(factories, concurrency=2)]
+        assert [result.index for result in results] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test that no more than the given number of calls run at the same time."""
+        running = 0
+        peak = 0
+
+        def factory():
+            async def call() -> None:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+            return call
+
+        results = [result async for result in iter_batch((factory() for _ in range(20)), concurrency=4)]
+
+        assert len(results) == 20  # noqa: PLR2004
+        assert peak == 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_progress(self):
+        """Test that the progress callback sees every completion."""
+        calls = []
+        factories = [_factory(1), _factory(2)]
+        async for _ in iter_batch(factories, on_progress=lambda r, done, total: calls.append((done, total))):
+            pass
+        assert calls == [(1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_input_failure(self):
+        """Test that an error raised by the input iterable is propagated."""
+
+        def factories():
+            yield _factory(1)
+            raise RuntimeError("input failed")
+
+        with pytest.raises(RuntimeError, match="input failed"):
+            async for _ in iter_batch(factories(), concurrency=2):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_workers(self):
+        """Test that leaving the iteration early cancels the running calls."""
+        started = []
+
+        def factory(index):
+            async def call() -> int:
+                started.append(index)
+                await asyncio.sleep(0 if index == 0 else 10)
+                return index
+
+            return call
+
+        batch = iter_batch((factory(i) for i in range(100)), concurrency=5)
+        async for result in batch:
+            assert result.index == 0
+            break
+        await batch.aclose()
+
+        assert len(started) <= 6  # noqa: PLR2004
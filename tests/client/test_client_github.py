@@ -1,11 +1,17 @@
 """Unit tests for the synchronous GitHub client."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
+from ghnova.cache.memory import MemoryCache
+from ghnova.client.adapter import PooledHTTPAdapter
 from ghnova.client.github import GitHub
+from ghnova.client.pool import PoolConfig
+from ghnova.client.rate_limit import RateLimitGovernor
+from ghnova.client.retry import RetryPolicy
 
 
 class TestGitHub:
@@ -75,3 +81,175 @@ class TestGitHub:
         client = GitHub(token=None, base_url="https://github.com")
         with pytest.raises(RuntimeError, match="GitHub must be used as a context manager"):
             client._request("GET", "repos/octocat/Hello-World")
+
+    @patch("requests.Session")
+    def test_request_with_cache(self, mock_session_class):
+        """Test that a 304 response is turned back into the cached body."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        first = MagicMock()
+        first.status_code = 200
+        first.content = b'[{"id": 1}]'
+        first.headers = {"ETag": '"abc"', "Content-Type": "application/json"}
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"abc"', "X-RateLimit-Remaining": "4999"}
+        not_modified.url = "https://api.github.com/repos/octocat/Hello-World/issues"
+        mock_session.request.side_effect = [first, not_modified]
+
+        client = GitHub(token="test_token", base_url="https://github.com", cache=MemoryCache())
+        with client:
+            assert client._request("GET", "repos/octocat/Hello-World/issues") is first
+            response = client._request("GET", "repos/octocat/Hello-World/issues")
+
+        second_headers = mock_session.request.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-None-Match"] == '"abc"'
+        not_modified.close.assert_called_once()
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.json() == [{"id": 1}]
+        assert response.headers["x-ratelimit-remaining"] == "4999"
+
+    @patch("requests.Session")
+    def test_request_with_cache_explicit_etag(self, mock_session_class):
+        """Test that a caller-supplied ETag bypasses the cache."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_session.request.return_value = not_modified
+
+        cache = MemoryCache()
+        client = GitHub(token=None, base_url="https://github.com", cache=cache)
+        with client:
+            response = client._request("GET", "user", etag='"abc"')
+
+        assert response is not_modified
+        assert len(cache) == 0
+
+    @patch("ghnova.client.github.time.sleep")
+    @patch("requests.Session")
+    def test_request_rate_limit(self, mock_session_class, mock_sleep):
+        """Test that the rate limit headers are tracked and requests are paced once the budget runs out."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 60),
+            "X-RateLimit-Resource": "core",
+        }
+        mock_session.request.return_value = mock_response
+
+        client = GitHub(token="test_token", base_url="https://github.com")
+        with client:
+            client._request("GET", "repos/octocat/Hello-World")
+            mock_sleep.assert_not_called()
+            assert client.rate_limit.get("core").remaining == 0
+            client._request("GET", "repos/octocat/Hello-World")
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 61  # noqa: PLR2004
+
+    def test_init_with_rate_limit(self):
+        """Test initialization with a custom rate limit governor."""
+        governor = RateLimitGovernor(enabled=False)
+        client = GitHub(token=None, rate_limit=governor)
+        assert client.rate_limit is governor
+        assert isinstance(GitHub(token=None).rate_limit, RateLimitGovernor)
+
+    @patch("ghnova.client.github.time.sleep")
+    @patch("requests.Session")
+    def test_request_retry(self, mock_session_class, mock_sleep):
+        """Test that transient failures are retried and every attempt is recorded."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        failed_response = MagicMock(status_code=502, headers={})
+        ok_response = MagicMock(status_code=200, headers={})
+        mock_session.request.side_effect = [requests.ConnectionError("reset"), failed_response, ok_response]
+
+        client = GitHub(token=None, retry=RetryPolicy(max_attempts=3))
+        with client:
+            response = client._request("GET", "repos/octocat/Hello-World")
+
+        assert response is ok_response
+        assert mock_session.request.call_count == 3  # noqa: PLR2004
+        assert mock_sleep.call_count == 2  # noqa: PLR2004
+        failed_response.close.assert_called_once()
+        assert [attempt.status_code for attempt in client.attempts] == [None, 502, 200]
+        assert client.attempts[0].error is not None
+        assert client.attempts[-1].retry_delay is None
+
+    @patch("ghnova.client.github.time.sleep")
+    @patch("requests.Session")
+    def test_request_retry_exhausted(self, mock_session_class, mock_sleep):
+        """Test that the last failure is raised once the attempts are exhausted."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.side_effect = requests.ConnectionError("reset")
+
+        client = GitHub(token=None, retry=RetryPolicy(max_attempts=2))
+        with client, pytest.raises(requests.ConnectionError):
+            client._request("GET", "repos/octocat/Hello-World")
+
+        assert mock_session.request.call_count == 2  # noqa: PLR2004
+
+    @patch("ghnova.client.github.time.sleep")
+    @patch("requests.Session")
+    def test_request_no_retry_for_post(self, mock_session_class, mock_sleep):
+        """Test that non-idempotent requests are not retried."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_response = MagicMock(status_code=502, headers={})
+        mock_response.raise_for_status.side_effect = requests.HTTPError("502")
+        mock_session.request.return_value = mock_response
+
+        client = GitHub(token=None, retry=RetryPolicy())
+        with client, pytest.raises(requests.HTTPError):
+            client._request("POST", "repos/octocat/Hello-World/issues")
+
+        mock_session.request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_enter_with_pool(self):
+        """Test that the pool configuration is mounted on the session."""
+        client = GitHub(token=None, pool=PoolConfig(max_connections=50))
+        with client:
+            adapter = client.session.get_adapter("https://api.github.com/")
+            assert isinstance(adapter, PooledHTTPAdapter)
+            assert adapter._pool_maxsize == 50  # noqa: PLR2004
+
+    def test_map(self):
+        """Test that map keeps the input order and isolates errors."""
+        progress = []
+
+        def fn(value: int) -> int:
+            if value == 2:  # noqa: PLR2004
+                raise ValueError("boom")
+            return value * 10
+
+        with GitHub(token=None) as client:
+            results = client.map(fn, range(5), max_workers=3, on_progress=lambda r, done, total: progress.append(total))
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert [result.value for result in results] == [0, 10, None, 30, 40]
+        assert isinstance(results[2].error, ValueError)
+        assert progress == [5] * 5
+
+    def test_map_enlarges_pool(self):
+        """Test that map sizes the connection pool to the number of workers."""
+        with GitHub(token=None) as client:
+            client.map(lambda value: value, [1], max_workers=32)
+            adapter = client.session.get_adapter("https://api.github.com/")
+            assert adapter._pool_maxsize == 32  # noqa: PLR2004
+
+            client.map(lambda value: value, [1], max_workers=4)
+            assert client.session.get_adapter("https://api.github.com/") is adapter
+
+    def test_map_invalid(self):
+        """Test the preconditions of map."""
+        with pytest.raises(RuntimeError, match="GitHub must be used as a context manager"):
+            GitHub(token=None).map(lambda value: value, [1])
+        with GitHub(token=None) as client, pytest.raises(ValueError, match="max_workers must be at least 1"):
+            client.map(lambda value: value, [1], max_workers=0)
@@ -0,0 +1,61 @@
+"""Unit tests for the connection pool configuration."""
+
+import socket
+
+import pytest
+
+from ghnova.client.adapter import PooledHTTPAdapter
+from ghnova.client.pool import PoolConfig
+
+
+class TestPoolConfig:
+    """Test cases for the PoolConfig class."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"max_connections": 0}, "max_connections must be at least 1"),
+            ({"max_connections_per_host": -1}, "max_connections_per_host must not be negative"),
+        ],
+    )
+    def test_invalid(self, kwargs, message):
+        """Test that invalid pool sizes are rejected."""
+        with pytest.raises(ValueError, match=message):
+            PoolConfig(**kwargs)
+
+    def test_socket_options(self):
+        """Test the socket options with and without TCP keepalive."""
+        options = PoolConfig(tcp_keepalive_idle=30).get_socket_options()
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+        assert PoolConfig(tcp_keepalive=False).get_socket_options() == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+    def test_create_adapter(self):
+        """Test that the adapter is sized by the per-host limit, falling back to the pool size."""
+        adapter = PoolConfig(max_connections=64, block=True).create_adapter()
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter._pool_maxsize == 64  # noqa: PLR2004
+        assert adapter._pool_block is True
+        assert adapter.poolmanager.connection_pool_kw["socket_options"] == PoolConfig().get_socket_options()
+
+        adapter = PoolConfig(max_connections=64, max_connections_per_host=16).create_adapter()
+        assert adapter._pool_maxsize == 16  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_create_connector(self):
+        """Test that the connector follows the configuration."""
+        connector = PoolConfig(max_connections=50, max_connections_per_host=20, dns_cache_ttl=300).create_connector()
+        try:
+            assert connector.limit == 50  # noqa: PLR2004
+            assert connector.limit_per_host == 20  # noqa: PLR2004
+            assert connector.use_dns_cache is True
+            sock = connector._socket_factory((socket.AF_INET, socket.SOCK_STREAM, 0, "", ("127.0.0.1", 0)))
+            try:
+                assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0
+            finally:
+                sock.close()
+        finally:
+            await connector.close()
@@ -0,0 +1,78 @@
+"""Unit tests for the synchronous pooled GitHub client."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from ghnova.client.pooled_github import PooledGitHub
+
+
+def _response(status_code: int, remaining: int) -> MagicMock:
+    response = MagicMock(status_code=status_code)
+    response.headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": "9999999999",
+        "X-RateLimit-Resource": "core",
+    }
+    if status_code >= 400:  # noqa: PLR2004
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+class TestPooledGitHub:
+    """Test cases for the PooledGitHub class."""
+
+    def test_init(self):
+        """Test that the pool tokens are not used as a session-wide header."""
+        client = PooledGitHub(tokens=["a", "b"])
+        assert client.headers == {}
+        assert client.token_pool.tokens == ["a", "b"]
+
+    def test_set_rate_limit_cost(self):
+        """Test that the cost is set on the governor of every token."""
+        client = PooledGitHub(tokens=["a", "b"])
+        client._set_rate_limit_cost(cost=7, resource="graphql")
+        assert [governor._costs for governor in client.token_pool.governors.values()] == [{"graphql": 7}] * 2
+
+    @patch("requests.Session")
+    def test_request_spreads_tokens(self, mock_session_class):
+        """Test that requests use the token with the most remaining budget."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.side_effect = [_response(200, 100), _response(200, 4000), _response(200, 3999)]
+
+        with PooledGitHub(tokens=["a", "b"]) as client:
+            for _ in range(3):
+                client._request("GET", "repos/octocat/Hello-World")
+
+        tokens = [call.kwargs["headers"]["Authorization"] for call in mock_session.request.call_args_list]
+        assert tokens == ["Bearer a", "Bearer b", "Bearer b"]
+
+    @patch("requests.Session")
+    def test_request_fails_over_exhausted_token(self, mock_session_class):
+        """Test that a rate limited request is retried with another token."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        ok_response = _response(200, 4000)
+        mock_session.request.side_effect = [_response(403, 0), ok_response]
+
+        with PooledGitHub(tokens=["a", "b"]) as client:
+            response = client._request("GET", "repos/octocat/Hello-World")
+
+        assert response is ok_response
+        tokens = [call.kwargs["headers"]["Authorization"] for call in mock_session.request.call_args_list]
+        assert tokens == ["Bearer a", "Bearer b"]
+
+    @patch("requests.Session")
+    def test_request_all_tokens_exhausted(self, mock_session_class):
+        """Test that the rate limit error is raised once every token is exhausted."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.side_effect = [_response(403, 0), _response(403, 0)]
+
+        with PooledGitHub(tokens=["a", "b"]) as client, pytest.raises(requests.HTTPError):
+            client._request("GET", "repos/octocat/Hello-World")
+
+        assert mock_session.request.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,119 @@
+"""Unit tests for the rate limit governor."""
+
+import pytest
+
+from ghnova.client.rate_limit import RateLimitGovernor, get_rate_limit_resource
+
+
+def _headers(limit: int, remaining: int, reset: int, resource: str | None = "core") -> dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+    if resource is not None:
+        headers["X-RateLimit-Resource"] = resource
+    return headers
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected"),
+    [
+        ("/repos/octocat/Hello-World/issues", "core"),
+        ("/repos/octocat/search/issues", "core"),
+        ("/search/issues", "search"),
+        ("search/code", "code_search"),
+        ("/graphql", "graphql"),
+    ],
+)
+def test_get_rate_limit_resource(endpoint, expected):
+    """Test guessing the bucket of an endpoint."""
+    assert get_rate_limit_resource(endpoint) == expected
+
+
+class TestRateLimitGovernor:
+    """Test cases for the RateLimitGovernor class."""
+
+    def test_invalid_threshold(self):
+        """Test that the threshold must be a fraction."""
+        with pytest.raises(ValueError, match="threshold must be between 0 and 1"):
+            RateLimitGovernor(threshold=1.5)
+
+    def test_update(self):
+        """Test tracking the budget from the response headers."""
+        governor = RateLimitGovernor()
+        governor.update(_headers(5000, 4990, 1000, resource="search"))
+
+        bucket = governor.get("search")
+        assert bucket is not None
+        assert (bucket.limit, bucket.remaining, bucket.reset) == (5000, 4990, 1000.0)
+        assert governor.get("core") is None
+        assert set(governor.buckets) == {"search"}
+        assert "search=4990/5000" in repr(governor)
+
+    def test_update_without_resource_header(self):
+        """Test that the guessed bucket is used when the response does not report one."""
+        governor = RateLimitGovernor()
+        governor.update(_headers(30, 10, 1000, resource=None), resource="search")
+        assert governor.get("search") is not None
+
+    def test_update_ignores_missing_headers(self):
+        """Test that responses without rate limit headers are ignored."""
+        governor = RateLimitGovernor()
+        governor.update({"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "oops"})
+        assert governor.buckets == {}
+
+    def test_update_out_of_order(self):
+        """Test that a stale response within the same window does not raise the budget."""
+        governor = RateLimitGovernor()
+        governor.update(_headers(5000, 10, 1000))
+        governor.update(_headers(5000, 12, 1000))
+        assert governor.get().remaining == 10  # noqa: PLR2004
+        governor.update(_headers(5000, 5000, 2000))
+        assert governor.get().remaining == 5000  # noqa: PLR2004
+
+    def test_reserve_unknown_bucket(self):
+        """Test that requests are not delayed before the budget is known."""
+        assert RateLimitGovernor().reserve("core", now=0) == 0
+
+    def test_reserve_above_threshold(self):
+        """Test that requests are not delayed while the budget is healthy."""
+        governor = RateLimitGovernor(threshold=0.2)
+        governor.update(_headers(100, 50, 100))
+        assert governor.reserve(now=0) == 0
+        assert governor.get().remaining == 49  # noqa: PLR2004
+
+    def test_reserve_paces_below_threshold(self):
+        """Test that the remaining requests are spread over the reset window."""
+        governor = RateLimitGovernor(threshold=0.2)
+        governor.update(_headers(100, 10, 100))
+
+        assert governor.reserve(now=0) == 0
+        assert governor.reserve(now=0) == pytest.approx(10)
+        assert governor.reserve(now=0) == pytest.approx(20)
+
+    def test_reserve_exhausted(self):
+        """Test that requests wait for the reset when the budget is exhausted."""
+        governor = RateLimitGovernor(reset_margin=1.0)
+        governor.update(_headers(5000, 0, 100))
+
+        assert governor.reserve(now=40) == pytest.approx(61)
+        assert governor.reserve(now=101) == 0
+
+    def test_reserve_with_cost(self):
+        """Test that requests spend the cost set for the bucket."""
+        governor = RateLimitGovernor(threshold=0.2, reset_margin=1.0)
+        governor.update(_headers(5000, 1500, 100, resource="graphql"))
+        governor.set_cost(cost=500, resource="graphql")
+
+        assert governor.reserve("graphql", now=0) == 0
+        assert governor.get("graphql").remaining == 1000  # noqa: PLR2004
+        assert governor.reserve("graphql", now=0) == 0
+        assert governor.reserve("graphql", now=0) == pytest.approx(50)
+        assert governor.reserve("graphql", now=0) == pytest.approx(101)
+
+    def test_reserve_disabled(self):
+        """Test that a disabled governor only tracks the budget."""
+        governor = RateLimitGovernor(enabled=False)
+        governor.update(_headers(5000, 0, 100))
+        assert governor.reserve(now=0) == 0
@@ -0,0 +1,90 @@
+"""Unit tests for the retry policy."""
+
+import email.utils
+import random
+
+import pytest
+
+from ghnova.client.retry import RetryPolicy, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Test cases for parse_retry_after."""
+
+    def test_seconds(self):
+        """Test parsing a number of seconds."""
+        assert parse_retry_after("120") == 120  # noqa: PLR2004
+
+    def test_http_date(self):
+        """Test parsing an HTTP date."""
+        value = email.utils.formatdate(1_000_030, usegmt=True)
+        assert parse_retry_after(value, now=1_000_000) == pytest.approx(30)
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value):
+        """Test that missing or malformed values are ignored."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    """Test cases for the RetryPolicy class."""
+
+    def test_invalid_max_attempts(self):
+        """Test that at least one attempt is required."""
+        with pytest.raises(ValueError, match="max_attempts must be at least 1"):
+            RetryPolicy(max_attempts=0)
+
+    def test_backoff_full_jitter(self):
+        """Test that the backoff is drawn between zero and the exponential bound."""
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, rng=random.Random(0))
+        for attempt, bound in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+            for _ in range(20):
+                assert 0 <= policy.get_backoff(attempt) <= bound
+
+    @pytest.mark.parametrize(
+        ("status_code", "headers", "expected"),
+        [
+            (429, {}, True),
+            (502, {}, True),
+            (404, {}, False),
+            (403, {}, False),
+            (403, {"Retry-After": "60"}, True),
+            (403, {"X-RateLimit-Remaining": "0"}, True),
+        ],
+    )
+    def test_is_retryable_status(self, status_code, headers, expected):
+        """Test which responses are retried."""
+        assert RetryPolicy().is_retryable_status(status_code, headers) is expected
+
+    def test_retry_delay_uses_retry_after(self):
+        """Test that Retry-After takes precedence over the backoff."""
+        policy = RetryPolicy()
+        assert policy.get_retry_delay("GET", 1, status_code=429, headers={"Retry-After": "7"}) == 7  # noqa: PLR2004
+
+    def test_retry_delay_too_long(self):
+        """Test that delays longer than the limit are not honored."""
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.get_retry_delay("GET", 1, status_code=429, headers={"Retry-After": "60"}) is None
+
+    def test_retry_delay_rate_limit_reset(self):
+        """Test that an exhausted budget waits for the reset."""
+        policy = RetryPolicy()
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+        assert policy.get_retry_delay("GET", 1, status_code=403, headers=headers, now=1000) == 30  # noqa: PLR2004
+
+    def test_retry_delay_backoff(self):
+        """Test that the backoff is used without server hints."""
+        policy = RetryPolicy(backoff_factor=1.0)
+        assert 0 <= policy.get_retry_delay("get", 1, status_code=502) <= 1
+
+    def test_no_retry(self):
+        """Test the cases that are not retried."""
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.get_retry_delay("GET", 2, status_code=502) is None
+        assert policy.get_retry_delay("POST", 1, status_code=502) is None
+        assert policy.get_retry_delay("GET", 1, status_code=404) is None
+        assert RetryPolicy(retry_connection_errors=False).get_retry_delay("GET", 1, error=OSError()) is None
+
+    def test_connection_error(self):
+        """Test that connection errors of idempotent requests are retried."""
+        assert RetryPolicy().get_retry_delay("GET", 1, error=OSError()) is not None
@@ -0,0 +1,96 @@
+"""Unit tests for the token pool."""
+
+import pytest
+
+from ghnova.client.pooled_github import PooledGitHub
+from ghnova.client.token_pool import TokenPool
+from ghnova.config.manager import ConfigManager
+
+
+def _headers(remaining: int, reset: int = 1000) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Resource": "core",
+    }
+
+
+class TestTokenPool:
+    """Test cases for the TokenPool class."""
+
+    def test_requires_token(self):
+        """Test that an empty pool is rejected."""
+        with pytest.raises(ValueError, match="At least one token is required"):
+            TokenPool(tokens=["", ""])
+
+    def test_deduplicates_tokens(self):
+        """Test that duplicate tokens are ignored."""
+        pool = TokenPool(tokens=["a", "b", "a"])
+        assert pool.tokens == ["a", "b"]
+        assert len(pool) == 2  # noqa: PLR2004
+        assert repr(pool) == "<TokenPool tokens=2>"
+
+    def test_select_rotates_unknown_tokens(self):
+        """Test that tokens without a known budget are used in turn."""
+        pool = TokenPool(tokens=["a", "b", "c"])
+        assert [pool.select(now=0)[0] for _ in range(3)] == ["a", "b", "c"]
+
+    def test_select_most_remaining(self):
+        """Test that the token with the most remaining budget is selected."""
+        pool = TokenPool(tokens=["a", "b", "c"])
+        pool.governors["a"].update(_headers(100))
+        pool.governors["b"].update(_headers(4000))
+        pool.governors["c"].update(_headers(50))
+
+        token, governor = pool.select(now=0)
+
+        assert token == "b"
+        assert governor is pool.governors["b"]
+
+    def test_select_skips_exhausted_tokens(self):
+        """Test that exhausted tokens are only used when every token is exhausted."""
+        pool = TokenPool(tokens=["a", "b"])
+        pool.governors["a"].update(_headers(0, reset=500))
+        pool.governors["b"].update(_headers(1))
+        assert pool.select(now=0)[0] == "b"
+        assert pool.has_budget(now=0)
+
+        pool.governors["b"].update(_headers(0, reset=900))
+        assert pool.select(now=0)[0] == "a"
+        assert not pool.has_budget(now=0)
+        assert pool.has_budget(now=1000)
+
+    def test_select_per_resource(self):
+        """Test that the budget of the requested bucket is used."""
+        pool = TokenPool(tokens=["a", "b"])
+        pool.governors["a"].update(_headers(0))
+        assert pool.select(resource="search", now=0)[0] in {"a", "b"}
+        assert pool.select(resource="core", now=0)[0] == "b"
+
+
+class TestFromAccounts:
+    """Test cases for creating a pooled client from the configuration."""
+
+    def test_from_accounts(self, tmp_path):
+        """Test creating a pooled client from configured accounts."""
+        config_path = tmp_path / "config.yaml"
+        manager = ConfigManager(filename=config_path)
+        manager.add_account(name="one", token="token-1", base_url="https://ghe.example.com")
+        manager.add_account(name="two", token="token-2", base_url="https://ghe.example.com")
+        manager.add_account(name="three", token="token-3", base_url="https://github.com")
+        manager.save_config()
+
+        client = PooledGitHub.from_accounts(names=["one", "two"], config_path=config_path)
+
+        assert client.token_pool.tokens == ["token-1", "token-2"]
+        assert client.base_url == "https://ghe.example.com"
+        assert str(client) == "<PooledGitHub base_url=https://ghe.example.com tokens=2>"
+
+        with pytest.raises(ValueError, match="must share the same base URL"):
+            PooledGitHub.from_accounts(config_path=config_path)
+
+    def test_from_accounts_without_accounts(self, tmp_path):
+        """Test that a pool needs at least one account."""
+        with pytest.raises(ValueError, match="No accounts are configured"):
+            PooledGitHub.from_accounts(config_path=tmp_path / "config.yaml")
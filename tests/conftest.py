@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import subprocess
+import sys
+from collections.abc import Callable
 
 import pytest
 
@@ -23,3 +26,32 @@ def setup_logger() -> None:
     for handler in list(logger.handlers):
         handler.close()
         logger.removeHandler(handler)
+
+
+@pytest.fixture(autouse=True)
+def isolate_daemon(tmp_path, monkeypatch) -> None:
+    """Point the CLI at a daemon socket that does not exist, so a running daemon does not serve the tests."""
+    monkeypatch.setenv("GHNOVA_DAEMON_SOCKET", str(tmp_path / "no-daemon.sock"))
+
+
+@pytest.fixture
+def import_times() -> Callable[[str], dict[str, int]]:
+    """Get a function measuring the cumulative import time of each module loaded by some code.
+
+    The code runs in a fresh interpreter with -X importtime. Compare the times of modules imported in the
+    same run, since absolute times depend on the machine.
+    """
+
+    def measure(code: str) -> dict[str, int]:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+        )
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, total, name = line.split("|")
+                if total.strip().isdigit():
+                    cumulative[name.strip()] = int(total)
+        return cumulative
+
+    return measure
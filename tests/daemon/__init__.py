@@ -0,0 +1 @@
+"""Unit tests for the ghnova.daemon package."""
@@ -0,0 +1,35 @@
+"""Fixtures for the daemon tests."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from ghnova.daemon.server import DaemonServer
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Path of a daemon socket in a short temporary directory, as socket paths are limited to about 100 bytes."""
+    directory = tempfile.mkdtemp(prefix="ghnova-")
+    yield Path(directory) / "daemon.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def server(socket_path) -> Iterator[DaemonServer]:
+    """Serve a daemon in a thread, with a mocked GitHub client."""
+    server = DaemonServer(socket_path=socket_path)
+    server.get_client = MagicMock(name="get_client")  # type: ignore[method-assign]
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
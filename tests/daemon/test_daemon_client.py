@@ -0,0 +1,87 @@
+"""Tests for the daemon client."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from ghnova.daemon.client import DaemonClient, is_daemon_running
+from ghnova.daemon.protocol import DaemonError, DaemonTimeoutError
+
+
+def test_is_daemon_running(server, socket_path) -> None:
+    """Test detecting a running daemon."""
+    assert is_daemon_running(socket_path)
+
+
+def test_is_daemon_not_running(socket_path) -> None:
+    """Test detecting a missing daemon."""
+    assert not is_daemon_running(socket_path)
+
+
+class TestDaemonClient:
+    """Tests for DaemonClient."""
+
+    def test_forwards_calls(self, server, socket_path) -> None:
+        """Test that the calls of the resources are forwarded to the daemon."""
+        server.get_client.return_value.issue.get_issue.return_value = ({"number": 1}, {"status_code": 200})
+
+        with DaemonClient(socket_path=socket_path, token="t", base_url="https://github.com", no_cache=True) as client:
+            result = client.issue.get_issue(owner="o", repository="r", issue_number=1)
+
+        assert result == [{"number": 1}, {"status_code": 200}]
+        server.get_client.return_value.issue.get_issue.assert_called_once_with(
+            owner="o", repository="r", issue_number=1
+        )
+
+    def test_falls_back_in_process(self, socket_path) -> None:
+        """Test that the calls run in-process when the daemon is not running."""
+        with patch("ghnova.client.github.GitHub") as mock_github:
+            fallback = mock_github.return_value.__enter__.return_value
+            fallback.user.get_user.return_value = ({"login": "me"}, {})
+
+            with DaemonClient(
+                socket_path=socket_path, token="t", base_url="https://github.com", no_cache=True
+            ) as client:
+                assert client.user.get_user(username="me") == ({"login": "me"}, {})
+                assert client.user.get_user(username="me") == ({"login": "me"}, {})
+
+        mock_github.assert_called_once_with(token="t", base_url="https://github.com", cache=None)
+        fallback.__exit__.assert_called_once()
+
+    def test_falls_back_in_process_on_timeout(self, socket_path) -> None:
+        """Test that a read runs in-process when the daemon does not answer in time."""
+        with (
+            patch("ghnova.daemon.client.send_request", side_effect=DaemonTimeoutError("No answer.")),
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            fallback = mock_github.return_value.__enter__.return_value
+            fallback.issue.list_issues.return_value = ([{"number": 1}], {})
+
+            with DaemonClient(
+                socket_path=socket_path, token="t", base_url="https://github.com", no_cache=True
+            ) as client:
+                assert client.issue.list_issues(owner="o", repository="r") == ([{"number": 1}], {})
+
+        fallback.issue.list_issues.assert_called_once_with(owner="o", repository="r")
+
+    def test_does_not_repeat_writes_on_timeout(self, socket_path) -> None:
+        """Test that a write is not sent again in-process when the daemon does not answer in time."""
+        with (
+            patch("ghnova.daemon.client.send_request", side_effect=DaemonTimeoutError("No answer.")),
+            patch("ghnova.client.github.GitHub") as mock_github,
+        ):
+            client = DaemonClient(socket_path=socket_path, token="t", base_url="https://github.com", no_cache=True)
+            with pytest.raises(DaemonError, match=r"outcome of issue\.create_issue is unknown"):
+                client.issue.create_issue(owner="o", repository="r", title="Bug")
+
+        mock_github.assert_not_called()
+
+    def test_unknown_attribute(self, socket_path) -> None:
+        """Test that only the resources of the client are exposed."""
+        client = DaemonClient(socket_path=socket_path, token="t", base_url="https://github.com")
+        with pytest.raises(AttributeError):
+            _ = client.session
+        with pytest.raises(AttributeError):
+            _ = client.user._get_user
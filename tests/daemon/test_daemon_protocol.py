@@ -0,0 +1,141 @@
+"""Tests for the daemon wire protocol."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import socket
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ghnova.daemon.protocol import (
+    DaemonError,
+    DaemonTimeoutError,
+    DaemonUnavailableError,
+    check_socket_path,
+    decode_message,
+    encode_message,
+    get_default_socket_path,
+    send_request,
+)
+
+
+def test_message_round_trip() -> None:
+    """Test that messages, including datetimes and tuples, survive encoding."""
+    moment = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    encoded = encode_message({"since": moment, "labels": ("bug", "docs"), "count": 1})
+
+    assert encoded.endswith(b"\n")
+    assert decode_message(encoded) == {"since": moment, "labels": ["bug", "docs"], "count": 1}
+
+
+def test_decode_message_rejects_non_objects() -> None:
+    """Test that a message must be a JSON object."""
+    with pytest.raises(ValueError, match="JSON object"):
+        decode_message(b"[1, 2]\n")
+
+
+def test_default_socket_path_from_environment(monkeypatch, tmp_path) -> None:
+    """Test that GHNOVA_DAEMON_SOCKET overrides the default socket path."""
+    monkeypatch.setenv("GHNOVA_DAEMON_SOCKET", str(tmp_path / "custom.sock"))
+    assert get_default_socket_path() == tmp_path / "custom.sock"
+
+
+def test_default_socket_path(monkeypatch, tmp_path) -> None:
+    """Test that the default socket lives in the runtime directory."""
+    monkeypatch.delenv("GHNOVA_DAEMON_SOCKET", raising=False)
+    runtime_dir = tmp_path / "runtime"
+    runtime_dir.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    path = get_default_socket_path()
+    assert path is not None
+    assert path.name == "daemon.sock"
+    assert "ghnova" in path.parts
+
+
+def test_default_socket_path_without_runtime_directory(monkeypatch, tmp_path) -> None:
+    """Test that the daemon is not used when the runtime directory falls back to the temporary directory."""
+    monkeypatch.delenv("GHNOVA_DAEMON_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    with patch("platformdirs.user_runtime_dir", side_effect=_warn_and_fall_back(tmp_path)):
+        assert get_default_socket_path() is None
+
+
+def _warn_and_fall_back(tmp_path: Path):
+    """Make a stand-in of platformdirs.user_runtime_dir falling back to the temporary directory."""
+
+    def user_runtime_dir(appname: str) -> str:
+        warnings.warn("XDG_RUNTIME_DIR is not set, falling back", stacklevel=2)
+        return str(tmp_path / "runtime-0" / appname)
+
+    return user_runtime_dir
+
+
+def test_check_socket_path_rejects_shared_directory(tmp_path) -> None:
+    """Test that a socket in a directory other users can access is not used."""
+    tmp_path.chmod(0o755)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(tmp_path / "daemon.sock"))
+        with pytest.raises(DaemonUnavailableError, match="not accessible to other users"):
+            check_socket_path(tmp_path / "daemon.sock")
+
+
+def test_check_socket_path_rejects_shared_socket(socket_path) -> None:
+    """Test that a socket other users can access is not used."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(socket_path))
+        socket_path.chmod(0o666)
+        with pytest.raises(DaemonUnavailableError, match="its socket"):
+            check_socket_path(socket_path)
+
+
+def test_check_socket_path_rejects_other_owner(server) -> None:
+    """Test that a socket owned by another user is not used."""
+    with (
+        patch("os.getuid", return_value=server.socket_path.stat().st_uid + 1),
+        pytest.raises(DaemonUnavailableError, match="owned by the current user"),
+    ):
+        send_request(server.socket_path, {"op": "ping"})
+
+
+def test_send_request_timeout(socket_path) -> None:
+    """Test that a daemon accepting a request without answering it times out."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(socket_path))
+        socket_path.chmod(0o600)
+        sock.listen()
+        with pytest.raises(DaemonTimeoutError, match="did not answer"):
+            send_request(socket_path, {"op": "ping"}, timeout=0.1)
+
+
+def test_send_request_unavailable(socket_path: Path) -> None:
+    """Test that a missing daemon raises DaemonUnavailableError."""
+    with pytest.raises(DaemonUnavailableError):
+        send_request(socket_path, {"op": "ping"})
+
+
+def test_send_request(server) -> None:
+    """Test sending a request to a running daemon."""
+    result = send_request(server.socket_path, {"op": "ping"})
+    assert result["clients"] == 0
+    assert isinstance(result["pid"], int)
+
+
+def test_send_request_error(server) -> None:
+    """Test that errors of the daemon are raised as DaemonError."""
+    with pytest.raises(DaemonError, match="Unknown daemon operation") as excinfo:
+        send_request(server.socket_path, {"op": "unknown"})
+    assert excinfo.value.error_type == "ValueError"
+
+
+def test_daemon_error_copy_and_pickle() -> None:
+    """Test that DaemonError keeps its message and type when copied or pickled."""
+    error = DaemonError("Unknown daemon operation", error_type="ValueError")
+    for clone in (copy.copy(error), pickle.loads(pickle.dumps(error))):
+        assert str(clone) == "Unknown daemon operation"
+        assert clone.error_type == "ValueError"
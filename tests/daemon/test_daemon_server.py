@@ -0,0 +1,161 @@
+"""Tests for the daemon server."""
+
+from __future__ import annotations
+
+import stat
+import threading
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghnova.daemon.protocol import DaemonError, send_request
+from ghnova.daemon.server import DaemonServer
+
+
+@dataclass(slots=True)
+class _Item:
+    number: int
+
+
+def _call(server: DaemonServer, resource: str, method: str, **kwargs):
+    return send_request(
+        server.socket_path,
+        {
+            "op": "call",
+            "token": "token",
+            "base_url": "https://github.com",
+            "cache_path": None,
+            "no_cache": True,
+            "resource": resource,
+            "method": method,
+            "kwargs": kwargs,
+        },
+    )
+
+
+class TestDaemonServer:
+    """Tests for DaemonServer."""
+
+    def test_socket_permissions(self, server) -> None:
+        """Test that only the owner can connect to the socket."""
+        assert stat.S_IMODE(server.socket_path.stat().st_mode) == 0o600  # noqa: PLR2004
+
+    def test_call(self, server) -> None:
+        """Test calling a method of a resource of the warm client."""
+        client = server.get_client.return_value
+        client.user.get_user.return_value = ({"login": "octocat"}, {"status_code": 200})
+
+        result = _call(server, "user", "get_user", username="octocat")
+
+        assert result == [{"login": "octocat"}, {"status_code": 200}]
+        client.user.get_user.assert_called_once_with(username="octocat")
+        server.get_client.assert_called_once_with(
+            token="token", base_url="https://github.com", cache_path=None, no_cache=True
+        )
+
+    def test_call_serializes_records_and_generators(self, server) -> None:
+        """Test that records become dictionaries and generators become lists."""
+        client = server.get_client.return_value
+        client.issue.iter_issues.return_value = (_Item(number=n) for n in (1, 2))
+
+        assert _call(server, "issue", "iter_issues") == [{"number": 1}, {"number": 2}]
+
+    @pytest.mark.parametrize(("resource", "method"), [("session", "get"), ("user", "_get_user"), ("user", "missing")])
+    def test_call_rejects_unknown_targets(self, server, resource, method) -> None:
+        """Test that only the public methods of the resources can be called."""
+        server.get_client.return_value = MagicMock(spec=["user"])
+        server.get_client.return_value.user = MagicMock(spec=["get_user"])
+
+        with pytest.raises(DaemonError, match="Unknown"):
+            _call(server, resource, method)
+
+    def test_call_error(self, server) -> None:
+        """Test that an exception of the call is returned to the client."""
+        server.get_client.return_value.user.get_user.side_effect = RuntimeError("boom")
+
+        with pytest.raises(DaemonError, match="boom") as excinfo:
+            _call(server, "user", "get_user")
+        assert excinfo.value.error_type == "RuntimeError"
+
+    def test_auth(self, server) -> None:
+        """Test resolving the authentication parameters in the daemon."""
+        with patch("ghnova.cli.utils.auth.get_auth_params", return_value=("t", "https://example.com")) as mock:
+            result = send_request(
+                server.socket_path,
+                {"op": "auth", "config_path": "config.yaml", "account_name": "work", "token": None, "base_url": None},
+            )
+
+        assert result == ["t", "https://example.com"]
+        mock.assert_called_once_with(config_path="config.yaml", account_name="work", token=None, base_url=None)
+
+    def test_refuses_shared_directory(self, tmp_path) -> None:
+        """Test that the socket is not created in a directory other users can access."""
+        tmp_path.chmod(0o755)
+        with pytest.raises(RuntimeError, match="mode 0o700"):
+            DaemonServer(socket_path=tmp_path / "daemon.sock")
+
+    def test_requires_private_runtime_directory(self) -> None:
+        """Test that the daemon does not fall back to a socket in the temporary directory."""
+        with (
+            patch("ghnova.daemon.server.get_default_socket_path", return_value=None),
+            pytest.raises(RuntimeError, match="XDG_RUNTIME_DIR"),
+        ):
+            DaemonServer()
+
+    def test_refuses_running_daemon(self, server) -> None:
+        """Test that a second daemon does not take over the socket of a running one."""
+        with pytest.raises(RuntimeError, match="already running"):
+            DaemonServer(socket_path=server.socket_path)
+
+    def test_replaces_stale_socket(self, socket_path) -> None:
+        """Test that the socket of a daemon that did not exit cleanly is replaced."""
+        socket_path.touch()
+        server = DaemonServer(socket_path=socket_path)
+        try:
+            assert socket_path.is_socket()
+        finally:
+            server.server_close()
+        assert not socket_path.exists()
+
+    def test_shutdown(self, socket_path) -> None:
+        """Test stopping the daemon with a shutdown request."""
+        server = DaemonServer(socket_path=socket_path)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+
+        send_request(socket_path, {"op": "shutdown"})
+        thread.join(timeout=5)
+        server.server_close()
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+    def test_idle_timeout(self, socket_path) -> None:
+        """Test that the daemon stops after the idle timeout."""
+        server = DaemonServer(socket_path=socket_path, idle_timeout=0.1)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        server.server_close()
+
+        assert not thread.is_alive()
+
+    def test_get_client_reuses_clients_and_caches(self, socket_path, tmp_path) -> None:
+        """Test that the clients and caches are kept warm between requests."""
+        server = DaemonServer(socket_path=socket_path)
+        cache_path = str(tmp_path / "cache.sqlite")
+        try:
+            first = server.get_client(token="a", base_url="https://github.com", cache_path=cache_path, no_cache=False)
+            again = server.get_client(token="a", base_url="https://github.com", cache_path=cache_path, no_cache=False)
+            other = server.get_client(token="b", base_url="https://github.com", cache_path=cache_path, no_cache=False)
+            uncached = server.get_client(token="a", base_url="https://github.com", cache_path=None, no_cache=True)
+
+            assert first is again
+            assert other is not first
+            assert other.cache is first.cache
+            assert uncached.cache is None
+            assert first.session is not None
+        finally:
+            server.server_close()
+        assert first.session is None
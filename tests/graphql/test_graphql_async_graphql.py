@@ -0,0 +1,67 @@
+"""Unit tests for the asynchronous GraphQL resource."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import ClientResponseError
+
+from ghnova.graphql.async_graphql import AsyncGraphQL
+
+
+def _response(payload: dict) -> MagicMock:
+    response = MagicMock(status=200, headers={})
+    response.read = AsyncMock(return_value=json.dumps(payload).encode())
+    return response
+
+
+def _issue(number: int) -> dict:
+    return {"__typename": "Issue", "number": number, "state": "OPEN"}
+
+
+class TestAsyncGraphQL:
+    """Test cases for the AsyncGraphQL class."""
+
+    @pytest.mark.asyncio
+    async def test_execute(self):
+        """Test executing a query against the GraphQL URL."""
+        mock_client = MagicMock()
+        mock_client.graphql_url = "https://ghe.example.com/api/graphql"
+        mock_client._request = AsyncMock(return_value=_response({"data": {"viewer": {"login": "octocat"}}}))
+
+        data, metadata = await AsyncGraphQL(client=mock_client).execute(query="{ viewer { login } }")
+
+        assert data == {"viewer": {"login": "octocat"}}
+        assert metadata == {"status_code": 200}
+        assert mock_client._request.call_args.kwargs["endpoint"] == "https://ghe.example.com/api/graphql"
+
+    @pytest.mark.asyncio
+    async def test_get_issues_batch_splits_on_timeout(self):
+        """Test that a batch timing out on the server is split in half."""
+        mock_client = MagicMock()
+        mock_client._request = AsyncMock(
+            side_effect=[
+                ClientResponseError(request_info=MagicMock(), history=(), status=502),
+                _response({"data": {"i0": {"issueOrPullRequest": _issue(1)}}}),
+                _response({"data": {"i0": {"issueOrPullRequest": _issue(2)}}}),
+            ]
+        )
+
+        issues = await AsyncGraphQL(client=mock_client).get_issues_batch([("o", "r", 1), ("o", "r", 2)])
+
+        assert [issue["number"] for issue in issues] == [1, 2]
+        assert mock_client._request.call_count == 3  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_get_issues_batch_records_cost(self):
+        """Test that the cost of each query paces the later queries of the client."""
+        mock_client = MagicMock()
+        mock_client._request = AsyncMock(
+            return_value=_response(
+                {"data": {"i0": {"issueOrPullRequest": _issue(1)}, "rateLimit": {"cost": 2, "remaining": 4998}}}
+            )
+        )
+
+        await AsyncGraphQL(client=mock_client).get_issues_batch([("o", "r", 1)])
+
+        mock_client._set_rate_limit_cost.assert_called_once_with(cost=2, resource="graphql")
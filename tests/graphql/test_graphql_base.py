@@ -0,0 +1,146 @@
+"""Unit tests for the GraphQL base class."""
+
+import copy
+import pickle
+
+import pytest
+
+from ghnova.graphql.base import BaseGraphQL, GraphQLError, to_rest_issue
+
+ISSUE_NODE = {
+    "__typename": "Issue",
+    "id": "I_1",
+    "databaseId": 11,
+    "number": 1,
+    "title": "Bug",
+    "body": "Broken",
+    "state": "CLOSED",
+    "stateReason": "COMPLETED",
+    "locked": False,
+    "url": "https://github.com/o/r/issues/1",
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-02T00:00:00Z",
+    "closedAt": "2024-01-03T00:00:00Z",
+    "author": {"login": "octocat", "databaseId": 1, "avatarUrl": "a", "url": "u"},
+    "labels": {"nodes": [{"id": "L_1", "name": "bug", "color": "f00", "description": None}]},
+    "assignees": {"nodes": [{"login": "hubot", "databaseId": 2, "avatarUrl": "b", "url": "v"}]},
+    "milestone": {"number": 3, "title": "v1", "state": "OPEN"},
+    "comments": {"totalCount": 4},
+}
+
+
+class TestToRestIssue:
+    """Test cases for to_rest_issue."""
+
+    def test_issue(self):
+        """Test shaping an issue like the REST API."""
+        issue = to_rest_issue(ISSUE_NODE)
+        assert issue["id"] == 11  # noqa: PLR2004
+        assert issue["node_id"] == "I_1"
+        assert issue["state"] == "closed"
+        assert issue["state_reason"] == "completed"
+        assert issue["user"] == {"login": "octocat", "id": 1, "avatar_url": "a", "html_url": "u"}
+        assert issue["labels"][0]["name"] == "bug"
+        assert issue["labels"][0]["id"] is None
+        assert issue["labels"][0]["node_id"] == "L_1"
+        assert issue["assignee"]["login"] == "hubot"
+        assert issue["milestone"] == {"number": 3, "title": "v1", "state": "open"}
+        assert issue["comments"] == 4  # noqa: PLR2004
+        assert "pull_request" not in issue
+
+    def test_pull_request(self):
+        """Test that pull requests carry the pull_request key like the REST API."""
+        node = {
+            **ISSUE_NODE,
+            "__typename": "PullRequest",
+            "state": "MERGED",
+            "mergedAt": "2024-01-03T00:00:00Z",
+            "author": None,
+            "milestone": None,
+        }
+        del node["stateReason"]
+        issue = to_rest_issue(node)
+        assert issue["state"] == "closed"
+        assert issue["state_reason"] is None
+        assert issue["user"] is None
+        assert issue["milestone"] is None
+        assert issue["pull_request"]["merged_at"] == "2024-01-03T00:00:00Z"
+
+
+class TestBaseGraphQL:
+    """Test cases for the BaseGraphQL class."""
+
+    def test_execute_helper(self):
+        """Test the request body and headers."""
+        body, kwargs = BaseGraphQL()._execute_helper(query="{ viewer { login } }", variables={"a": 1})
+        assert body == {"query": "{ viewer { login } }", "variables": {"a": 1}}
+        assert kwargs["headers"]["Accept"] == "application/vnd.github+json"
+
+    def test_check_payload(self):
+        """Test that GraphQL errors are raised."""
+        base = BaseGraphQL()
+        assert base._check_payload({"data": {"viewer": {"login": "octocat"}}}) == {"viewer": {"login": "octocat"}}
+        with pytest.raises(GraphQLError, match="Something went wrong") as excinfo:
+            base._check_payload({"data": {"viewer": None}, "errors": [{"message": "Something went wrong"}]})
+        assert excinfo.value.data == {"viewer": None}
+        with pytest.raises(GraphQLError):
+            base._check_payload([])
+
+    def test_graphql_error_copy_and_pickle(self):
+        """Test that GraphQL errors keep their errors and data when copied or pickled."""
+        error = GraphQLError(errors=[{"message": "Forbidden"}, {"type": "NOT_FOUND"}], data={"viewer": None})
+        for clone in (copy.copy(error), pickle.loads(pickle.dumps(error))):
+            assert str(clone) == "Forbidden; {'type': 'NOT_FOUND'}"
+            assert clone.errors == error.errors
+            assert clone.data == {"viewer": None}
+        assert str(GraphQLError(errors=[])) == "GraphQL request failed."
+
+    def test_build_issues_batch_query(self):
+        """Test that lookups are aliased and passed as variables."""
+        query, variables = BaseGraphQL()._build_issues_batch_query([("o", "r", 1), ("o", "s", 2)])
+        assert "i0: repository(owner: $owner0, name: $name0)" in query
+        assert "i1: repository(owner: $owner1, name: $name1)" in query
+        assert "$number1: Int!" in query
+        assert "fragment IssueFields on Issue" in query
+        assert "fragment PullRequestFields on PullRequest" in query
+        assert variables == {"owner0": "o", "name0": "r", "number0": 1, "owner1": "o", "name1": "s", "number1": 2}
+
+    def test_parse_issues_batch(self):
+        """Test that missing issues become None."""
+        payload = {
+            "data": {"i0": {"issueOrPullRequest": ISSUE_NODE}, "i1": {"issueOrPullRequest": None}, "i2": None},
+            "errors": [{"type": "NOT_FOUND", "message": "Could not resolve"}],
+        }
+        issues = BaseGraphQL()._parse_issues_batch(payload=payload, count=3)
+        assert issues[0]["number"] == 1
+        assert issues[1:] == [None, None]
+
+    def test_parse_issues_batch_errors(self):
+        """Test that other errors are raised."""
+        with pytest.raises(GraphQLError, match="Forbidden"):
+            BaseGraphQL()._parse_issues_batch(
+                payload={"errors": [{"type": "FORBIDDEN", "message": "Forbidden"}]}, count=1
+            )
+
+    def test_get_query_cost(self):
+        """Test reading the cost of the rateLimit selection."""
+        graphql = BaseGraphQL()
+        assert graphql._get_query_cost({"data": {"rateLimit": {"cost": 3, "remaining": 4997}}}) == 3  # noqa: PLR2004
+        assert graphql._get_query_cost({"data": {"viewer": {"login": "octocat"}}}) is None
+        assert graphql._get_query_cost({"errors": [{"message": "Bad query"}]}) is None
+        assert graphql._get_query_cost([]) is None
+
+    def test_should_split(self):
+        """Test when a batch is split."""
+        base = BaseGraphQL()
+        assert base._should_split(size=2, status_code=502)
+        assert base._should_split(size=2, payload={"errors": [{"type": "MAX_NODE_LIMIT_EXCEEDED"}]})
+        assert not base._should_split(size=1, status_code=502)
+        assert not base._should_split(size=2, status_code=401)
+        assert not base._should_split(size=2, payload={"errors": [{"type": "NOT_FOUND"}]})
+
+    def test_get_batch_ranges(self):
+        """Test splitting lookups into batches."""
+        assert BaseGraphQL()._get_batch_ranges(count=5, batch_size=2) == [(0, 2), (2, 4), (4, 5)]
+        with pytest.raises(ValueError, match="batch_size must be between 1 and 100"):
+            BaseGraphQL()._get_batch_ranges(count=5, batch_size=101)
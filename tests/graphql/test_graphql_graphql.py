@@ -0,0 +1,97 @@
+"""Unit tests for the synchronous GraphQL resource."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ghnova.graphql.base import GraphQLError
+from ghnova.graphql.graphql import GraphQL
+
+
+def _response(payload: dict) -> MagicMock:
+    response = MagicMock(status_code=200, headers={})
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+def _issue(number: int) -> dict:
+    return {"__typename": "Issue", "number": number, "state": "OPEN"}
+
+
+class TestGraphQL:
+    """Test cases for the GraphQL class."""
+
+    def test_execute(self):
+        """Test executing a query against the GraphQL URL."""
+        mock_client = MagicMock()
+        mock_client.graphql_url = "https://api.github.com/graphql"
+        mock_client._request.return_value = _response({"data": {"viewer": {"login": "octocat"}}})
+
+        data, metadata = GraphQL(client=mock_client).execute(query="{ viewer { login } }")
+
+        assert data == {"viewer": {"login": "octocat"}}
+        assert metadata == {"status_code": 200}
+        kwargs = mock_client._request.call_args.kwargs
+        assert kwargs["method"] == "POST"
+        assert kwargs["endpoint"] == "https://api.github.com/graphql"
+        assert kwargs["json"] == {"query": "{ viewer { login } }"}
+
+    def test_execute_errors(self):
+        """Test that GraphQL errors are raised."""
+        mock_client = MagicMock()
+        mock_client._request.return_value = _response({"errors": [{"message": "Bad query"}]})
+        with pytest.raises(GraphQLError, match="Bad query"):
+            GraphQL(client=mock_client).execute(query="{")
+
+    def test_get_issues_batch(self):
+        """Test that lookups are batched into aliased queries."""
+        mock_client = MagicMock()
+        mock_client._request.side_effect = [
+            _response({"data": {"i0": {"issueOrPullRequest": _issue(1)}, "i1": {"issueOrPullRequest": _issue(2)}}}),
+            _response({"data": {"i0": {"issueOrPullRequest": None}}, "errors": [{"type": "NOT_FOUND"}]}),
+        ]
+
+        issues = GraphQL(client=mock_client).get_issues_batch(
+            [("o", "r", 1), ("o", "r", 2), ("o", "r", 3)], batch_size=2
+        )
+
+        assert mock_client._request.call_count == 2  # noqa: PLR2004
+        assert [issue["number"] if issue else None for issue in issues] == [1, 2, None]
+
+    def test_get_issues_batch_records_cost(self):
+        """Test that the cost of each query paces the later queries of the client."""
+        mock_client = MagicMock()
+        mock_client._request.return_value = _response(
+            {"data": {"i0": {"issueOrPullRequest": _issue(1)}, "rateLimit": {"cost": 2, "remaining": 4998}}}
+        )
+
+        GraphQL(client=mock_client).get_issues_batch([("o", "r", 1)])
+
+        mock_client._set_rate_limit_cost.assert_called_once_with(cost=2, resource="graphql")
+
+    def test_get_issues_batch_splits_large_batches(self):
+        """Test that a batch exceeding the limits is split in half."""
+        mock_client = MagicMock()
+        error_response = MagicMock(status_code=502)
+        mock_client._request.side_effect = [
+            _response({"errors": [{"type": "MAX_NODE_LIMIT_EXCEEDED", "message": "Too many nodes"}]}),
+            requests.HTTPError("502", response=error_response),
+            _response({"data": {"i0": {"issueOrPullRequest": _issue(1)}}}),
+            _response({"data": {"i0": {"issueOrPullRequest": _issue(2)}}}),
+            _response({"data": {"i0": {"issueOrPullRequest": _issue(3)}, "i1": {"issueOrPullRequest": _issue(4)}}}),
+        ]
+
+        issues = GraphQL(client=mock_client).get_issues_batch([("o", "r", n) for n in range(1, 5)], batch_size=4)
+
+        assert [issue["number"] if issue else None for issue in issues] == [1, 2, 3, 4]
+        sizes = [len(call.kwargs["json"]["variables"]) // 3 for call in mock_client._request.call_args_list]
+        assert sizes == [4, 2, 1, 1, 2]
+
+    def test_get_issues_batch_raises_other_http_errors(self):
+        """Test that other HTTP errors are raised."""
+        mock_client = MagicMock()
+        mock_client._request.side_effect = requests.HTTPError("401", response=MagicMock(status_code=401))
+        with pytest.raises(requests.HTTPError):
+            GraphQL(client=mock_client).get_issues_batch([("o", "r", 1), ("o", "r", 2)])
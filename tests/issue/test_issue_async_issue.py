@@ -1,10 +1,12 @@
 """Unit tests for the asynchronous AsyncIssue class."""
 
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ghnova.issue.async_issue import AsyncIssue
+from ghnova.issue.record import IssueRecord
 
 
 class TestAsyncIssue:
@@ -52,7 +54,7 @@ class TestAsyncIssue:
                 per_page=30,
                 page=1,
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -129,7 +131,7 @@ class TestAsyncIssue:
                 repository="test-repo",
                 issue_number=1,
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -459,3 +461,105 @@ class TestAsyncIssue:
             )
             mock_delete.assert_called_once_with(endpoint="/repos/test-owner/test-repo/issues/1/lock", headers={})
             assert result == mock_response
+
+    @pytest.mark.asyncio
+    async def test_iter_issues(self):
+        """Test iter_issues paginates with 100 items per page."""
+        mock_client = AsyncMock()
+        issue = AsyncIssue(client=mock_client)
+
+        async def fake_paginate(endpoint, params=None, concurrency=None, **kwargs):
+            assert endpoint == "/orgs/test-org/issues"
+            assert params == {"per_page": 100, "page": 1}
+            assert concurrency == 4  # noqa: PLR2004
+            for item in [{"number": 1}, {"number": 2}]:
+                yield item
+
+        with patch.object(issue, "_paginate", side_effect=fake_paginate):
+            result = [item async for item in issue.iter_issues(organization="test-org", concurrency=4)]
+
+        assert result == [{"number": 1}, {"number": 2}]
+
+    @pytest.mark.asyncio
+    async def test_iter_issues_as_records(self):
+        """Test iter_issues decodes each page as records."""
+        mock_client = AsyncMock()
+        issue = AsyncIssue(client=mock_client)
+
+        async def fake_paginate(endpoint, params=None, concurrency=None, record_type=None, **kwargs):
+            assert record_type is IssueRecord
+            yield IssueRecord(number=1)
+
+        with patch.object(issue, "_paginate", side_effect=fake_paginate):
+            result = [item async for item in issue.iter_issues(organization="test-org", as_records=True)]
+
+        assert result == [IssueRecord(number=1)]
+
+    @pytest.mark.asyncio
+    async def test_iter_org_repository_issues(self):
+        """Test iter_org_repository_issues lists the issues of each repository with issues to list."""
+        mock_client = MagicMock()
+
+        async def fake_iter_repositories(**kwargs):
+            assert kwargs["organization"] == "test-org"
+            for repository in [
+                {"full_name": "test-org/a", "has_issues": True, "open_issues_count": 2},
+                {"full_name": "test-org/disabled", "has_issues": False, "open_issues_count": 0},
+                {"full_name": "test-org/empty", "has_issues": True, "open_issues_count": 0},
+                {"full_name": "test-org/b", "has_issues": True, "open_issues_count": 1},
+            ]:
+                yield repository
+
+        mock_client.repository.iter_repositories.side_effect = fake_iter_repositories
+        issue = AsyncIssue(client=mock_client)
+        issues = {"a": [{"number": 1}, {"number": 2}], "b": [{"number": 1}]}
+        endpoints = []
+
+        async def fake_paginate(endpoint, params=None, **kwargs):
+            endpoints.append(endpoint)
+            for item in issues[endpoint.split("/")[3]]:
+                yield item
+
+        with patch.object(issue, "_paginate", side_effect=fake_paginate):
+            result = [item async for item in issue.iter_org_repository_issues(organization="test-org", concurrency=2)]
+
+        assert sorted((item["repository_full_name"], item["number"]) for item in result) == [
+            ("test-org/a", 1),
+            ("test-org/a", 2),
+            ("test-org/b", 1),
+        ]
+        assert sorted(endpoints) == ["/repos/test-org/a/issues", "/repos/test-org/b/issues"]
+
+    @pytest.mark.asyncio
+    async def test_iter_org_repository_issues_since_by_repository(self):
+        """Test iter_org_repository_issues lists each repository from its own since time."""
+        mock_client = MagicMock()
+
+        async def fake_iter_repositories(**kwargs):
+            for name in ("a", "b"):
+                yield {"full_name": f"test-org/{name}", "has_issues": True, "open_issues_count": 1}
+
+        mock_client.repository.iter_repositories.side_effect = fake_iter_repositories
+        issue = AsyncIssue(client=mock_client)
+        since = {}
+
+        async def fake_paginate(endpoint, params=None, **kwargs):
+            since[endpoint] = params["since"]
+            for item in []:
+                yield item
+
+        with patch.object(issue, "_paginate", side_effect=fake_paginate):
+            result = [
+                item
+                async for item in issue.iter_org_repository_issues(
+                    organization="test-org",
+                    since=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    since_by_repository={"test-org/b": datetime(2024, 2, 1, tzinfo=timezone.utc)},
+                )
+            ]
+
+        assert result == []
+        assert since == {
+            "/repos/test-org/a/issues": "2024-01-01T00:00:00+00:00",
+            "/repos/test-org/b/issues": "2024-02-01T00:00:00+00:00",
+        }
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import pytest
 
 from ghnova.issue.base import BaseIssue
+from ghnova.utils.pagination import PageInfo
 
 
 class TestBaseIssue:
@@ -583,3 +584,33 @@ class TestBaseIssue:
             pytest.raises(ValueError, match=r"Invalid endpoint type determined: invalid type"),
         ):
             base_issue._list_issues_helper()
+
+    @pytest.mark.parametrize(
+        ("repository", "state", "expected"),
+        [
+            ({"has_issues": True, "open_issues_count": 3}, None, True),
+            ({"has_issues": False, "open_issues_count": 3}, "all", False),
+            ({"has_issues": True, "open_issues_count": 0}, None, False),
+            ({"has_issues": True, "open_issues_count": 0}, "open", False),
+            ({"has_issues": True, "open_issues_count": 0}, "closed", True),
+            ({"has_issues": True, "open_issues_count": 0}, "all", True),
+            ({}, None, True),
+        ],
+    )
+    def test_should_list_repository_issues(self, repository, state, expected):
+        """Test _should_list_repository_issues skips repositories without issues to list."""
+        assert BaseIssue()._should_list_repository_issues(repository, state) is expected
+
+    def test_get_fanout_page_callback(self):
+        """Test _get_fanout_page_callback numbers the pages across repositories."""
+        pages = []
+        callback = BaseIssue()._get_fanout_page_callback(pages.append)
+
+        callback(PageInfo(page=1, items=100, headers={}))
+        callback(PageInfo(page=1, items=30, headers={}))
+
+        assert [(info.page, info.items) for info in pages] == [(1, 100), (2, 30)]
+
+    def test_get_fanout_page_callback_none(self):
+        """Test _get_fanout_page_callback without a callback."""
+        assert BaseIssue()._get_fanout_page_callback(None) is None
@@ -0,0 +1,432 @@
+"""Unit tests for bulk issue operations."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ghnova.client.rate_limit import RateLimitGovernor
+from ghnova.issue.bulk import (
+    BulkCheckpoint,
+    BulkLocker,
+    BulkOperation,
+    BulkRunner,
+    ContentPacer,
+    parse_operation,
+    read_operations,
+)
+
+
+def _response(status_code: int, data: dict | None = None, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(data or {}).encode()
+    response.text = response.content.decode()
+    return response
+
+
+def _create(line: int = 1, key: str = "k1", title: str = "Bug") -> BulkOperation:
+    return BulkOperation(line=line, op="create", owner="octocat", repository="hello", key=key, fields={"title": title})
+
+
+def _runner(client: MagicMock, **kwargs) -> BulkRunner:
+    return BulkRunner(client=client, pacer=ContentPacer(min_interval=0, per_minute=None, per_hour=None), **kwargs)
+
+
+class TestParseOperation:
+    """Tests for parse_operation and read_operations."""
+
+    def test_create(self):
+        """Test parsing a create operation."""
+        operation = parse_operation(
+            {"op": "create", "owner": "octocat", "repository": "hello", "title": "Bug", "labels": ["bug"]}, line=3
+        )
+        assert operation.op == "create"
+        assert operation.fields == {"title": "Bug", "labels": ["bug"]}
+        assert operation.issue_number is None
+        assert operation.key == "line:3"
+
+    def test_update_with_key(self):
+        """Test parsing an update operation with its own key."""
+        operation = parse_operation(
+            {"op": "update", "owner": "o", "repository": "r", "issue_number": 7, "state": "closed", "key": "close-7"},
+            line=1,
+        )
+        assert operation.issue_number == 7  # noqa: PLR2004
+        assert operation.fields == {"state": "closed"}
+        assert operation.key == "close-7"
+
+    @pytest.mark.parametrize(
+        ("data", "message"),
+        [
+            ([], "JSON object"),
+            ({"op": "delete", "owner": "o", "repository": "r"}, "'op'"),
+            ({"op": "create", "owner": "o", "title": "t"}, "'repository'"),
+            ({"op": "create", "owner": "o", "repository": "r"}, "'title'"),
+            ({"op": "create", "owner": "o", "repository": "r", "title": "t", "state": "open"}, "Unknown fields"),
+            ({"op": "update", "owner": "o", "repository": "r", "state": "open"}, "'issue_number'"),
+        ],
+    )
+    def test_invalid(self, data, message):
+        """Test that invalid operations are rejected."""
+        with pytest.raises(ValueError, match=message):
+            parse_operation(data, line=1)
+
+    def test_read_operations(self):
+        """Test reading JSON Lines with content-derived keys and per-line errors."""
+        create = json.dumps({"op": "create", "owner": "o", "repository": "r", "title": "t"})
+        reordered = json.dumps({"title": "t", "repository": "r", "owner": "o", "op": "create"})
+        items = list(read_operations([create, "", reordered, "not json", '{"op": "create"}']))
+
+        assert [item.line for item in items] == [1, 3, 4, 5]
+        assert items[0].key.endswith("#1")
+        assert items[1].key == items[0].key.replace("#1", "#2")
+        assert items[2].status == "failed"
+        assert items[3].status == "failed"
+        assert items[3].key is None
+
+
+class TestContentPacer:
+    """Tests for ContentPacer."""
+
+    def test_min_interval(self):
+        """Test that requests are spaced by the minimum interval."""
+        pacer = ContentPacer(min_interval=1.0, per_minute=None, per_hour=None, clock=lambda: 100.0)
+        assert [pacer.reserve() for _ in range(3)] == [0.0, 1.0, 2.0]
+
+    def test_per_minute(self):
+        """Test that no more than per_minute requests are sent in any minute."""
+        pacer = ContentPacer(min_interval=0, per_minute=2, per_hour=None, clock=lambda: 0.0)
+        assert [pacer.reserve() for _ in range(5)] == [0.0, 0.0, 60.0, 60.0, 120.0]
+
+    def test_per_hour(self):
+        """Test that no more than per_hour requests are sent in any hour."""
+        pacer = ContentPacer(min_interval=0, per_minute=10, per_hour=3, clock=lambda: 0.0)
+        assert [pacer.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 3600.0]
+
+    def test_pause(self):
+        """Test that a pause holds the next requests."""
+        now = [10.0]
+        pacer = ContentPacer(min_interval=0, per_minute=None, per_hour=None, clock=lambda: now[0])
+        pacer.pause(30)
+        assert pacer.reserve() == 30.0  # noqa: PLR2004
+
+    def test_wait(self):
+        """Test that wait sleeps for the reserved delay."""
+        sleep = MagicMock()
+        pacer = ContentPacer(min_interval=2.0, per_minute=None, per_hour=None, clock=lambda: 0.0, sleep=sleep)
+        pacer.wait()
+        pacer.wait()
+        sleep.assert_called_once_with(2.0)
+
+    def test_invalid(self):
+        """Test that invalid limits are rejected."""
+        with pytest.raises(ValueError, match="min_interval"):
+            ContentPacer(min_interval=-1)
+        with pytest.raises(ValueError, match="per_minute"):
+            ContentPacer(per_minute=0)
+
+
+class TestBulkCheckpoint:
+    """Tests for BulkCheckpoint."""
+
+    def test_record_and_reload(self, tmp_path):
+        """Test that entries survive a restart and the last entry of a key wins."""
+        path = tmp_path / "run.checkpoint"
+        with BulkCheckpoint(path) as checkpoint:
+            checkpoint.record("k1", "pending")
+            checkpoint.record("k1", "done", number=5)
+            checkpoint.record("k2", "pending")
+        with path.open("a") as f:
+            f.write('{"key": "k3", "sta')
+
+        with BulkCheckpoint(path) as checkpoint:
+            assert checkpoint.get("k1")["state"] == "done"
+            assert checkpoint.get("k1")["number"] == 5  # noqa: PLR2004
+            assert checkpoint.get("k2")["state"] == "pending"
+            assert checkpoint.get("k3") is None
+
+
+class TestBulkRunner:
+    """Tests for BulkRunner."""
+
+    def test_create_and_update(self, tmp_path):
+        """Test running create and update operations and recording them in the checkpoint."""
+        client = MagicMock()
+        client.issue._create_issue.return_value = _response(201, {"number": 10, "html_url": "https://x/10"})
+        client.issue._update_issue.return_value = _response(200, {"number": 3, "html_url": "https://x/3"})
+        update = BulkOperation(
+            line=2, op="update", owner="o", repository="r", key="k2", fields={"state": "closed"}, issue_number=3
+        )
+
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            results = sorted(_runner(client, checkpoint=checkpoint).run([_create(), update]), key=lambda r: r.line)
+
+            assert [(r.status, r.number) for r in results] == [("created", 10), ("updated", 3)]
+            assert checkpoint.get("k1")["state"] == "done"
+            assert checkpoint.get("k2")["number"] == 3  # noqa: PLR2004
+
+        client.issue._create_issue.assert_called_once_with(owner="octocat", repository="hello", title="Bug")
+        client.issue._update_issue.assert_called_once_with(owner="o", repository="r", issue_number=3, state="closed")
+
+    def test_resume_skips_done(self, tmp_path):
+        """Test that the operations done in a previous run are skipped."""
+        client = MagicMock()
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            checkpoint.record("k1", "done", number=10, url="https://x/10")
+            (result,) = _runner(client, checkpoint=checkpoint).run([_create()])
+
+        assert result.status == "skipped"
+        assert result.number == 10  # noqa: PLR2004
+        client.issue._create_issue.assert_not_called()
+
+    def test_resume_reconciles_interrupted_create(self, tmp_path):
+        """Test that a create interrupted in flight is not sent again if the issue exists."""
+        client = MagicMock()
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            checkpoint.record("k1", "pending")
+            created_at = checkpoint.get("k1")["at"]
+            client.issue.iter_issues.return_value = iter(
+                [
+                    {"number": 12, "title": "Other", "created_at": created_at},
+                    {"number": 11, "title": "Bug", "created_at": created_at, "html_url": "https://x/11"},
+                ]
+            )
+            (result,) = _runner(client, checkpoint=checkpoint).run([_create()])
+
+            assert checkpoint.get("k1")["state"] == "done"
+
+        assert result.status == "skipped"
+        assert result.number == 11  # noqa: PLR2004
+        client.issue._create_issue.assert_not_called()
+
+    def test_resume_resends_lost_create(self, tmp_path):
+        """Test that a create interrupted before reaching the API is sent again."""
+        client = MagicMock()
+        client.issue.iter_issues.return_value = iter(
+            [{"number": 1, "title": "Bug", "created_at": "2000-01-01T00:00:00Z"}]
+        )
+        client.issue._create_issue.return_value = _response(201, {"number": 13})
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            checkpoint.record("k1", "pending")
+            (result,) = _runner(client, checkpoint=checkpoint).run([_create()])
+
+        assert result.status == "created"
+        assert result.number == 13  # noqa: PLR2004
+
+    def test_server_error_keeps_create_pending(self, tmp_path):
+        """Test that a create answered by a 5xx status is looked up instead of sent again on resume."""
+        client = MagicMock()
+        client.issue._create_issue.side_effect = requests.HTTPError(response=_response(502, {"message": "Bad Gateway"}))
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            (result,) = _runner(client, checkpoint=checkpoint).run([_create()])
+
+            assert result.status == "failed"
+            assert checkpoint.get("k1")["state"] == "pending"
+            first_attempt = checkpoint.get("k1")["at"]
+
+        # GitHub created the issue before answering 502.
+        client.issue.iter_issues.return_value = iter(
+            [{"number": 15, "title": "Bug", "created_at": first_attempt, "html_url": "https://x/15"}]
+        )
+        client.issue._create_issue.reset_mock()
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            (result,) = _runner(client, checkpoint=checkpoint).run([_create()])
+
+        assert result.status == "skipped"
+        assert result.number == 15  # noqa: PLR2004
+        client.issue._create_issue.assert_not_called()
+
+    def test_resend_keeps_first_attempt_time(self, tmp_path):
+        """Test that sending a pending create again keeps the time of its first attempt."""
+        client = MagicMock()
+        client.issue.iter_issues.return_value = iter([])
+        client.issue._create_issue.side_effect = requests.HTTPError(response=_response(500))
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            checkpoint.record("k1", "pending", at="2024-01-01T00:00:00+00:00")
+            (result,) = _runner(client, checkpoint=checkpoint).run([_create()])
+
+            assert result.status == "failed"
+            client.issue._create_issue.assert_called_once()
+
+            assert checkpoint.get("k1")["state"] == "pending"
+            assert checkpoint.get("k1")["at"] == "2024-01-01T00:00:00+00:00"
+
+    def test_secondary_rate_limit_is_retried(self):
+        """Test that a request rejected by a secondary rate limit is sent again after the requested delay."""
+        client = MagicMock()
+        rejected = _response(403, {"message": "You have exceeded a secondary rate limit"}, {"Retry-After": "30"})
+        client.issue._create_issue.side_effect = [
+            requests.HTTPError(response=rejected),
+            _response(201, {"number": 14}),
+        ]
+        pacer = MagicMock()
+
+        (result,) = BulkRunner(client=client, pacer=pacer).run([_create()])
+
+        assert result.status == "created"
+        pacer.pause.assert_called_once_with(30.0)
+        assert pacer.wait.call_count == 2  # noqa: PLR2004
+
+    def test_failures(self, tmp_path):
+        """Test that failed operations are reported with their error."""
+        client = MagicMock()
+        client.issue._create_issue.side_effect = [
+            requests.HTTPError(response=_response(422, {"message": "Validation Failed"})),
+            requests.ConnectionError("connection reset"),
+        ]
+
+        with BulkCheckpoint(tmp_path / "run.checkpoint") as checkpoint:
+            results = list(_runner(client, checkpoint=checkpoint).run([_create(), _create(line=2, key="k2")]))
+
+            assert checkpoint.get("k1")["state"] == "failed"
+            # The request may have reached the API, so the create stays pending for the next run.
+            assert checkpoint.get("k2")["state"] == "pending"
+
+        errors = {result.line: result.error for result in results}
+        assert errors[1] == "422: Validation Failed"
+        assert "connection reset" in errors[2]
+        assert not any(result.ok for result in results)
+
+    def test_concurrency(self):
+        """Test that no more than concurrency operations are in flight and the input is consumed lazily."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0, "read": 0}
+        release = threading.Event()
+
+        def create(**kwargs):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            release.wait(timeout=5)
+            with lock:
+                state["running"] -= 1
+            return _response(201, {"number": 1})
+
+        def operations():
+            for index in range(6):
+                state["read"] += 1
+                yield _create(line=index + 1, key=f"k{index}")
+
+        client = MagicMock()
+        client.issue._create_issue.side_effect = create
+        results = _runner(client, concurrency=2).run(operations())
+
+        threading.Timer(0.2, release.set).start()
+        first = next(results)
+        assert state["read"] <= 3  # noqa: PLR2004
+        assert len([first, *results]) == 6  # noqa: PLR2004
+        assert state["peak"] == 2  # noqa: PLR2004
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        with pytest.raises(ValueError, match="concurrency"):
+            BulkRunner(client=MagicMock(), concurrency=0)
+        with pytest.raises(ValueError, match="max_attempts"):
+            BulkRunner(client=MagicMock(), max_attempts=0)
+
+
+def _locker_client(*issues: dict) -> MagicMock:
+    client = MagicMock()
+    client.issue.iter_issues.return_value = iter(issues)
+    client.issue._lock_issue.return_value = _response(204)
+    client.issue._unlock_issue.return_value = _response(204)
+    return client
+
+
+def _locker(client: MagicMock, **kwargs) -> BulkLocker:
+    return BulkLocker(client=client, pacer=ContentPacer(min_interval=0, per_minute=None, per_hour=None), **kwargs)
+
+
+class TestBulkLocker:
+    """Tests for BulkLocker."""
+
+    def test_lock(self):
+        """Test locking the matching issues, skipping locked issues and pull requests."""
+        client = _locker_client(
+            {"number": 1, "title": "a", "locked": False},
+            {"number": 2, "title": "b", "locked": True},
+            {"number": 3, "title": "c", "locked": False, "pull_request": {"url": "x"}},
+        )
+
+        results = list(
+            _locker(client).run(
+                owner="o", repository="r", lock_reason="resolved", filters={"state": "open", "labels": ["bug"]}
+            )
+        )
+
+        assert sorted((r.number, r.status) for r in results) == [(1, "locked"), (2, "unchanged")]
+        client.issue._lock_issue.assert_called_once_with(
+            owner="o", repository="r", issue_number=1, lock_reason="resolved"
+        )
+        kwargs = client.issue.iter_issues.call_args.kwargs
+        assert kwargs["state"] == "open"
+        assert kwargs["labels"] == ["bug"]
+
+    def test_unlock(self):
+        """Test unlocking the matching locked issues."""
+        client = _locker_client({"number": 1, "locked": True}, {"number": 2, "locked": False})
+
+        results = list(_locker(client).run(owner="o", repository="r", action="unlock"))
+
+        assert sorted((r.number, r.status) for r in results) == [(1, "unlocked"), (2, "unchanged")]
+        client.issue._unlock_issue.assert_called_once_with(owner="o", repository="r", issue_number=1)
+
+    def test_dry_run(self):
+        """Test that a dry run reports the issues without changing them."""
+        client = _locker_client({"number": 1, "locked": False}, {"number": 2, "locked": False})
+
+        results = list(_locker(client).run(owner="o", repository="r", dry_run=True))
+
+        assert [r.status for r in results] == ["planned", "planned"]
+        client.issue._lock_issue.assert_not_called()
+
+    def test_max_requests(self):
+        """Test that no more than max_requests requests are sent."""
+        client = _locker_client(*({"number": number, "locked": False} for number in range(1, 6)))
+        locker = _locker(client)
+
+        results = list(locker.run(owner="o", repository="r", max_requests=2))
+
+        assert len(results) == 2  # noqa: PLR2004
+        assert client.issue._lock_issue.call_count == 2  # noqa: PLR2004
+        assert locker.budget_exhausted
+
+    def test_rate_limit_reserve(self):
+        """Test that the run stops when the rate limit budget drops below the reserve."""
+        client = _locker_client({"number": 1, "locked": False})
+        client.rate_limit = RateLimitGovernor()
+        client.rate_limit.update(
+            {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "2000000000"}
+        )
+        locker = _locker(client)
+
+        assert list(locker.run(owner="o", repository="r", rate_limit_reserve=100)) == []
+        assert locker.budget_exhausted
+        client.issue._lock_issue.assert_not_called()
+
+    def test_failure(self):
+        """Test that failed requests are reported."""
+        client = _locker_client({"number": 1, "locked": False})
+        client.issue._lock_issue.side_effect = requests.HTTPError(
+            response=_response(403, {"message": "Must have admin rights"})
+        )
+
+        (result,) = _locker(client).run(owner="o", repository="r")
+
+        assert not result.ok
+        assert result.status_code == 403  # noqa: PLR2004
+        assert result.error == "403: Must have admin rights"
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        locker = _locker(MagicMock())
+        with pytest.raises(ValueError, match="action"):
+            list(locker.run(owner="o", repository="r", action="delete"))
+        with pytest.raises(ValueError, match="lock_reason"):
+            list(locker.run(owner="o", repository="r", action="unlock", lock_reason="spam"))
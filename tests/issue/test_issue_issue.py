@@ -1,8 +1,13 @@
 """Unit tests for the synchronous Issue class."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from ghnova.issue.issue import Issue
+from ghnova.issue.record import IssueRecord
+from ghnova.utils.pagination import PageInfo
 
 
 class TestIssue:
@@ -51,7 +56,7 @@ class TestIssue:
                 etag=None,
                 last_modified=None,
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -130,7 +135,7 @@ class TestIssue:
                 etag='"old-etag"',
                 last_modified="Wed, 20 Oct 2015 07:28:00 GMT",
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -248,3 +253,135 @@ class TestIssue:
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
             )
+
+    def test_iter_issues(self):
+        """Test iter_issues paginates with 100 items per page."""
+        mock_client = MagicMock()
+        issue = Issue(client=mock_client)
+        items = [{"number": 1}, {"number": 2}]
+
+        with patch.object(issue, "_paginate", return_value=iter(items)) as mock_paginate:
+            result = list(issue.iter_issues(owner="test-owner", repository="test-repo", state="all"))
+
+        assert result == items
+        mock_paginate.assert_called_once()
+        kwargs = mock_paginate.call_args.kwargs
+        assert kwargs["endpoint"] == "/repos/test-owner/test-repo/issues"
+        assert kwargs["params"] == {"state": "all", "per_page": 100, "page": 1}
+
+    def test_list_issues_as_records(self):
+        """Test list_issues decodes the issues as records."""
+        mock_client = MagicMock()
+        issue = Issue(client=mock_client)
+        records = [IssueRecord(number=1)]
+
+        with (
+            patch.object(issue, "_list_issues", return_value=MagicMock()),
+            patch(
+                "ghnova.issue.issue.process_response_with_last_modified", return_value=(records, 200, None, None)
+            ) as mock_process,
+        ):
+            result, _ = issue.list_issues(owner="test-owner", repository="test-repo", as_records=True)
+
+        assert result == records
+        assert mock_process.call_args.kwargs["record_type"] is IssueRecord
+
+    def test_iter_issues_as_records(self):
+        """Test iter_issues decodes each page as records."""
+        mock_client = MagicMock()
+        issue = Issue(client=mock_client)
+
+        with patch.object(issue, "_paginate", return_value=iter([IssueRecord(number=1)])) as mock_paginate:
+            result = list(issue.iter_issues(owner="test-owner", repository="test-repo", as_records=True))
+
+        assert result == [IssueRecord(number=1)]
+        assert mock_paginate.call_args.kwargs["record_type"] is IssueRecord
+
+    def test_iter_org_repository_issues(self):
+        """Test iter_org_repository_issues lists the issues of each repository with issues to list."""
+        mock_client = MagicMock()
+        mock_client.repository.iter_repositories.return_value = iter(
+            [
+                {"full_name": "test-org/a", "has_issues": True, "open_issues_count": 2},
+                {"full_name": "test-org/disabled", "has_issues": False, "open_issues_count": 0},
+                {"full_name": "test-org/empty", "has_issues": True, "open_issues_count": 0},
+                {"full_name": "test-org/b", "has_issues": True, "open_issues_count": 1},
+            ]
+        )
+        issue = Issue(client=mock_client)
+        issues = {"a": [{"number": 1}, {"number": 2}], "b": [{"number": 1}]}
+
+        def fake_paginate(endpoint, params=None, on_page=None, **kwargs):
+            name = endpoint.split("/")[3]
+            on_page(PageInfo(page=1, items=len(issues[name]), headers={}))
+            yield from issues[name]
+
+        on_page = MagicMock()
+        with patch.object(issue, "_paginate", side_effect=fake_paginate) as mock_paginate:
+            result = list(issue.iter_org_repository_issues(organization="test-org", concurrency=2, on_page=on_page))
+
+        assert sorted((item["repository_full_name"], item["number"]) for item in result) == [
+            ("test-org/a", 1),
+            ("test-org/a", 2),
+            ("test-org/b", 1),
+        ]
+        assert sorted(call.kwargs["endpoint"] for call in mock_paginate.call_args_list) == [
+            "/repos/test-org/a/issues",
+            "/repos/test-org/b/issues",
+        ]
+        assert sorted(call.args[0].page for call in on_page.call_args_list) == [1, 2]
+        assert mock_client.repository.iter_repositories.call_args.kwargs["organization"] == "test-org"
+
+    def test_iter_org_repository_issues_closed(self):
+        """Test iter_org_repository_issues lists repositories without open issues for closed issues."""
+        mock_client = MagicMock()
+        mock_client.repository.iter_repositories.return_value = iter(
+            [{"full_name": "test-org/empty", "has_issues": True, "open_issues_count": 0}]
+        )
+        issue = Issue(client=mock_client)
+
+        with patch.object(issue, "_paginate", return_value=iter([{"number": 3}])) as mock_paginate:
+            result = list(issue.iter_org_repository_issues(organization="test-org", state="closed"))
+
+        assert result == [{"number": 3, "repository_full_name": "test-org/empty"}]
+        assert mock_paginate.call_args.kwargs["params"]["state"] == "closed"
+
+    def test_iter_org_repository_issues_since_by_repository(self):
+        """Test iter_org_repository_issues lists each repository from its own since time."""
+        mock_client = MagicMock()
+        mock_client.repository.iter_repositories.return_value = iter(
+            [
+                {"full_name": "test-org/a", "has_issues": True, "open_issues_count": 1},
+                {"full_name": "test-org/b", "has_issues": True, "open_issues_count": 1},
+            ]
+        )
+        issue = Issue(client=mock_client)
+
+        with patch.object(issue, "_paginate", side_effect=lambda **kwargs: iter([])) as mock_paginate:
+            list(
+                issue.iter_org_repository_issues(
+                    organization="test-org",
+                    since=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    since_by_repository={"test-org/b": datetime(2024, 2, 1, tzinfo=timezone.utc)},
+                )
+            )
+
+        since = {call.kwargs["endpoint"]: call.kwargs["params"]["since"] for call in mock_paginate.call_args_list}
+        assert since == {
+            "/repos/test-org/a/issues": "2024-01-01T00:00:00+00:00",
+            "/repos/test-org/b/issues": "2024-02-01T00:00:00+00:00",
+        }
+
+    def test_iter_org_repository_issues_error(self):
+        """Test iter_org_repository_issues raises the error of a repository."""
+        mock_client = MagicMock()
+        mock_client.repository.iter_repositories.return_value = iter(
+            [{"full_name": "test-org/a", "has_issues": True, "open_issues_count": 1}]
+        )
+        issue = Issue(client=mock_client)
+
+        with (
+            patch.object(issue, "_paginate", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            list(issue.iter_org_repository_issues(organization="test-org"))
@@ -0,0 +1,222 @@
+"""Unit tests for the issue mirror."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from ghnova.issue.mirror import IssueMirror, get_default_mirror_path, get_scope
+
+
+def _issue(number: int, updated_at: str, state: str = "open", **extra) -> dict:
+    return {
+        "id": 1000 + number,
+        "number": number,
+        "title": f"Issue {number}",
+        "state": state,
+        "updated_at": updated_at,
+        **extra,
+    }
+
+
+def _client(*pages: list[dict]) -> MagicMock:
+    client = MagicMock()
+    client.issue.iter_issues.side_effect = [iter(page) for page in pages]
+    return client
+
+
+class TestGetScope:
+    """Tests for get_scope."""
+
+    def test_repository(self):
+        """Test the scope of a repository."""
+        assert get_scope(owner="octocat", repository="hello") == "octocat/hello"
+        assert get_scope(organization="github", repository="docs") == "github/docs"
+
+    def test_organization(self):
+        """Test the scope of an organization."""
+        assert get_scope(organization="github") == "org:github"
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"owner": "octocat"}, {"repository": "hello"}, {"owner": "octocat", "organization": "github"}]
+    )
+    def test_invalid(self, kwargs):
+        """Test that a repository or an organization is required."""
+        with pytest.raises(ValueError, match=r"must be given|Give"):
+            get_scope(**kwargs)
+
+
+def test_default_mirror_path(monkeypatch, tmp_path):
+    """Test that GHNOVA_MIRROR_PATH overrides the default path."""
+    monkeypatch.setenv("GHNOVA_MIRROR_PATH", str(tmp_path / "mirror.sqlite"))
+    assert get_default_mirror_path() == tmp_path / "mirror.sqlite"
+    monkeypatch.delenv("GHNOVA_MIRROR_PATH")
+    assert get_default_mirror_path().name == "issues.sqlite"
+
+
+class TestIssueMirror:
+    """Tests for IssueMirror."""
+
+    def test_first_sync(self, tmp_path):
+        """Test that the first sync fetches all issues, including closed ones, sorted by update time."""
+        client = _client([_issue(1, "2024-01-01T00:00:00Z"), _issue(2, "2024-01-03T00:00:00Z", state="closed")])
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            result = mirror.sync(client=client, owner="octocat", repository="hello")
+
+            assert result.scope == "octocat/hello"
+            assert result.fetched == 2  # noqa: PLR2004
+            assert result.since is None
+            assert result.cursor == "2024-01-03T00:00:00Z"
+            assert result.total == 2  # noqa: PLR2004
+            assert mirror.get_cursor("octocat/hello") == "2024-01-03T00:00:00Z"
+
+        kwargs = client.issue.iter_issues.call_args.kwargs
+        assert kwargs["state"] == "all"
+        assert kwargs["sort"] == "updated"
+        assert kwargs["since"] is None
+        assert kwargs["direction"] == "asc"
+
+    def test_delta_sync(self, tmp_path):
+        """Test that later syncs fetch the issues updated since the high-water mark and upsert them."""
+        client = _client(
+            [_issue(1, "2024-01-01T00:00:00Z"), _issue(2, "2024-01-03T00:00:00Z")],
+            [_issue(2, "2024-01-03T00:00:00Z"), _issue(1, "2024-01-05T00:00:00Z", state="closed")],
+        )
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            mirror.sync(client=client, owner="octocat", repository="hello")
+            result = mirror.sync(client=client, owner="octocat", repository="hello")
+
+            assert result.since == "2024-01-03T00:00:00Z"
+            assert result.cursor == "2024-01-05T00:00:00Z"
+            assert result.total == 2  # noqa: PLR2004
+            assert mirror.get_issue("octocat/hello", number=1)["state"] == "closed"
+            assert [issue["number"] for issue in mirror.list_issues("octocat/hello", state="open")] == [2]
+
+        since = client.issue.iter_issues.call_args.kwargs["since"]
+        assert since == datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+    def test_empty_delta_keeps_cursor(self, tmp_path):
+        """Test that a sync without updates keeps the high-water mark."""
+        client = _client([_issue(1, "2024-01-01T00:00:00Z")], [])
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            mirror.sync(client=client, owner="octocat", repository="hello")
+            result = mirror.sync(client=client, owner="octocat", repository="hello")
+
+        assert result.fetched == 0
+        assert result.cursor == "2024-01-01T00:00:00Z"
+
+    def test_full_sync_ignores_cursor(self, tmp_path):
+        """Test that a full sync fetches all issues again."""
+        client = _client([_issue(1, "2024-01-01T00:00:00Z")], [_issue(1, "2024-01-01T00:00:00Z")])
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            mirror.sync(client=client, owner="octocat", repository="hello")
+            result = mirror.sync(client=client, owner="octocat", repository="hello", full=True)
+
+        assert result.since is None
+        assert client.issue.iter_issues.call_args.kwargs["since"] is None
+
+    def test_interrupted_sync_keeps_written_pages(self, tmp_path):
+        """Test that a failing sync keeps the pages written so far and rolls back the partial page."""
+
+        def failing():
+            yield _issue(2, "2024-02-01T00:00:00Z")
+            yield _issue(3, "2024-02-02T00:00:00Z")
+            yield _issue(4, "2024-02-03T00:00:00Z")
+            raise RuntimeError("connection lost")
+
+        client = MagicMock()
+        client.issue.iter_issues.side_effect = [iter([_issue(1, "2024-01-01T00:00:00Z")]), failing()]
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            mirror.sync(client=client, owner="octocat", repository="hello")
+            with pytest.raises(RuntimeError, match="connection lost"):
+                mirror.sync(client=client, owner="octocat", repository="hello", per_page=2)
+
+            assert mirror.get_cursor("octocat/hello") == "2024-02-02T00:00:00Z"
+            assert [issue["number"] for issue in mirror.list_issues("octocat/hello")] == [1, 2, 3]
+
+    def test_pages_are_committed(self, tmp_path):
+        """Test that each page is committed, so other connections see it during the sync."""
+        path = tmp_path / "mirror.sqlite"
+        seen = []
+
+        def issues():
+            yield _issue(1, "2024-01-01T00:00:00Z")
+            yield _issue(2, "2024-01-02T00:00:00Z")
+            with IssueMirror(path=path) as other:
+                seen.append((other.get_cursor("octocat/hello"), len(other.list_issues("octocat/hello"))))
+            yield _issue(3, "2024-01-03T00:00:00Z")
+
+        client = MagicMock()
+        client.issue.iter_issues.return_value = issues()
+
+        with IssueMirror(path=path) as mirror:
+            result = mirror.sync(client=client, owner="octocat", repository="hello", per_page=2)
+
+        assert seen == [("2024-01-02T00:00:00Z", 2)]
+        assert result.fetched == 3  # noqa: PLR2004
+        assert result.cursor == "2024-01-03T00:00:00Z"
+
+    def test_organization_sync(self, tmp_path):
+        """Test mirroring the issues of an organization with a high-water mark per repository."""
+        client = MagicMock()
+        client.issue.iter_org_repository_issues.side_effect = [
+            iter(
+                [
+                    _issue(1, "2024-01-01T00:00:00Z", repository_full_name="github/docs"),
+                    _issue(
+                        1, "2024-01-02T00:00:00Z", id=2001, repository_full_name="github/cli", pull_request={"url": "x"}
+                    ),
+                ]
+            ),
+            iter([_issue(2, "2024-01-05T00:00:00Z", repository_full_name="github/docs")]),
+        ]
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            result = mirror.sync(client=client, organization="github", concurrency=2)
+
+            assert result.scope == "org:github"
+            assert result.cursor == "2024-01-02T00:00:00Z"
+            assert mirror.get_issue("org:github", number=1, repository="github/cli")["updated_at"].startswith(
+                "2024-01-02"
+            )
+            assert len(mirror.list_issues("org:github", include_pull_requests=False)) == 1
+            assert mirror.get_cursor("org:github", repository="github/docs") == "2024-01-01T00:00:00Z"
+
+            result = mirror.sync(client=client, organization="github")
+
+            assert result.since == "2024-01-02T00:00:00Z"
+            assert result.cursor == "2024-01-05T00:00:00Z"
+            assert mirror.get_cursor("org:github", repository="github/docs") == "2024-01-05T00:00:00Z"
+            assert mirror.get_cursor("org:github", repository="github/cli") == "2024-01-02T00:00:00Z"
+            assert result.total == 3  # noqa: PLR2004
+
+            mirror.reset("org:github")
+            assert mirror.get_cursor("org:github") is None
+
+        first, second = client.issue.iter_org_repository_issues.call_args_list
+        assert first.kwargs["since_by_repository"] == {}
+        assert first.kwargs["concurrency"] == 2  # noqa: PLR2004
+        assert second.kwargs["since_by_repository"] == {
+            "github/docs": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "github/cli": datetime(2024, 1, 2, tzinfo=timezone.utc),
+        }
+        assert second.kwargs["direction"] == "asc"
+
+    def test_reset(self, tmp_path):
+        """Test removing the mirror of a scope."""
+        client = _client([_issue(1, "2024-01-01T00:00:00Z")])
+
+        with IssueMirror(path=tmp_path / "mirror.sqlite") as mirror:
+            mirror.sync(client=client, owner="octocat", repository="hello")
+            mirror.reset("octocat/hello")
+
+            assert mirror.get_cursor("octocat/hello") is None
+            assert mirror.list_issues("octocat/hello") == []
+            assert mirror.get_issue("octocat/hello", number=1) is None
@@ -119,7 +119,7 @@ class TestAsyncPullRequest:
                 etag=None,
                 last_modified=None,
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -171,7 +171,7 @@ class TestAsyncPullRequest:
                 etag='"old-etag"',
                 last_modified="Wed, 20 Oct 2015 07:28:00 GMT",
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -229,3 +229,18 @@ class TestAsyncPullRequest:
                 headers={"Accept": "application/vnd.github+json"},
             )
             assert result == mock_response
+
+    @pytest.mark.asyncio
+    async def test_iter_pull_requests(self):
+        """Test iter_pull_requests paginates with 100 items per page."""
+        pull_request = AsyncPullRequest(client=AsyncMock())
+
+        async def fake_paginate(endpoint, params=None, **kwargs):
+            assert endpoint == "/repos/owner/repo/pulls"
+            assert params == {"per_page": 100, "page": 1}
+            yield {"number": 1}
+
+        with patch.object(pull_request, "_paginate", side_effect=fake_paginate):
+            result = [item async for item in pull_request.iter_pull_requests(owner="owner", repository="repo")]
+
+        assert result == [{"number": 1}]
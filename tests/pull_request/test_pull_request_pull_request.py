@@ -115,7 +115,7 @@ class TestPullRequest:
                 etag=None,
                 last_modified=None,
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -165,7 +165,7 @@ class TestPullRequest:
                 etag='"old-etag"',
                 last_modified="Wed, 20 Oct 2015 07:28:00 GMT",
             )
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
             assert result == (
                 mock_data,
                 {"status_code": mock_status, "etag": mock_etag, "last_modified": mock_last_mod},
@@ -222,3 +222,16 @@ class TestPullRequest:
                 headers={"Accept": "application/vnd.github+json"},
             )
             assert result == mock_response
+
+    def test_iter_pull_requests(self):
+        """Test iter_pull_requests paginates with 100 items per page."""
+        pull_request = PullRequest(client=MagicMock())
+        items = [{"number": 1}]
+
+        with patch.object(pull_request, "_paginate", return_value=iter(items)) as mock_paginate:
+            result = list(pull_request.iter_pull_requests(owner="owner", repository="repo", state="closed"))
+
+        assert result == items
+        kwargs = mock_paginate.call_args.kwargs
+        assert kwargs["endpoint"] == "/repos/owner/repo/pulls"
+        assert kwargs["params"] == {"state": "closed", "per_page": 100, "page": 1}
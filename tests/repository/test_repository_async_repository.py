@@ -235,7 +235,7 @@ class TestAsyncRepository:
             assert result[1]["status_code"] == 200  # noqa: PLR2004
             assert result[1]["etag"] == "etag-value"
             assert result[1]["last_modified"] == "last-modified-value"
-            mock_process.assert_called_once_with(mock_response)
+            mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
 
     @pytest.mark.asyncio
     async def test_list_repositories_public_method_with_owner(self):
@@ -528,3 +528,17 @@ class TestAsyncRepository:
             # Test with "member"
             await self.repository.list_repositories(repository_type="member")
             assert self.mock_client._request.call_args[1]["params"]["type"] == "member"
+
+    @pytest.mark.asyncio
+    async def test_iter_repositories(self):
+        """Test iter_repositories paginates with 100 items per page."""
+
+        async def fake_paginate(endpoint, params=None, **kwargs):
+            assert endpoint == "/users/octocat/repos"
+            assert params == {"per_page": 100, "page": 1}
+            yield {"id": 1}
+
+        with patch.object(self.repository, "_paginate", side_effect=fake_paginate):
+            result = [item async for item in self.repository.iter_repositories(owner="octocat")]
+
+        assert result == [{"id": 1}]
@@ -219,7 +219,7 @@ class TestRepository:
         assert result[1]["status_code"] == 200  # noqa: PLR2004
         assert result[1]["etag"] == "etag-value"
         assert result[1]["last_modified"] == "last-modified-value"
-        mock_process.assert_called_once_with(mock_response)
+        mock_process.assert_called_once_with(mock_response, record_type=None, fields=None)
 
     @patch("ghnova.repository.repository.process_response_with_last_modified")
     def test_list_repositories_public_method_with_owner(self, mock_process):
@@ -439,3 +439,15 @@ class TestRepository:
             call_args = mock_helper.call_args
             assert call_args[1]["owner"] == "test"
             assert call_args[1]["visibility"] == "public"
+
+    def test_iter_repositories(self):
+        """Test iter_repositories paginates with 100 items per page."""
+        items = [{"id": 1}, {"id": 2}]
+
+        with patch.object(self.repository, "_paginate", return_value=iter(items)) as mock_paginate:
+            result = list(self.repository.iter_repositories(organization="test-org"))
+
+        assert result == items
+        kwargs = mock_paginate.call_args.kwargs
+        assert kwargs["endpoint"] == "/orgs/test-org/repos"
+        assert kwargs["params"] == {"per_page": 100, "page": 1}
@@ -1,6 +1,7 @@
 """Unit tests for the asynchronous Resource base class."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -80,3 +81,150 @@ class TestAsyncResource:
 
         assert result == mock_response
         mock_client._request.assert_called_once_with(method="PATCH", endpoint="/test", headers={"custom": "header"})
+
+    @pytest.mark.asyncio
+    async def test_paginate(self):
+        """Test _paginate follows the Link header until the last page."""
+        mock_client = AsyncMock()
+        resource = AsyncResource(client=mock_client)
+        first = MagicMock()
+        first.headers = {"Link": '<https://api.github.com/items?page=2>; rel="next"'}
+        second = MagicMock()
+        second.headers = {}
+        mock_client._request.side_effect = [first, second]
+
+        with patch(
+            "ghnova.resource.async_resource.process_async_response_with_last_modified",
+            side_effect=[([{"id": 1}], 200, None, None), ([{"id": 2}], 200, None, None)],
+        ):
+            items = [item async for item in resource._paginate("/items", params={"page": 1})]
+
+        assert items == [{"id": 1}, {"id": 2}]
+        assert mock_client._request.call_args_list[1].kwargs == {
+            "method": "GET",
+            "endpoint": "https://api.github.com/items?page=2",
+            "params": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_paginate_concurrent(self):
+        """Test _paginate fetches the remaining pages concurrently and yields them in page order."""
+        mock_client = AsyncMock()
+        resource = AsyncResource(client=mock_client)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_request(method, endpoint, params=None, **kwargs):
+            nonlocal in_flight, max_in_flight
+            page = params["page"]
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later pages answer faster, so completion order differs from page order.
+            await asyncio.sleep(0.01 * (6 - page))
+            in_flight -= 1
+            response = MagicMock()
+            response.headers = {}
+            if page == 1:
+                response.headers = {
+                    "Link": '<https://api.github.com/items?page=2>; rel="next", '
+                    '<https://api.github.com/items?page=5>; rel="last"'
+                }
+            response.page = page
+            return response
+
+        async def fake_process(response, record_type=None, fields=None):
+            return [{"page": response.page}], 200, None, None
+
+        mock_client._request.side_effect = fake_request
+        with patch("ghnova.resource.async_resource.process_async_response_with_last_modified", fake_process):
+            items = [item async for item in resource._paginate("/items", params={"page": 1}, concurrency=2)]
+
+        assert [item["page"] for item in items] == [1, 2, 3, 4, 5]
+        assert max_in_flight == 2  # noqa: PLR2004
+        assert all(call.kwargs["endpoint"] == "/items" for call in mock_client._request.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_paginate_concurrent_without_last_link(self):
+        """Test _paginate falls back to following next links when the last page is unknown."""
+        mock_client = AsyncMock()
+        resource = AsyncResource(client=mock_client)
+        first = MagicMock()
+        first.headers = {"Link": '<https://api.github.com/items?page=2>; rel="next"'}
+        second = MagicMock()
+        second.headers = {}
+        mock_client._request.side_effect = [first, second]
+
+        with patch(
+            "ghnova.resource.async_resource.process_async_response_with_last_modified",
+            side_effect=[([{"id": 1}], 200, None, None), ([{"id": 2}], 200, None, None)],
+        ):
+            items = [item async for item in resource._paginate("/items", params={"page": 1}, concurrency=4)]
+
+        assert items == [{"id": 1}, {"id": 2}]
+        assert mock_client._request.call_args_list[1].kwargs["endpoint"] == "https://api.github.com/items?page=2"
+
+    @pytest.mark.asyncio
+    async def test_paginate_invalid_concurrency(self):
+        """Test _paginate rejects a non-positive concurrency."""
+        resource = AsyncResource(client=AsyncMock())
+        with pytest.raises(ValueError, match="concurrency must be a positive integer"):
+            [item async for item in resource._paginate("/items", concurrency=0)]
+
+    @pytest.mark.asyncio
+    async def test_paginate_concurrent_max_pages(self):
+        """Test _paginate with concurrency requests at most max_pages and reports them in page order."""
+        mock_client = AsyncMock()
+        resource = AsyncResource(client=mock_client)
+
+        async def fake_request(method, endpoint, params=None, **kwargs):
+            response = MagicMock()
+            response.headers = {"X-RateLimit-Remaining": str(100 - params["page"])}
+            if params["page"] == 1:
+                response.headers["Link"] = (
+                    '<https://api.github.com/items?page=2>; rel="next", '
+                    '<https://api.github.com/items?page=9>; rel="last"'
+                )
+            response.page = params["page"]
+            return response
+
+        async def fake_process(response, record_type=None, fields=None):
+            return [{"page": response.page}], 200, None, None
+
+        mock_client._request.side_effect = fake_request
+        pages = []
+        with patch("ghnova.resource.async_resource.process_async_response_with_last_modified", fake_process):
+            items = [
+                item
+                async for item in resource._paginate(
+                    "/items", params={"page": 1}, concurrency=4, max_pages=3, on_page=pages.append
+                )
+            ]
+
+        assert [item["page"] for item in items] == [1, 2, 3]
+        assert mock_client._request.call_count == 3  # noqa: PLR2004
+        assert [(page.page, page.rate_limit_remaining) for page in pages] == [(1, 99), (2, 98), (3, 97)]
+
+    @pytest.mark.asyncio
+    async def test_paginate_max_pages(self):
+        """Test _paginate stops following next links after max_pages."""
+        mock_client = AsyncMock()
+        resource = AsyncResource(client=mock_client)
+        response = MagicMock()
+        response.headers = {"Link": '<https://api.github.com/items?page=2>; rel="next"'}
+        mock_client._request.return_value = response
+
+        with patch(
+            "ghnova.resource.async_resource.process_async_response_with_last_modified",
+            return_value=([{"id": 1}], 200, None, None),
+        ):
+            items = [item async for item in resource._paginate("/items", max_pages=1)]
+
+        assert items == [{"id": 1}]
+        mock_client._request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_paginate_invalid_max_pages(self):
+        """Test _paginate rejects a non-positive max_pages."""
+        resource = AsyncResource(client=AsyncMock())
+        with pytest.raises(ValueError, match="max_pages must be a positive integer"):
+            [item async for item in resource._paginate("/items", max_pages=0)]
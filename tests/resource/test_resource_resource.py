@@ -1,6 +1,8 @@
 """Unit tests for the synchronous Resource base class."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from ghnova.resource.resource import Resource
 
@@ -73,3 +75,86 @@ class TestResource:
 
         assert result == mock_response
         mock_client._request.assert_called_once_with(method="PATCH", endpoint="/test", headers={"custom": "header"})
+
+    def test_paginate(self):
+        """Test _paginate follows the Link header until the last page."""
+        mock_client = MagicMock()
+        resource = Resource(client=mock_client)
+        first = MagicMock()
+        first.headers = {"Link": '<https://api.github.com/items?page=2>; rel="next"'}
+        second = MagicMock()
+        second.headers = {}
+        mock_client._request.side_effect = [first, second]
+
+        with patch(
+            "ghnova.resource.resource.process_response_with_last_modified",
+            side_effect=[([{"id": 1}, {"id": 2}], 200, None, None), ([{"id": 3}], 200, None, None)],
+        ):
+            items = list(resource._paginate("/items", params={"per_page": 2, "page": 1}, headers={"X": "1"}))
+
+        assert items == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert mock_client._request.call_args_list[0].kwargs == {
+            "method": "GET",
+            "endpoint": "/items",
+            "params": {"per_page": 2, "page": 1},
+            "headers": {"X": "1"},
+        }
+        assert mock_client._request.call_args_list[1].kwargs == {
+            "method": "GET",
+            "endpoint": "https://api.github.com/items?page=2",
+            "params": None,
+            "headers": {"X": "1"},
+        }
+
+    def test_paginate_non_list_response(self):
+        """Test _paginate stops on a response without a list body."""
+        mock_client = MagicMock()
+        resource = Resource(client=mock_client)
+        response = MagicMock()
+        response.headers = {"Link": '<https://api.github.com/items?page=2>; rel="next"'}
+        mock_client._request.return_value = response
+
+        with patch("ghnova.resource.resource.process_response_with_last_modified", return_value=({}, 304, None, None)):
+            assert list(resource._paginate("/items")) == []
+        mock_client._request.assert_called_once()
+
+    def test_paginate_max_pages_and_on_page(self):
+        """Test _paginate stops after max_pages and reports each page."""
+        mock_client = MagicMock()
+        resource = Resource(client=mock_client)
+        response = MagicMock()
+        response.headers = {
+            "Link": '<https://api.github.com/items?page=2>; rel="next"',
+            "X-RateLimit-Remaining": "42",
+        }
+        mock_client._request.return_value = response
+        pages = []
+
+        with patch(
+            "ghnova.resource.resource.process_response_with_last_modified",
+            return_value=([{"id": 1}, {"id": 2}], 200, None, None),
+        ):
+            items = list(resource._paginate("/items", max_pages=2, on_page=pages.append))
+
+        assert len(items) == 4  # noqa: PLR2004
+        assert mock_client._request.call_count == 2  # noqa: PLR2004
+        assert [(page.page, page.items, page.rate_limit_remaining) for page in pages] == [(1, 2, 42), (2, 2, 42)]
+
+    def test_paginate_fields(self):
+        """Test _paginate decodes the selected fields of each page."""
+        mock_client = MagicMock()
+        resource = Resource(client=mock_client)
+        mock_client._request.return_value.headers = {}
+
+        with patch(
+            "ghnova.resource.resource.process_response_with_last_modified", return_value=([], 200, None, None)
+        ) as mock_process:
+            list(resource._paginate("/items", fields=["number"]))
+
+        mock_process.assert_called_once_with(mock_client._request.return_value, record_type=None, fields=["number"])
+
+    def test_paginate_invalid_max_pages(self):
+        """Test _paginate rejects a non-positive max_pages."""
+        resource = Resource(client=MagicMock())
+        with pytest.raises(ValueError, match="max_pages must be a positive integer"):
+            list(resource._paginate("/items", max_pages=0))
@@ -0,0 +1,43 @@
+"""Fixtures for the search tests."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def make_fake_search() -> Callable[..., tuple[Callable[..., MagicMock], list[tuple[str, int]]]]:
+    """Make fake _search methods serving results created at regular intervals."""
+
+    def factory(
+        start: datetime, total: int = 2500, interval: timedelta = timedelta(hours=7)
+    ) -> tuple[Callable[..., MagicMock], list[tuple[str, int]]]:
+        results = [{"id": i, "created_at": start + interval * i} for i in range(total)]
+        queries: list[tuple[str, int]] = []
+
+        def fake_search(kind: str, query: str, per_page: int = 30, page: int = 1, **kwargs: Any) -> MagicMock:
+            queries.append((query, page))
+            items = results
+            match = re.search(r"created:(\S+)\.\.(\S+)", query)
+            if match:
+                low, high = (datetime.fromisoformat(value) for value in match.groups())
+                items = [item for item in items if low <= item["created_at"] <= high]
+            # The search API rejects pages past the first 1,000 results.
+            assert (page - 1) * per_page < 1000  # noqa: PLR2004
+            response = MagicMock()
+            response.data = {
+                "total_count": len(items),
+                "incomplete_results": False,
+                "items": items[(page - 1) * per_page : page * per_page],
+            }
+            return response
+
+        return fake_search, queries
+
+    return factory
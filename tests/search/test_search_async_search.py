@@ -0,0 +1,105 @@
+"""Unit tests for the asynchronous Search resource."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ghnova.search.async_search import AsyncSearch
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+"""Creation time of the first fake result."""
+
+
+async def fake_process(response):
+    """Process a fake response."""
+    return response.data, 200, None, None
+
+
+class TestAsyncSearch:
+    """Test cases for the AsyncSearch class."""
+
+    @pytest.mark.asyncio
+    async def test_search(self):
+        """Test getting a page of search results."""
+        search = AsyncSearch(client=AsyncMock())
+
+        with (
+            patch.object(search, "_search", new_callable=AsyncMock) as mock_search,
+            patch("ghnova.search.async_search.process_async_response_with_last_modified") as mock_process,
+        ):
+            mock_search.return_value = AsyncMock()
+            mock_process.return_value = ({"total_count": 1, "items": [{"login": "octocat"}]}, 200, None, None)
+            data, metadata = await search.search(kind="users", query="octocat")
+
+        assert data == {"total_count": 1, "items": [{"login": "octocat"}]}
+        assert metadata == {"status_code": 200, "etag": None, "last_modified": None}
+
+    @pytest.mark.asyncio
+    async def test_private_search(self):
+        """Test that _search sends the query to the search endpoint."""
+        search = AsyncSearch(client=AsyncMock())
+
+        with patch.object(search, "_get", new_callable=AsyncMock) as mock_get:
+            await search._search(kind="issues", query="is:open", order="desc")
+
+        assert mock_get.call_args.kwargs["endpoint"] == "/search/issues"
+        assert mock_get.call_args.kwargs["params"] == {"q": "is:open", "per_page": 30, "page": 1, "order": "desc"}
+
+    @pytest.mark.asyncio
+    async def test_iter_search_over_cap_without_split(self, caplog, make_fake_search):
+        """Test that a query over the cap returns the first results with a warning."""
+        search = AsyncSearch(client=AsyncMock())
+        fake_search, _ = make_fake_search(START)
+
+        async def async_fake_search(**kwargs):
+            return fake_search(**kwargs)
+
+        with (
+            patch.object(search, "_search", side_effect=async_fake_search),
+            patch("ghnova.search.async_search.process_async_response_with_last_modified", side_effect=fake_process),
+            caplog.at_level(logging.WARNING, logger="ghnova"),
+        ):
+            items = [item async for item in search.iter_search(kind="issues", query="org:octocat")]
+
+        assert len(items) == 1000  # noqa: PLR2004
+        assert "Use split_by" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_iter_search_split(self, make_fake_search):
+        """Test that a split search returns every result once, from the oldest slice."""
+        search = AsyncSearch(client=AsyncMock())
+        fake_search, queries = make_fake_search(START)
+        on_page = MagicMock()
+
+        async def async_fake_search(**kwargs):
+            return fake_search(**kwargs)
+
+        with (
+            patch.object(search, "_search", side_effect=async_fake_search),
+            patch("ghnova.search.async_search.process_async_response_with_last_modified", side_effect=fake_process),
+        ):
+            items = [
+                item
+                async for item in search.iter_search(
+                    kind="issues",
+                    query="org:octocat",
+                    split_by="created",
+                    since=START,
+                    until=START + timedelta(hours=7 * 2499),
+                    on_page=on_page,
+                )
+            ]
+
+        assert [item["id"] for item in items] == list(range(2500))
+        assert len(queries) == 1 + 4 * 7
+        assert [call.args[0].page for call in on_page.call_args_list] == list(range(1, len(queries) + 1))
+
+    @pytest.mark.asyncio
+    async def test_iter_search_since_requires_split_by(self):
+        """Test that since without split_by is rejected."""
+        search = AsyncSearch(client=AsyncMock())
+
+        with pytest.raises(ValueError, match="require split_by"):
+            _ = [item async for item in search.iter_search(kind="issues", query="org:octocat", since=START)]
@@ -0,0 +1,166 @@
+"""Unit tests for the base class of the Search resource."""
+
+import itertools
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ghnova.search.base import (
+    SEARCH_EPOCH,
+    BaseSearch,
+    format_search_time,
+    get_split_parts,
+    split_range,
+)
+
+
+class TestSearchHelpers:
+    """Test cases for the helpers of split searches."""
+
+    def test_format_search_time(self):
+        """Test that times are formatted in UTC without microseconds."""
+        value = datetime(2024, 1, 1, 12, 0, 0, 500, tzinfo=timezone(timedelta(hours=2)))
+
+        assert format_search_time(value) == "2024-01-01T10:00:00+00:00"
+
+    def test_format_search_time_naive(self):
+        """Test that naive times are taken as UTC."""
+        assert format_search_time(datetime(2024, 1, 1)) == "2024-01-01T00:00:00+00:00"
+
+    def test_split_range_halves(self):
+        """Test that a range is split into consecutive sub-ranges covering it."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(seconds=9)
+
+        assert split_range(start, end) == [
+            (start, start + timedelta(seconds=4)),
+            (start + timedelta(seconds=5), end),
+        ]
+
+    def test_split_range_parts(self):
+        """Test that the sub-ranges do not overlap and cover the range."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+
+        slices = split_range(start, end, parts=7)
+
+        assert slices is not None
+        assert len(slices) == 7  # noqa: PLR2004
+        assert slices[0][0] == start
+        assert slices[-1][1] == end
+        for (_, previous_end), (next_start, _) in itertools.pairwise(slices):
+            assert next_start == previous_end + timedelta(seconds=1)
+
+    def test_split_range_fewer_seconds_than_parts(self):
+        """Test that a short range is split into one-second ranges."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        slices = split_range(start, start + timedelta(seconds=2), parts=10)
+
+        assert slices == [(start + timedelta(seconds=i), start + timedelta(seconds=i)) for i in range(3)]
+
+    def test_split_range_single_second(self):
+        """Test that a one-second range cannot be split."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert split_range(start, start) is None
+
+    @pytest.mark.parametrize(
+        ("total_count", "parts"),
+        [(1001, 2), (1600, 2), (1601, 3), (10000, 13)],
+    )
+    def test_get_split_parts(self, total_count, parts):
+        """Test that queries are split in proportion to their number of results."""
+        assert get_split_parts(total_count) == parts
+
+
+class TestBaseSearch:
+    """Test cases for the BaseSearch class."""
+
+    def test_search_helper(self):
+        """Test the endpoint and parameters of a search request."""
+        endpoint, params, kwargs = BaseSearch()._search_helper(
+            kind="issues", query="repo:octocat/hello is:open", sort="created", order="asc", per_page=50, page=2
+        )
+
+        assert endpoint == "/search/issues"
+        assert params == {
+            "q": "repo:octocat/hello is:open",
+            "per_page": 50,
+            "page": 2,
+            "sort": "created",
+            "order": "asc",
+        }
+        assert kwargs["headers"]["Accept"] == "application/vnd.github+json"
+        assert kwargs["headers"]["X-GitHub-Api-Version"] == "2022-11-28"
+
+    def test_search_helper_invalid_kind(self):
+        """Test that an unknown kind is rejected."""
+        with pytest.raises(ValueError, match="Invalid search kind"):
+            BaseSearch()._search_helper(kind="commits", query="fix")  # type: ignore[arg-type]
+
+    def test_search_helper_empty_query(self):
+        """Test that an empty query is rejected."""
+        with pytest.raises(ValueError, match="must not be empty"):
+            BaseSearch()._search_helper(kind="users", query="  ")
+
+    def test_get_split_range_defaults(self):
+        """Test that a split search defaults to the whole history."""
+        start, end = BaseSearch()._get_split_range(
+            kind="issues", query="org:octocat", split_by="created", since=None, until=None
+        )
+
+        assert start == SEARCH_EPOCH
+        assert end <= datetime.now(timezone.utc)
+        assert end.microsecond == 0
+
+    def test_get_split_range_invalid_field(self):
+        """Test that users cannot be split on updated."""
+        with pytest.raises(ValueError, match="cannot be split on 'updated'"):
+            BaseSearch()._get_split_range(kind="users", query="type:user", split_by="updated", since=None, until=None)
+
+    def test_get_split_range_qualifier_in_query(self):
+        """Test that a query already restricting the split field is rejected."""
+        with pytest.raises(ValueError, match="since and until"):
+            BaseSearch()._get_split_range(
+                kind="issues", query="org:octocat created:>2024-01-01", split_by="created", since=None, until=None
+            )
+
+    def test_get_split_range_reversed(self):
+        """Test that since after until is rejected."""
+        with pytest.raises(ValueError, match="must not be after"):
+            BaseSearch()._get_split_range(
+                kind="issues",
+                query="org:octocat",
+                split_by="created",
+                since=datetime(2024, 2, 1, tzinfo=timezone.utc),
+                until=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+
+    def test_get_slice_query(self):
+        """Test that the date qualifier is appended to the query."""
+        query = BaseSearch()._get_slice_query(
+            query="org:octocat",
+            split_by="updated",
+            start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end=datetime(2024, 1, 31, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+        assert query == "org:octocat updated:2024-01-01T00:00:00+00:00..2024-01-31T23:59:59+00:00"
+
+    def test_get_last_page(self):
+        """Test that the last page stops at the cap."""
+        search = BaseSearch()
+
+        assert search._get_last_page(total_count=0, per_page=100) == 1
+        assert search._get_last_page(total_count=250, per_page=100) == 3  # noqa: PLR2004
+        assert search._get_last_page(total_count=5000, per_page=30) == 34  # noqa: PLR2004
+
+    def test_drop_seen(self):
+        """Test that results returned by an earlier slice are dropped."""
+        seen = {1}
+
+        items = list(BaseSearch()._drop_seen([{"id": 1}, {"id": 2}, {"node_id": "U_x"}, {"login": "a"}], seen))
+
+        assert items == [{"id": 2}, {"node_id": "U_x"}, {"login": "a"}]
+        assert seen == {1, 2, "U_x"}
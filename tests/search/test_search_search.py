@@ -0,0 +1,159 @@
+"""Unit tests for the Search resource."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghnova.search.search import Search
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+"""Creation time of the first fake result."""
+
+
+def fake_process(response):
+    """Process a fake response."""
+    return response.data, 200, None, None
+
+
+class TestSearch:
+    """Test cases for the Search class."""
+
+    def test_search(self):
+        """Test getting a page of search results."""
+        search = Search(client=MagicMock())
+
+        with (
+            patch.object(search, "_search") as mock_search,
+            patch("ghnova.search.search.process_response_with_last_modified") as mock_process,
+        ):
+            mock_search.return_value = MagicMock()
+            mock_process.return_value = ({"total_count": 1, "items": [{"id": 1}]}, 200, '"etag"', None)
+            data, metadata = search.search(kind="issues", query="org:octocat", sort="updated")
+
+        assert data == {"total_count": 1, "items": [{"id": 1}]}
+        assert metadata == {"status_code": 200, "etag": '"etag"', "last_modified": None}
+        mock_search.assert_called_once_with(
+            kind="issues",
+            query="org:octocat",
+            sort="updated",
+            order=None,
+            per_page=30,
+            page=1,
+            etag=None,
+            last_modified=None,
+        )
+
+    def test_private_search(self):
+        """Test that _search sends the query to the search endpoint."""
+        search = Search(client=MagicMock())
+
+        with patch.object(search, "_get") as mock_get:
+            search._search(kind="repositories", query="language:python", per_page=100, page=3)
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["endpoint"] == "/search/repositories"
+        assert mock_get.call_args.kwargs["params"] == {"q": "language:python", "per_page": 100, "page": 3}
+
+    def test_iter_search_under_cap(self, make_fake_search):
+        """Test that all pages of a query under the cap are returned."""
+        search = Search(client=MagicMock())
+        fake_search, queries = make_fake_search(START, total=250)
+        on_page = MagicMock()
+
+        with (
+            patch.object(search, "_search", side_effect=fake_search),
+            patch("ghnova.search.search.process_response_with_last_modified", side_effect=fake_process),
+        ):
+            items = list(search.iter_search(kind="issues", query="org:octocat", on_page=on_page))
+
+        assert [item["id"] for item in items] == list(range(250))
+        assert [page for _, page in queries] == [1, 2, 3]
+        assert [call.args[0].page for call in on_page.call_args_list] == [1, 2, 3]
+
+    def test_iter_search_over_cap_without_split(self, caplog, make_fake_search):
+        """Test that a query over the cap returns the first results with a warning."""
+        search = Search(client=MagicMock())
+        fake_search, queries = make_fake_search(START)
+
+        with (
+            patch.object(search, "_search", side_effect=fake_search),
+            patch("ghnova.search.search.process_response_with_last_modified", side_effect=fake_process),
+            caplog.at_level(logging.WARNING, logger="ghnova"),
+        ):
+            items = list(search.iter_search(kind="issues", query="org:octocat"))
+
+        assert len(items) == 1000  # noqa: PLR2004
+        assert len(queries) == 10  # noqa: PLR2004
+        assert "Use split_by" in caplog.text
+
+    def test_iter_search_split(self, make_fake_search):
+        """Test that a split search returns every result once, from the oldest slice."""
+        search = Search(client=MagicMock())
+        fake_search, queries = make_fake_search(START)
+
+        with (
+            patch.object(search, "_search", side_effect=fake_search),
+            patch("ghnova.search.search.process_response_with_last_modified", side_effect=fake_process),
+        ):
+            items = list(
+                search.iter_search(
+                    kind="issues",
+                    query="org:octocat",
+                    split_by="created",
+                    since=START,
+                    until=START + timedelta(hours=7 * 2499),
+                )
+            )
+
+        assert [item["id"] for item in items] == list(range(2500))
+        assert queries[0][0] == "org:octocat created:2020-01-01T00:00:00+00:00..2021-12-29T21:00:00+00:00"
+        # The first request finds 2,500 results, then each of the 4 slices fits under the cap.
+        assert len(queries) == 1 + 4 * 7
+
+    def test_iter_search_split_drops_duplicates(self, make_fake_search):
+        """Test that a result returned by two slices is returned once."""
+        search = Search(client=MagicMock())
+        fake_search, _ = make_fake_search(START, total=1500)
+
+        def moving_search(**kwargs):
+            response = fake_search(**kwargs)
+            # An item updated during the search shows up again in a later slice.
+            response.data["items"] = [*response.data["items"], {"id": 0}]
+            return response
+
+        with (
+            patch.object(search, "_search", side_effect=moving_search),
+            patch("ghnova.search.search.process_response_with_last_modified", side_effect=fake_process),
+        ):
+            items = list(search.iter_search(kind="issues", query="org:octocat", split_by="created", since=START))
+
+        ids = [item["id"] for item in items]
+        assert sorted(ids) == list(range(1500))
+
+    def test_iter_search_split_unsplittable(self, caplog, make_fake_search):
+        """Test that a one-second slice over the cap is returned up to the cap with a warning."""
+        search = Search(client=MagicMock())
+        fake_search, _ = make_fake_search(START, total=1200, interval=timedelta(0))
+
+        with (
+            patch.object(search, "_search", side_effect=fake_search),
+            patch("ghnova.search.search.process_response_with_last_modified", side_effect=fake_process),
+            caplog.at_level(logging.WARNING, logger="ghnova"),
+        ):
+            items = list(
+                search.iter_search(
+                    kind="issues", query="org:octocat", split_by="created", since=START, until=START + timedelta(1)
+                )
+            )
+
+        assert len(items) == 1000  # noqa: PLR2004
+        assert "cannot be split further" in caplog.text
+
+    def test_iter_search_since_requires_split_by(self):
+        """Test that since without split_by is rejected."""
+        search = Search(client=MagicMock())
+
+        with pytest.raises(ValueError, match="require split_by"):
+            list(search.iter_search(kind="issues", query="org:octocat", since=START))
@@ -0,0 +1,76 @@
+"""Regression tests for the import time of the ghnova package."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_FRACTION = 0.25
+"""Upper bound of the import time of the top-level package, as a fraction of the import time of requests."""
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """Run Python code in a fresh interpreter.
+
+    Args:
+        code: The code to run.
+        *options: Additional interpreter options.
+
+    Returns:
+        The completed process.
+
+    """
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+
+
+def get_loaded_modules(statement: str) -> set[str]:
+    """Get the top-level modules loaded by an import statement in a fresh interpreter.
+
+    Args:
+        statement: The import statement.
+
+    Returns:
+        The names of the loaded top-level modules.
+
+    """
+    result = run_python(f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))")
+    return {name.split(".")[0] for name in json.loads(result.stdout)}
+
+
+@pytest.mark.parametrize(
+    ("statement", "forbidden"),
+    [
+        ("import ghnova", {"aiohttp", "requests", "pydantic"}),
+        ("import ghnova.client", {"aiohttp", "requests", "pydantic"}),
+        ("from ghnova.client import GitHub", {"aiohttp"}),
+        ("from ghnova.client import PooledGitHub", {"aiohttp"}),
+        ("from ghnova.client import AsyncGitHub", {"requests"}),
+        ("from ghnova.client import AsyncPooledGitHub", {"requests"}),
+        ("from ghnova.cli.main import app", {"aiohttp", "requests", "pydantic"}),
+    ],
+)
+def test_import_does_not_load(statement, forbidden):
+    """Test that imports only load the HTTP library they need."""
+    assert get_loaded_modules(statement).isdisjoint(forbidden)
+
+
+def test_import_time_budget(import_times):
+    """Test that importing the top-level package costs a fraction of importing requests in the same process."""
+    cumulative = import_times("import ghnova\nimport requests")
+
+    assert cumulative["ghnova"] < IMPORT_TIME_FRACTION * cumulative["requests"]
+
+
+def test_lazy_attributes():
+    """Test that the lazy attributes of the packages resolve to the public classes."""
+    import ghnova  # noqa: PLC0415
+    import ghnova.client  # noqa: PLC0415
+    from ghnova.client.github import GitHub  # noqa: PLC0415
+
+    assert ghnova.client.GitHub is GitHub
+    assert "GitHub" in dir(ghnova.client)
+    with pytest.raises(AttributeError, match="no attribute"):
+        _ = ghnova.client.Missing
@@ -77,7 +77,7 @@ class TestAsyncUser:
         mock_response = AsyncMock()
         mock_response.status = 200
         mock_response.headers = {}
-        mock_response.json = AsyncMock(return_value={"login": "octocat"})
+        mock_response.read = AsyncMock(return_value=b'{"login": "octocat"}')
 
         with patch.object(user, "_get_user", new_callable=AsyncMock) as mock_get_user:
             mock_get_user.return_value = mock_response
@@ -191,3 +191,18 @@ class TestAsyncUser:
         assert metadata["etag"] == '"etag"'
         assert metadata["last_modified"] == "Wed, 21 Oct 2015 07:28:00 GMT"
         mock_get_contextual.assert_called_once_with(username="octocat", subject_type="repository", subject_id="123")
+
+    @pytest.mark.asyncio
+    async def test_iter_users(self):
+        """Test iter_users paginates with the since cursor."""
+        user = AsyncUser(client=AsyncMock())
+
+        async def fake_paginate(endpoint, params=None, **kwargs):
+            assert endpoint == "/users"
+            assert params == {"per_page": 100}
+            yield {"id": 1}
+
+        with patch.object(user, "_paginate", side_effect=fake_paginate):
+            result = [item async for item in user.iter_users()]
+
+        assert result == [{"id": 1}]
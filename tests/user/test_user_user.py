@@ -71,7 +71,7 @@ class TestUser:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {}
-        mock_response.json.return_value = {"login": "octocat"}
+        mock_response.content = b'{"login": "octocat"}'
 
         with patch.object(user, "_get_user") as mock_get_user:
             mock_get_user.return_value = mock_response
@@ -181,3 +181,16 @@ class TestUser:
         assert metadata["etag"] == '"etag"'
         assert metadata["last_modified"] == "Wed, 21 Oct 2015 07:28:00 GMT"
         mock_get_contextual.assert_called_once_with(username="octocat", subject_type="repository", subject_id="123")
+
+    def test_iter_users(self):
+        """Test iter_users paginates with the since cursor."""
+        user = User(client=MagicMock())
+        items = [{"id": 5}, {"id": 6}]
+
+        with patch.object(user, "_paginate", return_value=iter(items)) as mock_paginate:
+            result = list(user.iter_users(since=4))
+
+        assert result == items
+        kwargs = mock_paginate.call_args.kwargs
+        assert kwargs["endpoint"] == "/users"
+        assert kwargs["params"] == {"since": 4, "per_page": 100}
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 
 import pytest
+import typer
 
-from ghnova.cli.utils.api import execute_api_command
+from ghnova.cli.utils.api import (
+    check_single_page_options,
+    execute_api_command,
+    execute_paginated_command,
+    split_fields,
+)
+from ghnova.utils.pagination import PageInfo
 
 
 def test_execute_api_command_success(capsys):
@@ -39,3 +47,129 @@ def test_execute_api_command_exception(caplog):
     # ensure the original exception was wrapped
     assert excinfo.type.__name__ in ("Exit", "TyperExit")
     assert "Error executing failing cmd" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("number", ["number"]),
+        ("number, state,user.login,", ["number", "state", "user.login"]),
+    ],
+)
+def test_split_fields(value, expected):
+    """Should split the comma-separated value of --fields."""
+    assert split_fields(value) == expected
+
+
+def test_execute_api_command_ndjson(capsys):
+    """Should print one item per line in the NDJSON format."""
+
+    def api_call():
+        return [{"id": 1}, {"id": 2}], {"page": 1}
+
+    execute_api_command(api_call=api_call, command_name="test cmd", output_format="ndjson")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2}]
+
+
+def test_execute_api_command_broken_pipe(monkeypatch):
+    """Should exit quietly when the reader of the output goes away."""
+
+    def write_items(*args, **kwargs):
+        raise BrokenPipeError
+
+    dup2_calls = []
+    monkeypatch.setattr("ghnova.cli.utils.output.write_items", write_items)
+    monkeypatch.setattr("os.dup2", lambda *args: dup2_calls.append(args))
+    monkeypatch.setattr("sys.stdout", io.StringIO())
+    monkeypatch.setattr("sys.stdout.fileno", lambda: 1, raising=False)
+
+    with pytest.raises(typer.Exit):
+        execute_api_command(api_call=lambda: ([], {}), command_name="test cmd", output_format="ndjson")
+
+    assert len(dup2_calls) == 1
+
+
+def test_execute_paginated_command_json(capsys):
+    """Should output all items with the pagination metadata."""
+
+    def iterate(on_page):
+        on_page(PageInfo(page=1, items=2, headers={"X-RateLimit-Remaining": "10"}))
+        yield {"id": 1}
+        yield {"id": 2}
+
+    execute_paginated_command(iterate=iterate, command_name="test cmd")
+
+    output = json.loads(capsys.readouterr().out)
+    assert output["data"] == [{"id": 1}, {"id": 2}]
+    assert output["metadata"] == {"pages": 1, "items": 2, "rate_limit_remaining": 10}
+
+
+def test_execute_paginated_command_json_streams_items(capsys):
+    """Should write each item of the JSON document before the next page is fetched."""
+    written = []
+
+    def iterate(on_page):
+        on_page(PageInfo(page=1, items=1, headers={}))
+        yield {"id": 1}
+        written.append(capsys.readouterr().out)
+        on_page(PageInfo(page=2, items=1, headers={}))
+        yield {"id": 2}
+
+    execute_paginated_command(iterate=iterate, command_name="test cmd", max_items=5)
+
+    output = json.loads(written[0] + capsys.readouterr().out)
+    assert '"id": 1' in written[0]
+    assert output["data"] == [{"id": 1}, {"id": 2}]
+    assert output["metadata"]["pages"] == 2  # noqa: PLR2004
+
+
+def test_execute_paginated_command_max_items(capsys):
+    """Should stop after max_items and close the iterator."""
+    consumed = []
+    closed = []
+
+    def iterate(on_page):
+        try:
+            for number in range(100):
+                consumed.append(number)
+                yield {"id": number}
+        finally:
+            closed.append(True)
+
+    execute_paginated_command(iterate=iterate, command_name="test cmd", output_format="ndjson", max_items=3)
+
+    assert len(capsys.readouterr().out.splitlines()) == 3  # noqa: PLR2004
+    assert consumed == [0, 1, 2]
+    assert closed == [True]
+
+
+def test_execute_paginated_command_error():
+    """Should close the iterator and exit on errors."""
+    closed = []
+
+    def iterate(on_page):
+        try:
+            yield {"id": 1}
+            raise RuntimeError("boom")
+        finally:
+            closed.append(True)
+
+    with pytest.raises(typer.Exit):
+        execute_paginated_command(iterate=iterate, command_name="test cmd", output_format="ndjson")
+
+    assert closed == [True]
+
+
+def test_check_single_page_options(caplog):
+    """Should accept the first page and reject any other single-page option."""
+    check_single_page_options(page=1)
+    check_single_page_options()
+
+    with caplog.at_level(logging.ERROR, logger="ghnova"), pytest.raises(typer.Exit):
+        check_single_page_options(page=3, last_modified="Wed, 21 Oct 2015 07:28:00 GMT")
+
+    assert "--page, --last-modified cannot be combined" in caplog.text
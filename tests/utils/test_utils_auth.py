@@ -14,7 +14,7 @@ def test_get_auth_params_with_account_name_and_token_base_url_warns(caplog):
     """Providing account_name should use account values and log a warning if token/base_url were also passed."""
     caplog.set_level("WARNING", logger="ghnova")
 
-    with patch("ghnova.cli.utils.auth.ConfigManager") as mock_cm:
+    with patch("ghnova.config.manager.ConfigManager") as mock_cm:
         mock_inst = mock_cm.return_value
         mock_inst.load_config.return_value = None
         mock_inst.get_config.return_value = SimpleNamespace(token="acct-token", base_url="https://acct.example")
@@ -28,7 +28,7 @@ def test_get_auth_params_with_account_name_and_token_base_url_warns(caplog):
 
 def test_get_auth_params_use_default_account():
     """When neither token nor account_name provided, use default account from config."""
-    with patch("ghnova.cli.utils.auth.ConfigManager") as mock_cm:
+    with patch("ghnova.config.manager.ConfigManager") as mock_cm:
         mock_inst = mock_cm.return_value
         mock_inst.load_config.return_value = None
         mock_inst.has_default_account.return_value = True
@@ -42,7 +42,7 @@ def test_get_auth_params_use_default_account():
 
 def test_get_auth_params_no_default_raises():
     """If no default account and no credentials provided, raise ValueError."""
-    with patch("ghnova.cli.utils.auth.ConfigManager") as mock_cm:
+    with patch("ghnova.config.manager.ConfigManager") as mock_cm:
         mock_inst = mock_cm.return_value
         mock_inst.load_config.return_value = None
         mock_inst.has_default_account.return_value = False
@@ -0,0 +1,154 @@
+"""Unit tests for the fan-out utilities."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+import pytest
+
+from ghnova.utils.fanout import aiter_fanout, iter_fanout
+
+
+class TestIterFanout:
+    """Test cases for iter_fanout."""
+
+    def test_merges_all_items(self):
+        """Test that the items of all sources are returned, each source in order."""
+        items = list(iter_fanout(range(5), lambda source: [(source, index) for index in range(3)], concurrency=2))
+
+        assert sorted(items) == [(source, index) for source in range(5) for index in range(3)]
+        for source in range(5):
+            assert [index for item_source, index in items if item_source == source] == [0, 1, 2]
+
+    def test_bounds_concurrency(self):
+        """Test that at most concurrency sources are fetched at the same time."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fetch(source):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return [source]
+
+        items = list(iter_fanout(range(12), fetch, concurrency=3))
+
+        assert sorted(items) == list(range(12))
+        assert 1 < peak <= 3  # noqa: PLR2004
+
+    def test_consumes_sources_lazily(self):
+        """Test that the sources are consumed as the items are read."""
+        sources = itertools.count()
+
+        items = iter_fanout(sources, lambda source: [source], concurrency=2)
+        first = list(itertools.islice(items, 5))
+        items.close()
+
+        assert len(first) == 5  # noqa: PLR2004
+        assert next(sources) < 1000  # noqa: PLR2004
+
+    def test_raises_error_of_fetch(self):
+        """Test that an error of a source is raised to the consumer."""
+
+        def fetch(source):
+            if source == 3:  # noqa: PLR2004
+                raise RuntimeError("boom")
+            return [source]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(iter_fanout(range(10), fetch, concurrency=2))
+
+    def test_raises_error_of_sources(self):
+        """Test that an error of the sources is raised to the consumer."""
+
+        def sources():
+            yield 1
+            raise RuntimeError("listing failed")
+
+        with pytest.raises(RuntimeError, match="listing failed"):
+            list(iter_fanout(sources(), lambda source: [source], concurrency=2))
+
+    def test_stops_threads_on_close(self):
+        """Test that closing the iterator stops the threads."""
+        items = iter_fanout(itertools.count(), lambda source: range(1000), concurrency=4)
+        next(items)
+        items.close()
+
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("ghnova-fanout")]
+
+    def test_invalid_concurrency(self):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError, match="at least 1"):
+            list(iter_fanout([1], lambda source: [source], concurrency=0))
+
+
+class TestAiterFanout:
+    """Test cases for aiter_fanout."""
+
+    @staticmethod
+    async def sources(count):
+        """Yield the sources."""
+        for source in range(count):
+            yield source
+
+    @pytest.mark.asyncio
+    async def test_merges_all_items(self):
+        """Test that the items of all sources are returned, each source in order."""
+
+        async def fetch(source):
+            for index in range(3):
+                await asyncio.sleep(0)
+                yield (source, index)
+
+        items = [item async for item in aiter_fanout(self.sources(5), fetch, concurrency=2)]
+
+        assert sorted(items) == [(source, index) for source in range(5) for index in range(3)]
+        for source in range(5):
+            assert [index for item_source, index in items if item_source == source] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self):
+        """Test that at most concurrency sources are fetched at the same time."""
+        active = 0
+        peak = 0
+
+        async def fetch(source):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            yield source
+
+        items = [item async for item in aiter_fanout(self.sources(12), fetch, concurrency=3)]
+
+        assert sorted(items) == list(range(12))
+        assert peak == 3  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_raises_error_of_fetch(self):
+        """Test that an error of a source is raised to the consumer."""
+
+        async def fetch(source):
+            if source == 3:  # noqa: PLR2004
+                raise RuntimeError("boom")
+            yield source
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _ = [item async for item in aiter_fanout(self.sources(10), fetch, concurrency=2)]
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        """Test that concurrency must be positive."""
+
+        async def fetch(source):
+            yield source
+
+        with pytest.raises(ValueError, match="at least 1"):
+            _ = [item async for item in aiter_fanout(self.sources(1), fetch, concurrency=0)]
@@ -0,0 +1,87 @@
+"""Unit tests for the JSON codec."""
+
+import contextlib
+import datetime
+
+import pytest
+
+from ghnova.issue.record import IssueRecord
+from ghnova.utils import json_codec
+from ghnova.utils.json_codec import JSONCodec, MsgspecCodec, OrjsonCodec, StdlibCodec
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    """Restore the automatic codec selection after each test."""
+    yield
+    json_codec.set_codec(None)
+
+
+def _codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(codec_class())
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+class TestCodecs:
+    """Test cases shared by every installed codec."""
+
+    def test_loads(self, codec):
+        """Test decoding from bytes and str."""
+        assert codec.loads(b'[{"id": 1, "title": "caf\xc3\xa9"}]') == [{"id": 1, "title": "café"}]
+        assert codec.loads('{"a": null}') == {"a": None}
+
+    def test_loads_invalid(self, codec):
+        """Test that invalid documents raise ValueError."""
+        with pytest.raises(ValueError, match=r"\w"):
+            codec.loads(b"not json")
+
+    def test_dumps(self, codec):
+        """Test encoding, indentation and the fallback for unsupported objects."""
+        assert json_codec.StdlibCodec().loads(codec.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+        assert codec.dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+        encoded = codec.dumps({"when": datetime.date(2024, 1, 2)})
+        assert "2024-01-02" in encoded
+
+    def test_dumps_record(self, codec):
+        """Test that records are encoded as objects, with nested records."""
+        record = IssueRecord.from_dict(
+            {"id": 1, "title": "Bug", "user": {"login": "octocat"}, "labels": [{"id": 2, "name": "bug"}]}
+        )
+        decoded = json_codec.StdlibCodec().loads(codec.dumps([record]))
+        assert decoded == [record.to_dict()]
+        assert decoded[0]["user"]["login"] == "octocat"
+        assert decoded[0]["labels"][0]["name"] == "bug"
+
+
+def test_base_codec():
+    """Test that the base codec is abstract."""
+    with pytest.raises(NotImplementedError):
+        JSONCodec().loads(b"{}")
+    with pytest.raises(NotImplementedError):
+        JSONCodec().dumps({})
+
+
+def test_set_codec():
+    """Test selecting a codec by name or instance."""
+    json_codec.set_codec("json")
+    assert isinstance(json_codec.get_codec(), StdlibCodec)
+    assert json_codec.loads(b"[1]") == [1]
+    assert json_codec.dumps([1]) == "[1]"
+
+    codec = StdlibCodec()
+    json_codec.set_codec(codec)
+    assert json_codec.get_codec() is codec
+
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        json_codec.set_codec("yaml")
+
+
+def test_default_codec(monkeypatch):
+    """Test that the fastest installed codec is selected."""
+    monkeypatch.setattr(json_codec.importlib.util, "find_spec", lambda name: None)
+    json_codec.set_codec(None)
+    assert json_codec.get_codec().name == "json"
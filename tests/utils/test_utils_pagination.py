@@ -0,0 +1,72 @@
+"""Unit tests for pagination utilities."""
+
+from ghnova.utils.pagination import PageInfo, get_next_link, get_page_number, parse_link_header
+
+LINK_HEADER = (
+    '<https://api.github.com/repositories/1/issues?page=2>; rel="next", '
+    '<https://api.github.com/repositories/1/issues?page=5>; rel="last"'
+)
+
+
+class TestParseLinkHeader:
+    """Test cases for parse_link_header."""
+
+    def test_parse_link_header(self):
+        """Test parsing a header with several relations."""
+        links = parse_link_header(LINK_HEADER)
+        assert links == {
+            "next": "https://api.github.com/repositories/1/issues?page=2",
+            "last": "https://api.github.com/repositories/1/issues?page=5",
+        }
+
+    def test_parse_link_header_empty(self):
+        """Test parsing a missing header."""
+        assert parse_link_header(None) == {}
+        assert parse_link_header("") == {}
+
+    def test_parse_link_header_multiple_rel_values(self):
+        """Test a link carrying several space-separated relation types."""
+        links = parse_link_header('<https://api.github.com/users?since=1>; rel="next last"')
+        assert links == {"next": "https://api.github.com/users?since=1", "last": "https://api.github.com/users?since=1"}
+
+
+class TestGetNextLink:
+    """Test cases for get_next_link."""
+
+    def test_get_next_link(self):
+        """Test extracting the next link."""
+        assert get_next_link({"Link": LINK_HEADER}) == "https://api.github.com/repositories/1/issues?page=2"
+
+    def test_get_next_link_last_page(self):
+        """Test that the last page has no next link."""
+        assert get_next_link({}) is None
+        assert get_next_link({"Link": '<https://api.github.com/x?page=1>; rel="prev"'}) is None
+
+
+class TestGetPageNumber:
+    """Test cases for get_page_number."""
+
+    def test_get_page_number(self):
+        """Test extracting the page number of a link."""
+        url = "https://api.github.com/repositories/1/issues?per_page=100&page=40"
+        assert get_page_number(url) == 40  # noqa: PLR2004
+
+    def test_get_page_number_missing(self):
+        """Test links without a usable page parameter."""
+        assert get_page_number(None) is None
+        assert get_page_number("https://api.github.com/users?since=10") is None
+        assert get_page_number("https://api.github.com/items?page=abc") is None
+
+
+class TestPageInfo:
+    """Test cases for PageInfo."""
+
+    def test_rate_limit_remaining(self):
+        """Test reading the remaining rate limit from the headers."""
+        info = PageInfo(page=1, items=2, headers={"X-RateLimit-Remaining": "17"})
+        assert info.rate_limit_remaining == 17  # noqa: PLR2004
+
+    def test_rate_limit_remaining_missing(self):
+        """Test a missing or invalid rate limit header."""
+        assert PageInfo(page=1, items=2, headers={}).rate_limit_remaining is None
+        assert PageInfo(page=1, items=2, headers={"X-RateLimit-Remaining": "n/a"}).rate_limit_remaining is None
@@ -0,0 +1,96 @@
+"""Unit tests for field projection."""
+
+import importlib.util
+import json
+
+import pytest
+
+from ghnova.utils import projection
+from ghnova.utils.projection import decode_projected, parse_fields, project
+
+ISSUES = [
+    {
+        "number": 1,
+        "title": "Found a bug",
+        "url": "https://api.github.com/repos/octocat/Hello-World/issues/1",
+        "user": {"login": "octocat", "id": 1, "avatar_url": "https://github.com/images/error/octocat_happy.gif"},
+        "labels": [{"name": "bug", "color": "f29513"}, {"name": "ui", "color": "ffffff"}],
+        "milestone": None,
+    },
+    {"number": 2, "title": "Typo", "user": None, "labels": []},
+]
+
+
+@pytest.fixture(params=["msgspec", "dict"])
+def decoder(request, monkeypatch):
+    """Decode with msgspec or by projecting the decoded dictionaries."""
+    if request.param == "msgspec":
+        if importlib.util.find_spec("msgspec") is None:
+            pytest.skip("msgspec is not installed.")
+    else:
+        monkeypatch.setattr(projection, "_get_decoder", lambda fields: None)
+    return request.param
+
+
+class TestParseFields:
+    """Test cases for parse_fields."""
+
+    def test_nested_paths(self):
+        """Test that paths sharing a parent are merged."""
+        assert parse_fields(["number", "user.login", "labels.name", "labels.color"]) == {
+            "number": None,
+            "user": {"login": None},
+            "labels": {"name": None, "color": None},
+        }
+
+    def test_whole_field_wins(self):
+        """Test that selecting a whole field supersedes its subfields, in either order."""
+        assert parse_fields(["user.login", "user"]) == {"user": None}
+        assert parse_fields(["user", "user.login"]) == {"user": None}
+
+    @pytest.mark.parametrize("path", ["", "user.", ".login", "user..login"])
+    def test_invalid_path(self, path):
+        """Test that empty path segments are rejected."""
+        with pytest.raises(ValueError, match="Invalid field path"):
+            parse_fields([path])
+
+
+class TestProject:
+    """Test cases for project."""
+
+    def test_project(self):
+        """Test projecting objects, lists and missing fields."""
+        result = project(ISSUES, parse_fields(["number", "user.login", "labels.name", "missing"]))
+
+        assert result == [
+            {"number": 1, "user": {"login": "octocat"}, "labels": [{"name": "bug"}, {"name": "ui"}]},
+            {"number": 2, "user": None, "labels": []},
+        ]
+
+
+class TestDecodeProjected:
+    """Test cases for decode_projected."""
+
+    def test_decode_list(self, decoder):
+        """Test decoding a listing with either decoder."""
+        result = decode_projected(json.dumps(ISSUES).encode(), ["number", "user.login", "labels.name", "milestone"])
+
+        assert result == [
+            {"number": 1, "user": {"login": "octocat"}, "labels": [{"name": "bug"}, {"name": "ui"}], "milestone": None},
+            {"number": 2, "user": None, "labels": []},
+        ]
+
+    def test_decode_object(self, decoder):
+        """Test decoding a single resource."""
+        result = decode_projected(json.dumps(ISSUES[0]).encode(), ["title", "user"])
+
+        assert result == {"title": "Found a bug", "user": ISSUES[0]["user"]}
+
+    def test_decode_unexpected_shape_falls_back(self):
+        """Test that subfields of a scalar keep the scalar."""
+        assert decode_projected(b'[{"title": "Typo"}]', ["title.text"]) == [{"title": "Typo"}]
+
+    def test_decode_invalid_json(self, decoder):
+        """Test that an invalid document raises ValueError."""
+        with pytest.raises(ValueError, match=r"\w"):
+            decode_projected(b"[{", ["number"])
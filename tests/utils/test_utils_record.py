@@ -0,0 +1,155 @@
+"""Unit tests for the compact records."""
+
+import importlib.util
+import json
+
+import pytest
+
+from ghnova.issue.record import IssueRecord, LabelRecord
+from ghnova.pull_request.record import BranchRecord, PullRequestRecord
+from ghnova.repository.record import RepositoryRecord
+from ghnova.user.record import UserRecord
+from ghnova.utils import record
+from ghnova.utils.record import decode_records
+
+USER = {
+    "login": "octocat",
+    "id": 1,
+    "node_id": "MDQ6VXNlcjE=",
+    "avatar_url": "https://github.com/images/error/octocat_happy.gif",
+    "url": "https://api.github.com/users/octocat",
+    "html_url": "https://github.com/octocat",
+    "type": "User",
+    "site_admin": False,
+}
+
+ISSUE = {
+    "id": 1,
+    "node_id": "MDU6SXNzdWUx",
+    "url": "https://api.github.com/repos/octocat/Hello-World/issues/1347",
+    "html_url": "https://github.com/octocat/Hello-World/issues/1347",
+    "number": 1347,
+    "state": "open",
+    "title": "Found a bug",
+    "body": "I'm having a problem with this.",
+    "user": USER,
+    "labels": [{"id": 208045946, "name": "bug", "color": "f29513", "default": True}],
+    "assignee": USER,
+    "assignees": [USER],
+    "locked": True,
+    "comments": 0,
+    "pull_request": {"html_url": "https://github.com/octocat/Hello-World/pull/1347"},
+    "created_at": "2011-04-22T13:33:48Z",
+    "updated_at": "2011-04-22T13:33:48Z",
+    "closed_at": None,
+    "author_association": "COLLABORATOR",
+}
+
+
+@pytest.fixture(params=["msgspec", "dict"])
+def decoder(request, monkeypatch):
+    """Decode records with msgspec or from dictionaries."""
+    if request.param == "msgspec":
+        if importlib.util.find_spec("msgspec") is None:
+            pytest.skip("msgspec is not installed.")
+        monkeypatch.setattr(record, "_decoders", {})
+    else:
+        monkeypatch.setattr(record, "_get_decoder", lambda record_type: None)
+    return request.param
+
+
+class TestRecord:
+    """Test cases for the Record base class."""
+
+    def test_from_dict_keeps_declared_fields(self):
+        """Test that undeclared fields are dropped and nested objects are converted."""
+        issue = IssueRecord.from_dict(ISSUE)
+
+        assert issue.number == 1347  # noqa: PLR2004
+        assert issue.user == UserRecord(
+            login="octocat",
+            id=1,
+            node_id="MDQ6VXNlcjE=",
+            type="User",
+            site_admin=False,
+            html_url="https://github.com/octocat",
+        )
+        assert issue.assignees == [issue.user]
+        assert issue.labels == [LabelRecord(id=208045946, name="bug", color="f29513")]
+        assert not hasattr(issue, "author_association")
+
+    def test_from_dict_missing_fields_use_defaults(self):
+        """Test that missing fields keep their defaults."""
+        issue = IssueRecord.from_dict({"number": 1, "user": None})
+
+        assert issue.title is None
+        assert issue.user is None
+        assert issue.labels == []
+
+    def test_records_are_slotted(self):
+        """Test that records do not carry an instance dictionary."""
+        for record_type in (IssueRecord, PullRequestRecord, RepositoryRecord, UserRecord):
+            assert not hasattr(record_type(), "__dict__")
+
+    def test_to_dict(self):
+        """Test converting a record back to a dictionary."""
+        data = IssueRecord.from_dict(ISSUE).to_dict()
+
+        assert data["user"]["login"] == "octocat"
+        assert data["labels"] == [{"id": 208045946, "name": "bug", "color": "f29513"}]
+
+    def test_is_pull_request(self):
+        """Test telling pull requests apart in the issues listing."""
+        assert IssueRecord.from_dict(ISSUE).is_pull_request
+        assert not IssueRecord.from_dict({**ISSUE, "pull_request": None}).is_pull_request
+
+
+class TestDecodeRecords:
+    """Test cases for decode_records."""
+
+    def test_decode_issues(self, decoder):
+        """Test decoding issues with either decoder."""
+        issues = decode_records(json.dumps([ISSUE, {**ISSUE, "number": 1348}]).encode(), IssueRecord)
+
+        assert issues == [IssueRecord.from_dict(ISSUE), IssueRecord.from_dict({**ISSUE, "number": 1348})]
+
+    def test_decode_pull_requests(self, decoder):
+        """Test decoding nested branches of pull requests."""
+        pull_request = {
+            **ISSUE,
+            "draft": False,
+            "merged_at": None,
+            "head": {"label": "octocat:new-topic", "ref": "new-topic", "sha": "6dcb09b", "repo": {"id": 1}},
+            "base": {"label": "octocat:main", "ref": "main", "sha": "6dcb09c", "user": USER},
+        }
+
+        (result,) = decode_records(json.dumps([pull_request]).encode(), PullRequestRecord)
+
+        assert result.head == BranchRecord(label="octocat:new-topic", ref="new-topic", sha="6dcb09b")
+        assert result.base.ref == "main"
+        assert result.draft is False
+
+    def test_decode_repositories(self, decoder):
+        """Test decoding repositories."""
+        repository = {"id": 1296269, "full_name": "octocat/Hello-World", "owner": USER, "topics": ["api"]}
+
+        (result,) = decode_records(json.dumps([repository]).encode(), RepositoryRecord)
+
+        assert result.full_name == "octocat/Hello-World"
+        assert result.owner.login == "octocat"
+        assert result.topics == ["api"]
+
+    def test_decode_not_a_list(self, decoder):
+        """Test that a document that is not an array gives no records."""
+        assert decode_records(b'{"message": "Not Found"}', IssueRecord) == []
+
+    def test_decode_unexpected_types_falls_back(self):
+        """Test that values not matching the field types are kept through the dictionary path."""
+        (result,) = decode_records(b'[{"number": "1347"}]', IssueRecord)
+
+        assert result.number == "1347"
+
+    def test_decode_invalid_json(self, decoder):
+        """Test that an invalid document raises ValueError."""
+        with pytest.raises(ValueError, match=r"\w"):
+            decode_records(b"[{", IssueRecord)
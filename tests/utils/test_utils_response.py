@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from ghnova.user.record import UserRecord
 from ghnova.utils.response import process_async_response_with_last_modified, process_response_with_last_modified
 
 
@@ -15,7 +16,7 @@ class TestResponseUtils:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"ETag": '"test-etag"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
 
         data, status, etag, last_mod = process_response_with_last_modified(mock_response)
 
@@ -24,6 +25,36 @@ class TestResponseUtils:
         assert etag == '"test-etag"'
         assert last_mod == "Wed, 21 Oct 2015 07:28:00 GMT"
 
+    def test_process_response_with_last_modified_records(self):
+        """Test decoding the body as records."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'[{"login": "octocat", "id": 1, "gists_url": "https://api.github.com/gists"}]'
+
+        data, status, _, _ = process_response_with_last_modified(mock_response, record_type=UserRecord)
+
+        assert data == [UserRecord(login="octocat", id=1)]
+        assert status == 200  # noqa: PLR2004
+
+    def test_process_response_with_last_modified_fields(self):
+        """Test keeping only the selected fields of the body."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'[{"number": 1, "title": "Bug", "user": {"login": "octocat", "id": 1}}]'
+
+        data, _, _, _ = process_response_with_last_modified(mock_response, fields=["number", "user.login"])
+
+        assert data == [{"number": 1, "user": {"login": "octocat"}}]
+
+    def test_process_response_with_last_modified_fields_and_records(self):
+        """Test that fields cannot be combined with records."""
+        mock_response = MagicMock()
+
+        with pytest.raises(ValueError, match="fields cannot be combined"):
+            process_response_with_last_modified(mock_response, record_type=UserRecord, fields=["login"])
+
     def test_process_response_with_last_modified_304(self):
         """Test processing response with status 304."""
         mock_response = MagicMock()
@@ -68,7 +99,7 @@ class TestResponseUtils:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {}
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"not json"
 
         data, status, etag, last_mod = process_response_with_last_modified(mock_response)
 
@@ -83,7 +114,7 @@ class TestResponseUtils:
         mock_response = AsyncMock()
         mock_response.status = 200
         mock_response.headers = {"ETag": '"test-etag"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
-        mock_response.json = AsyncMock(return_value={"key": "value"})
+        mock_response.read = AsyncMock(return_value=b'{"key": "value"}')
 
         data, status, etag, last_mod = await process_async_response_with_last_modified(mock_response)
 
@@ -140,7 +171,7 @@ class TestResponseUtils:
         mock_response = AsyncMock()
         mock_response.status = 200
         mock_response.headers = {}
-        mock_response.json = AsyncMock(side_effect=ValueError("Invalid JSON"))
+        mock_response.read = AsyncMock(return_value=b"not json")
 
         data, status, etag, last_mod = await process_async_response_with_last_modified(mock_response)
 